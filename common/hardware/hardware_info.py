@@ -303,13 +303,12 @@ class HardwareInfoService:
                     logger.error("재시도 후에도 펌웨어 인벤토리를 가져올 수 없습니다.")
                     return "펌웨어 정보를 가져올 수 없습니다."
                 
-                firmware_details = []
-                for member in firmware_data['Members']:
-                    if '@odata.id' in member:
-                        firmware_url = self.get_full_url(member['@odata.id'])
-                        detail = await self.fetch_hardware_info(firmware_url, "펌웨어 상세")
-                        if detail:
-                            firmware_details.append(detail)
+                # 컴포넌트 상세는 동시에 조회 (순서 유지)
+                details = await asyncio.gather(*[
+                    self.fetch_hardware_info(self.get_full_url(member['@odata.id']), "펌웨어 상세")
+                    for member in firmware_data['Members'] if '@odata.id' in member
+                ])
+                firmware_details = [detail for detail in details if detail]
                 
                 return self.data_processor.process_firmware_details(firmware_details)
                 
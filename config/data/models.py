@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 @dataclass
@@ -9,16 +9,21 @@ class IDRACConfig:
     PORT: str = ""
     USERNAME: str = ""
     PASSWORD: str = ""
+    GROUP: str = ""
+    TAGS: List[str] = field(default_factory=list)
     CONNECTED: bool = False
     LAST_CONNECTED: Optional[datetime] = None
     LAST_DISCONNECTED: Optional[datetime] = None
 
-    def __init__(self, NAME: str = "", IP: str = "", PORT: str = "", USERNAME: str = "", PASSWORD: str = ""):
+    def __init__(self, NAME: str = "", IP: str = "", PORT: str = "", USERNAME: str = "", PASSWORD: str = "",
+                 GROUP: str = "", TAGS: Optional[List[str]] = None):
         self.NAME = NAME
         self.IP = IP
         self.PORT = PORT
         self.USERNAME = USERNAME
         self.PASSWORD = PASSWORD
+        self.GROUP = GROUP
+        self.TAGS = list(TAGS) if TAGS else []
         self.CONNECTED = False  
         self.LAST_CONNECTED = None  
         self.LAST_DISCONNECTED = None  
@@ -47,6 +52,8 @@ class IDRACConfig:
             'PORT': self.PORT,
             'USERNAME': self.USERNAME,
             'PASSWORD': self.PASSWORD,
+            'GROUP': self.GROUP,
+            'TAGS': list(self.TAGS),
             'CONNECTED': self.CONNECTED,
             'LAST_CONNECTED': self.LAST_CONNECTED,
             'LAST_DISCONNECTED': self.LAST_DISCONNECTED
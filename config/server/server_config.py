@@ -1,8 +1,9 @@
 from config.system.log_config import setup_logging
 from config.data.models import IDRACConfig
+from config.server.server_registry import ServerRegistry
 from utils.server_utils import convert_to_idrac_config
 from utils.config_utils import ConfigManager
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
 # logger 객체 생성
@@ -10,32 +11,36 @@ logger = setup_logging()
 
 class ServerConfig:
     _instance = None
-    _RELOAD_INTERVAL = timedelta(minutes=5)  # 설정 파일 재로드 간격
-    
+    _RELOAD_INTERVAL = timedelta(minutes=5)  # 레지스트리 변경 확인 간격
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ServerConfig, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
-    
+
     def __init__(self):
         if not self._initialized:
             self.config_manager = ConfigManager()
+            self.registry = ServerRegistry(self.config_manager)
             self.servers: Dict[str, IDRACConfig] = {}
             self.observers = []
             self.quick_connect_server = None
             self._last_load_time = None  # 마지막 로드 시간 추적
+            self._revision = 0  # 마지막으로 반영한 레지스트리 리비전
+            self._stored: Dict[str, Dict[str, Any]] = {}  # 레지스트리에 저장된 레코드 스냅샷
             self._initialized = True
+            self.registry.migrate_legacy_config()
             self._load_servers()  # 초기화 시 서버 로드 복원
-    
+
     def _validate_server_config(self, server_info: Dict[str, Any]) -> bool:
         """서버 설정 유효성 검사 메서드"""
         required_keys = ['NAME', 'IP', 'USERNAME', 'PASSWORD']
         return (
-            isinstance(server_info, dict) and 
+            isinstance(server_info, dict) and
             all(key in server_info for key in required_keys)
         )
-    
+
     def _convert_server_to_dict(self, server: IDRACConfig) -> Dict[str, Any]:
         """서버 객체를 딕셔너리로 변환하는 공통 메서드"""
         return {
@@ -43,92 +48,154 @@ class ServerConfig:
             'IP': server.IP,
             'PORT': server.PORT,
             'USERNAME': server.USERNAME,
-            'PASSWORD': server.PASSWORD
+            'PASSWORD': server.PASSWORD,
+            'GROUP': server.GROUP,
+            'TAGS': sorted(server.TAGS)
         }
-    
+
+    def _apply_record(self, server_info: Dict[str, Any]):
+        """레지스트리 레코드를 메모리 서버 객체에 반영 (연결 상태는 유지)"""
+        name = server_info['NAME']
+        server = self.servers.get(name)
+        if server is None:
+            self.servers[name] = convert_to_idrac_config(server_info)
+        else:
+            server.update(IP=server_info['IP'], USERNAME=server_info['USERNAME'],
+                          PASSWORD=server_info['PASSWORD'], NAME=name, PORT=server_info['PORT'])
+            server.GROUP = server_info.get('GROUP', '')
+            server.TAGS = list(server_info.get('TAGS', []))
+        self._stored[name] = self._convert_server_to_dict(self.servers[name])
+
     def load_servers(self) -> Dict[str, IDRACConfig]:
         """외부에서 호출 가능한 서버 정보 로드 메서드"""
         current_time = datetime.now()
-        
-        # 캐시된 데이터 재사용 또는 강제 새로고침
-        if (not self.servers or 
-            not self._last_load_time or 
+
+        # 캐시된 데이터 재사용 또는 변경분 반영
+        if (not self.servers or
+            not self._last_load_time or
             current_time - self._last_load_time > self._RELOAD_INTERVAL):
             return self._load_servers()
-        
+
         return self.servers
-    
+
     def _load_servers(self) -> Dict[str, IDRACConfig]:
-        """서버 정보 로드 (내부 메서드)"""
+        """서버 정보 로드 (내부 메서드)
+
+        레지스트리 리비전이 바뀌지 않았으면 다시 읽지 않고,
+        바뀐 경우에도 변경된 레코드만 복호화해 반영합니다.
+        """
         try:
-            config = self.config_manager.load_config()
-            
-            # 서버 정보 로드
-            self.servers.clear()  # 기존 서버 정보 초기화
-            for name, server_info in config.items():
-                if name != 'quick_connect_server':
+            revision = self.registry.get_revision()
+            if revision != self._revision or not self._last_load_time:
+                changed = self.registry.get_changed_servers(self._revision if self._last_load_time else 0)
+                for server_info in changed:
                     try:
                         if self._validate_server_config(server_info):
-                            self.servers[name] = convert_to_idrac_config(server_info)
+                            self._apply_record(server_info)
                         else:
-                            logger.warning(f"잘못된 서버 설정 형식: {name}")
+                            logger.warning(f"잘못된 서버 설정 형식: {server_info.get('NAME')}")
                     except Exception as e:
-                        logger.error(f"서버 정보 변환 실패 ({name}): {str(e)}")
-            
+                        logger.error(f"서버 정보 변환 실패 ({server_info.get('NAME')}): {str(e)}")
+
+                # 삭제된 서버 정리
+                stored_names = set(self.registry.get_server_names())
+                for name in list(self.servers):
+                    if name not in stored_names:
+                        del self.servers[name]
+                        self._stored.pop(name, None)
+
+                self._revision = revision
+                logger.debug(f"서버 정보 로드 완료: {len(self.servers)}개의 서버 (변경 {len(changed)}개)")
+
             # 빠른 연결 서버 설정 로드
-            self.quick_connect_server = config.get('quick_connect_server')
-            
+            quick_connect_server = self.registry.get_setting('quick_connect_server')
+            if quick_connect_server != self.quick_connect_server and quick_connect_server:
+                logger.info(f"빠른 연결 서버 설정: {quick_connect_server}")
+            self.quick_connect_server = quick_connect_server
+
             # 로드 시간 업데이트
             self._last_load_time = datetime.now()
-            
-            logger.debug(f"서버 정보 로드 완료: {len(self.servers)}개의 서버")
-            if self.quick_connect_server:
-                logger.info(f"빠른 연결 서버 설정: {self.quick_connect_server}")
-            
+
             return self.servers
         except Exception as e:
             logger.error(f"서버 정보 로드 실패: {str(e)}")
             return {}
-    
+
     def save_servers(self):
-        """서버 정보 저장"""
+        """서버 정보 저장
+
+        메모리의 서버 목록을 마지막 저장 상태와 비교해
+        변경/삭제된 레코드만 하나의 트랜잭션으로 레지스트리에 기록합니다.
+        """
         try:
-            # 서버 정보를 딕셔너리로 변환 (공통 메서드 사용)
-            config = {
-                name: self._convert_server_to_dict(server) 
-                for name, server in self.servers.items() 
+            current = {
+                name: self._convert_server_to_dict(server)
+                for name, server in self.servers.items()
                 if isinstance(server, IDRACConfig)
             }
+            upserts = [info for name, info in current.items() if self._stored.get(name) != info]
+            deletes = [name for name in self._stored if name not in current]
+
+            self.registry.apply_changes(upserts, deletes)
+            self._stored = current
+            self._revision = self.registry.get_revision()
 
             # 빠른 연결 서버 설정 저장
-            if self.quick_connect_server:
-                config['quick_connect_server'] = self.quick_connect_server
+            if self.quick_connect_server and self.quick_connect_server not in current:
+                self.quick_connect_server = None
+            self.registry.set_setting('quick_connect_server', self.quick_connect_server)
 
-            # 설정 파일에 저장
-            logger.debug(f"서버 정보 저장 완료: {len(self.servers)}개의 서버")
-            if self.quick_connect_server:
-                logger.info(f"빠른 연결 서버 설정: {self.quick_connect_server}")
-            
-            self.config_manager.save_config(config)
+            logger.debug(f"서버 정보 저장 완료: {len(self.servers)}개의 서버 (변경 {len(upserts)}개, 삭제 {len(deletes)}개)")
             self._notify_observers()
         except Exception as e:
             logger.error(f"서버 정보 저장 실패: {str(e)}")
 
-    def add_server(self, name: str, ip: str, username: str, password: str, port: str):
+    def add_server(self, name: str, ip: str, username: str, password: str, port: str,
+                   group: str = "", tags: Optional[List[str]] = None):
         server_info = {
             'NAME': name,
             'IP': ip,
             'PORT': port,
             'USERNAME': username,
-            'PASSWORD': password
+            'PASSWORD': password,
+            'GROUP': group,
+            'TAGS': tags or []
         }
-        self.servers[name] = convert_to_idrac_config(server_info)
-        self.save_servers()
+        try:
+            self.registry.upsert_server(server_info)
+            self._apply_record(server_info)
+            self._revision = self.registry.get_revision()
+            self._notify_observers()
+        except Exception as e:
+            logger.error(f"서버 추가 실패 ({name}): {str(e)}")
+
+    def rename_server(self, old_name: str, server_info: Dict[str, Any]):
+        """서버 정보 수정 (이름 변경 포함, 단일 트랜잭션)"""
+        try:
+            self.registry.rename_server(old_name, server_info)
+            if old_name != server_info['NAME']:
+                self.servers.pop(old_name, None)
+                self._stored.pop(old_name, None)
+                if self.quick_connect_server == old_name:
+                    self.save_quick_connect_server(server_info['NAME'])
+            self._apply_record(server_info)
+            self._revision = self.registry.get_revision()
+            self._notify_observers()
+        except Exception as e:
+            logger.error(f"서버 정보 수정 실패 ({old_name}): {str(e)}")
 
     def remove_server(self, name: str):
         if name in self.servers:
-            del self.servers[name]
-            self.save_servers()
+            try:
+                self.registry.delete_server(name)
+                del self.servers[name]
+                self._stored.pop(name, None)
+                self._revision = self.registry.get_revision()
+                if self.quick_connect_server == name:
+                    self.save_quick_connect_server(None)
+                self._notify_observers()
+            except Exception as e:
+                logger.error(f"서버 삭제 실패 ({name}): {str(e)}")
 
     def get_server(self, name: str) -> Optional[IDRACConfig]:
         return self.servers.get(name)
@@ -136,6 +203,87 @@ class ServerConfig:
     def get_all_servers(self) -> Dict[str, IDRACConfig]:
         return self.servers
 
+    def find_servers_by_ip(self, ip: str) -> List[IDRACConfig]:
+        """IP 주소로 서버 검색 (인덱스 조회)"""
+        return [self.servers[info['NAME']] for info in self.registry.find_by_ip(ip) if info['NAME'] in self.servers]
+
+    def find_servers_by_tag(self, tag: str) -> List[IDRACConfig]:
+        """태그로 서버 검색 (인덱스 조회)"""
+        return [self.servers[info['NAME']] for info in self.registry.find_by_tag(tag) if info['NAME'] in self.servers]
+
+    def get_servers_in_group(self, group: str) -> List[IDRACConfig]:
+        """그룹에 속한 서버 목록 반환 (인덱스 조회)"""
+        return [self.servers[info['NAME']] for info in self.registry.find_by_group(group) if info['NAME'] in self.servers]
+
+    def get_groups(self) -> List[str]:
+        return self.registry.get_groups()
+
+    def get_tags(self) -> List[str]:
+        return self.registry.get_tags()
+
+    def set_server_group(self, name: str, group: str):
+        """서버 그룹 지정 (해당 레코드만 갱신)"""
+        server = self.servers.get(name)
+        if server:
+            self.add_server(name, server.IP, server.USERNAME, server.PASSWORD, server.PORT,
+                            group=group, tags=server.TAGS)
+
+    def set_server_tags(self, name: str, tags: List[str]):
+        """서버 태그 지정 (해당 레코드만 갱신)"""
+        server = self.servers.get(name)
+        if server:
+            self.add_server(name, server.IP, server.USERNAME, server.PASSWORD, server.PORT,
+                            group=server.GROUP, tags=tags)
+
+    def export_servers(self) -> Dict[str, Dict[str, Any]]:
+        """기존 내보내기 형식과 호환되는 서버 설정 딕셔너리 반환"""
+        export_data = {}
+        for name, server in self.servers.items():
+            entry = {
+                'IP': server.IP,
+                'PORT': getattr(server, 'PORT', '443'),
+                'USERNAME': server.USERNAME,
+                'PASSWORD': server.PASSWORD,
+                'CONNECTED': server.CONNECTED,
+                'LAST_CONNECTED': str(server.LAST_CONNECTED) if server.LAST_CONNECTED else None
+            }
+            # 그룹/태그는 설정된 경우에만 추가 (이전 버전에서도 그대로 가져올 수 있음)
+            if server.GROUP:
+                entry['GROUP'] = server.GROUP
+            if server.TAGS:
+                entry['TAGS'] = list(server.TAGS)
+            export_data[name] = entry
+        return export_data
+
+    def import_servers(self, import_data: Dict[str, Dict[str, Any]]):
+        """내보내기 형식의 서버 설정을 하나의 트랜잭션으로 가져오기
+
+        실패하면 레지스트리는 변경되지 않습니다.
+        """
+        servers = []
+        for name, server_info in import_data.items():
+            if name == 'quick_connect_server':
+                continue
+            servers.append({
+                'NAME': name,
+                'IP': server_info['IP'],
+                'PORT': server_info.get('PORT', '443'),
+                'USERNAME': server_info['USERNAME'],
+                'PASSWORD': server_info['PASSWORD'],
+                'GROUP': server_info.get('GROUP', ''),
+                'TAGS': server_info.get('TAGS', [])
+            })
+
+        self.registry.replace_all(servers)
+        self.servers.clear()
+        self._stored.clear()
+        for server_info in servers:
+            self._apply_record(server_info)
+        self._revision = self.registry.get_revision()
+        if self.quick_connect_server not in self.servers:
+            self.save_quick_connect_server(None)
+        self._notify_observers()
+
     def add_observer(self, observer):
         self.observers.append(observer)
 
@@ -146,8 +294,7 @@ class ServerConfig:
     def set_quick_connect_server(self, name: str):
         """빠른 연결 서버 설정"""
         if name in self.servers:
-            self.quick_connect_server = name
-            self.save_servers()
+            self.save_quick_connect_server(name)
             logger.info(f"빠른 연결 서버 설정: {name}")
 
     def get_quick_connect_server(self) -> Optional[IDRACConfig]:
@@ -164,12 +311,10 @@ class ServerConfig:
             logger.error(f"빠른 연결 서버 정보 조회 실패: {str(e)}")
             return None
 
-    def save_quick_connect_server(self, server_name: str):
-        """빠른 연결 서버 설정 저장"""
+    def save_quick_connect_server(self, server_name: Optional[str]):
+        """빠른 연결 서버 설정 저장 (설정 값 하나만 갱신)"""
         try:
-            config = self.config_manager.load_config()
-            config['quick_connect_server'] = server_name
-            self.config_manager.save_config(config)
+            self.registry.set_setting('quick_connect_server', server_name)
             self.quick_connect_server = server_name
             logger.info(f"빠른 연결 서버 설정 저장: {server_name}")
         except Exception as e:
@@ -0,0 +1,259 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+class ServerRegistry:
+    """인덱스 기반 서버 레지스트리 (SQLite)
+
+    서버 한 대가 레코드 하나이며, 인증 정보는 레코드 단위로 Fernet 암호화됩니다.
+    모든 변경은 단일 트랜잭션으로 처리되고, 변경될 때마다 리비전이 증가하므로
+    변경된 레코드만 다시 읽을 수 있습니다.
+    """
+
+    DB_NAME = "servers.db"
+
+    def __init__(self, config_manager):
+        self.config_manager = config_manager
+        self.fernet = config_manager.fernet
+        self.db_path = config_manager.config_dir / self.DB_NAME
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS servers (
+                    name TEXT PRIMARY KEY,
+                    ip TEXT NOT NULL,
+                    port TEXT NOT NULL DEFAULT '443',
+                    credentials BLOB NOT NULL,
+                    grp TEXT NOT NULL DEFAULT '',
+                    revision INTEGER NOT NULL,
+                    updated TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_servers_ip ON servers(ip);
+                CREATE INDEX IF NOT EXISTS idx_servers_grp ON servers(grp);
+                CREATE INDEX IF NOT EXISTS idx_servers_revision ON servers(revision);
+
+                CREATE TABLE IF NOT EXISTS server_tags (
+                    name TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (name, tag)
+                );
+                CREATE INDEX IF NOT EXISTS idx_server_tags_tag ON server_tags(tag);
+
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    # --- 내부 유틸리티 ---
+
+    def _encrypt_credentials(self, username: str, password: str) -> bytes:
+        return self.fernet.encrypt(json.dumps({'USERNAME': username, 'PASSWORD': password}).encode())
+
+    def _decrypt_credentials(self, token: bytes) -> Dict[str, str]:
+        return json.loads(self.fernet.decrypt(token))
+
+    def _next_revision(self) -> int:
+        row = self._conn.execute("SELECT value FROM settings WHERE key = 'revision'").fetchone()
+        revision = int(row['value']) + 1 if row else 1
+        self._conn.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES ('revision', ?)", (str(revision),))
+        return revision
+
+    def _write_record(self, server_info: Dict[str, Any], revision: int):
+        name = server_info['NAME']
+        self._conn.execute(
+            """INSERT OR REPLACE INTO servers (name, ip, port, credentials, grp, revision, updated)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (
+                name,
+                server_info['IP'],
+                server_info.get('PORT') or '443',
+                self._encrypt_credentials(server_info['USERNAME'], server_info['PASSWORD']),
+                server_info.get('GROUP', '') or '',
+                revision,
+                datetime.now().isoformat()
+            )
+        )
+        self._conn.execute("DELETE FROM server_tags WHERE name = ?", (name,))
+        tags = {tag.strip() for tag in server_info.get('TAGS', []) or [] if tag and tag.strip()}
+        self._conn.executemany(
+            "INSERT INTO server_tags (name, tag) VALUES (?, ?)", [(name, tag) for tag in sorted(tags)])
+
+    def _row_to_dict(self, row: sqlite3.Row) -> Optional[Dict[str, Any]]:
+        try:
+            credentials = self._decrypt_credentials(row['credentials'])
+        except Exception as e:
+            logger.error(f"서버 인증 정보 복호화 실패 ({row['name']}): {str(e)}")
+            return None
+        tags = [r['tag'] for r in self._conn.execute(
+            "SELECT tag FROM server_tags WHERE name = ? ORDER BY tag", (row['name'],))]
+        return {
+            'NAME': row['name'],
+            'IP': row['ip'],
+            'PORT': row['port'],
+            'USERNAME': credentials.get('USERNAME', ''),
+            'PASSWORD': credentials.get('PASSWORD', ''),
+            'GROUP': row['grp'],
+            'TAGS': tags
+        }
+
+    def _fetch(self, query: str, params: Iterable = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(query, tuple(params)).fetchall()
+            return [record for record in (self._row_to_dict(row) for row in rows) if record]
+
+    # --- 레코드 단위 변경 ---
+
+    def upsert_server(self, server_info: Dict[str, Any]):
+        """서버 레코드 하나를 원자적으로 추가/갱신"""
+        with self._lock, self._conn:
+            self._write_record(server_info, self._next_revision())
+
+    def delete_server(self, name: str) -> bool:
+        """서버 레코드 하나를 원자적으로 삭제"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM servers WHERE name = ?", (name,))
+            if cursor.rowcount:
+                self._conn.execute("DELETE FROM server_tags WHERE name = ?", (name,))
+                self._next_revision()
+            return cursor.rowcount > 0
+
+    def rename_server(self, old_name: str, server_info: Dict[str, Any]):
+        """이름 변경을 포함한 서버 갱신을 하나의 트랜잭션으로 처리"""
+        with self._lock, self._conn:
+            revision = self._next_revision()
+            if old_name != server_info['NAME']:
+                self._conn.execute("DELETE FROM server_tags WHERE name = ?", (old_name,))
+                self._conn.execute("DELETE FROM servers WHERE name = ?", (old_name,))
+            self._write_record(server_info, revision)
+
+    def apply_changes(self, upserts: List[Dict[str, Any]], deletes: List[str]):
+        """여러 레코드의 추가/갱신/삭제를 하나의 트랜잭션으로 적용"""
+        if not upserts and not deletes:
+            return
+        with self._lock, self._conn:
+            revision = self._next_revision()
+            for name in deletes:
+                self._conn.execute("DELETE FROM server_tags WHERE name = ?", (name,))
+                self._conn.execute("DELETE FROM servers WHERE name = ?", (name,))
+            for server_info in upserts:
+                self._write_record(server_info, revision)
+
+    def replace_all(self, servers: List[Dict[str, Any]]):
+        """전체 레코드를 하나의 트랜잭션으로 교체 (가져오기 용도)"""
+        with self._lock, self._conn:
+            revision = self._next_revision()
+            self._conn.execute("DELETE FROM server_tags")
+            self._conn.execute("DELETE FROM servers")
+            for server_info in servers:
+                self._write_record(server_info, revision)
+
+    # --- 조회 ---
+
+    def get_revision(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM settings WHERE key = 'revision'").fetchone()
+            return int(row['value']) if row else 0
+
+    def get_server(self, name: str) -> Optional[Dict[str, Any]]:
+        records = self._fetch("SELECT * FROM servers WHERE name = ?", (name,))
+        return records[0] if records else None
+
+    def get_all_servers(self) -> List[Dict[str, Any]]:
+        return self._fetch("SELECT * FROM servers ORDER BY name")
+
+    def get_changed_servers(self, since_revision: int) -> List[Dict[str, Any]]:
+        """지정한 리비전 이후 변경된 레코드만 반환"""
+        return self._fetch("SELECT * FROM servers WHERE revision > ?", (since_revision,))
+
+    def get_server_names(self) -> List[str]:
+        with self._lock:
+            return [row['name'] for row in self._conn.execute("SELECT name FROM servers")]
+
+    def find_by_ip(self, ip: str) -> List[Dict[str, Any]]:
+        return self._fetch("SELECT * FROM servers WHERE ip = ?", (ip,))
+
+    def find_by_group(self, group: str) -> List[Dict[str, Any]]:
+        return self._fetch("SELECT * FROM servers WHERE grp = ? ORDER BY name", (group,))
+
+    def find_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        return self._fetch(
+            """SELECT s.* FROM servers s JOIN server_tags t ON s.name = t.name
+               WHERE t.tag = ? ORDER BY s.name""", (tag,))
+
+    def get_groups(self) -> List[str]:
+        with self._lock:
+            return [row['grp'] for row in self._conn.execute(
+                "SELECT DISTINCT grp FROM servers WHERE grp != '' ORDER BY grp")]
+
+    def get_tags(self) -> List[str]:
+        with self._lock:
+            return [row['tag'] for row in self._conn.execute(
+                "SELECT DISTINCT tag FROM server_tags ORDER BY tag")]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM servers").fetchone()[0]
+
+    # --- 설정 값 ---
+
+    def get_setting(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+            return row['value'] if row else None
+
+    def set_setting(self, key: str, value: Optional[str]):
+        with self._lock, self._conn:
+            if value is None:
+                self._conn.execute("DELETE FROM settings WHERE key = ?", (key,))
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
+
+    # --- 기존 형식 호환 ---
+
+    def migrate_legacy_config(self) -> bool:
+        """기존 config.enc(전체 암호화 JSON) 내용을 레지스트리로 1회 이관"""
+        if self.get_setting('legacy_migrated') or self.count():
+            return False
+        try:
+            legacy = self.config_manager.load_config()
+            servers = [
+                dict(info, NAME=info.get('NAME') or name)
+                for name, info in legacy.items()
+                if name != 'quick_connect_server' and isinstance(info, dict)
+                and all(key in info for key in ('IP', 'USERNAME', 'PASSWORD'))
+            ]
+            with self._lock, self._conn:
+                revision = self._next_revision()
+                for server_info in servers:
+                    self._write_record(server_info, revision)
+                if legacy.get('quick_connect_server'):
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO settings (key, value) VALUES ('quick_connect_server', ?)",
+                        (legacy['quick_connect_server'],))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO settings (key, value) VALUES ('legacy_migrated', ?)",
+                    (datetime.now().isoformat(),))
+            if servers:
+                logger.info(f"기존 서버 설정 이관 완료: {len(servers)}개의 서버")
+            return True
+        except Exception as e:
+            logger.error(f"기존 서버 설정 이관 실패: {str(e)}")
+            return False
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import json
 import os
 import sys
 from pathlib import Path
@@ -65,132 +68,200 @@ class ResourceManager:
         lib_dir.mkdir(parents=True, exist_ok=True)
         return lib_dir
 
+    # 번들 리소스 매니페스트 (앱 버전 + 파일별 콘텐츠 해시)
+    MANIFEST_NAME = 'resource_manifest.json'
+    ICON_FILES = [
+        'boot_icon.png', 'cpu_icon.png', 'device_icon.png',
+        'idrac_icon.png', 'misc_icon.png', 'network_icon.png',
+        'nic_icon.png', 'power_icon.png', 'profile_icon.png',
+        'system_icon.png'
+    ]
+    CONFIG_FILES = {
+        'server': ['server_config.json'],
+        'data': ['data_config.json']
+    }
+
+    # UI 모듈이 공유하는 메모리 아이콘/픽스맵 캐시
+    _pixmap_cache = {}
+    _icon_cache = {}
+
     @classmethod
-    def preload_resources(cls):
-        """자주 사용되는 리소스를 메모리에 미리 로드"""
+    def get_app_version(cls):
+        """애플리케이션 버전 반환"""
         try:
-            # 핵심 라이브러리 추출
-            cls.extract_core_libraries()
-            
-            # 자주 사용되는 아이콘 파일 미리 로드
-            icon_dir = cls.get_resource_dir() / 'icon'
-            if icon_dir.exists():
-                for icon in icon_dir.glob('*.png'):
-                    try:
-                        with open(icon, 'rb') as f:
-                            f.read()
-                    except Exception as e:
-                        logging.error(f"아이콘 프리로드 실패 ({icon.name}): {e}")
-                        
-        except Exception as e:
-            logging.error(f"리소스 프리로드 실패: {e}", exc_info=True)
+            from version import __version__
+            return __version__
+        except ImportError:
+            return '0.0.0'
 
     @classmethod
-    def extract_core_libraries(cls):
-        """핵심 라이브러리를 라이브러리 디렉토리로 추출하고 경로 설정"""
+    def get_manifest_path(cls):
+        """현재 버전의 리소스 매니페스트 경로 반환"""
+        return cls.get_resource_dir() / f"{cls.get_app_version()}-{cls.MANIFEST_NAME}"
+
+    @staticmethod
+    def _hash_file(path, chunk_size=65536):
+        """파일 콘텐츠의 SHA-256 해시 계산"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def _iter_package_resources(cls, base_path):
+        """번들 내 추출 대상 리소스의 (원본, 대상 상대경로) 목록 생성"""
+        resource_files = []
+
+        # PyQt6 번역 파일
+        qt_translations = os.path.join(base_path, 'PyQt6', 'Qt6', 'translations')
+        if os.path.exists(qt_translations):
+            for file in os.listdir(qt_translations):
+                if file.endswith('.qm'):
+                    resource_files.append((
+                        os.path.join(qt_translations, file),
+                        Path('translations', 'PyQt6', 'Qt6', 'translations', file)
+                    ))
+
+        # 아이콘 파일
+        for icon in cls.ICON_FILES:
+            resource_files.append((os.path.join(base_path, 'icon', icon), Path('icon', icon)))
+
+        # 설정 파일
+        for subdir, files in cls.CONFIG_FILES.items():
+            for file in files:
+                resource_files.append((
+                    os.path.join(base_path, 'config', subdir, file),
+                    Path('config', subdir, file)
+                ))
+
+        return [(src, rel) for src, rel in resource_files if os.path.exists(src)]
+
+    @classmethod
+    def load_manifest(cls):
+        """현재 버전의 매니페스트 로드 (없거나 손상된 경우 None)"""
+        try:
+            with open(cls.get_manifest_path(), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != cls.get_app_version():
+                return None
+            return manifest
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def preload_resources(cls):
+        """리소스 매니페스트 확인 후 필요한 경우에만 번들 리소스 추출
+
+        추출은 릴리스당 한 번만 수행되며, 이후 실행에서는
+        버전별 매니페스트 파일의 존재 여부(stat 1회)만 확인합니다.
+        아이콘은 실제로 사용될 때 get_pixmap/get_icon 캐시로 로드됩니다.
+        """
         if not getattr(sys, 'frozen', False):
             return
-        
-        lib_dir = cls.get_lib_dir()
-        base_path = sys._MEIPASS
-        
+
         try:
-            # 라이브러리 디렉토리를 Python 경로에 추가
-            if str(lib_dir) not in sys.path:
-                sys.path.insert(0, str(lib_dir))
-            
-            core_libs = {
-                'PyQt6': ['QtCore', 'QtGui', 'QtWidgets'],
-                'cryptography': ['fernet'],
-                'numpy': ['core', 'lib'],
-                'pandas': ['core']
-            }
-            
-            for lib, modules in core_libs.items():
-                lib_path = os.path.join(base_path, lib)
-                if os.path.exists(lib_path):
-                    dst_path = lib_dir / lib
-                    if not dst_path.exists():
-                        shutil.copytree(lib_path, dst_path)
-                        print(f"라이브러리 추출 완료: {lib}")
-                        
-                    # 라이브러리별 경로 설정
-                    lib_specific_path = str(dst_path)
-                    if lib_specific_path not in sys.path:
-                        sys.path.insert(0, lib_specific_path)
-                        
+            if cls.get_manifest_path().exists():
+                return
+            cls.extract_package_resources()
         except Exception as e:
-            logging.error(f"라이브러리 추출 실패: {e}", exc_info=True)
+            logging.error(f"리소스 프리로드 실패: {e}", exc_info=True)
 
     @classmethod
     def extract_package_resources(cls):
-        """패키지 리소스를 라이브러리 디렉토리로 추출"""
+        """변경된 패키지 리소스만 추출하고 버전별 매니페스트 기록"""
         if not getattr(sys, 'frozen', False):
             return
-            
+
         resource_dir = cls.get_resource_dir()
         base_path = sys._MEIPASS
-        
+
         try:
-            # PyQt6 번역 파일 복사
-            translations_dir = resource_dir / 'translations' / 'PyQt6' / 'Qt6' / 'translations'
-            translations_dir.mkdir(parents=True, exist_ok=True)
-            qt_translations = os.path.join(base_path, 'PyQt6', 'Qt6', 'translations')
-            if os.path.exists(qt_translations):
-                for file in os.listdir(qt_translations):
-                    if file.endswith('.qm'):
-                        src = os.path.join(qt_translations, file)
-                        dst = translations_dir / file
-                        try:
-                            if not dst.exists() and os.path.exists(src):
-                                shutil.copy2(src, dst)
-                                print(f"번역 파일 복사 완료: {file}")
-                        except Exception as e:
-                            print(f"번역 파일 복사 실패 ({file}): {e}")
-            
-            # 아이콘 파일 복사
-            icon_files = [
-                'boot_icon.png', 'cpu_icon.png', 'device_icon.png',
-                'idrac_icon.png', 'misc_icon.png', 'network_icon.png',
-                'nic_icon.png', 'power_icon.png', 'profile_icon.png',
-                'system_icon.png'
-            ]
-            icon_dir = resource_dir / 'icon'
-            icon_dir.mkdir(parents=True, exist_ok=True)
-            for icon in icon_files:
-                src = os.path.join(base_path, 'icon', icon)
-                dst = icon_dir / icon
+            # 이전 버전 매니페스트의 해시와 비교해 바뀐 파일만 복사
+            previous_files = {}
+            for old_manifest in resource_dir.glob(f"*-{cls.MANIFEST_NAME}"):
+                try:
+                    with open(old_manifest, 'r', encoding='utf-8') as f:
+                        previous_files.update(json.load(f).get('files', {}))
+                except (OSError, ValueError):
+                    pass
+
+            files = {}
+            copied = 0
+            for src, rel_path in cls._iter_package_resources(base_path):
+                key = rel_path.as_posix()
                 try:
-                    if not dst.exists() and os.path.exists(src):
+                    digest = cls._hash_file(src)
+                    dst = resource_dir / rel_path
+                    if previous_files.get(key) != digest or not dst.exists():
+                        dst.parent.mkdir(parents=True, exist_ok=True)
                         shutil.copy2(src, dst)
-                        print(f"아이콘 파일 복사 완료: {icon}")
+                        copied += 1
+                    files[key] = digest
                 except Exception as e:
-                    print(f"아이콘 파일 복사 실패 ({icon}): {e}")
-            
-            # 설정 파일 복사
-            config_files = {
-                'server': ['server_config.json'],
-                'data': ['data_config.json']
+                    logging.error(f"리소스 파일 추출 실패 ({key}): {e}")
+
+            manifest = {
+                'version': cls.get_app_version(),
+                'created': datetime.now().isoformat(),
+                'files': files
             }
-            
-            config_dir = resource_dir / 'config'
-            for subdir, files in config_files.items():
-                subdir_path = config_dir / subdir
-                subdir_path.mkdir(parents=True, exist_ok=True)
-                for file in files:
-                    src = os.path.join(base_path, 'config', subdir, file)
-                    dst = subdir_path / file
-                    try:
-                        if not dst.exists() and os.path.exists(src):
-                            shutil.copy2(src, dst)
-                            print(f"설정 파일 복사 완료: {file}")
-                    except Exception as e:
-                        print(f"설정 파일 복사 실패 ({file}): {e}")
-                        
+            manifest_path = cls.get_manifest_path()
+            temp_path = manifest_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(temp_path, manifest_path)
+
+            # 이전 버전 매니페스트 정리
+            for old_manifest in resource_dir.glob(f"*-{cls.MANIFEST_NAME}"):
+                if old_manifest != manifest_path:
+                    old_manifest.unlink(missing_ok=True)
+
+            logging.info(f"리소스 매니페스트 갱신 완료: {len(files)}개 파일 중 {copied}개 추출")
+
         except Exception as e:
-            print(f"리소스 추출 중 오류 발생: {e}")
             logging.error(f"리소스 추출 중 오류 발생: {e}", exc_info=True)
 
+    @classmethod
+    def find_icon_path(cls, icon_name):
+        """아이콘 파일 경로 탐색 (추출 디렉토리 → 번들 → 소스 트리 순)"""
+        candidates = [cls.get_resource_dir() / 'icon' / icon_name]
+        if getattr(sys, 'frozen', False):
+            candidates.append(Path(sys._MEIPASS) / 'icon' / icon_name)
+        candidates.append(Path(__file__).resolve().parents[2] / 'icon' / icon_name)
+
+        for path in candidates:
+            if path.exists():
+                return path
+        return None
+
+    @classmethod
+    def get_pixmap(cls, icon_name):
+        """아이콘 QPixmap 반환 (프로세스 내 캐시 공유)"""
+        if icon_name in cls._pixmap_cache:
+            return cls._pixmap_cache[icon_name]
+
+        from PyQt6.QtGui import QPixmap
+
+        icon_path = cls.find_icon_path(icon_name)
+        pixmap = QPixmap(str(icon_path)) if icon_path else QPixmap()
+        if pixmap.isNull():
+            logging.warning(f"아이콘 파일을 찾을 수 없습니다: {icon_name}")
+        cls._pixmap_cache[icon_name] = pixmap
+        return pixmap
+
+    @classmethod
+    def get_icon(cls, icon_name):
+        """아이콘 QIcon 반환 (프로세스 내 캐시 공유)"""
+        if icon_name in cls._icon_cache:
+            return cls._icon_cache[icon_name]
+
+        from PyQt6.QtGui import QIcon
+
+        icon = QIcon(cls.get_pixmap(icon_name))
+        cls._icon_cache[icon_name] = icon
+        return icon
+
     @classmethod
     def setup_directories(cls):
         """
@@ -1,8 +1,13 @@
+import atexit
 from datetime import datetime
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+import queue
+import re
 from .app_config import ResourceManager
+from .log_index import LogIndexWriter
 
 # 상수 정의
 LOG_FILE_MAX_SIZE = 1 * 1024 * 1024  # 1MB
@@ -10,8 +15,52 @@ LOG_FILE_BACKUP_COUNT = 5
 LOG_FORMAT = '%(asctime)s - [%(process)d] - %(name)s - %(levelname)s - [서버: %(server)s] - %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 LOGGER_NAME = 'dell_idrac_monitor'
+# 로그 파일 형식: 'text' (기본) 또는 'json' (한 줄에 JSON 객체 하나)
+LOG_FILE_FORMAT = os.environ.get('DELL_IDRAC_LOG_FORMAT', 'text').lower()
+
+class JsonLineFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나를 기록하는 구조화 로그 포맷터"""
+
+    def format(self, record):
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{self.formatStack(record.stack_info)}"
+        return json.dumps({
+            'ts': self.formatTime(record, self.datefmt),
+            'level': record.levelname,
+            'server': getattr(record, 'server', 'SYSTEM'),
+            'message': message,
+            'pid': record.process,
+            'name': record.name
+        }, ensure_ascii=False)
 
 class TimestampRotatingFileHandler(RotatingFileHandler):
+    # 레코드 기록 후 호출되는 콜백 (예: 검색 인덱서 깨우기)
+    _write_listeners = []
+
+    @classmethod
+    def add_write_listener(cls, callback):
+        if callback not in cls._write_listeners:
+            cls._write_listeners.append(callback)
+
+    @classmethod
+    def remove_write_listener(cls, callback):
+        if callback in cls._write_listeners:
+            cls._write_listeners.remove(callback)
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        # 레코드별 바이트 오프셋/시간/레벨/서버 사이드카 인덱스
+        self.index = LogIndexWriter(self.baseFilename)
+        try:
+            self.index.open()
+        except Exception:
+            self.index = None
+
     def rotation_filename(self, default_name):
         # 개발 모드와 배포 모드 모두에서 동일한 로그 파일 이름 생성
         dir_name = os.path.dirname(default_name)
@@ -22,8 +71,75 @@ class TimestampRotatingFileHandler(RotatingFileHandler):
     def rotate(self, source, dest):
         if os.path.exists(source):
             os.rename(source, dest)
+            LogIndexWriter.rotate(source, dest)
+
+    def doRollover(self):
+        # RotatingFileHandler.doRollover와 같은 순서로 백업을 밀어내되,
+        # 이동/삭제하는 모든 백업 파일의 사이드카 인덱스도 함께 옮기거나 삭제
+        if self.index is not None:
+            self.index.close()
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backupCount > 0:
+            for i in range(self.backupCount - 1, 0, -1):
+                source = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dest = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(source):
+                    if os.path.exists(dest):
+                        os.remove(dest)
+                    LogIndexWriter.remove(dest)
+                    self.rotate(source, dest)
+            dest = self.rotation_filename(self.baseFilename + ".1")
+            if os.path.exists(dest):
+                os.remove(dest)
+            LogIndexWriter.remove(dest)
+            self.rotate(self.baseFilename, dest)
+        if not self.delay:
+            self.stream = self._open()
+        if self.index is not None:
+            self.index.reset()
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            offset = self.stream.tell()
+            logging.FileHandler.emit(self, record)
+            if self.index is not None:
+                self.index.append(offset, record.created, record.levelname,
+                                  getattr(record, 'server', 'SYSTEM'))
+            for callback in self._write_listeners:
+                callback()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        super().flush()
+        if getattr(self, 'index', None) is not None:
+            self.index.flush()
+
+    def close(self):
+        if getattr(self, 'index', None) is not None:
+            self.index.close()
+        super().close()
 
 class ConnectionLogFilter(logging.Filter):
+    # 미리 컴파일된 메시지 분류 패턴
+    # 대부분의 로그는 _CLASSIFY_PATTERN 한 번의 검색으로 통과 여부가 결정됨
+    _CLASSIFY_PATTERN = re.compile(
+        r"\[펌웨어 업데이트\]|연결 상태 업데이트|서버 연결 성공|Redfish API 요청|시스템 상태|정보 업데이트"
+    )
+    _FIRMWARE_PATTERN = re.compile(r"\[펌웨어 업데이트\]")
+    _CONNECTION_PATTERN = re.compile(r"연결 상태 업데이트|서버 연결 성공")
+    _DISCONNECTED_PATTERN = re.compile(r"연결 끊김|서버 연결 거부됨")
+    _CONNECTED_PATTERN = re.compile(r"연결됨|서버 연결 성공")
+    _DEGRADED_PATTERN = re.compile(r"응답 없음|연결 실패|응답 지연")
+    _REDFISH_PATTERN = re.compile(r"Redfish API 요청")
+    _LOG_ENTRY_PATTERN = re.compile(r"로그 엔트리 조회")
+
     def __init__(self):
         super().__init__()
         self.last_status = None
@@ -31,42 +147,41 @@ class ConnectionLogFilter(logging.Filter):
 
     def filter(self, record):
         try:
+            msg = record.msg if isinstance(record.msg, str) else str(record.msg)
+
+            # 분류 대상이 아닌 일반 로그는 바로 허용
+            if not self._CLASSIFY_PATTERN.search(msg):
+                return True
 
             # 펌웨어 업데이트 관련 로그는 항상 허용
-            if "[펌웨어 업데이트]" in str(record.msg):
+            if self._FIRMWARE_PATTERN.search(msg):
                 return True
-            if "연결 상태 업데이트" in str(record.msg) or "서버 연결 성공" in str(record.msg):
-                if ("연결 끊김" in str(record.msg) or "서버 연결 거부됨" in str(record.msg)) and self.is_connected:
+            if self._CONNECTION_PATTERN.search(msg):
+                if self._DISCONNECTED_PATTERN.search(msg) and self.is_connected:
                     self.is_connected = False
                     return True
-                elif ("연결됨" in str(record.msg) or "서버 연결 성공" in str(record.msg)) and not self.is_connected:
+                elif self._CONNECTED_PATTERN.search(msg) and not self.is_connected:
                     self.is_connected = True
                     return True
-                elif "응답 없음" in str(record.msg) or "연결 실패" in str(record.msg) or "응답 지연" in str(record.msg):
+                elif self._DEGRADED_PATTERN.search(msg):
                     return True
                 return False
-                
-            if "Redfish API 요청" in str(record.msg):
+
+            if self._REDFISH_PATTERN.search(msg):
                 # SEL 및 LC 로그 엔트리 조회는 로깅하지 않음
-                if "로그 엔트리 조회" in str(record.msg):
+                if self._LOG_ENTRY_PATTERN.search(msg):
                     return False
-                
+
                 # 현재 활성 서버 상태 유지
                 record.server = _current_active_server
-                
+
                 return record.levelno == logging.DEBUG
-                
-            if "시스템 상태" in str(record.msg) or "정보 업데이트" in str(record.msg):
-                current_status = str(record.msg)
-                if current_status != self.last_status:
-                    self.last_status = current_status
-                    return True
-                return False
-                
-            if any(msg in str(record.msg) for msg in ["애플리케이션 시작", "애플리케이션 종료", "리소스 정리"]):
+
+            # 시스템 상태/정보 업데이트는 내용이 바뀐 경우에만 기록
+            if msg != self.last_status:
+                self.last_status = msg
                 return True
-                
-            return True
+            return False
         except Exception as e:
             # 예외 발생 시 기본적으로 로그를 허용
             return True
@@ -111,7 +226,18 @@ def get_logger(name=LOGGER_NAME, server=None):
     
     return ServerLoggerAdapter(logger, {})
 
+_queue_listener = None
+
 def setup_logging():
+    """
+    로깅 파이프라인 설정
+
+    로거에는 QueueHandler 하나만 연결되어 호출 스레드에서는 필터 적용 후
+    큐에 넣기만 하고, 파일/콘솔 출력은 QueueListener 스레드에서 처리합니다.
+    필터는 QueueHandler에서 레코드당 한 번만 실행됩니다.
+    """
+    global _queue_listener
+
     logger = get_logger(LOGGER_NAME)
     if logger.logger.handlers:
         return logger
@@ -129,29 +255,41 @@ def setup_logging():
     )
     file_handler.setLevel(logging.DEBUG)
     
-    # 기본 서버 정보를 제공하는 필터 추가
-    default_server_filter = DefaultServerFilter()
-    file_handler.addFilter(default_server_filter)
-    logger.logger.addFilter(default_server_filter)
-    
     formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
-    file_handler.setFormatter(formatter)
-    
-    connection_filter = ConnectionLogFilter()
-    file_handler.addFilter(connection_filter)
-    logger.logger.addFilter(connection_filter)
-    
-    logger.logger.addHandler(file_handler)
+    if LOG_FILE_FORMAT == 'json':
+        file_handler.setFormatter(JsonLineFormatter(datefmt=LOG_DATE_FORMAT))
+    else:
+        file_handler.setFormatter(formatter)
     
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)  # 콘솔 로그 레벨을 DEBUG로 변경
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(default_server_filter)
-    console_handler.addFilter(connection_filter)  # 콘솔에도 동일한 필터 적용
-    logger.logger.addHandler(console_handler)
+    
+    # 호출 스레드 쪽: 서버 정보 기본값 + 연결 로그 필터를 한 번만 적용
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.setLevel(logging.DEBUG)
+    queue_handler.addFilter(DefaultServerFilter())
+    queue_handler.addFilter(ConnectionLogFilter())
+    logger.logger.addHandler(queue_handler)
+    
+    # 출력 스레드 쪽: 파일/콘솔 기록
+    _queue_listener = QueueListener(
+        queue_handler.queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(shutdown_logging)
     
     return logger
 
+def shutdown_logging():
+    """큐에 남은 로그를 모두 기록하고 출력 스레드 종료"""
+    global _queue_listener
+    if _queue_listener is not None:
+        try:
+            _queue_listener.stop()
+        finally:
+            _queue_listener = None
+
 # 기존 로깅 함수들 수정
 def log_connection_status(status):
     logger = get_logger(LOGGER_NAME)
@@ -0,0 +1,330 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import json
+import os
+import re
+import struct
+
+# 사이드카 인덱스 레코드: 로그 파일 내 바이트 오프셋, 기록 시각(epoch 초), 레벨 코드, 서버 ID
+INDEX_RECORD = struct.Struct('<QIBH')
+INDEX_SUFFIX = '.idx'
+SERVER_TABLE_SUFFIX = '.idx.servers'
+
+LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+_LEVEL_CODES = {level: code for code, level in enumerate(LOG_LEVELS)}
+_UNKNOWN_LEVEL = 255
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 텍스트 로그 형식: 2025-01-07 23:43:47 - [87281] - dell_idrac_monitor - INFO - [서버: SYSTEM] - 메시지
+_TEXT_LINE_PATTERN = re.compile(
+    r'^(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - \[(?P<pid>\d+)\] - (?P<name>\S+) - '
+    r'(?P<level>[A-Z]+) - \[서버: (?P<server>.*?)\] - (?P<message>.*)$'
+)
+
+def parse_log_line(line):
+    """로그 한 줄(텍스트 또는 JSON 형식)을 ts/level/server/message 딕셔너리로 변환"""
+    line = line.rstrip('\r\n')
+    if line.startswith('{'):
+        try:
+            data = json.loads(line)
+            return {
+                'ts': data.get('ts', ''),
+                'level': data.get('level', ''),
+                'server': data.get('server', 'SYSTEM'),
+                'message': data.get('message', ''),
+                'pid': data.get('pid', ''),
+                'name': data.get('name', '')
+            }
+        except ValueError:
+            return None
+
+    match = _TEXT_LINE_PATTERN.match(line)
+    if not match:
+        return None
+    return match.groupdict()
+
+def format_log_entry(entry):
+    """파싱된 로그 항목을 기존 텍스트 로그 형식의 한 줄로 변환"""
+    return (f"{entry.get('ts', '')} - [{entry.get('pid', '')}] - {entry.get('name', '')} - "
+            f"{entry.get('level', '')} - [서버: {entry.get('server', 'SYSTEM')}] - {entry.get('message', '')}")
+
+def _parse_timestamp(ts):
+    try:
+        return int(datetime.strptime(ts[:19], TIMESTAMP_FORMAT).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+class LogIndexWriter:
+    """회전 로그 핸들러가 유지하는 사이드카 인덱스 기록기
+
+    레코드를 쓸 때마다 고정 길이(15바이트) 인덱스 항목을 추가하며,
+    서버 이름은 별도 테이블 파일에 한 줄씩 저장하고 줄 번호를 ID로 사용합니다.
+    """
+
+    def __init__(self, log_path):
+        self.log_path = str(log_path)
+        self.index_path = self.log_path + INDEX_SUFFIX
+        self.server_table_path = self.log_path + SERVER_TABLE_SUFFIX
+        self._index_file = None
+        self._server_file = None
+        self._server_ids = {}
+        self._last_offset = -1
+
+    def open(self):
+        """기존 인덱스를 이어서 쓰기 위해 열기 (로그 파일과 불일치하면 재구성)"""
+        self.close()
+        log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+
+        if not self._is_consistent(log_size):
+            LogIndex.build(self.log_path)
+
+        self._server_ids = {}
+        if os.path.exists(self.server_table_path):
+            with open(self.server_table_path, 'r', encoding='utf-8') as f:
+                for server_id, name in enumerate(f.read().split('\n')[:-1]):
+                    self._server_ids[name] = server_id
+
+        self._last_offset = -1
+        if os.path.exists(self.index_path):
+            size = os.path.getsize(self.index_path)
+            if size >= INDEX_RECORD.size:
+                with open(self.index_path, 'rb') as f:
+                    f.seek(size - size % INDEX_RECORD.size - INDEX_RECORD.size)
+                    self._last_offset = INDEX_RECORD.unpack(f.read(INDEX_RECORD.size))[0]
+
+        self._index_file = open(self.index_path, 'ab')
+        self._server_file = open(self.server_table_path, 'a', encoding='utf-8')
+
+    def _is_consistent(self, log_size):
+        if not os.path.exists(self.index_path) or not os.path.exists(self.server_table_path):
+            return log_size == 0 and not os.path.exists(self.index_path)
+        index_size = os.path.getsize(self.index_path)
+        if index_size % INDEX_RECORD.size:
+            return False
+        if index_size == 0:
+            return log_size == 0
+        with open(self.index_path, 'rb') as f:
+            f.seek(index_size - INDEX_RECORD.size)
+            last_offset = INDEX_RECORD.unpack(f.read(INDEX_RECORD.size))[0]
+        return last_offset < log_size
+
+    def _server_id(self, server):
+        server = (server or 'SYSTEM').replace('\n', ' ')
+        server_id = self._server_ids.get(server)
+        if server_id is None:
+            server_id = len(self._server_ids)
+            self._server_ids[server] = server_id
+            self._server_file.write(server + '\n')
+            self._server_file.flush()
+        return server_id
+
+    def append(self, offset, created, level, server):
+        """레코드 하나의 인덱스 항목 추가
+
+        로그 핸들러가 레코드마다 로그 파일을 flush하므로, 인덱스도 바로 flush해
+        조회 쪽에서 마지막 레코드가 인덱스에 빠진 채로 보이지 않게 합니다.
+        """
+        if self._index_file is None:
+            self.open()
+        self._index_file.write(INDEX_RECORD.pack(
+            offset,
+            int(created),
+            _LEVEL_CODES.get(level, _UNKNOWN_LEVEL),
+            self._server_id(server)
+        ))
+        self._index_file.flush()
+        self._last_offset = offset
+
+    def flush(self):
+        if self._index_file is not None:
+            self._index_file.flush()
+
+    def close(self):
+        for f in (self._index_file, self._server_file):
+            if f is not None:
+                try:
+                    f.close()
+                except Exception:
+                    pass
+        self._index_file = None
+        self._server_file = None
+
+    def reset(self):
+        """로그 회전 후 새 파일용 빈 인덱스 시작"""
+        self.close()
+        for path in (self.index_path, self.server_table_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.open()
+
+    @staticmethod
+    def rotate(source, dest):
+        """로그 파일 회전 시 사이드카 인덱스도 함께 이름 변경 (원본에 없으면 대상의 이전 인덱스 삭제)"""
+        for suffix in (INDEX_SUFFIX, SERVER_TABLE_SUFFIX):
+            if os.path.exists(source + suffix):
+                os.replace(source + suffix, dest + suffix)
+            elif os.path.exists(dest + suffix):
+                os.remove(dest + suffix)
+
+    @staticmethod
+    def remove(log_path):
+        """로그 파일의 사이드카 인덱스 삭제"""
+        for suffix in (INDEX_SUFFIX, SERVER_TABLE_SUFFIX):
+            if os.path.exists(log_path + suffix):
+                os.remove(log_path + suffix)
+
+class LogIndex:
+    """사이드카 인덱스 조회기
+
+    인덱스만 읽어 레벨/서버/시간 조건에 맞는 레코드 위치를 찾고,
+    로그 파일에서는 해당 레코드만 직접 seek 해서 읽습니다.
+    """
+
+    def __init__(self, log_path, records=None, servers=None):
+        self.log_path = str(log_path)
+        self.offsets = []
+        self.timestamps = []
+        self.levels = []
+        self.server_ids = []
+        self.servers = servers or []
+        for offset, ts, level, server_id in records or []:
+            self.offsets.append(offset)
+            self.timestamps.append(ts)
+            self.levels.append(level)
+            self.server_ids.append(server_id)
+        self._log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @classmethod
+    def open(cls, log_path):
+        """사이드카 인덱스를 로드 (없거나 손상된 경우 로그 파일을 스캔해 생성)"""
+        log_path = str(log_path)
+        index_path = log_path + INDEX_SUFFIX
+        server_table_path = log_path + SERVER_TABLE_SUFFIX
+        try:
+            if os.path.exists(index_path) and os.path.exists(server_table_path):
+                with open(index_path, 'rb') as f:
+                    data = f.read()
+                data = data[:len(data) - len(data) % INDEX_RECORD.size]
+                with open(server_table_path, 'r', encoding='utf-8') as f:
+                    servers = f.read().split('\n')[:-1]
+                records = list(INDEX_RECORD.iter_unpack(data))
+                log_size = os.path.getsize(log_path)
+                if not records or records[-1][0] < log_size:
+                    return cls(log_path, records, servers)
+        except OSError:
+            pass
+        return cls.build(log_path)
+
+    @classmethod
+    def build(cls, log_path):
+        """로그 파일을 한 번 스캔해 사이드카 인덱스 생성"""
+        log_path = str(log_path)
+        records = []
+        server_ids = {}
+        offset = 0
+        with open(log_path, 'rb') as f:
+            for raw_line in f:
+                line_offset = offset
+                offset += len(raw_line)
+                entry = parse_log_line(raw_line.decode('utf-8', errors='replace'))
+                if entry is None:
+                    continue  # 여러 줄 레코드의 연속 줄(예: 트레이스백)
+                server = entry.get('server') or 'SYSTEM'
+                if server not in server_ids:
+                    server_ids[server] = len(server_ids)
+                records.append((
+                    line_offset,
+                    _parse_timestamp(entry.get('ts', '')),
+                    _LEVEL_CODES.get(entry.get('level', ''), _UNKNOWN_LEVEL),
+                    server_ids[server]
+                ))
+
+        servers = list(server_ids)
+        try:
+            with open(log_path + INDEX_SUFFIX, 'wb') as f:
+                for record in records:
+                    f.write(INDEX_RECORD.pack(*record))
+            with open(log_path + SERVER_TABLE_SUFFIX, 'w', encoding='utf-8') as f:
+                f.write(''.join(f"{name}\n" for name in servers))
+        except OSError:
+            pass  # 읽기 전용 위치의 로그는 메모리 인덱스만 사용
+        return cls(log_path, records, servers)
+
+    def refresh(self):
+        """인덱스 파일에 새로 추가된 레코드만 읽어 반영 (인덱스가 새로 시작된 경우 False)"""
+        index_path = self.log_path + INDEX_SUFFIX
+        try:
+            size = os.path.getsize(index_path)
+            known = len(self.offsets) * INDEX_RECORD.size
+            if size < known:
+                return False
+            readable = (size - known) // INDEX_RECORD.size * INDEX_RECORD.size
+            if readable:
+                with open(index_path, 'rb') as f:
+                    f.seek(known)
+                    records = list(INDEX_RECORD.iter_unpack(f.read(readable)))
+                if any(server_id >= len(self.servers) for _, _, _, server_id in records):
+                    with open(self.log_path + SERVER_TABLE_SUFFIX, 'r', encoding='utf-8') as f:
+                        self.servers = f.read().split('\n')[:-1]
+                for offset, ts, level, server_id in records:
+                    self.offsets.append(offset)
+                    self.timestamps.append(ts)
+                    self.levels.append(level)
+                    self.server_ids.append(server_id)
+            self._log_size = os.path.getsize(self.log_path)
+            return True
+        except OSError:
+            return False
+
+    def get_servers(self):
+        return list(self.servers)
+
+    def query(self, level=None, server=None, start=None, end=None):
+        """조건에 맞는 레코드 번호 목록 반환 (level/server는 이름, start/end는 datetime)"""
+        lo, hi = 0, len(self.offsets)
+        if start is not None:
+            lo = bisect_left(self.timestamps, int(start.timestamp()), lo, hi)
+        if end is not None:
+            hi = bisect_right(self.timestamps, int(end.timestamp()), lo, hi)
+
+        level_code = _LEVEL_CODES.get(level) if level else None
+        server_id = None
+        if server:
+            if server not in self.servers:
+                return []
+            server_id = self.servers.index(server)
+
+        return [
+            i for i in range(lo, hi)
+            if (level_code is None or self.levels[i] == level_code)
+            and (server_id is None or self.server_ids[i] == server_id)
+        ]
+
+    def level_counts(self, server=None, level=None):
+        """레벨별 레코드 수 (인덱스만 사용)"""
+        counts = {name: 0 for name in LOG_LEVELS}
+        for i in self.query(level=level, server=server):
+            code = self.levels[i]
+            if code < len(LOG_LEVELS):
+                counts[LOG_LEVELS[code]] += 1
+        return counts
+
+    def read_entries(self, indices):
+        """레코드 번호에 해당하는 로그 항목만 seek 해서 읽어 텍스트 형식으로 반환"""
+        entries = []
+        with open(self.log_path, 'rb') as f:
+            for i in indices:
+                start = self.offsets[i]
+                end = self.offsets[i + 1] if i + 1 < len(self.offsets) else self._log_size
+                f.seek(start)
+                raw = f.read(max(0, end - start)).decode('utf-8', errors='replace').rstrip('\r\n')
+                if raw.startswith('{'):
+                    entry = parse_log_line(raw)
+                    if entry is not None:
+                        raw = format_log_entry(entry)
+                entries.append(raw + '\n')
+        return entries
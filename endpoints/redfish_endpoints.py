@@ -14,6 +14,7 @@ class URLPattern:
     # 시스템 관련 엔드포인트
     SYSTEM_BIOS = f"{SYSTEMS}/Bios"
     BIOS_RESET = f"{SYSTEM_BIOS}/Actions/Bios.ResetBios"
+    BIOS_REGISTRY = f"{SYSTEM_BIOS}/BiosRegistry"
     SYSTEM_PROCESSORS = f"{SYSTEMS}/Processors"
     SYSTEM_MEMORY = f"{SYSTEMS}/Memory"
     SYSTEM_STORAGE = f"{SYSTEMS}/Storage"
@@ -62,6 +63,7 @@ class URLPattern:
     # 네트워크 어댑터 관련 엔드포인트 추가
     NETWORK_ADAPTER_ATTRIBUTES = f"{CHASSIS_NETWORK}/{{adapter_id}}/NetworkDeviceFunctions/{{func_id}}/Oem/Dell/DellNetworkAttributes/{{func_id}}"
     NETWORK_ATTRIBUTES_REGISTRY = f"{BASE}/Registries/NetworkAttributesRegistry_{{func_id}}"
+    REGISTRY = f"{BASE}/Registries/{{registry_id}}"
 
     # TSR 로그 관련 엔드포인트 추가
     TSR_EXPORT = f"{MANAGERS}/Oem/Dell/DellLCService/Actions/DellLCService.ExportTechSupportReport"
@@ -70,6 +72,7 @@ class URLPattern:
     JOB_SERVICE = f"{BASE}/JobService"
     JOB_COLLECTION = f"{JOB_SERVICE}/Jobs"
     JOB_DETAILS = f"{JOB_COLLECTION}/{{job_id}}"
+    MANAGER_JOBS = f"{MANAGERS}/Jobs"  # Dell 설정 작업(TargetSettingsURI) 생성
 
     # BIOS 관련 엔드포인트
     BIOS_SETTINGS = f"{SYSTEMS}/Bios/Settings"
@@ -156,6 +159,8 @@ class RedfishEndpoints:
                 # BIOS 관련
                 '/redfish/v1/Systems/System.Embedded.1/Bios/Settings': 'BIOS 설정 조회',
                 '/redfish/v1/Systems/System.Embedded.1/Bios/Actions/Bios.ResetBios': 'BIOS 리셋',
+                '/redfish/v1/Managers/iDRAC.Embedded.1/Jobs': 'iDRAC 설정 작업 생성',
+                '/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry': 'BIOS 속성 레지스트리 조회',
 
             }.get(pattern, '알 수 없는 요청')
         
@@ -199,6 +204,11 @@ class RedfishEndpoints:
         """BIOS 정보 조회"""
         return self.get_url(URLPattern.SYSTEM_BIOS)
 
+    @property
+    def bios_registry(self) -> str:
+        """BIOS 속성 레지스트리 조회"""
+        return self.get_url(URLPattern.BIOS_REGISTRY)
+
     @property
     def idrac_info(self) -> str:
         """iDRAC 정보 조회"""
@@ -386,6 +396,10 @@ class RedfishEndpoints:
         )
         return self.get_url(pattern)
 
+    def get_registry_url(self, registry_id: str) -> str:
+        """레지스트리 파일 정보 조회"""
+        return self.get_url(URLPattern.REGISTRY.format(registry_id=registry_id))
+
     # TSR 로그 수집 관련 엔드포인트
     @property
     def tsr_export(self) -> str:
@@ -403,6 +417,11 @@ class RedfishEndpoints:
         """Job 컬렉션 조회"""
         return self.get_url(URLPattern.JOB_COLLECTION)
 
+    @property
+    def manager_jobs(self) -> str:
+        """iDRAC 작업 큐 (설정 작업 생성)"""
+        return self.get_url(URLPattern.MANAGER_JOBS)
+
     def get_job_details_url(self, job_id: str) -> str:
         """특정 Job 상세 정보 조회"""
         return self.get_url(URLPattern.JOB_DETAILS.format(job_id=job_id))
@@ -125,8 +125,9 @@ class ApplicationInitializer:
         """UI 구성 요소 준비"""
         try:
             # 필요한 UI 구성 요소 사전 로드 또는 초기화 작업
-            # 예: 아이콘, 테마, 폰트 등
-            pass
+            # 로그 뷰어 전체 파일 검색용 인덱서를 백그라운드에서 시작
+            from utils.log_search import log_search_index
+            log_search_index.start()
         except Exception as e:
             self.logger.error(f"UI 구성 요소 준비 실패: {e}")
             raise
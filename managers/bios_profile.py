@@ -0,0 +1,256 @@
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from config.system.log_config import setup_logging
+from utils.cafe24 import BIOS_PROFILE as CAFE24_BIOS_PROFILE
+
+logger = setup_logging()
+
+FLEET_WORKERS = 32  # 동시에 처리할 서버 수
+
+# 속성별 비교 결과
+CELL_MATCH = 'match'  # 현재 값이 목표와 같음
+CELL_PENDING = 'pending'  # 재부팅 후 적용될 대기 값이 목표와 같음
+CELL_CHANGE = 'change'  # 변경 필요
+CELL_UNSUPPORTED = 'unsupported'  # 서버에 없는 속성
+
+# 서버별 상태
+STATUS_COMPLIANT = '일치'
+STATUS_PENDING = '적용 대기'
+STATUS_DRIFT = '변경 필요'
+STATUS_APPLIED = '변경 요청됨'
+STATUS_CONFLICT = '작업 충돌'
+STATUS_FAILED = '실패'
+STATUS_CANCELLED = '취소'
+
+# 진행 단계 (progress_callback 두 번째 인자)
+STAGE_FETCH = '조회'
+STAGE_PATCH = '설정 변경'
+STAGE_JOB = '작업 생성'
+STAGE_REBOOT = '재시작'
+
+BUILTIN_PROFILES = {
+    'Cafe24 기본': CAFE24_BIOS_PROFILE,
+}
+
+def load_profile(path):
+    """프로파일 파일 읽기 -> (이름, 속성)
+
+    {"name": ..., "attributes": {...}} 형식과 속성만 담은 JSON을 모두 지원합니다.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("BIOS 프로파일은 JSON 객체여야 합니다.")
+    if isinstance(data.get('attributes'), dict):
+        return data.get('name', ''), data['attributes']
+    return '', data
+
+def save_profile(path, name, attributes):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'name': name, 'attributes': attributes}, f, ensure_ascii=False, indent=2)
+
+def coerce_value(desired, current):
+    """목표 값을 서버의 현재 값 형식(정수/문자열)에 맞춤"""
+    if isinstance(current, bool) or not isinstance(current, int) or isinstance(desired, int):
+        return desired
+    try:
+        return int(str(desired).strip())
+    except ValueError:
+        return desired
+
+def values_equal(left, right):
+    if left is None or right is None:
+        return left is right
+    return str(left).strip() == str(right).strip()
+
+def compare_attributes(desired, current, pending):
+    """속성별 비교 결과 {속성: {'current', 'pending', 'desired', 'state'}}
+
+    pending은 Bios/Settings의 대기 속성으로, 목표와 같으면 다시 PATCH하지 않습니다.
+    """
+    cells = {}
+    for name, value in desired.items():
+        if name not in current:
+            cells[name] = {'current': None, 'pending': None, 'desired': value, 'state': CELL_UNSUPPORTED}
+            continue
+        value = coerce_value(value, current[name])
+        if values_equal(current[name], value) and (name not in pending or values_equal(pending[name], value)):
+            state = CELL_MATCH
+        elif name in pending and values_equal(pending[name], value):
+            state = CELL_PENDING
+        else:
+            state = CELL_CHANGE
+        cells[name] = {'current': current[name], 'pending': pending.get(name), 'desired': value, 'state': state}
+    return cells
+
+class BiosServerPlan:
+    """서버 한 대의 프로파일 비교/적용 결과"""
+
+    def __init__(self, name, host):
+        self.name = name
+        self.host = host
+        self.cells = {}
+        self.status = ''
+        self.job_id = None
+        self.message = ''
+
+    @property
+    def changes(self):
+        """PATCH할 속성 (목표와 다른 속성만)"""
+        return {name: cell['desired'] for name, cell in self.cells.items() if cell['state'] == CELL_CHANGE}
+
+    @property
+    def unsupported(self):
+        return [name for name, cell in self.cells.items() if cell['state'] == CELL_UNSUPPORTED]
+
+    def evaluate(self, desired, current, pending):
+        self.cells = compare_attributes(desired, current, pending)
+        states = {cell['state'] for cell in self.cells.values()}
+        if CELL_CHANGE in states:
+            self.status = STATUS_DRIFT
+            self.message = f"{len(self.changes)}개 속성 변경 필요"
+        elif CELL_PENDING in states:
+            self.status = STATUS_PENDING
+            self.message = "재부팅 후 적용될 값이 목표와 같습니다."
+        else:
+            self.status = STATUS_COMPLIANT
+            self.message = ''
+        if self.unsupported:
+            self.message = f"{self.message} (미지원 속성: {', '.join(self.unsupported)})".strip()
+
+class BiosProfileEngine:
+    """BIOS 목표 상태(프로파일)를 여러 서버에 맞추는 엔진
+
+    plan()은 서버마다 현재/대기 BIOS 속성을 동시에 조회해 목표와 다른 속성만
+    골라내고, apply()는 다른 속성이 있는 서버에만 그 속성만 PATCH한 뒤 설정
+    작업을 만듭니다. 이미 일치하는 서버에는 요청을 보내지 않으며, 대기 값이
+    목표와 같지만 작업이 없는 서버에는 작업만 만듭니다. 같은 프로파일을 다시
+    적용해도 결과가 같으므로, 실패한 서버만 다시 실행하면 됩니다.
+
+    server_managers: {서버 이름: DellServerManager}
+    progress_callback(서버 이름, 단계)
+    """
+
+    def __init__(self, server_managers, attributes, progress_callback=None, is_cancelled=None,
+                 max_workers=FLEET_WORKERS):
+        self.server_managers = server_managers
+        self.attributes = dict(attributes)
+        self.progress_callback = progress_callback
+        self.is_cancelled = is_cancelled or (lambda: False)
+        self.max_workers = max_workers
+        self.plans = {}
+
+    def _progress(self, name, stage):
+        if self.progress_callback:
+            self.progress_callback(name, stage)
+
+    def _run_all(self, names, func):
+        """서버별 작업을 동시에 실행 (서버 하나의 오류는 해당 서버 결과에만 기록)"""
+        if not names:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as executor:
+            futures = {executor.submit(func, name): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                plan = self.plans[name]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"BIOS 프로파일 처리 중 오류 발생 ({name}): {str(e)}")
+                    plan.status = STATUS_FAILED
+                    plan.message = str(e)
+
+    def plan(self):
+        """모든 서버의 차이 계산 -> {서버 이름: BiosServerPlan}"""
+        self.plans = {name: BiosServerPlan(name, manager.host) for name, manager in self.server_managers.items()}
+        self._run_all(list(self.plans), self._plan_server)
+        drift = sum(1 for plan in self.plans.values() if plan.status == STATUS_DRIFT)
+        logger.info(f"BIOS 프로파일 비교 완료: 서버 {len(self.plans)}대 중 {drift}대 변경 필요")
+        return self.plans
+
+    def _plan_server(self, name):
+        plan = self.plans[name]
+        if self.is_cancelled():
+            plan.status = STATUS_CANCELLED
+            return
+        self._progress(name, STAGE_FETCH)
+        current, pending = self.server_managers[name].fetch_bios_attributes()
+        plan.evaluate(self.attributes, current, pending)
+
+    def apply(self, reboot=False):
+        """plan() 결과 중 변경/작업이 필요한 서버에만 적용 (reboot이면 작업 생성 후 재시작)"""
+        if not self.plans:
+            self.plan()
+        names = [name for name, plan in self.plans.items() if plan.status in (STATUS_DRIFT, STATUS_PENDING)]
+        self._run_all(names, lambda name: self._apply_server(name, reboot))
+        applied = sum(1 for plan in self.plans.values() if plan.status == STATUS_APPLIED)
+        logger.info(f"BIOS 프로파일 적용 완료: 대상 {len(names)}대 중 {applied}대 작업 생성")
+        return self.plans
+
+    def _apply_server(self, name, reboot):
+        plan = self.plans[name]
+        manager = self.server_managers[name]
+        if self.is_cancelled():
+            plan.status = STATUS_CANCELLED
+            return
+
+        # 끝나지 않은 BIOS 설정 작업이 있으면 iDRAC가 새 변경을 거부하므로 먼저 확인
+        active_jobs = [job.get('Id', '') for job in manager.fetch_pending_bios_jobs()]
+        if plan.status == STATUS_DRIFT:
+            if active_jobs:
+                plan.status = STATUS_CONFLICT
+                plan.message = f"예약된 BIOS 설정 작업이 있습니다: {', '.join(active_jobs)}"
+                return
+            self._progress(name, STAGE_PATCH)
+            manager.update_bios_settings(plan.changes)
+        elif active_jobs:
+            # 대기 값이 목표와 같고 적용할 작업도 이미 있음
+            plan.job_id = active_jobs[0]
+            plan.message = f"예약된 작업 {plan.job_id}로 재부팅 후 적용됩니다."
+            return
+
+        self._progress(name, STAGE_JOB)
+        plan.job_id = manager.create_bios_config_job()
+        plan.status = STATUS_APPLIED
+        plan.message = f"작업 {plan.job_id} 생성, 재부팅 후 적용"
+        for cell in plan.cells.values():
+            if cell['state'] == CELL_CHANGE:
+                cell['state'] = CELL_PENDING
+                cell['pending'] = cell['desired']
+
+        if reboot:
+            self._progress(name, STAGE_REBOOT)
+            manager.restart_system()
+            plan.message = f"작업 {plan.job_id} 생성, 재시작 요청"
+
+def build_matrix(attributes, plans):
+    """결과 행렬 (헤더, 행 목록) - 행: 서버, 열: 상태/작업/속성별 값
+
+    속성 칸은 일치하면 현재 값, 다르면 '현재 → 목표', 목표 값이 대기 중이면 '(대기)'를 붙입니다.
+    """
+    headers = ["서버", "호스트", "상태", "작업 ID"] + list(attributes) + ["메시지"]
+    rows = []
+    for plan in sorted(plans.values(), key=lambda plan: plan.name):
+        row = [plan.name, plan.host, plan.status, plan.job_id or '']
+        for name in attributes:
+            row.append(format_cell(plan.cells.get(name)))
+        row.append(plan.message)
+        rows.append(row)
+    return headers, rows
+
+def format_cell(cell):
+    if cell is None:
+        return ''
+    if cell['state'] == CELL_UNSUPPORTED:
+        return '미지원'
+    if cell['state'] == CELL_MATCH:
+        return str(cell['current'])
+    if cell['state'] == CELL_PENDING:
+        if values_equal(cell['current'], cell['desired']):
+            return f"{cell['current']} (대기)"
+        return f"{cell['current']} → {cell['desired']} (대기)"
+    current = str(cell['current'])
+    if cell['pending'] is not None and not values_equal(cell['pending'], cell['current']):
+        current = f"{current} (대기 {cell['pending']})"
+    return f"{current} → {cell['desired']}"
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 import time
 
@@ -7,13 +8,35 @@ import urllib3
 
 from config.system.log_config import setup_logging
 from endpoints.redfish_endpoints import RedfishEndpoints, URLPattern
+from managers.firmware_upload import (SUPPORTED_PACKAGE_EXTENSIONS, MultipartFileStream, UploadCancelled,
+                                     task_uri_from_response)
+from managers.job_tracker import JobTracker
+from managers.nic_attributes import NIC_FETCH_WORKERS, NicAttributeCollector, nic_attribute_cache
+from managers.storage_topology import StorageTopology
+from managers.task_monitor import task_monitor
+from managers.tsr_collector import STAGE_DOWNLOAD, STAGE_VERIFY, TsrCollector
+from utils.attribute_registry import (BIOS_REGISTRY_ID, NIC_REGISTRY_ID, attribute_registry_cache,
+                                      nic_registry_version)
+from utils.firmware_cache import firmware_inventory_cache, firmware_package_cache
 
 # logger 객체 생성
 logger = setup_logging()
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+def _redfish_error_message(response):
+    """Redfish 오류 응답에서 사람이 읽을 메시지 추출"""
+    try:
+        error = response.json().get('error', {})
+        messages = [info.get('Message', '') for info in error.get('@Message.ExtendedInfo', [])]
+        return ' '.join(message for message in messages if message) or error.get('message', '') or response.text
+    except ValueError:
+        return response.text
+
 class DellServerManager:
+    FIRMWARE_FETCH_WORKERS = 8  # 펌웨어 컴포넌트 동시 조회 수
+    NIC_FETCH_WORKERS = NIC_FETCH_WORKERS  # NIC 어댑터/속성 동시 조회 수
+
     def __init__(self, ip: str, port: str, auth: tuple):
         self.endpoints = RedfishEndpoints(ip, port)
         self.auth = auth
@@ -24,6 +47,9 @@ class DellServerManager:
         self.cache_ttl = 300  # 5분
         self.last_etag = {}
         self.redfish_client = None  # Redfish 클라이언트 초기화
+        self.storage_topology = StorageTopology(self)
+        self.job_tracker = JobTracker(self)
+        self._firmware_components = {}  # 컴포넌트 ID -> 펌웨어 상세 정보
 
     def check_connection(self):
         """서버와의 기본 연결 상태 확인"""
@@ -47,6 +73,10 @@ class DellServerManager:
         self.cache.clear()
         self.last_etag.clear()
         self.redfish_client = None
+        self.storage_topology.clear()
+        self.job_tracker.clear()
+        self._firmware_components.clear()
+        nic_attribute_cache.invalidate(self.host)
 
     @lru_cache(maxsize=32)        
     def fetch_basic_info(self):
@@ -171,70 +201,20 @@ class DellServerManager:
         return self.fetch_detailed_info(self.endpoints.memory)
 
     def fetch_storage_info(self):
-        """스토리지 상세 정보 조회"""
+        """스토리지 상세 정보 조회 (변경된 리소스만 다시 조회)"""
         try:
-            response = requests.get(
-                f"{self.endpoints.storage}",
-                auth=self.auth,
-                verify=False
-            )
-            response.raise_for_status()
-            storage_data = response.json()
-            
-            result = []
-            for member in storage_data.get('Members', []):
-                member_uri = member.get('@odata.id')
-                if member_uri:
-                    # 컨트롤러 정보 조회
-                    controller_response = requests.get(
-                        f"{self.endpoints.base_url}{member_uri}",
-                        auth=self.auth,
-                        verify=False
-                    )
-                    controller_data = controller_response.json()
-                    
-                    # 볼륨 정보 조회
-                    volumes = []
-                    volumes_uri = f"{self.endpoints.base_url}{member_uri}/Volumes"
-                    volumes_response = requests.get(
-                        volumes_uri,
-                        auth=self.auth,
-                        verify=False
-                    )
-                    if volumes_response.status_code == 200:
-                        volumes_data = volumes_response.json()
-                        for volume in volumes_data.get('Members', []):
-                            volume_uri = volume.get('@odata.id')
-                            if volume_uri:
-                                volume_response = requests.get(
-                                    f"{self.endpoints.base_url}{volume_uri}",
-                                    auth=self.auth,
-                                    verify=False
-                                )
-                                volumes.append(volume_response.json())
-                    
-                    controller_data['Volumes'] = volumes
-                    
-                    # 드라이브 정보 조회 (기존 코드와 동일)
-                    drives = []
-                    for drive in controller_data.get('Drives', []):
-                        drive_uri = drive.get('@odata.id')
-                        if drive_uri:
-                            drive_response = requests.get(
-                                f"{self.endpoints.base_url}{drive_uri}",
-                                auth=self.auth,
-                                verify=False
-                            )
-                            drives.append(drive_response.json())
-                    
-                    controller_data['Drives'] = drives
-                    result.append(controller_data)
-            
-            return {'Controllers': result}
+            self.storage_topology.refresh()
+            return self.storage_topology.to_storage_info()
         except Exception as e:
             logger.error(f"스토리지 정보 조회 실패: {str(e)}")
             return None
 
+    def get_storage_topology(self, refresh=False):
+        """스토리지 구성 캐시 반환 (처음 사용하거나 refresh=True이면 갱신)"""
+        if refresh or not self.storage_topology.loaded:
+            self.storage_topology.refresh()
+        return self.storage_topology
+
     def fetch_storage_detail(self, storage_id):
         """스토리지 컨트롤러 상세 정보 조회"""
         try:
@@ -245,9 +225,7 @@ class DellServerManager:
                 # storage_id가 컨트롤러 ID만 포함하는 경우
                 url = f"{self.endpoints.storage}/{storage_id}"
                 
-            response = requests.get(url, auth=self.auth, verify=False)
-            response.raise_for_status()
-            return response.json()
+            return self.storage_topology.fetch(url)[0]
         except Exception as e:
             logger.error(f"스토리지 상세 정보 조회 실패: {e}")
             return None
@@ -256,9 +234,7 @@ class DellServerManager:
         """특정 컨트롤러의 드라이브 목록 조회"""
         try:
             url = self.endpoints.get_storage_drives_url(controller_id)
-            response = requests.get(url, auth=self.auth, verify=False)
-            response.raise_for_status()
-            return response.json()
+            return self.storage_topology.fetch(url)[0]
         except Exception as e:
             logger.error(f"드라이브 목록 조회 실패: {e}")
             return None
@@ -266,11 +242,11 @@ class DellServerManager:
     def fetch_drive_detail(self, controller_id, drive_id):
         """개별 드라이브 상세 정보 조회"""
         try:
+            if drive_id in self.storage_topology.drives:
+                return self.storage_topology.refresh_drive(drive_id)
             # 전체 URL 경로를 사용하도록 수정
             url = f"{self.endpoints.storage}/{controller_id}/Drives/{drive_id}"
-            response = requests.get(url, auth=self.auth, verify=False)
-            response.raise_for_status()
-            return response.json()
+            return self.storage_topology.fetch(url)[0]
         except Exception as e:
             logger.error(f"드라이브 상세 정보 조회 실패: {e}")
             return None
@@ -289,76 +265,59 @@ class DellServerManager:
             logger.error(f"드라이브 리빌딩 상태 조회 실패: {str(e)}")
         return None
 
+    def _fetch_json(self, uri):
+        response = self.session.get(f"{self.endpoints.base_url}{uri}", auth=self.auth, verify=False, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    def _fetch_all_json(self, executor, uris):
+        """여러 URI를 동시에 조회 (순서 유지)"""
+        return list(executor.map(self._fetch_json, uris))
+
     def fetch_network_adapters_info(self):
-        """네트워크 어댑터 정보 조회"""
+        """네트워크 어댑터 정보 조회
+
+        어댑터 상세 -> 포트/기능 컬렉션 -> 포트/기능 상세를 단계마다 한 번에 동시 조회합니다.
+        """
         try:
             # 네트워크 어댑터 목록 조회
-            response = requests.get(self.endpoints.network_adapters, auth=self.auth, verify=False)
+            response = self.session.get(self.endpoints.network_adapters, auth=self.auth, verify=False, timeout=30)
             response.raise_for_status()
             adapters_data = response.json()
+            adapter_uris = [adapter['@odata.id'] for adapter in adapters_data.get('Members', [])
+                            if adapter.get('@odata.id')]
+            if not adapter_uris:
+                return {'NetworkAdapters': []}
+
+            with ThreadPoolExecutor(max_workers=self.NIC_FETCH_WORKERS) as executor:
+                # 어댑터 상세 정보 조회
+                adapters = self._fetch_all_json(executor, adapter_uris)
+
+                # 포트/네트워크 장치 기능 컬렉션 조회
+                collection_uris = []
+                for adapter_info in adapters:
+                    for key in ('NetworkPorts', 'NetworkDeviceFunctions'):
+                        uri = adapter_info.get(key, {}).get('@odata.id')
+                        if uri:
+                            collection_uris.append((adapter_info, key, uri))
+                collections = self._fetch_all_json(executor, [uri for _, _, uri in collection_uris])
+
+                # 포트/기능 상세 정보 조회
+                member_uris = []
+                for (adapter_info, key, _), collection in zip(collection_uris, collections):
+                    for member in collection.get('Members', []):
+                        if member.get('@odata.id'):
+                            member_uris.append((adapter_info, key, member['@odata.id']))
+                members = self._fetch_all_json(executor, [uri for _, _, uri in member_uris])
 
             result = []
-            for adapter in adapters_data.get('Members', []):
-                adapter_uri = adapter.get('@odata.id')
-                if adapter_uri:
-                    # 어댑터 상세 정보 조회
-                    adapter_response = requests.get(
-                        f"{self.endpoints.base_url}{adapter_uri}",
-                        auth=self.auth,
-                        verify=False
-                    )
-                    adapter_response.raise_for_status()
-                    adapter_info = adapter_response.json()
-
-                    # 포트 정보 조회
-                    ports = []
-                    ports_uri = adapter_info.get('NetworkPorts', {}).get('@odata.id')
-                    if ports_uri:
-                        ports_response = requests.get(
-                            f"{self.endpoints.base_url}{ports_uri}",
-                            auth=self.auth,
-                            verify=False
-                        )
-                        ports_response.raise_for_status()
-                        ports_data = ports_response.json()
-                        for port in ports_data.get('Members', []):
-                            port_uri = port.get('@odata.id')
-                            if port_uri:
-                                port_response = requests.get(
-                                    f"{self.endpoints.base_url}{port_uri}",
-                                    auth=self.auth,
-                                    verify=False
-                                )
-                                port_response.raise_for_status()
-                                ports.append(port_response.json())
-
-                    # 네트워크 장치 기능 정보 조회
-                    device_functions = []
-                    device_functions_uri = adapter_info.get('NetworkDeviceFunctions', {}).get('@odata.id')
-                    if device_functions_uri:
-                        functions_response = requests.get(
-                            f"{self.endpoints.base_url}{device_functions_uri}",
-                            auth=self.auth,
-                            verify=False
-                        )
-                        functions_response.raise_for_status()
-                        functions_data = functions_response.json()
-                        
-                        for function in functions_data.get('Members', []):
-                            function_uri = function.get('@odata.id')
-                            if function_uri:
-                                function_response = requests.get(
-                                    f"{self.endpoints.base_url}{function_uri}",
-                                    auth=self.auth,
-                                    verify=False
-                                )
-                                function_response.raise_for_status()
-                                device_functions.append(function_response.json())
-
-                    # 결과에 추가
-                    adapter_info['NetworkPorts'] = ports
-                    adapter_info['NetworkDeviceFunctions'] = device_functions
-                    result.append(adapter_info)
+            details = {}
+            for (adapter_info, key, _), member in zip(member_uris, members):
+                details.setdefault((id(adapter_info), key), []).append(member)
+            for adapter_info in adapters:
+                adapter_info['NetworkPorts'] = details.get((id(adapter_info), 'NetworkPorts'), [])
+                adapter_info['NetworkDeviceFunctions'] = details.get((id(adapter_info), 'NetworkDeviceFunctions'), [])
+                result.append(adapter_info)
 
             return {'NetworkAdapters': result}
         except Exception as e:
@@ -630,8 +589,105 @@ class DellServerManager:
             logger.error(f"펌웨어 인벤토리 조회 실패: {str(e)}")
             return None
 
-    def update_firmware(self, file_path: str = None, image_uri: str = None, transfer_protocol: str = "HTTP"):
-        """펌웨어 업데이트를 시작합니다."""
+    @property
+    def host(self):
+        """IP:포트 (캐시 구분용)"""
+        return self.endpoints.base_url.split('://')[-1]
+
+    def _firmware_cache_key(self):
+        """(서비스 태그, iDRAC/BIOS 버전 signature, 모델명) - 조회 실패 시 캐시 사용 안 함
+
+        펌웨어 업데이트 후 바뀐 버전을 바로 반영하도록 fetch_basic_info 캐시를 쓰지 않고 직접 조회합니다.
+        """
+        try:
+            system = self.session.get(self.endpoints.system, auth=self.auth, verify=False, timeout=self.timeout)
+            idrac = self.session.get(self.endpoints.managers, auth=self.auth, verify=False, timeout=self.timeout)
+            system.raise_for_status()
+            idrac.raise_for_status()
+            system, idrac = system.json(), idrac.json()
+            signature = {
+                'idrac': idrac.get('FirmwareVersion'),
+                'bios': system.get('BiosVersion'),
+            }
+            return system.get('SKU', 'None'), signature, system.get('Model')
+        except Exception as e:
+            logger.warning(f"펌웨어 캐시 키 조회 실패: {str(e)}")
+            return None, None, None
+
+    def fetch_firmware_components(self, progress_callback=None, use_cache=True):
+        """펌웨어 인벤토리 전체 컴포넌트 상세 목록 조회
+
+        서비스 태그별 캐시를 먼저 확인하고(iDRAC/BIOS 버전이 바뀌었으면 무효),
+        없으면 $expand로 한 번에 받거나 지원하지 않는 경우 구성원을 동시에
+        조회합니다. progress_callback(완료 수, 전체 수)는 개별 조회 시에만 호출됩니다.
+        """
+        service_tag, signature, model = self._firmware_cache_key()
+        if use_cache:
+            cached = firmware_inventory_cache.get(service_tag, signature)
+            if cached is not None:
+                self._firmware_components = {component.get('Id'): component for component in cached}
+                return cached
+
+        # 이전에 받아 둔 상세 정보가 다시 저장되지 않도록 비우고 새로 조회
+        self._firmware_components = {}
+        components = self._fetch_firmware_inventory_expanded()
+        if components is None:
+            components = self._fetch_firmware_inventory_parallel(progress_callback)
+        if components is None:
+            return []
+
+        self._firmware_components = {component.get('Id'): component for component in components}
+        firmware_inventory_cache.store(service_tag, components, signature=signature, host=self.host, model=model)
+        return components
+
+    def _fetch_firmware_inventory_expanded(self):
+        """$expand로 인벤토리와 컴포넌트 상세를 한 번에 조회 (미지원 시 None)"""
+        try:
+            response = self.session.get(
+                f"{self.endpoints.firmware_inventory}?$expand=*($levels=1)",
+                auth=self.auth,
+                verify=False,
+                timeout=60
+            )
+            if response.status_code != 200:
+                return None
+            members = response.json().get('Members', [])
+            # 확장되지 않고 링크만 온 경우
+            if not members or any('Version' not in member for member in members):
+                return None
+            return members
+        except Exception as e:
+            logger.debug(f"펌웨어 인벤토리 $expand 조회 실패: {str(e)}")
+            return None
+
+    def _fetch_firmware_inventory_parallel(self, progress_callback=None):
+        """구성원 링크를 받아 컴포넌트 상세를 동시에 조회 (원래 순서 유지)"""
+        firmware_data = self.fetch_firmware_inventory()
+        if not firmware_data:
+            return None
+        component_ids = [member['@odata.id'].split('/')[-1]
+                         for member in firmware_data.get('Members', []) if member.get('@odata.id')]
+        results = [None] * len(component_ids)
+        with ThreadPoolExecutor(max_workers=self.FIRMWARE_FETCH_WORKERS) as executor:
+            futures = {executor.submit(self._request_firmware_component, component_id): index
+                       for index, component_id in enumerate(component_ids)}
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    logger.error(f"펌웨어 컴포넌트 조회 실패 ({component_ids[futures[future]]}): {str(e)}")
+                if progress_callback:
+                    progress_callback(done, len(component_ids))
+        return [component for component in results if component]
+
+    def update_firmware(self, file_path: str = None, image_uri: str = None, transfer_protocol: str = "HTTP",
+                        progress_callback=None, is_cancelled=None):
+        """펌웨어 업데이트를 시작합니다.
+
+        로컬 파일은 멀티파트 스트리밍 업로드 후 생성된 작업 URI를, 원격 URI는
+        SimpleUpdate 응답을 반환합니다. 같은 패키지가 이미 iDRAC에 스테이징되어
+        있으면 업로드 없이 바로 설치합니다. 실패하면 None을 반환합니다.
+        """
         try:
             if file_path and os.path.exists(file_path):
                 # 파일 정보 로깅
@@ -642,58 +698,13 @@ class DellServerManager:
                 logger.debug(f" - 파일 크기: {file_size} bytes")
                 logger.debug(f" - 파일 형식: {ext}")
                 
-                if ext.lower() not in ['.exe', '.d7', '.d8', '.d9', '.pm', '.sc']:
+                if ext.lower() not in SUPPORTED_PACKAGE_EXTENSIONS:
                     logger.error(f"지원되지 않는 파일 형식입니다: {ext}")
                     return None
 
-                # Dell Update Service Install 엔드포인트 사용
-                import base64
-                with open(file_path, 'rb') as f:
-                    encoded = base64.b64encode(f.read()).decode()
-                
-                headers = {
-                    'Accept': 'application/json',
-                    'Content-Type': 'application/json',
-                    'X-Auth-Token': self.auth[1] if isinstance(self.auth, tuple) else None
-                }
-                
-                payload = {
-                    "SoftwareIdentityURIs": [],  # 펌웨어 ID 목록 (선택사항)
-                    "ShareParameters": {
-                        "Target": "ALL",  # 모든 구성 요소 업데이트
-                        "IPAddress": "",  # 로컬 업데이트이므로 비워둠
-                        "ShareName": "",
-                        "UserName": "",
-                        "Password": ""
-                    },
-                    "ImageFile": encoded,
-                    "ImportOptions": "Include"  # 모든 구성 요소 포함
-                }
-                
-                # 요청 정보 로깅
-                logger.debug(f"[펌웨어 업데이트] Dell Update Service 요청 정보:")
-                logger.debug(f" - URL: {self.endpoints.firmware_rollback}")  # firmware_rollback이 DellUpdateService.Install 엔드포인트
-                logger.debug(f" - 헤더: {headers}")
-                logger.debug(f" - 파일명: {os.path.basename(file_path)}")
-                logger.debug(f" - Payload 크기: {len(encoded)} bytes")
-                
-                response = self.session.post(
-                    self.endpoints.firmware_rollback,  # DellUpdateService.Install 엔드포인트 사용
-                    auth=self.auth,
-                    verify=False,
-                    json=payload,
-                    headers=headers,
-                    timeout=300
-                )
-                
-                # 응답 정보 로깅
-                logger.debug(f"[펌웨어 업데이트] 응답 정보:")
-                logger.debug(f" - 상태 코드: {response.status_code}")
-                logger.debug(f" - 응답 헤더: {dict(response.headers)}")
-                logger.debug(f" - 응답 내용: {response.text}")
-                
-                response.raise_for_status()
-                return response.json()
+                task_uri = self._update_firmware_from_file(file_path, progress_callback, is_cancelled)
+                task_monitor.watch(self, task_uri, f"펌웨어 업데이트: {os.path.basename(file_path)}")
+                return task_uri
                     
             elif image_uri:
                 # 원격 URI를 통한 업데이트는 SimpleUpdate 사용
@@ -728,6 +739,7 @@ class DellServerManager:
                 logger.debug(f" - 응답 내용: {response.text}")
                 
                 response.raise_for_status()
+                task_monitor.watch(self, task_uri_from_response(response), f"펌웨어 업데이트: {image_uri}")
                 return response.json()
             else:
                 raise ValueError("file_path 또는 image_uri 중 하나는 반드시 제공되어야 합니다.")
@@ -756,11 +768,91 @@ class DellServerManager:
             else:
                 logger.error(f"펌웨어 업데이트 실패: {str(e)}")
             return None
+        except UploadCancelled:
+            logger.info("펌웨어 업로드가 취소되었습니다.")
+            raise
         except Exception as e:
             logger.error(f"예기치 않은 오류 발생: {str(e)}")
             logger.debug(f"[펌웨어 업데이트] 예외 정보:", exc_info=True)
             return None
 
+    def _update_firmware_from_file(self, file_path, progress_callback=None, is_cancelled=None):
+        """이미 스테이징된 같은 패키지가 있으면 바로 설치, 없으면 업로드 후 기록"""
+        digest = None
+        available = None
+        try:
+            digest = firmware_package_cache.digest(file_path)
+            available = self.fetch_available_packages()
+            staged_uri = self.find_staged_package(digest, available)
+            if staged_uri:
+                logger.info(f"[펌웨어 업데이트] 이미 스테이징된 패키지 설치 (업로드 생략): {staged_uri}")
+                task_uri = self.install_staged_package(staged_uri)
+                if task_uri:
+                    if progress_callback:
+                        file_size = os.path.getsize(file_path)
+                        progress_callback(file_size, file_size)
+                    return task_uri
+                # 설치 요청이 거부되면 기록을 지우고 다시 업로드
+                firmware_package_cache.forget_staged(self.host, digest)
+        except Exception as e:
+            logger.warning(f"스테이징된 패키지 확인 실패, 업로드 진행: {str(e)}")
+
+        task_uri = self.upload_firmware_multipart(file_path, progress_callback, is_cancelled)
+        if digest and available is not None:
+            self._remember_uploaded_package(file_path, digest, available)
+        return task_uri
+
+    def fetch_available_packages(self):
+        """iDRAC에 업로드되어 설치를 기다리는 'Available-' 인벤토리 항목 URI 목록 (캐시 없이 조회)"""
+        firmware_data = self.fetch_firmware_inventory()
+        if firmware_data is None:
+            raise RuntimeError("펌웨어 인벤토리를 조회할 수 없습니다.")
+        return [member['@odata.id'] for member in firmware_data.get('Members', [])
+                if member.get('@odata.id', '').rstrip('/').split('/')[-1].startswith('Available-')]
+
+    def find_staged_package(self, digest, available=None):
+        """같은 패키지가 이미 스테이징되어 있으면 그 인벤토리 URI 반환
+
+        이 프로그램으로 올린 패키지의 해시 기록으로만 찾습니다. 'Available-' 항목의
+        버전만으로는 어떤 컴포넌트의 패키지인지 확인할 수 없어 추정하지 않습니다.
+        """
+        if available is None:
+            available = self.fetch_available_packages()
+        record = firmware_package_cache.staged(self.host, digest)
+        if not record:
+            return None
+        if record['uri'] in available:
+            return record['uri']
+        firmware_package_cache.forget_staged(self.host, digest)
+        return None
+
+    def install_staged_package(self, software_uri, install_upon="Now"):
+        """스테이징된 패키지 설치 요청 (DellUpdateService.Install), 작업 URI 반환 (실패 시 None)"""
+        try:
+            response = self.session.post(
+                self.endpoints.firmware_update,
+                auth=self.auth,
+                verify=False,
+                json={"SoftwareIdentityURIs": [software_uri], "InstallUpon": install_upon},
+                headers={'Accept': 'application/json'},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return task_uri_from_response(response)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"스테이징된 패키지 설치 요청 실패 ({software_uri}): {str(e)}")
+            return None
+
+    def _remember_uploaded_package(self, file_path, digest, available_before):
+        """업로드 후 새로 생긴 'Available-' 항목을 패키지 해시와 연결"""
+        try:
+            new_entries = set(self.fetch_available_packages()) - set(available_before)
+            if len(new_entries) == 1:
+                firmware_package_cache.remember_staged(self.host, digest, new_entries.pop(),
+                                                       os.path.basename(file_path))
+        except Exception as e:
+            logger.debug(f"업로드한 패키지 스테이징 기록 실패: {str(e)}")
+
     def rollback_firmware(self, component_id: str):
         """펌웨어 롤백 실행
         
@@ -785,19 +877,66 @@ class DellServerManager:
             logger.error(f"펌웨어 롤백 실행 실패: {str(e)}")
             return None
 
-    def multipart_firmware_update(self, file_path):
-        """대용량 펌웨어 파일을 업데이트합니다.
-        이 메소드는 더 이상 멀티파트 업로드를 시도하지 않고, 
-        대신 update_firmware 메소드를 호출합니다.
+    def _multipart_push_uri(self):
+        """UpdateService의 MultipartHttpPushUri (없으면 Dell OEM 멀티파트 업로드 액션)"""
+        try:
+            update_service = self.fetch_detailed_info(self.endpoints.update_service)
+            push_uri = update_service.get('MultipartHttpPushUri')
+            if push_uri:
+                return f"{self.endpoints.base_url}{push_uri}"
+        except Exception as e:
+            logger.warning(f"MultipartHttpPushUri 조회 실패: {str(e)}")
+        return self.endpoints.firmware_multipart_update
+
+    def upload_firmware_multipart(self, file_path, progress_callback=None, is_cancelled=None,
+                                  apply_time="Immediate"):
+        """펌웨어 패키지를 multipart/form-data로 스트리밍 업로드하고 작업 URI 반환
+
+        파일은 청크 단위로 읽어 보내므로 패키지 크기만큼 메모리를 쓰지 않습니다.
+        progress_callback(보낸 바이트, 전체 바이트), is_cancelled()가 True이면
+        UploadCancelled가 발생합니다.
+        """
+        stream = MultipartFileStream(
+            file_path,
+            parameters={"Targets": [], "@Redfish.OperationApplyTime": apply_time},
+            progress_callback=progress_callback,
+            is_cancelled=is_cancelled
+        )
+        url = self._multipart_push_uri()
+        logger.info(f"[펌웨어 업데이트] 멀티파트 업로드 시작: {os.path.basename(file_path)} ({stream.file_size} bytes) -> {url}")
+        try:
+            response = self.session.post(
+                url,
+                data=stream,
+                headers={'Content-Type': stream.content_type, 'Accept': 'application/json'},
+                auth=self.auth,
+                verify=False,
+                # 연결 타임아웃만 짧게 두고 전송/응답 대기는 업로드 크기에 맡김
+                timeout=(10, 600)
+            )
+        finally:
+            stream.close()
+        logger.debug(f"[펌웨어 업데이트] 응답: {response.status_code} {response.text[:500]}")
+        response.raise_for_status()
+        task_uri = task_uri_from_response(response)
+        logger.info(f"[펌웨어 업데이트] 업로드 완료, 작업: {task_uri}")
+        return task_uri
+
+    def multipart_firmware_update(self, file_path, progress_callback=None, is_cancelled=None):
+        """여러 펌웨어 파일을 차례로 스트리밍 업로드 (파일마다 작업 URI 반환)
+
+        progress_callback(파일 순번, 보낸 바이트, 전체 바이트)
         """
         if isinstance(file_path, list):
             results = []
-            for single_file in file_path:
-                result = self.update_firmware(file_path=single_file)
-                results.append(result)
+            for index, single_file in enumerate(file_path):
+                callback = (lambda sent, total, index=index: progress_callback(index, sent, total)) if progress_callback else None
+                results.append(self.update_firmware(file_path=single_file, progress_callback=callback,
+                                                    is_cancelled=is_cancelled))
             return results
         else:
-            return self.update_firmware(file_path=file_path)
+            callback = (lambda sent, total: progress_callback(0, sent, total)) if progress_callback else None
+            return self.update_firmware(file_path=file_path, progress_callback=callback, is_cancelled=is_cancelled)
 
     def get_firmware_queue(self):
         """펌웨어 업데이트 대기열 조회"""
@@ -896,7 +1035,10 @@ class DellServerManager:
             url = self.endpoints.get_job_details_url(job_id)
             response = self.session.get(url, auth=self.auth, verify=False)
             response.raise_for_status()
-            return response.json()
+            job = response.json()
+            # 펌웨어 작업이 끝나면 인벤토리 캐시 무효화
+            self.note_firmware_job(job)
+            return job
         except Exception as e:
             logger.error(f"Job 상세 정보 조회 실패 (Job ID: {job_id}): {str(e)}")
             raise
@@ -912,106 +1054,78 @@ class DellServerManager:
             logger.error(f"Job 삭제 실패 (Job ID: {job_id}): {str(e)}")
             raise
 
-    def collect_tsr_log(self, progress_callback=None):
-        try:
-            basic_info = self.fetch_basic_info()
-            service_tag = basic_info['system'].get('ServiceTag', "Unknown")
+    def collect_tsr_log(self, progress_callback=None, download_dir=None, is_cancelled=None):
+        """TSR 로그 수집 후 다운로드 경로 반환 (실패 시 None)
 
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"TSR_Log_{service_tag}_{timestamp}.zip"
-            
-            data = {
-                "ShareType": "Local",
-            }
-            
-            logger.info(f"TSR 로그 수집 요청 시작: {filename}")
-            response = requests.post(
-                self.endpoints.tsr_export,
-                json=data,
-                auth=self.auth,
-                headers={'Content-Type': 'application/json'},
-                verify=False
-            )
-            
-            if response.status_code != 202:
-                raise Exception(f"TSR 로그 수집 요청 실패: {response.text}")
-            
-            task_uri = response.headers.get('Location') or response.json().get('@odata.id')
-            if not task_uri:
-                raise Exception("작업 상태를 모니터링할 수 없습니다.")
-            
-            logger.info("TSR 로그 수집 작업 모니터링 시작")
-            while True:
-                task_response = requests.get(
-                    f"{self.endpoints.base_url}{task_uri}",
-                    auth=self.auth,
-                    verify=False
-                )
-                
-                task_data = task_response.json()
-                task_state = task_data.get('TaskState')
-                if task_state == 'Completed':
-                    logger.info("TSR 로그 수집 완료")
-                    break
-                elif task_state in ['Failed', 'Exception', 'Killed']:
-                    error_message = task_data.get('Messages', [{}])[0].get('Message', '알 수 없는 오류')
-                    raise Exception(f"TSR 로그 수집 실패: {error_message}")
-                
-                time.sleep(2)
-                if progress_callback:
-                    progress_callback(task_data.get('PercentComplete', 0))
-            
-            logger.info("TSR 로그 파일 다운로드 시작")
-            download_url = f"{self.endpoints.firmware_inventory}/{filename}"
-            download_response = requests.get(
-                download_url,
-                auth=self.auth,
-                verify=False,
-                stream=True
-            )
-            
-            if download_response.status_code == 200:
-                download_path = os.path.join(os.path.expanduser("~"), "Downloads", filename)
-                total_size = int(download_response.headers.get('content-length', 0))
-                downloaded = 0
-                with open(download_path, 'wb') as file:
-                    for chunk in download_response.iter_content(chunk_size=8192):
-                        file.write(chunk)
-                        downloaded += len(chunk)
-                        if progress_callback and total_size:
-                            progress = (downloaded / total_size) * 100
-                            progress_callback(progress)
-                
-                logger.info(f"TSR 로그 다운로드 완료: {download_path}")
-                return download_path
-            else:
-                raise Exception(f"TSR 로그 다운로드 실패: HTTP 상태 코드 {download_response.status_code}")
-        
+        progress_callback(퍼센트): TSR 생성 0~80%, 다운로드 80~100%
+        """
+        def on_progress(stage, percent):
+            if progress_callback:
+                progress_callback(80 + percent * 0.2 if stage == STAGE_DOWNLOAD else
+                                  100 if stage == STAGE_VERIFY else percent * 0.8)
+
+        try:
+            return TsrCollector(self, on_progress, is_cancelled).collect(download_dir)
         except Exception as e:
             logger.error(f"TSR 로그 수집 중 오류 발생: {str(e)}")
             return None
 
+    def note_firmware_job(self, job):
+        """작업 상태 전달 - 펌웨어 작업이 끝나 인벤토리 캐시가 무효화되면 받아 둔 상세 정보도 삭제"""
+        if firmware_inventory_cache.note_job(self.host, job):
+            self._firmware_components = {}
+
     def fetch_firmware_component(self, component_id: str):
-        """특정 컴포넌트의 펌웨어 정보 조회"""
+        """특정 컴포넌트의 펌웨어 정보 조회 (인벤토리 전체를 받아 둔 경우 캐시 사용)"""
+        if component_id in self._firmware_components:
+            return self._firmware_components[component_id]
         try:
-            response = requests.get(
-                self.endpoints.get_firmware_inventory_component_url(component_id),
-                auth=self.auth,
-                verify=False
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._request_firmware_component(component_id)
         except Exception as e:
             logger.error(f"펌웨어 컴포넌트 정보 조회 실패: {str(e)}")
             raise
 
+    def _request_firmware_component(self, component_id):
+        """컴포넌트 상세 조회 (캐시 사용 안 함)"""
+        response = self.session.get(
+            self.endpoints.get_firmware_inventory_component_url(component_id),
+            auth=self.auth,
+            verify=False,
+            timeout=30
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_network_attributes(self, adapter_id: str, func_id: str):
+        """NIC 기능의 DellNetworkAttributes 조회 (캐시 사용 안 함)"""
+        url = self.endpoints.get_network_adapter_attributes_url(adapter_id, func_id)
+        response = self.session.get(url, auth=self.auth, verify=False, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_nic_attributes(self, nic_data=None, refresh=False, functions=None):
+        """NIC 기능 속성을 한 번에 동시 조회 {(어댑터 ID, 기능 ID): 응답} (캐시 우선)
+
+        functions([(어댑터 ID, 기능 ID, 펌웨어 버전)])를 주면 해당 기능만, 아니면 모든 기능을 조회합니다.
+        """
+        collector = NicAttributeCollector(self, self.NIC_FETCH_WORKERS)
+        if functions is not None:
+            return collector.collect_functions(functions, refresh)
+        if nic_data is None:
+            nic_data = self.fetch_network_adapters_info()
+        return collector.collect(nic_data, refresh)
+
+    def _cached_network_attributes(self, adapter_id, func_id):
+        data = nic_attribute_cache.get(self.host, adapter_id, func_id)
+        if data is None:
+            data = self.fetch_network_attributes(adapter_id, func_id)
+            nic_attribute_cache.put(self.host, adapter_id, func_id, None, data)
+        return data
+
     def fetch_network_virtualization_info(self, adapter_id: str, func_id: str):
         """네트워크 가상화 설정 정보 조회"""
         try:
-            url = self.endpoints.get_network_adapter_attributes_url(adapter_id, func_id)
-            response = requests.get(url, auth=self.auth, verify=False)
-            response.raise_for_status()
-            return response.json()
+            return self._cached_network_attributes(adapter_id, func_id)
         except Exception as e:
             logger.error(f"네트워크 가상화 설정 정보 조회 실패: {str(e)}")
             raise
@@ -1019,14 +1133,61 @@ class DellServerManager:
     def fetch_all_network_settings(self, adapter_id: str, func_id: str):
         """모든 네트워크 설정 정보 조회"""
         try:
-            url = self.endpoints.get_network_adapter_attributes_url(adapter_id, func_id)
-            response = requests.get(url, auth=self.auth, verify=False)
-            response.raise_for_status()
-            return response.json()
+            return self._cached_network_attributes(adapter_id, func_id)
         except Exception as e:
             logger.error(f"네트워크 설정 조회 실패: {str(e)}")
             raise
 
+    def _fetch_registry_document(self, url):
+        """레지스트리 URL -> 레지스트리 문서 (파일 정보면 Location의 영어 문서를 따라감)"""
+        response = self.session.get(url, auth=self.auth, verify=False, timeout=60)
+        response.raise_for_status()
+        document = response.json()
+        if 'RegistryEntries' in document:
+            return document
+        locations = [location for location in document.get('Location', []) if location.get('Uri')]
+        if not locations:
+            raise ValueError(f"레지스트리 위치 정보가 없습니다: {url}")
+        location = next((location for location in locations
+                         if str(location.get('Language', '')).lower().startswith('en')), locations[0])
+        response = self.session.get(f"{self.endpoints.base_url}{location['Uri']}", auth=self.auth,
+                                    verify=False, timeout=60)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_bios_registry(self, registry_id=None):
+        """BIOS 속성 레지스트리 문서 조회 (Bios/BiosRegistry, 없으면 Registries 컬렉션)"""
+        try:
+            return self._fetch_registry_document(self.endpoints.bios_registry)
+        except Exception as e:
+            if not registry_id:
+                logger.error(f"BIOS 레지스트리 조회 실패: {str(e)}")
+                raise
+            logger.debug(f"Bios/BiosRegistry 조회 실패, Registries 컬렉션 사용: {str(e)}")
+            # 'BiosAttributeRegistry.v1_0_3' -> 'BiosAttributeRegistry'
+            return self._fetch_registry_document(self.endpoints.get_registry_url(registry_id.split('.')[0]))
+
+    def fetch_nic_registry(self, func_id: str):
+        """NIC 기능의 네트워크 속성 레지스트리 문서 조회"""
+        return self._fetch_registry_document(self.endpoints.get_network_attributes_registry_url(func_id))
+
+    def bios_registry(self, bios_info=None):
+        """현재 BIOS 버전의 속성 레지스트리 조회기 (디스크 캐시 우선, 없으면 None)"""
+        try:
+            bios_info = bios_info or self.fetch_bios_info()
+            registry_id = bios_info.get('AttributeRegistry') or BIOS_REGISTRY_ID
+            version = bios_info.get('Attributes', {}).get('SystemBiosVersion')
+            return attribute_registry_cache.view(registry_id, version,
+                                                 lambda: self.fetch_bios_registry(registry_id))
+        except Exception as e:
+            logger.error(f"BIOS 레지스트리 준비 실패: {str(e)}")
+            return None
+
+    def nic_registry(self, adapter, func_id):
+        """NIC 어댑터 모델/펌웨어 버전의 속성 레지스트리 조회기 (없으면 None)"""
+        return attribute_registry_cache.view(NIC_REGISTRY_ID, nic_registry_version(adapter),
+                                             lambda: self.fetch_nic_registry(func_id))
+
     def update_bios_settings(self, settings: dict) -> bool:
         """
         BIOS 설정을 변경합니다.
@@ -1036,26 +1197,70 @@ class DellServerManager:
                            예: {"BootMode": "Uefi", "EmbNic1": "Enabled"}
 
         Returns:
-            bool: 설정 변경 작업이 성공적으로 큐에 추가되었는지 여부
+            bool: 설정 변경이 BIOS 대기 설정으로 등록되었는지 여부
+                  (실제 반영은 create_bios_config_job으로 만든 작업이 재부팅 때 수행)
+
+        Raises:
+            Exception: iDRAC가 요청을 거부한 경우 (응답 메시지 포함)
         """
         try:
-            logger.info("BIOS 설정 변경 시도")
+            logger.info(f"BIOS 설정 변경 시도: {', '.join(settings)}")
             response = self.session.patch(
                 self.endpoints.bios_settings,
-                json={"Attributes": settings}
+                json={"Attributes": settings},
+                auth=self.auth,
+                verify=False,
+                timeout=30
             )
             
             if response.status_code in [200, 202]:
                 logger.info("BIOS 설정 변경 작업이 성공적으로 큐에 추가됨")
+                if 'Location' in response.headers:
+                    task_monitor.watch(self, response.headers['Location'], "BIOS 설정 변경")
                 return True
             else:
-                logger.error(f"BIOS 설정 변경 실패. 상태 코드: {response.status_code}")
-                return False
+                message = _redfish_error_message(response)
+                logger.error(f"BIOS 설정 변경 실패. 상태 코드: {response.status_code}, {message}")
+                raise Exception(f"BIOS 설정 변경 실패 (HTTP {response.status_code}): {message}")
                 
         except Exception as e:
             logger.error(f"BIOS 설정 변경 중 오류 발생: {str(e)}")
             raise
 
+    def create_bios_config_job(self):
+        """대기 중인 BIOS 설정을 적용할 설정 작업 생성 (다음 재부팅 때 실행, 작업 ID 반환)"""
+        try:
+            response = self.session.post(
+                self.endpoints.manager_jobs,
+                json={"TargetSettingsURI": URLPattern.BIOS_SETTINGS},
+                auth=self.auth,
+                verify=False,
+                timeout=30
+            )
+            if response.status_code not in [200, 201, 202, 204]:
+                raise Exception(f"BIOS 설정 작업 생성 실패 (HTTP {response.status_code}): "
+                                f"{_redfish_error_message(response)}")
+            location = response.headers.get('Location', '')
+            job_id = location.rstrip('/').split('/')[-1] if location else None
+            if not job_id:
+                try:
+                    job_id = response.json().get('Id')
+                except ValueError:
+                    job_id = None
+            logger.info(f"BIOS 설정 작업 생성 성공 (Job ID: {job_id})")
+            task_monitor.watch(self, location or job_id, "BIOS 설정 적용")
+            return job_id
+        except Exception as e:
+            logger.error(f"BIOS 설정 작업 생성 실패: {str(e)}")
+            raise
+
+    def fetch_pending_bios_jobs(self):
+        """아직 끝나지 않은 BIOS 설정 작업 목록 (작업 추적기 기준)"""
+        self.job_tracker.refresh(force=True)
+        return [job for job in self.job_tracker.active_jobs()
+                if job.get('JobType') == 'BIOSConfiguration'
+                or URLPattern.BIOS_SETTINGS in str(job.get('TargetSettingsURI', ''))]
+
     def reset_bios(self) -> bool:
         """
         BIOS를 기본 설정으로 초기화합니다.
@@ -1078,6 +1283,7 @@ class DellServerManager:
                 if 'Location' in response.headers:
                     job_uri = response.headers['Location']
                     logger.info(f"BIOS 리셋 작업 ID: {job_uri}")
+                    task_monitor.watch(self, job_uri, "BIOS 초기화")
                 return True
             else:
                 logger.error(f"BIOS 리셋 실패. 상태 코드: {response.status_code}")
@@ -1089,14 +1295,14 @@ class DellServerManager:
 
     def get_bios_settings(self) -> dict:
         """
-        현재 BIOS 설정을 조회합니다.
+        재부팅 후 적용될 BIOS 대기 설정을 조회합니다.
 
         Returns:
-            dict: 현재 BIOS 설정 정보
+            dict: 대기 중인 BIOS 설정 (변경 요청한 속성만 포함)
         """
         try:
             logger.info("BIOS 설정 조회 시도")
-            response = self.session.get(self.endpoints.bios_settings)
+            response = self.session.get(self.endpoints.bios_settings, auth=self.auth, verify=False, timeout=30)
             
             if response.status_code == 200:
                 logger.info("BIOS 설정 조회 성공")
@@ -1109,40 +1315,19 @@ class DellServerManager:
             logger.error(f"BIOS 설정 조회 중 오류 발생: {str(e)}")
             raise
 
-    def update_firmware(self, file_path: str) -> bool:
-        """
-        펌웨어 업데이트를 시작합니다.
-
-        Args:
-            file_path (str): 펌웨어 파일 경로
-
-        Returns:
-            bool: 업데이트 작업이 성공적으로 큐에 추가되었는지 여부
-        """
-        try:
-            with open(file_path, 'rb') as f:
-                files = {'file': f}
-                response = self.session.post(
-                    self.endpoints.firmware_update,
-                    files=files,
-                    auth=self.auth,
-                    verify=False
-                )
-                
-                if response.status_code in [200, 202]:
-                    logger.info("펌웨어 업데이트 작업이 성공적으로 큐에 추가됨")
-                    return True
-                else:
-                    logger.error(f"펌웨어 업데이트 실패. 상태 코드: {response.status_code}")
-                    return False
-                    
-        except Exception as e:
-            logger.error(f"펌웨어 업데이트 중 오류 발생: {str(e)}")
-            raise
+    def fetch_bios_attributes(self):
+        """(현재 BIOS 속성, 재부팅 후 적용될 대기 속성) 동시 조회"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(
+                self.session.get, self.endpoints.bios, auth=self.auth, verify=False, timeout=30)
+            pending_future = executor.submit(self.get_bios_settings)
+            response = current_future.result()
+            response.raise_for_status()
+            return response.json().get('Attributes', {}), pending_future.result()
 
     def update_firmware_multipart(self, file_path: str) -> bool:
         """
-        대용량 펌웨어 파일을 멀티파트 업로드로 업데이트합니다.
+        대용량 펌웨어 파일을 멀티파트 스트리밍 업로드로 업데이트합니다.
 
         Args:
             file_path (str): 펌웨어 파일 경로
@@ -1151,22 +1336,9 @@ class DellServerManager:
             bool: 업데이트 작업이 성공적으로 큐에 추가되었는지 여부
         """
         try:
-            with open(file_path, 'rb') as f:
-                files = {'file': f}
-                response = self.session.post(
-                    self.endpoints.firmware_multipart_update,
-                    files=files,
-                    auth=self.auth,
-                    verify=False
-                )
-                
-                if response.status_code in [200, 202]:
-                    logger.info("멀티파트 펌웨어 업데이트 작업이 성공적으로 큐에 추가됨")
-                    return True
-                else:
-                    logger.error(f"멀티파트 펌웨어 업데이트 실패. 상태 코드: {response.status_code}")
-                    return False
-                    
+            task_uri = self.upload_firmware_multipart(file_path)
+            logger.info(f"멀티파트 펌웨어 업데이트 작업이 성공적으로 큐에 추가됨: {task_uri}")
+            return True
         except Exception as e:
             logger.error(f"멀티파트 펌웨어 업데이트 중 오류 발생: {str(e)}")
             raise
@@ -1379,6 +1551,7 @@ class DellServerManager:
             response.raise_for_status()
             job_id = response.json().get('Id')
             logger.info(f"시스템 재시작 예약 성공 (Job ID: {job_id})")
+            task_monitor.watch(self, response.headers.get('Location') or job_id, "시스템 재시작 예약")
             return job_id
         except Exception as e:
             logger.error(f"시스템 재시작 예약 실패: {str(e)}")
@@ -0,0 +1,103 @@
+import json
+import os
+import uuid
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 파일을 읽어 보내는 단위 (1MB)
+SUPPORTED_PACKAGE_EXTENSIONS = ('.exe', '.bin', '.d7', '.d8', '.d9', '.pm', '.sc', '.upm', '.pmc')
+
+class UploadCancelled(Exception):
+    """사용자가 업로드를 취소한 경우"""
+
+class MultipartFileStream:
+    """multipart/form-data 본문을 파일에서 조금씩 읽어 만드는 스트림
+
+    JSON 파라미터 파트와 파일 파트 머리/꼬리만 메모리에 두고 파일 내용은
+    UPLOAD_CHUNK_SIZE 단위로 읽어 보내므로, 패키지 크기와 관계없이 메모리
+    사용량이 일정합니다. 전체 길이를 미리 계산해 Content-Length로 보내며,
+    실제로 전송한 파일 바이트 수로 progress_callback(보낸 바이트, 전체 바이트)를
+    호출합니다.
+    """
+
+    def __init__(self, file_path, parameters=None, file_field='UpdateFile', parameters_field='UpdateParameters',
+                 progress_callback=None, is_cancelled=None):
+        self.file_path = file_path
+        self.file_size = os.path.getsize(file_path)
+        self.boundary = uuid.uuid4().hex
+        self.progress_callback = progress_callback
+        self.is_cancelled = is_cancelled
+
+        head = b''
+        if parameters is not None:
+            head += self._part_header(parameters_field, 'application/json')
+            head += json.dumps(parameters).encode('utf-8') + b'\r\n'
+        head += self._part_header(file_field, 'application/octet-stream', os.path.basename(file_path))
+        self._head = head
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode('ascii')
+        self._file = None
+        self._stage = 0  # 0: 머리, 1: 파일, 2: 꼬리, 3: 끝
+        self.sent = 0
+
+    def _part_header(self, name, content_type, filename=None):
+        disposition = f'form-data; name="{name}"'
+        if filename:
+            disposition += f'; filename="{filename}"'
+        return (f"--{self.boundary}\r\n"
+                f"Content-Disposition: {disposition}\r\n"
+                f"Content-Type: {content_type}\r\n\r\n").encode('utf-8')
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self):
+        return len(self._head) + self.file_size + len(self._tail)
+
+    def read(self, size=-1):
+        if self._stage == 0:
+            self._stage = 1
+            self._file = open(self.file_path, 'rb')
+            return self._head
+        if self._stage == 1:
+            if self.is_cancelled and self.is_cancelled():
+                self.close()
+                raise UploadCancelled("업로드가 취소되었습니다.")
+            chunk = self._file.read(UPLOAD_CHUNK_SIZE if size is None or size < 0 else max(size, UPLOAD_CHUNK_SIZE))
+            if chunk:
+                self.sent += len(chunk)
+                if self.progress_callback:
+                    self.progress_callback(self.sent, self.file_size)
+                return chunk
+            self._file.close()
+            self._stage = 2
+        if self._stage == 2:
+            self._stage = 3
+            return self._tail
+        return b''
+
+    def __iter__(self):
+        while True:
+            chunk = self.read()
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        self._stage = 3
+
+def task_uri_from_response(response):
+    """작업 생성 응답에서 작업(Task/Job) URI 추출"""
+    location = response.headers.get('Location')
+    if location:
+        # 일부 펌웨어는 전체 URL을 돌려줌
+        return '/redfish/' + location.split('/redfish/', 1)[1] if '/redfish/' in location else location
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    return body.get('@odata.id') or body.get('Id')
@@ -0,0 +1,168 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.system.log_config import setup_logging
+from utils.firmware_cache import TERMINAL_JOB_STATES
+
+logger = setup_logging()
+
+def job_id_of(member):
+    return member.get('Id') or member.get('@odata.id', '').rstrip('/').split('/')[-1]
+
+def is_terminal(job):
+    return job.get('JobState') in TERMINAL_JOB_STATES
+
+def _job_signature(job):
+    return (job.get('JobState'), job.get('PercentComplete'), job.get('Message'), job.get('EndTime'))
+
+class JobTracker:
+    """iDRAC 작업 큐 추적기
+
+    $expand를 지원하면 작업 컬렉션 한 번으로 전체 상세를 받고, 지원하지 않으면
+    목록만 받아 처음 보는 작업과 아직 끝나지 않은 작업만 상세 조회합니다.
+    완료/실패 등 종료 상태가 된 작업은 다시 조회하지 않고 그대로 보관합니다.
+    진행 중인 작업은 변화가 없을수록 조회 간격을 늘리며(MIN~MAX_INTERVAL),
+    refresh() 결과는 {'added', 'updated', 'removed'}로 구독자에게 알립니다.
+    """
+
+    MIN_INTERVAL = 5  # 진행 중인 작업 조회 간격(초)
+    MAX_INTERVAL = 60
+    IDLE_INTERVAL = 60  # 진행 중인 작업이 없을 때 목록 확인 간격(초)
+    BACKOFF = 2
+    DETAIL_WORKERS = 8
+
+    def __init__(self, server_manager):
+        self.server_manager = server_manager
+        self._jobs = {}  # 작업 ID -> 작업 상세
+        self._schedule = {}  # 진행 중인 작업 ID -> [다음 조회 시각, 현재 간격]
+        self._expand_supported = None
+        self._listeners = []
+        self._lock = threading.RLock()
+
+    def clear(self):
+        with self._lock:
+            self._jobs.clear()
+            self._schedule.clear()
+            self._expand_supported = None
+
+    def add_listener(self, callback):
+        """변경 알림 구독 (callback(changes), refresh를 호출한 스레드에서 실행)"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def jobs(self):
+        """추적 중인 작업 목록 (시작 시각 내림차순)"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.get('StartTime') or '', reverse=True)
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_jobs(self):
+        with self._lock:
+            return [job for job in self._jobs.values() if not is_terminal(job)]
+
+    def suggested_interval(self):
+        """다음 refresh까지 권장 대기 시간(초)"""
+        with self._lock:
+            if not self._schedule:
+                return self.IDLE_INTERVAL
+            now = time.monotonic()
+            return max(self.MIN_INTERVAL, min(due - now for due, _ in self._schedule.values()))
+
+    def _fetch_collection(self):
+        """(구성원 목록, 상세 포함 여부)"""
+        session = self.server_manager.session
+        url = self.server_manager.endpoints.job_collection
+        if self._expand_supported is not False:
+            try:
+                response = session.get(f"{url}?$expand=*($levels=1)", auth=self.server_manager.auth,
+                                       verify=False, timeout=30)
+                if response.status_code == 200:
+                    members = response.json().get('Members', [])
+                    if all('JobState' in member for member in members):
+                        self._expand_supported = True
+                        return members, True
+                self._expand_supported = False
+                logger.debug("작업 컬렉션 $expand 미지원, 개별 조회로 전환")
+            except Exception as e:
+                logger.debug(f"작업 컬렉션 $expand 조회 실패: {str(e)}")
+        return self.server_manager.fetch_job_queue().get('Members', []), False
+
+    def _due_ids(self, current_ids, now, force):
+        with self._lock:
+            return [job_id for job_id in current_ids
+                    if job_id not in self._jobs
+                    or (not is_terminal(self._jobs[job_id])
+                        and (force or self._schedule.get(job_id, [0])[0] <= now))]
+
+    def refresh(self, force=False):
+        """작업 큐를 확인해 변경 사항 반환 {'added': [...], 'updated': [...], 'removed': [ID...]}
+
+        force가 True이면 조회 간격과 관계없이 진행 중인 작업을 모두 다시 확인합니다.
+        """
+        members, expanded = self._fetch_collection()
+        now = time.monotonic()
+        current_ids = [job_id_of(member) for member in members]
+
+        if expanded:
+            fetched = {job_id_of(member): member for member in members}
+        else:
+            due_ids = self._due_ids(current_ids, now, force)
+            fetched = {}
+            if due_ids:
+                with ThreadPoolExecutor(max_workers=min(self.DETAIL_WORKERS, len(due_ids))) as executor:
+                    for job_id, job in zip(due_ids, executor.map(self._fetch_detail, due_ids)):
+                        if job is not None:
+                            fetched[job_id] = job
+
+        changes = {'added': [], 'updated': [], 'removed': []}
+        with self._lock:
+            for job_id, job in fetched.items():
+                previous = self._jobs.get(job_id)
+                if previous is not None and is_terminal(previous):
+                    # 종료된 작업은 다시 바뀌지 않음
+                    continue
+                self.server_manager.note_firmware_job(job)
+                self._jobs[job_id] = job
+                if previous is None:
+                    changes['added'].append(job)
+                elif _job_signature(previous) != _job_signature(job):
+                    changes['updated'].append(job)
+                self._reschedule(job_id, job, previous, now)
+
+            for job_id in set(self._jobs) - set(current_ids):
+                del self._jobs[job_id]
+                self._schedule.pop(job_id, None)
+                changes['removed'].append(job_id)
+
+        if any(changes.values()):
+            for callback in list(self._listeners):
+                try:
+                    callback(changes)
+                except Exception as e:
+                    logger.error(f"작업 변경 알림 처리 실패: {str(e)}")
+        return changes
+
+    def _fetch_detail(self, job_id):
+        try:
+            return self.server_manager.fetch_job_details(job_id)
+        except Exception:
+            return None
+
+    def _reschedule(self, job_id, job, previous, now):
+        if is_terminal(job):
+            self._schedule.pop(job_id, None)
+            return
+        interval = self._schedule.get(job_id, [0, self.MIN_INTERVAL])[1]
+        if previous is None or _job_signature(previous) != _job_signature(job):
+            interval = self.MIN_INTERVAL
+        else:
+            interval = min(interval * self.BACKOFF, self.MAX_INTERVAL)
+        self._schedule[job_id] = [now + interval, interval]
@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+NIC_FETCH_WORKERS = 8  # NIC 속성 동시 조회 수
+
+def adapter_firmware(adapter):
+    """어댑터의 컨트롤러 펌웨어 버전 (없으면 None)"""
+    controllers = adapter.get('Controllers') or [{}]
+    return controllers[0].get('FirmwarePackageVersion')
+
+def nic_functions(nic_data):
+    """fetch_network_adapters_info 결과 -> [(어댑터 ID, 기능 ID, 펌웨어 버전)]"""
+    targets = []
+    for adapter in (nic_data or {}).get('NetworkAdapters', []):
+        firmware = adapter_firmware(adapter)
+        for function in adapter.get('NetworkDeviceFunctions', []):
+            if function.get('Id'):
+                targets.append((adapter.get('Id'), function['Id'], firmware))
+    return targets
+
+def supports_virtualization(adapter):
+    return any(controller.get('ControllerCapabilities', {}).get('VirtualizationOffload', {})
+               .get('SRIOV', {}).get('SRIOVVEPACapable', False) for controller in adapter.get('Controllers', []))
+
+def port_functions(nic_data, virtualization_only=False):
+    """포트별 첫 번째 기능({포트 ID}-1) 목록 -> [(어댑터 ID, 기능 ID, 펌웨어 버전)]"""
+    targets = []
+    for adapter in (nic_data or {}).get('NetworkAdapters', []):
+        if virtualization_only and not supports_virtualization(adapter):
+            continue
+        firmware = adapter_firmware(adapter)
+        for port in adapter.get('NetworkPorts', []):
+            if port.get('Id'):
+                targets.append((adapter.get('Id'), f"{port['Id']}-1", firmware))
+    return targets
+
+class NicAttributeCache:
+    """서버별 NIC 기능 속성(DellNetworkAttributes) 캐시
+
+    키는 (호스트, 어댑터 ID, 기능 ID)이고 항목마다 조회 당시 어댑터 펌웨어 버전을
+    함께 보관해, 펌웨어가 바뀌었거나 TTL이 지나면 다시 조회합니다. NIC 속성은
+    설정 작업과 재부팅을 거쳐야 바뀌므로 화면을 다시 열 때마다 받을 필요가 없습니다.
+    """
+
+    TTL = 600
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, host, adapter_id, func_id, firmware=None):
+        with self._lock:
+            entry = self._entries.get((host, adapter_id, func_id))
+        if entry is None or time.time() - entry['fetched_at'] > self.TTL:
+            return None
+        if firmware and entry['firmware'] and entry['firmware'] != firmware:
+            return None
+        return entry['data']
+
+    def put(self, host, adapter_id, func_id, firmware, data):
+        with self._lock:
+            self._entries[(host, adapter_id, func_id)] = {
+                'firmware': firmware,
+                'fetched_at': time.time(),
+                'data': data,
+            }
+
+    def invalidate(self, host=None):
+        """호스트(없으면 전체) 캐시 삭제"""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == host]:
+                    del self._entries[key]
+
+class NicAttributeCollector:
+    """서버 한 대의 NIC 기능 속성을 한 번에 동시 조회
+
+    어댑터/기능을 하나씩 순서대로 요청하지 않고, 캐시에 없는 기능만 모아 작업
+    스레드에서 함께 요청합니다. 한 기능의 조회 실패는 그 기능만 결과에서 빠집니다.
+    """
+
+    def __init__(self, server_manager, max_workers=NIC_FETCH_WORKERS):
+        self.server_manager = server_manager
+        self.max_workers = max_workers
+
+    def collect(self, nic_data, refresh=False):
+        """모든 NIC 기능 -> {(어댑터 ID, 기능 ID): DellNetworkAttributes 응답}"""
+        return self.collect_functions(nic_functions(nic_data), refresh)
+
+    def collect_functions(self, targets, refresh=False):
+        """[(어댑터 ID, 기능 ID, 펌웨어 버전)] -> {(어댑터 ID, 기능 ID): DellNetworkAttributes 응답}"""
+        host = self.server_manager.host
+        results = {}
+        missing = []
+        for adapter_id, func_id, firmware in targets:
+            cached = None if refresh else nic_attribute_cache.get(host, adapter_id, func_id, firmware)
+            if cached is not None:
+                results[(adapter_id, func_id)] = cached
+            else:
+                missing.append((adapter_id, func_id, firmware))
+
+        if missing:
+            started = time.time()
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                futures = {executor.submit(self.server_manager.fetch_network_attributes, adapter_id, func_id):
+                           (adapter_id, func_id, firmware) for adapter_id, func_id, firmware in missing}
+                for future in as_completed(futures):
+                    adapter_id, func_id, firmware = futures[future]
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        logger.error(f"NIC 속성 조회 실패 ({func_id}): {str(e)}")
+                        continue
+                    nic_attribute_cache.put(host, adapter_id, func_id, firmware, data)
+                    results[(adapter_id, func_id)] = data
+            logger.debug(f"NIC 속성 조회: 기능 {len(targets)}개 중 {len(missing)}개 요청 "
+                         f"({time.time() - started:.1f}초)")
+        return results
+
+# 전역 인스턴스
+nic_attribute_cache = NicAttributeCache()
@@ -0,0 +1,244 @@
+import re
+import threading
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+_BAY_PATTERN = re.compile(r"Disk\.Bay\.(\d+)")
+_ENCLOSURE_PATTERN = re.compile(r"(Enclosure\.[^:]+)")
+
+def bay_number(drive_id):
+    """드라이브 ID(Disk.Bay.X:Enclosure...)에서 Bay 번호 추출 (Bay 형식이 아니면 None)"""
+    match = _BAY_PATTERN.search(drive_id or '')
+    return int(match.group(1)) if match else None
+
+def enclosure_of(drive_id):
+    """드라이브 ID에서 인클로저 ID 추출 (Disk.Bay.0:Enclosure.Internal.0-1:... -> Enclosure.Internal.0-1)"""
+    match = _ENCLOSURE_PATTERN.search(drive_id or '')
+    return match.group(1) if match else ''
+
+def sort_drives_by_bay(drives):
+    """Bay 번호 순으로 드라이브 정렬 (Bay 형식이 아닌 드라이브는 원래 순서로 뒤에 배치)"""
+    def sort_key(drive):
+        bay = bay_number(drive.get('Id', ''))
+        return float('inf') if bay is None else bay
+    return sorted(drives, key=sort_key)
+
+def _etag(response, data):
+    return response.headers.get('ETag') or data.get('@odata.etag')
+
+class StorageTopology:
+    """컨트롤러 → 볼륨 → 드라이브 구성 캐시
+
+    컬렉션과 각 리소스를 If-None-Match 조건부 요청으로 조회해 304 응답이거나
+    @odata.etag가 이전과 같으면 캐시한 객체를 그대로 사용하고, 컬렉션 구성이나
+    리소스 내용이 바뀐 경우에만 Bay/볼륨/상태별 색인을 다시 만듭니다.
+    색인 조회(예: Bay 7 드라이브가 속한 볼륨)는 추가 요청 없이 처리합니다.
+    """
+
+    def __init__(self, server_manager):
+        self.server_manager = server_manager
+        self._lock = threading.RLock()
+        self._resources = {}  # URI -> (etag, 데이터)
+        self.controllers = {}  # 컨트롤러 URI -> 컨트롤러 데이터
+        self.volumes = {}  # 볼륨 URI -> 볼륨 데이터
+        self.drives = {}  # 드라이브 ID -> 드라이브 데이터
+        self._reset_indexes()
+        self.loaded = False
+
+    def _reset_indexes(self):
+        self.by_bay = {}  # (컨트롤러 ID, 인클로저 ID, Bay 번호) -> 드라이브 ID
+        self.bay_drives = {}  # Bay 번호 -> 드라이브 ID 목록 (컨트롤러/인클로저를 모를 때)
+        self.by_state = {}  # RaidStatus -> 드라이브 ID 집합
+        self.drive_volumes = {}  # 드라이브 ID -> 볼륨 URI 목록
+        self.drive_controller = {}  # 드라이브 ID -> 컨트롤러 URI
+        self.volume_drives = {}  # 볼륨 URI -> 드라이브 ID 목록 (Bay 순)
+        self.volume_controller = {}  # 볼륨 URI -> 컨트롤러 URI
+
+    def clear(self):
+        with self._lock:
+            self._resources.clear()
+            self.controllers = {}
+            self.volumes = {}
+            self.drives = {}
+            self._reset_indexes()
+            self.loaded = False
+
+    # --- 조회 ---
+
+    def fetch(self, uri):
+        """조건부 GET (변경이 없으면 캐시한 데이터 반환), 반환값: (데이터, 변경 여부)"""
+        url = uri if uri.startswith('http') else f"{self.server_manager.endpoints.base_url}{uri}"
+        key = url[len(self.server_manager.endpoints.base_url):] if url.startswith(self.server_manager.endpoints.base_url) else url
+        cached = self._resources.get(key)
+        headers = {'If-None-Match': cached[0]} if cached and cached[0] else {}
+        response = self.server_manager.session.get(url, auth=self.server_manager.auth, headers=headers, verify=False)
+        if response.status_code == 304 and cached:
+            return cached[1], False
+        response.raise_for_status()
+        data = response.json()
+        etag = _etag(response, data)
+        # etag를 주지 않는 리소스는 내용 비교
+        if cached and (cached[0] == etag if etag else cached[1] == data):
+            return cached[1], False
+        self._resources[key] = (etag, data)
+        return data, True
+
+    def refresh(self):
+        """변경된 리소스만 다시 받아 구성과 색인 갱신, 변경 여부 반환"""
+        with self._lock:
+            collection, changed = self.fetch(self.server_manager.endpoints.storage)
+            controllers = {}
+            volumes = {}
+            drives = {}
+            for member in collection.get('Members', []):
+                controller_uri = member.get('@odata.id')
+                if not controller_uri:
+                    continue
+                controller, controller_changed = self.fetch(controller_uri)
+                changed |= controller_changed
+                controllers[controller_uri] = controller
+
+                volume_collection, volumes_changed = self._fetch_optional(f"{controller_uri}/Volumes")
+                changed |= volumes_changed
+                for volume_member in volume_collection.get('Members', []):
+                    volume_uri = volume_member.get('@odata.id')
+                    if volume_uri:
+                        volume, volume_changed = self.fetch(volume_uri)
+                        changed |= volume_changed
+                        volumes[volume_uri] = (controller_uri, volume)
+
+                for drive_link in controller.get('Drives', []):
+                    drive_uri = drive_link.get('@odata.id')
+                    if drive_uri:
+                        drive, drive_changed = self.fetch(drive_uri)
+                        changed |= drive_changed
+                        drives[drive.get('Id', drive_uri.split('/')[-1])] = (controller_uri, drive)
+
+            if changed or not self.loaded or len(drives) != len(self.drives):
+                self._build(controllers, volumes, drives)
+            self._prune(controllers, volumes, drives)
+            self.loaded = True
+            return changed
+
+    def _fetch_optional(self, uri):
+        try:
+            return self.fetch(uri)
+        except Exception as e:
+            logger.debug(f"선택 리소스 조회 실패 ({uri}): {str(e)}")
+            return {}, False
+
+    def _prune(self, controllers, volumes, drives):
+        """더 이상 구성에 없는 리소스의 캐시 삭제"""
+        alive = set(controllers) | set(volumes)
+        alive |= {f"{uri}/Volumes" for uri in controllers}
+        alive |= {drive.get('@odata.id') for _, drive in drives.values()}
+        alive.add(self.server_manager.endpoints.storage[len(self.server_manager.endpoints.base_url):])
+        for key in list(self._resources):
+            if key not in alive:
+                del self._resources[key]
+
+    def _build(self, controllers, volumes, drives):
+        self.controllers = controllers
+        self.volumes = {uri: volume for uri, (_, volume) in volumes.items()}
+        self.drives = {drive_id: drive for drive_id, (_, drive) in drives.items()}
+        self._reset_indexes()
+
+        for drive_id, (controller_uri, drive) in drives.items():
+            self.drive_controller[drive_id] = controller_uri
+            self._index_drive(drive_id, drive)
+
+        for volume_uri, (controller_uri, volume) in volumes.items():
+            self.volume_controller[volume_uri] = controller_uri
+            drive_ids = [link.get('@odata.id', '').split('/')[-1]
+                         for link in volume.get('Links', {}).get('Drives', [])]
+            drive_ids = [drive.get('Id') for drive in sort_drives_by_bay(
+                self.drives.get(drive_id, {'Id': drive_id}) for drive_id in drive_ids)]
+            self.volume_drives[volume_uri] = drive_ids
+            for drive_id in drive_ids:
+                self.drive_volumes.setdefault(drive_id, []).append(volume_uri)
+
+    def _controller_id(self, drive_id):
+        return self.drive_controller.get(drive_id, '').rstrip('/').split('/')[-1]
+
+    def _index_drive(self, drive_id, drive):
+        bay = bay_number(drive_id)
+        if bay is not None:
+            # 컨트롤러/인클로저마다 Bay 번호가 0부터 시작하므로 함께 구분
+            key = (self._controller_id(drive_id), enclosure_of(drive_id), bay)
+            if key not in self.by_bay:
+                self.bay_drives.setdefault(bay, []).append(drive_id)
+            self.by_bay[key] = drive_id
+        self.by_state.setdefault(self.drive_state(drive), set()).add(drive_id)
+
+    @staticmethod
+    def drive_state(drive):
+        return drive.get('Oem', {}).get('Dell', {}).get('DellPhysicalDisk', {}).get('RaidStatus', 'N/A')
+
+    def refresh_drive(self, drive_id):
+        """드라이브 하나만 조건부 조회해 상태 색인 갱신"""
+        with self._lock:
+            drive = self.drives.get(drive_id)
+            if drive is None or not drive.get('@odata.id'):
+                return None
+            updated, changed = self.fetch(drive['@odata.id'])
+            if changed:
+                for members in self.by_state.values():
+                    members.discard(drive_id)
+                self.drives[drive_id] = updated
+                self._index_drive(drive_id, updated)
+            return updated
+
+    # --- 색인 조회 (추가 요청 없음) ---
+
+    def _drive_id_at_bay(self, bay, controller=None, enclosure=None):
+        """Bay 번호의 드라이브 ID
+
+        controller(컨트롤러 ID 또는 URI)/enclosure로 범위를 좁히며, 조건에 맞는
+        드라이브가 여러 개면 어느 것인지 알 수 없으므로 None을 반환합니다.
+        """
+        bay = int(bay)
+        controller_id = controller.rstrip('/').split('/')[-1] if controller else None
+        if controller_id and enclosure:
+            return self.by_bay.get((controller_id, enclosure, bay))
+        matches = [drive_id for drive_id in self.bay_drives.get(bay, ())
+                   if (controller_id is None or self._controller_id(drive_id) == controller_id)
+                   and (enclosure is None or enclosure_of(drive_id) == enclosure)]
+        return matches[0] if len(matches) == 1 else None
+
+    def drive_at_bay(self, bay, controller=None, enclosure=None):
+        drive_id = self._drive_id_at_bay(bay, controller, enclosure)
+        return self.drives.get(drive_id) if drive_id else None
+
+    def volumes_of_drive(self, drive_id):
+        return [self.volumes[uri] for uri in self.drive_volumes.get(drive_id, []) if uri in self.volumes]
+
+    def volume_of_bay(self, bay, controller=None, enclosure=None):
+        """Bay 번호의 드라이브가 속한 (첫 번째) 볼륨"""
+        drive_id = self._drive_id_at_bay(bay, controller, enclosure)
+        volumes = self.volumes_of_drive(drive_id) if drive_id else []
+        return volumes[0] if volumes else None
+
+    def drives_in_volume(self, volume_uri):
+        """볼륨 구성 드라이브 (Bay 순)"""
+        return [self.drives[drive_id] for drive_id in self.volume_drives.get(volume_uri, []) if drive_id in self.drives]
+
+    def drives_by_state(self, state):
+        return [self.drives[drive_id] for drive_id in sorted(self.by_state.get(state, ())) if drive_id in self.drives]
+
+    def controller_of(self, drive_id):
+        return self.controllers.get(self.drive_controller.get(drive_id))
+
+    def to_storage_info(self):
+        """기존 fetch_storage_info 반환 형식 ({'Controllers': [...]}, 볼륨/드라이브 포함)"""
+        with self._lock:
+            result = []
+            for controller_uri, controller in self.controllers.items():
+                controller_data = dict(controller)
+                controller_data['Volumes'] = [volume for uri, volume in self.volumes.items()
+                                              if self.volume_controller.get(uri) == controller_uri]
+                controller_data['Drives'] = [drive for drive_id, drive in self.drives.items()
+                                             if self.drive_controller.get(drive_id) == controller_uri]
+                result.append(controller_data)
+            return {'Controllers': result}
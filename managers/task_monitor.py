@@ -0,0 +1,229 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+# Redfish Task(TaskState)와 Dell Job(JobState) 상태를 함께 처리
+SUCCESS_STATES = ('Completed', 'RebootCompleted')
+FAILURE_STATES = ('Exception', 'Killed', 'Cancelled', 'Failed', 'CompletedWithErrors', 'Interrupted',
+                  'RebootFailed')
+
+def normalize_task_uri(task_uri):
+    """Location 헤더 값/전체 URL/작업 ID -> '/redfish/...' 경로"""
+    if '/redfish/' in task_uri:
+        return '/redfish/' + task_uri.split('/redfish/', 1)[1]
+    if task_uri.startswith('/'):
+        return task_uri
+    return f"/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{task_uri}"
+
+class MonitoredTask:
+    """감시 중인 작업 하나의 상태"""
+
+    def __init__(self, key, server_manager, uri, label):
+        self.key = key
+        self.server_manager = server_manager
+        self.uri = uri
+        self.label = label or uri.rstrip('/').split('/')[-1]
+        self.host = server_manager.host
+        self.state = 'New'
+        self.percent = 0
+        self.message = ''
+        self.started_at = time.time()
+        self.finished_at = None
+        self.interval = TaskMonitor.MIN_INTERVAL
+        self.errors = 0
+        self.seen = False  # 한 번이라도 조회에 성공했는지
+
+    @property
+    def finished(self):
+        return self.finished_at is not None
+
+    @property
+    def succeeded(self):
+        return self.state in SUCCESS_STATES
+
+    def snapshot(self):
+        return {
+            'key': self.key,
+            'host': self.host,
+            'uri': self.uri,
+            'label': self.label,
+            'state': self.state,
+            'percent': self.percent,
+            'message': self.message,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'succeeded': self.succeeded,
+        }
+
+class TaskMonitor:
+    """여러 서버의 Redfish Task/Dell Job URI를 함께 감시하는 모니터
+
+    작업마다 스레드를 두지 않고, 스케줄러 스레드 하나가 다음 조회 시각 순으로
+    작업을 꺼내 소수의 작업 스레드에서 조회합니다. 진행률이 바뀌면 간격을
+    MIN_INTERVAL로 되돌리고, 그대로이면 MAX_INTERVAL까지 늘립니다(재부팅을 기다리는
+    예약 작업 등). 화면과 무관하게 동작하므로 창을 닫아도 감시가 계속되며,
+    구독자는 add_listener(callback(이벤트, 작업 정보))로 'progress'/'finished'를 받습니다.
+    """
+
+    MIN_INTERVAL = 2
+    MAX_INTERVAL = 30
+    BACKOFF = 1.5
+    MAX_ERRORS = 5  # 연속 조회 실패 허용 횟수
+    TASK_TIMEOUT = 12 * 60 * 60
+    WORKERS = 4
+
+    def __init__(self):
+        self._tasks = {}
+        self._queue = []  # (다음 조회 시각, 순번, 작업 키)
+        self._counter = itertools.count()
+        self._listeners = []
+        self._condition = threading.Condition()
+        self._executor = None
+        self._thread = None
+
+    def add_listener(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def watch(self, server_manager, task_uri, label=None):
+        """작업 URI 감시 시작 후 작업 키 반환 (이미 감시 중이면 같은 키)"""
+        if not task_uri:
+            return None
+        uri = normalize_task_uri(str(task_uri))
+        key = f"{server_manager.host}{uri}"
+        with self._condition:
+            if key not in self._tasks or self._tasks[key].finished:
+                self._tasks[key] = MonitoredTask(key, server_manager, uri, label)
+                self._push(key, 0)
+                logger.info(f"작업 감시 시작: {key} ({self._tasks[key].label})")
+            self._ensure_running()
+            self._condition.notify()
+        return key
+
+    def forget(self, key):
+        """작업 감시 중단 (목록에서도 제거)"""
+        with self._condition:
+            self._tasks.pop(key, None)
+
+    def tasks(self, include_finished=True):
+        with self._condition:
+            return [task.snapshot() for task in self._tasks.values() if include_finished or not task.finished]
+
+    def get(self, key):
+        with self._condition:
+            task = self._tasks.get(key)
+            return task.snapshot() if task else None
+
+    def _push(self, key, delay):
+        heapq.heappush(self._queue, (time.monotonic() + delay, next(self._counter), key))
+
+    def _ensure_running(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._executor = ThreadPoolExecutor(max_workers=self.WORKERS, thread_name_prefix='TaskMonitor')
+            self._thread = threading.Thread(target=self._run, name='TaskMonitor', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._queue:
+                        self._condition.wait()
+                        continue
+                    due, _, key = self._queue[0]
+                    wait = due - time.monotonic()
+                    if wait > 0:
+                        self._condition.wait(wait)
+                        continue
+                    heapq.heappop(self._queue)
+                    task = self._tasks.get(key)
+                    if task is not None and not task.finished:
+                        break
+            self._executor.submit(self._poll, task)
+
+    def _poll(self, task):
+        previous = (task.state, task.percent)
+        try:
+            data = self._fetch(task)
+            task.errors = 0
+        except Exception as e:
+            task.errors += 1
+            logger.warning(f"작업 상태 조회 실패 ({task.key}, {task.errors}/{self.MAX_ERRORS}): {str(e)}")
+            if task.errors >= self.MAX_ERRORS:
+                self._finish(task, 'Unknown', f"작업 상태를 확인할 수 없습니다: {str(e)}")
+            else:
+                self._reschedule(task, changed=False)
+            return
+
+        if data is None:
+            if task.seen:
+                # 완료 후 작업 URI가 정리된 경우
+                self._finish(task, 'Completed', '작업 정보가 더 이상 없습니다 (완료 후 정리된 것으로 판단).')
+            else:
+                self._finish(task, 'Unknown', '작업을 찾을 수 없습니다.')
+            return
+        task.seen = True
+
+        task.state = data.get('TaskState') or data.get('JobState') or task.state
+        task.percent = data.get('PercentComplete', task.percent) or 0
+        messages = data.get('Messages') or []
+        task.message = data.get('Message') or (messages[-1].get('Message', '') if messages else task.message)
+        if 'JobState' in data:
+            task.server_manager.note_firmware_job(data)
+
+        if task.state in SUCCESS_STATES or task.state in FAILURE_STATES:
+            self._finish(task, task.state, task.message)
+        elif time.time() - task.started_at > self.TASK_TIMEOUT:
+            self._finish(task, 'Unknown', "작업 감시 시간이 초과되었습니다.")
+        else:
+            changed = (task.state, task.percent) != previous
+            if changed:
+                self._notify('progress', task)
+            self._reschedule(task, changed)
+
+    def _fetch(self, task):
+        """작업 상세 (없어진 작업이면 None)"""
+        manager = task.server_manager
+        response = manager.session.get(f"{manager.endpoints.base_url}{task.uri}", auth=manager.auth,
+                                       verify=False, timeout=15)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def _reschedule(self, task, changed):
+        task.interval = self.MIN_INTERVAL if changed else min(task.interval * self.BACKOFF, self.MAX_INTERVAL)
+        with self._condition:
+            if task.key in self._tasks:
+                self._push(task.key, task.interval)
+                self._condition.notify()
+
+    def _finish(self, task, state, message):
+        task.state = state
+        task.message = message
+        task.finished_at = time.time()
+        if task.succeeded:
+            task.percent = 100
+        logger.info(f"작업 종료: {task.key} {state} {message}")
+        self._notify('finished', task)
+
+    def _notify(self, event, task):
+        snapshot = task.snapshot()
+        for callback in list(self._listeners):
+            try:
+                callback(event, snapshot)
+            except Exception as e:
+                logger.error(f"작업 알림 처리 실패: {str(e)}")
+
+# 전역 인스턴스
+task_monitor = TaskMonitor()
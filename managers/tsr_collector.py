@@ -0,0 +1,234 @@
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 다운로드 버퍼 (1MB)
+DOWNLOAD_RETRIES = 3  # 연결이 끊겼을 때 이어받기 시도 횟수
+POLL_INITIAL_INTERVAL = 2.0
+POLL_MAX_INTERVAL = 20.0
+POLL_BACKOFF = 1.5
+TASK_TIMEOUT = 30 * 60  # TSR 생성 대기 한도 (초)
+TASK_FAILED_STATES = ('Failed', 'Exception', 'Killed', 'Cancelled')
+TSR_COLLECT_WORKERS = 8  # 동시에 수집할 서버 수 (iDRAC 작업/다운로드 동시 실행 한도)
+
+# 진행 단계 (progress_callback 첫 번째 인자)
+STAGE_EXPORT = '수집 요청'
+STAGE_WAIT = 'TSR 생성 중'
+STAGE_DOWNLOAD = '다운로드'
+STAGE_VERIFY = '검증'
+
+class TsrCollectionCancelled(Exception):
+    """사용자가 TSR 수집을 취소한 경우"""
+
+def default_download_dir():
+    return os.path.join(os.path.expanduser("~"), "Downloads")
+
+def verify_zip(path):
+    """TSR 압축 파일 무결성 검사 (손상된 경우 ValueError)"""
+    if not zipfile.is_zipfile(path):
+        raise ValueError("ZIP 형식이 아닙니다.")
+    with zipfile.ZipFile(path) as archive:
+        bad_member = archive.testzip()
+        if bad_member is not None:
+            raise ValueError(f"손상된 항목: {bad_member}")
+        if not archive.namelist():
+            raise ValueError("비어 있는 압축 파일입니다.")
+
+class TsrCollector:
+    """서버 한 대의 TSR 수집 (내보내기 요청 -> 작업 대기 -> 다운로드 -> ZIP 검증)
+
+    작업 상태는 간격을 점점 늘려 가며(Retry-After가 있으면 그 값) 조회하고,
+    다운로드는 세션을 재사용해 큰 버퍼로 받아 '.part' 파일에 쓰다가 연결이
+    끊기면 Range 요청으로 이어받습니다.
+    """
+
+    def __init__(self, server_manager, progress_callback=None, is_cancelled=None):
+        self.server_manager = server_manager
+        self.endpoints = server_manager.endpoints
+        self.session = server_manager.session
+        self.auth = server_manager.auth
+        self.progress_callback = progress_callback  # (단계, 퍼센트)
+        self.is_cancelled = is_cancelled
+
+    def _report(self, stage, percent):
+        if self.progress_callback:
+            self.progress_callback(stage, percent)
+
+    def _check_cancelled(self):
+        if self.is_cancelled and self.is_cancelled():
+            raise TsrCollectionCancelled("TSR 수집이 취소되었습니다.")
+
+    def _url(self, uri):
+        return uri if uri.startswith('http') else f"{self.endpoints.base_url}{uri}"
+
+    def start_export(self):
+        """TSR 내보내기 요청 후 작업 URI 반환"""
+        self._report(STAGE_EXPORT, 0)
+        response = self.session.post(
+            self.endpoints.tsr_export,
+            json={"ShareType": "Local"},
+            auth=self.auth,
+            headers={'Content-Type': 'application/json'},
+            verify=False,
+            timeout=30
+        )
+        if response.status_code != 202:
+            raise Exception(f"TSR 로그 수집 요청 실패: {response.text}")
+        task_uri = response.headers.get('Location') or response.json().get('@odata.id')
+        if not task_uri:
+            raise Exception("작업 상태를 모니터링할 수 없습니다.")
+        return task_uri
+
+    def wait_for_task(self, task_uri):
+        """작업 완료까지 백오프 간격으로 조회, 완료 응답 반환"""
+        interval = POLL_INITIAL_INTERVAL
+        deadline = time.monotonic() + TASK_TIMEOUT
+        last_percent = None
+        while True:
+            self._check_cancelled()
+            response = self.session.get(self._url(task_uri), auth=self.auth, verify=False, timeout=30)
+            task_data = response.json()
+            task_state = task_data.get('TaskState')
+            if task_state == 'Completed':
+                self._report(STAGE_WAIT, 100)
+                return response
+            if task_state in TASK_FAILED_STATES:
+                error_message = (task_data.get('Messages') or [{}])[0].get('Message', '알 수 없는 오류')
+                raise Exception(f"TSR 로그 수집 실패: {error_message}")
+            if time.monotonic() > deadline:
+                raise Exception("TSR 로그 수집 시간이 초과되었습니다.")
+
+            percent = task_data.get('PercentComplete', 0) or 0
+            self._report(STAGE_WAIT, percent)
+            # 진행률이 움직이면 간격을 처음으로 되돌리고, 멈춰 있으면 점점 늘림
+            interval = POLL_INITIAL_INTERVAL if percent != last_percent else min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+            last_percent = percent
+            retry_after = response.headers.get('Retry-After')
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else interval
+            self._sleep(delay)
+
+    def _sleep(self, seconds):
+        # 취소를 빨리 반영하도록 잘게 나눠 대기
+        end = time.monotonic() + seconds
+        while True:
+            self._check_cancelled()
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(0.5, remaining))
+
+    def download_uri(self, task_response, filename):
+        """완료된 작업 응답의 Location(.zip)이 있으면 그 경로, 없으면 기존 위치"""
+        location = task_response.headers.get('Location', '')
+        if location.lower().endswith('.zip'):
+            return self._url(location)
+        return f"{self.endpoints.firmware_inventory}/{filename}"
+
+    def download(self, url, path):
+        """'.part' 파일로 받으며 끊기면 Range로 이어받고, 완료 후 원래 이름으로 변경"""
+        part_path = f"{path}.part"
+        for attempt in range(1, DOWNLOAD_RETRIES + 1):
+            self._check_cancelled()
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            headers = {'Range': f"bytes={offset}-"} if offset else {}
+            try:
+                with self.session.get(url, auth=self.auth, verify=False, stream=True,
+                                      headers=headers, timeout=(10, 120)) as response:
+                    if response.status_code == 416:
+                        # 이미 끝까지 받은 상태
+                        break
+                    if response.status_code not in (200, 206):
+                        raise Exception(f"TSR 로그 다운로드 실패: HTTP 상태 코드 {response.status_code}")
+                    if response.status_code == 200:
+                        # 서버가 Range를 무시하면 처음부터 다시 받음
+                        offset = 0
+                    total_size = offset + int(response.headers.get('content-length', 0))
+                    downloaded = offset
+                    with open(part_path, 'ab' if offset else 'wb') as file:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            self._check_cancelled()
+                            file.write(chunk)
+                            downloaded += len(chunk)
+                            if total_size:
+                                self._report(STAGE_DOWNLOAD, downloaded * 100 / total_size)
+                    if total_size and downloaded < total_size:
+                        raise requests.exceptions.ChunkedEncodingError("응답이 중간에 끊겼습니다.")
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout) as e:
+                if attempt == DOWNLOAD_RETRIES:
+                    raise Exception(f"TSR 로그 다운로드 실패: {str(e)}")
+                logger.warning(f"TSR 다운로드 중단, 이어받기 재시도 ({attempt}/{DOWNLOAD_RETRIES}): {str(e)}")
+                time.sleep(attempt)
+        os.replace(part_path, path)
+        return path
+
+    def collect(self, download_dir=None):
+        """TSR 수집 전체 과정 실행 후 저장 경로 반환"""
+        basic_info = self.server_manager.fetch_basic_info()
+        service_tag = basic_info['system'].get('ServiceTag', "Unknown")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"TSR_Log_{service_tag}_{timestamp}.zip"
+        download_dir = download_dir or default_download_dir()
+        os.makedirs(download_dir, exist_ok=True)
+        path = os.path.join(download_dir, filename)
+
+        logger.info(f"TSR 로그 수집 요청 시작: {self.server_manager.host} {filename}")
+        task_uri = self.start_export()
+        task_response = self.wait_for_task(task_uri)
+
+        logger.info(f"TSR 로그 파일 다운로드 시작: {self.server_manager.host}")
+        try:
+            self.download(self.download_uri(task_response, filename), path)
+        except Exception:
+            # 파일명에 시각이 들어가 다음 수집에서 이어받을 수 없으므로 조각 파일 정리
+            if os.path.exists(f"{path}.part"):
+                os.remove(f"{path}.part")
+            raise
+
+        self._report(STAGE_VERIFY, 100)
+        try:
+            verify_zip(path)
+        except (ValueError, zipfile.BadZipFile) as e:
+            os.remove(path)
+            raise Exception(f"TSR 압축 파일 검증 실패: {str(e)}")
+        logger.info(f"TSR 로그 다운로드 완료: {path}")
+        return path
+
+def collect_tsr_logs(server_managers, download_dir=None, progress_callback=None, is_cancelled=None,
+                     max_workers=TSR_COLLECT_WORKERS):
+    """여러 서버의 TSR을 동시에 수집
+
+    server_managers: {서버 이름: DellServerManager}
+    progress_callback(서버 이름, 단계, 퍼센트)
+    반환: {서버 이름: (저장 경로 또는 None, 오류 메시지 또는 None)}
+    서버마다 작업 스레드에서 요청부터 검증까지 진행하며, 동시에 처리하는 서버는
+    max_workers대로 제한합니다.
+    """
+    results = {}
+    if not server_managers:
+        return results
+
+    def run(name, server_manager):
+        callback = (lambda stage, percent: progress_callback(name, stage, percent)) if progress_callback else None
+        return TsrCollector(server_manager, callback, is_cancelled).collect(download_dir)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers or TSR_COLLECT_WORKERS, len(server_managers))) as executor:
+        futures = {executor.submit(run, name, manager): name for name, manager in server_managers.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = (future.result(), None)
+            except TsrCollectionCancelled as e:
+                results[name] = (None, str(e))
+            except Exception as e:
+                logger.error(f"TSR 로그 수집 중 오류 발생 ({name}): {str(e)}")
+                results[name] = (None, str(e))
+    return results
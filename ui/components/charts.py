@@ -0,0 +1,229 @@
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from utils.system_utils import get_system_matplotlib_font
+
+def _graph_height(count):
+    """데이터 개수에 따라 그래프 높이(인치) 결정"""
+    if count <= 2:
+        return 2.5  # 로그 개수가 적을 때 더 작은 높이
+    return max(3, min(count * 0.5, 6))
+
+class HorizontalBarChart(FigureCanvas):
+    """가로 막대 차트 캔버스
+
+    Figure/캔버스와 막대·라벨 아티스트를 계속 유지하고, 항목 구성이 같으면
+    막대 길이와 라벨만 바꾼 뒤 draw_idle()로 다시 그립니다. pyplot 전역 상태를
+    사용하지 않으므로 갱신할 때마다 Figure나 캔버스가 새로 생기지 않습니다.
+    """
+
+    def __init__(self, title, xlabel='', width=8, parent=None):
+        get_system_matplotlib_font()
+        self.figure = Figure(figsize=(width, _graph_height(0)))
+        super().__init__(self.figure)
+        if parent is not None:
+            self.setParent(parent)
+        self.ax = self.figure.add_subplot(111)
+        self.title = title
+        self.xlabel = xlabel
+        self._labels = None
+        self._bars = []
+        self._annotations = []
+        self._setup_axes()
+
+    def _setup_axes(self):
+        self.ax.set_title(self.title, fontsize=10)
+        self.ax.set_xlabel(self.xlabel, fontsize=9)
+        self.ax.tick_params(labelsize=8)
+
+    def _rebuild(self, labels, values, colors):
+        """항목 구성이 바뀐 경우에만 같은 축 위에 막대를 다시 생성"""
+        self.ax.clear()
+        self._setup_axes()
+        self._bars = list(self.ax.barh(labels, values, color=colors, height=0.5))  # 막대 높이 더 작게
+        self._annotations = [
+            self.ax.text(bar.get_width(), bar.get_y() + bar.get_height() / 2, '', va='center', fontsize=8)
+            for bar in self._bars
+        ]
+        self._labels = list(labels)
+        self.setMinimumHeight(int(_graph_height(len(labels)) * self.figure.dpi))
+        self.figure.tight_layout()
+
+    def update_bars(self, labels, values, colors=None, annotations=None):
+        """막대 값 갱신 (annotations는 막대 끝에 표시할 텍스트, 기본값은 값 자체)"""
+        labels = list(labels)
+        values = list(values)
+        if not labels:
+            self.show_message('로그 데이터 없음')
+            return
+        if annotations is None:
+            annotations = [f'{value}' for value in values]
+
+        if labels != self._labels:
+            self._rebuild(labels, values, colors)
+        else:
+            for index, (bar, value) in enumerate(zip(self._bars, values)):
+                bar.set_width(value)
+                if colors:
+                    bar.set_color(colors[index])
+
+        for bar, text, annotation in zip(self._bars, self._annotations, annotations):
+            text.set_x(bar.get_width())
+            text.set_text(annotation)
+
+        self.ax.set_xlim(0, max(max(values), 1) * 1.1)
+        self.draw_idle()
+
+    def show_message(self, message):
+        """데이터가 없을 때 축 가운데에 안내 문구 표시"""
+        self.ax.clear()
+        self._setup_axes()
+        self._labels = None
+        self._bars = []
+        self._annotations = []
+        self.ax.text(0.5, 0.5, message, horizontalalignment='center',
+                     verticalalignment='center', transform=self.ax.transAxes)
+        self.draw_idle()
+
+class StackedBarChart(FigureCanvas):
+    """누적 세로 막대 차트 캔버스 (시간대별 레벨 분포 등)
+
+    분류와 계열 구성이 같으면 각 막대의 높이와 시작 위치만 바꿔 다시 그립니다.
+    """
+
+    def __init__(self, title, xlabel='', ylabel='', width=10, height=5, parent=None):
+        get_system_matplotlib_font()
+        self.figure = Figure(figsize=(width, height))
+        super().__init__(self.figure)
+        if parent is not None:
+            self.setParent(parent)
+        self.ax = self.figure.add_subplot(111)
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self._layout_key = None
+        self._containers = []
+        self._setup_axes()
+
+    def _setup_axes(self):
+        self.ax.set_title(self.title)
+        self.ax.set_xlabel(self.xlabel)
+        self.ax.set_ylabel(self.ylabel)
+
+    def update_series(self, categories, series, colors=None):
+        """categories: x축 라벨 목록, series: {계열 이름: 값 목록} (순서대로 누적)"""
+        categories = list(categories)
+        names = list(series)
+        layout_key = (tuple(categories), tuple(names))
+        positions = range(len(categories))
+
+        if layout_key != self._layout_key:
+            self.ax.clear()
+            self._setup_axes()
+            self._containers = []
+            bottom = [0] * len(categories)
+            for index, name in enumerate(names):
+                color = colors[index] if colors else None
+                container = self.ax.bar(positions, series[name], bottom=bottom, label=name, color=color, alpha=0.7)
+                self._containers.append(container)
+                bottom = [b + c for b, c in zip(bottom, series[name])]
+            self.ax.set_xticks(list(positions))
+            self.ax.set_xticklabels(categories, rotation=45)
+            if names:
+                self.ax.legend()
+            self.figure.tight_layout()
+            self._layout_key = layout_key
+        else:
+            bottom = [0] * len(categories)
+            for container, name in zip(self._containers, names):
+                for bar, base, value in zip(container.patches, bottom, series[name]):
+                    bar.set_y(base)
+                    bar.set_height(value)
+                bottom = [b + c for b, c in zip(bottom, series[name])]
+            self.ax.set_ylim(0, max(max(bottom, default=0), 1) * 1.1)
+
+        self.draw_idle()
+
+class StepSeriesChart(FigureCanvas):
+    """시간에 따른 값 변화를 계단형 선으로 표시하는 캔버스 (상태 이력 등)
+
+    categories를 지정하면 문자열 값을 해당 순서의 y축 위치로 바꿔 표시합니다.
+    선 아티스트를 유지하고 같은 계열이면 데이터만 교체합니다.
+    """
+
+    def __init__(self, title, ylabel='', width=8, height=3.5, parent=None):
+        get_system_matplotlib_font()
+        self.figure = Figure(figsize=(width, height))
+        super().__init__(self.figure)
+        if parent is not None:
+            self.setParent(parent)
+        self.ax = self.figure.add_subplot(111)
+        self.title = title
+        self.ylabel = ylabel
+        self._layout_key = None
+        self._lines = {}
+        self._setup_axes()
+
+    def _setup_axes(self):
+        self.ax.set_title(self.title, fontsize=10)
+        self.ax.set_ylabel(self.ylabel, fontsize=9)
+        self.ax.tick_params(labelsize=8)
+        self.ax.grid(True, alpha=0.3)
+
+    def update_series(self, series, categories=None, ylabel=None):
+        """series: {계열 이름: [(datetime, 값), ...]}"""
+        from matplotlib.dates import AutoDateLocator, ConciseDateFormatter, date2num
+
+        series = {name: points for name, points in series.items() if points}
+        if not series:
+            self.show_message('이력 데이터 없음')
+            return
+
+        if categories is not None:
+            categories = list(categories)
+            for points in series.values():
+                for _, value in points:
+                    if value not in categories:
+                        categories.append(value)
+            position = {value: index for index, value in enumerate(categories)}
+            series = {name: [(ts, position[value]) for ts, value in points] for name, points in series.items()}
+
+        layout_key = (tuple(series), tuple(categories or ()), ylabel)
+        if layout_key != self._layout_key:
+            self.ax.clear()
+            self._setup_axes()
+            if ylabel is not None:
+                self.ax.set_ylabel(ylabel, fontsize=9)
+            self._lines = {}
+            for name in series:
+                self._lines[name], = self.ax.step([], [], where='post', label=name, marker='.')
+            if categories:
+                self.ax.set_yticks(range(len(categories)))
+                self.ax.set_yticklabels(categories)
+            # 빈 선으로 시작하므로 날짜 축을 명시적으로 지정
+            self.ax.xaxis_date()
+            locator = AutoDateLocator()
+            self.ax.xaxis.set_major_locator(locator)
+            self.ax.xaxis.set_major_formatter(ConciseDateFormatter(locator))
+            if len(series) > 1:
+                self.ax.legend(fontsize=8)
+            self._layout_key = layout_key
+
+        for name, points in series.items():
+            times, values = zip(*points)
+            self._lines[name].set_data(date2num(times), values)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        if categories:
+            self.ax.set_ylim(-0.5, len(categories) - 0.5)
+        self.figure.tight_layout()
+        self.draw_idle()
+
+    def show_message(self, message):
+        self.ax.clear()
+        self._setup_axes()
+        self._layout_key = None
+        self._lines = {}
+        self.ax.text(0.5, 0.5, message, horizontalalignment='center',
+                     verticalalignment='center', transform=self.ax.transAxes)
+        self.draw_idle()
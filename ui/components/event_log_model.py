@@ -0,0 +1,148 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, QTimer
+from PyQt6.QtGui import QColor
+
+# 심각도별 표시 색상
+SEVERITY_COLORS = {
+    'Critical': QColor('red'),
+    'Warning': QColor('orange'),
+    'OK': QColor('green'),
+}
+
+SEARCH_DEBOUNCE_MS = 250  # 검색어 입력 후 필터 적용까지 대기 시간
+
+class EventLogModel(QAbstractTableModel):
+    """SEL/LC 이벤트 로그 테이블 모델
+
+    columns는 (헤더, 이벤트 딕셔너리 -> 표시 값 함수) 목록입니다. 표시 문자열,
+    심각도, 소문자 검색 키는 적재 시 한 번만 계산하고, 화면에는 보이는 행만
+    data()로 요청되므로 항목마다 위젯 아이템을 만들지 않습니다.
+    """
+
+    def __init__(self, columns, severity_column=None, search_key=None, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.severity_column = severity_column
+        self.search_key = search_key or (lambda event: event.get('Message', ''))
+        # (원본 이벤트, 표시 값 튜플, 심각도, 소문자 검색 키)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.columns[section][0]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        _, values, severity, _ = self._rows[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return values[index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self.severity_column:
+            return SEVERITY_COLORS.get(severity)
+        return None
+
+    def set_events(self, events):
+        """전체 이벤트 교체"""
+        self.beginResetModel()
+        self._rows = [
+            (
+                event,
+                tuple(str(getter(event)) for _, getter in self.columns),
+                event.get('Severity', 'N/A'),
+                str(self.search_key(event)).lower()
+            )
+            for event in events
+        ]
+        self.endResetModel()
+
+    def filter_fields(self, row):
+        """프록시 필터용 (심각도, 소문자 검색 키)"""
+        _, _, severity, search_key = self._rows[row]
+        return severity, search_key
+
+    def event_at(self, row):
+        return self._rows[row][0]
+
+class EventLogFilterProxyModel(QSortFilterProxyModel):
+    """심각도/검색어 조건으로 이벤트 행을 거르는 프록시 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._severity = None
+        self._search = ''
+
+    def set_filters(self, severity=None, search=''):
+        search = (search or '').strip().lower()
+        if (severity, search) == (self._severity, self._search):
+            return
+        self._severity = severity
+        self._search = search
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._severity is None and not self._search:
+            return True
+        severity, search_key = self.sourceModel().filter_fields(source_row)
+        if self._severity is not None and severity != self._severity:
+            return False
+        if self._search and self._search not in search_key:
+            return False
+        return True
+
+    def visible_events(self):
+        """현재 필터를 통과한 원본 이벤트 목록"""
+        source = self.sourceModel()
+        return [
+            source.event_at(self.mapToSource(self.index(row, 0)).row())
+            for row in range(self.rowCount())
+        ]
+
+class PageProxyModel(QSortFilterProxyModel):
+    """원본(보통 필터 프록시)의 한 페이지 구간 행만 보여주는 프록시 모델"""
+
+    def __init__(self, page_size=50, parent=None):
+        super().__init__(parent)
+        self.page_size = page_size
+        self.page = 0
+
+    def setSourceModel(self, source_model):
+        super().setSourceModel(source_model)
+        # 원본 행 위치가 바뀌면 페이지 구간을 다시 계산 (추가된 행만 검사하는 기본 동작 보완)
+        source_model.rowsInserted.connect(self._source_rows_changed)
+        source_model.rowsRemoved.connect(self._source_rows_changed)
+
+    def _source_rows_changed(self, *args):
+        self.page = max(0, min(self.page, self.page_count() - 1))
+        self.invalidateFilter()
+
+    def page_count(self):
+        source = self.sourceModel()
+        total = source.rowCount() if source is not None else 0
+        return max(1, (total - 1) // self.page_size + 1)
+
+    def set_page(self, page):
+        page = max(0, min(page, self.page_count() - 1))
+        if page != self.page:
+            self.page = page
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        start = self.page * self.page_size
+        return start <= source_row < start + self.page_size
+
+def create_search_debouncer(parent, callback, interval=SEARCH_DEBOUNCE_MS):
+    """입력이 멈춘 뒤 interval(ms) 후에 한 번만 callback을 호출하는 타이머 생성
+
+    검색창 textChanged에 timer.start를 연결하면 입력 중에는 타이머가 재시작됩니다.
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(interval)
+    timer.timeout.connect(callback)
+    return timer
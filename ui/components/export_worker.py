@@ -0,0 +1,75 @@
+from PyQt6.QtCore import QThread, Qt, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog
+
+from config.system.log_config import setup_logging
+from ui.components.popups.error_dialog import ErrorDialog
+from utils.export_utils import ExportCancelled, export_sheets
+
+logger = setup_logging()
+
+class ExportWorker(QThread):
+    """export_sheets를 백그라운드 스레드에서 실행하는 작업자"""
+
+    progress = pyqtSignal(int, int)  # 완료 행 수, 전체 행 수
+    succeeded = pyqtSignal(list)  # 기록한 파일 경로 목록
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, file_path, sheets, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.sheets = sheets
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            written = export_sheets(
+                self.file_path,
+                self.sheets,
+                progress_callback=self.progress.emit,
+                is_cancelled=lambda: self._cancel_requested
+            )
+            self.succeeded.emit(written)
+        except ExportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            logger.error(f"내보내기 중 오류: {str(e)}")
+            self.failed.emit(str(e))
+
+def start_export(parent, file_path, sheets, title="내보내기"):
+    """진행률 다이얼로그와 함께 내보내기 작업 시작 (GUI 스레드는 바로 반환)"""
+    progress_dialog = QProgressDialog(f"{title} 중...", "취소", 0, 0, parent)
+    progress_dialog.setWindowTitle(title)
+    progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    progress_dialog.setMinimumDuration(300)
+    progress_dialog.setAutoClose(False)
+    progress_dialog.setAutoReset(False)
+
+    worker = ExportWorker(file_path, sheets, parent)
+
+    def on_progress(done, total):
+        if total:
+            progress_dialog.setMaximum(total)
+            progress_dialog.setValue(min(done, total))
+        progress_dialog.setLabelText(f"{title} 중... ({done:,}행)")
+
+    def on_succeeded(written):
+        progress_dialog.close()
+        ErrorDialog(f"{title} 완료", "파일이 저장되었습니다.", "\n".join(written), parent).exec()
+
+    def on_failed(message):
+        progress_dialog.close()
+        ErrorDialog(f"{title} 오류", "파일로 내보내는 중 오류가 발생했습니다.", message, parent).exec()
+
+    worker.progress.connect(on_progress)
+    worker.succeeded.connect(on_succeeded)
+    worker.failed.connect(on_failed)
+    worker.cancelled.connect(progress_dialog.close)
+    worker.finished.connect(worker.deleteLater)
+    progress_dialog.canceled.connect(worker.cancel)
+
+    worker.start()
+    return worker
@@ -0,0 +1,90 @@
+import os
+
+from PyQt6.QtCore import QThread, Qt, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog
+
+from config.system.log_config import setup_logging
+from managers.firmware_upload import UploadCancelled
+from ui.components.popups.error_dialog import ErrorDialog
+
+logger = setup_logging()
+
+PROGRESS_SCALE = 1000  # QProgressDialog 최대값 (int 범위를 넘는 바이트 수 대신 비율 사용)
+
+class FirmwareUploadWorker(QThread):
+    """펌웨어 패키지를 백그라운드 스레드에서 차례로 업로드하는 작업자"""
+
+    progress = pyqtSignal(int, object, object)  # 파일 순번, 보낸 바이트, 전체 바이트
+    succeeded = pyqtSignal(list)  # 파일별 작업 URI
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, server_manager, file_paths, parent=None):
+        super().__init__(parent)
+        self.server_manager = server_manager
+        self.file_paths = list(file_paths)
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            results = self.server_manager.multipart_firmware_update(
+                self.file_paths,
+                progress_callback=self.progress.emit,
+                is_cancelled=lambda: self._cancel_requested
+            )
+            failed = [os.path.basename(path) for path, result in zip(self.file_paths, results) if not result]
+            if failed:
+                self.failed.emit("업로드하지 못한 파일: " + ", ".join(failed))
+            else:
+                self.succeeded.emit(results)
+        except UploadCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            logger.error(f"펌웨어 업로드 중 오류: {str(e)}")
+            self.failed.emit(str(e))
+
+def start_firmware_upload(parent, server_manager, file_paths, on_finished=None):
+    """진행률 다이얼로그와 함께 펌웨어 업로드 시작 (GUI 스레드는 바로 반환)"""
+    file_paths = list(file_paths)
+    progress_dialog = QProgressDialog("펌웨어 업로드 준비 중...", "취소", 0, PROGRESS_SCALE, parent)
+    progress_dialog.setWindowTitle("펌웨어 업데이트")
+    progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    progress_dialog.setMinimumDuration(0)
+    progress_dialog.setAutoClose(False)
+    progress_dialog.setAutoReset(False)
+
+    worker = FirmwareUploadWorker(server_manager, file_paths, parent)
+
+    def on_progress(index, sent, total):
+        progress_dialog.setValue(int(PROGRESS_SCALE * sent / total) if total else 0)
+        progress_dialog.setLabelText(
+            f"[{index + 1}/{len(file_paths)}] {os.path.basename(file_paths[index])}\n"
+            f"{sent / (1024 ** 2):,.1f} / {total / (1024 ** 2):,.1f} MB 업로드")
+
+    def on_succeeded(task_uris):
+        progress_dialog.close()
+        ErrorDialog(
+            "업데이트 시작",
+            "펌웨어 업데이트 작업이 생성되었습니다(이미 스테이징된 패키지는 업로드 생략). 작업 큐에서 진행 상황을 확인하세요.",
+            "\n".join(str(uri) for uri in task_uris),
+            parent
+        ).exec()
+        if on_finished:
+            on_finished(task_uris)
+
+    def on_failed(message):
+        progress_dialog.close()
+        ErrorDialog("업데이트 오류", "펌웨어 업로드 중 오류가 발생했습니다.", message, parent).exec()
+
+    worker.progress.connect(on_progress)
+    worker.succeeded.connect(on_succeeded)
+    worker.failed.connect(on_failed)
+    worker.cancelled.connect(progress_dialog.close)
+    worker.finished.connect(worker.deleteLater)
+    progress_dialog.canceled.connect(worker.cancel)
+
+    worker.start()
+    return worker
@@ -4,22 +4,22 @@ from datetime import datetime
 import pytz
 from dateutil import parser
 
-import pandas as pd
 import requests
 
-from openpyxl.styles import PatternFill, Font, Alignment
-from openpyxl.styles.borders import Border, Side
-
 from config.server.server_config import server_config
 from config.system.log_config import setup_logging, set_current_server
 from managers.dell_server_manager import DellServerManager
+from managers.nic_attributes import port_functions
 from PyQt6.QtCore import QTimer, Qt, QUrl
 from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWidgets import (QApplication, QDialog, QFileDialog, QGroupBox, QHBoxLayout, QLabel, QLineEdit, 
                              QMainWindow, QMessageBox, QPushButton, QProgressDialog, QVBoxLayout, QWidget)
+from ui.components.export_worker import start_export
 from ui.components.popups.detail_dialog import DetailDialog
 from ui.components.popups.error_dialog import ErrorDialog
 from ui.components.server_section import ServerSection
+from utils.export_utils import EXPORT_FORMATS, ExportSheet, ensure_export_extension, estimate_column_widths
+from utils.health_history import drive_metrics, health_history, memory_metrics
 from utils.utils import convert_capacity
 
 logger = setup_logging()
@@ -441,6 +441,7 @@ class HardwareInfoWidget(QWidget):
                 if memory_data.get('Members@odata.count', 0) > 0:
                     mem_count = {"✅": 0, "❌": 0, "⚠️": 0}
                     total_capacity_gb = 0
+                    history_samples = {}
                     
                     for member in memory_data.get('Members', []):
                         member_uri = member.get('@odata.id')
@@ -454,6 +455,7 @@ class HardwareInfoWidget(QWidget):
                             status = memory_info.get('Status', {})
                             health = status.get('Health')
                             enabled = memory_info.get('Enabled', True)
+                            history_samples[memory_info.get('Id', member_uri.split('/')[-1])] = memory_metrics(memory_info)
                             
                             # 메모리 용량 계산 (MB를 GB로 변환)
                             capacity_mb = memory_info.get('CapacityMiB', 0)
@@ -467,6 +469,8 @@ class HardwareInfoWidget(QWidget):
                             else:
                                 mem_count["⚠️"] += 1
                     
+                    health_history.record(self._history_server_key(), 'memory', history_samples)
+                    
                     # 상태 텍스트 업데이트 (총 용량 포함)
                     status_text = "MEM: "
                     if mem_count["✅"] > 0:
@@ -494,9 +498,11 @@ class HardwareInfoWidget(QWidget):
             storage_data = self.server_manager.fetch_storage_info()
             if storage_data and 'Controllers' in storage_data:
                 disk_count = {"✅": 0, "❌": 0, "⚠️": 0}
+                history_samples = {}
                 
                 for controller in storage_data.get('Controllers', []):
                     for drive in controller.get('Drives', []):
+                        history_samples[drive.get('Id', 'N/A')] = drive_metrics(drive)
                         raid_status = drive.get('Oem', {}).get('Dell', {}).get('DellPhysicalDisk', {}).get('RaidStatus')
                         if raid_status == 'Online':
                             disk_count["✅"] += 1
@@ -505,6 +511,8 @@ class HardwareInfoWidget(QWidget):
                         else:
                             disk_count["⚠️"] += 1
                 
+                health_history.record(self._history_server_key(), 'drive', history_samples)
+                
                 status_parts = []
                 for icon, count in disk_count.items():
                     if count > 0:
@@ -520,6 +528,17 @@ class HardwareInfoWidget(QWidget):
             self.status_labels['DSK'].setText("DSK: 오류")
             logger.error(f"디스크 상태 업데이트 실패: {e}")
 
+    def _history_server_key(self):
+        """상태 이력 저장 시 서버 구분 키 (IP:포트)"""
+        return self.server_manager.endpoints.base_url.split('://')[-1]
+
+    def show_health_history(self, component_type):
+        """드라이브/DIMM 상태 이력 다이얼로그 표시"""
+        from ui.components.popups.health_history_dialog import HealthHistoryDialog
+        kind = 'memory' if component_type == 'MEM' else 'drive'
+        dialog = HealthHistoryDialog(self._history_server_key(), kind, component_type, self)
+        dialog.exec()
+
     def _update_psu_status(self):
         try:
             if self.server_manager is not None:
@@ -654,7 +673,10 @@ class HardwareInfoWidget(QWidget):
                         }
 
             if info:
-                dialog = DetailDialog(f"{component_type} 상세 정보", info, self)
+                history_callback = None
+                if component_type in ('MEM', 'DSK'):
+                    history_callback = lambda: self.show_health_history(component_type)
+                dialog = DetailDialog(f"{component_type} 상세 정보", info, self, history_callback=history_callback)
                 dialog.exec()
                 
         except Exception as e:
@@ -876,11 +898,12 @@ def get_all_system_settings(parent, server_manager):
         # NIC Configuration
         all_settings['NIC Configuration'] = {}
         if nic_data and 'NetworkAdapters' in nic_data:
+            # 모든 NIC 기능 속성을 한 번에 동시 조회 (캐시 우선)
+            nic_attributes = server_manager.fetch_nic_attributes(nic_data)
             for adapter in nic_data['NetworkAdapters']:
                 for func in adapter.get('NetworkDeviceFunctions', []):
                     if func_id := func.get('Id'):
-                        virt_info = server_manager.fetch_network_virtualization_info(
-                            adapter.get('Id'), func_id)
+                        virt_info = nic_attributes.get((adapter.get('Id'), func_id))
                         if virt_info and 'Attributes' in virt_info:
                             attrs = virt_info['Attributes']
                             
@@ -956,16 +979,15 @@ def save_system_info(parent_dialog, server_manager):
         default_path = os.path.join(documents_path, default_filename)
 
         progress_dialog.setValue(10)
-        file_name, _ = QFileDialog.getSaveFileName(
+        file_name, selected_filter = QFileDialog.getSaveFileName(
             parent_dialog, 
             "시스템 설정 정보 저장",
             default_path,
-            "Excel Files (*.xlsx);;All Files (*)"
+            EXPORT_FORMATS
         )
 
         if file_name:
-            if not file_name.endswith('.xlsx'):
-                file_name += '.xlsx'
+            file_name = ensure_export_extension(file_name, selected_filter)
 
             model_name = basic_info['system'].get('Model', 'N/A')
             service_tag = basic_info['system'].get('ServiceTag', 'N/A')
@@ -1092,31 +1114,8 @@ def save_system_info(parent_dialog, server_manager):
                                     {'구성 요소': '        상태', 'Dell Attribute name': 'RaidStatus', 'value': dell_volume.get('RaidStatus', 'N/A')}
                                 ])
 
-                                # 드라이브 정보 수집 및 정렬
-                                drives_info = []
-                                volume_drives = volume.get('Links', {}).get('Drives', [])
-
-                                for drive_link in volume_drives:
-                                    drive_uri = drive_link.get('@odata.id')
-                                    if drive_uri:
-                                        drive_info = requests.get(
-                                            f"{server_manager.endpoints.base_url}{drive_uri}",
-                                            auth=server_manager.auth,
-                                            verify=False
-                                        ).json()
-                                        drives_info.append(drive_info)
-
-                                # Bay 번호로 정렬 (Bay 형식이 아닌 경우 원래 순서 유지)
-                                def get_bay_number(drive_info):
-                                    drive_id = drive_info.get('Id', '')
-                                    try:
-                                        if 'Bay.' in drive_id:
-                                            return int(drive_id.split('Bay.')[-1].split(':')[0])
-                                        return 0
-                                    except (ValueError, IndexError):
-                                        return 0
-
-                                drives_info.sort(key=get_bay_number)
+                                # 드라이브 정보 (스토리지 구성 캐시의 볼륨별 색인, Bay 순)
+                                drives_info = server_manager.storage_topology.drives_in_volume(volume.get('@odata.id', ''))
 
                                 # 정렬된 드라이브 정보 추가
                                 for drive in drives_info:
@@ -1159,6 +1158,9 @@ def save_system_info(parent_dialog, server_manager):
                 
                 # iDRAC 라이센스 확인
                 license_info = server_manager.check_idrac_license()
+
+                # 포트별 NIC 속성을 한 번에 동시 조회 (캐시 우선)
+                port_attributes = server_manager.fetch_nic_attributes(functions=port_functions(nic_data))
                 
                 for adapter in sorted_adapters:
                     adapter_id = adapter.get('Id', 'Unknown')
@@ -1189,11 +1191,7 @@ def save_system_info(parent_dialog, server_manager):
                             port_info = port
                             device_function_id = f"{port_id}-1"
                             
-                            device_function_info = requests.get(
-                                f"{server_manager.endpoints.base_url}/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/{adapter.get('Id')}/NetworkDeviceFunctions/{device_function_id}/Oem/Dell/DellNetworkAttributes/{device_function_id}",
-                                auth=server_manager.auth,
-                                verify=False
-                            ).json()
+                            device_function_info = port_attributes.get((adapter.get('Id'), device_function_id)) or {}
                             
                             virtualization_mode = device_function_info.get('Attributes', {}).get('VirtualizationMode', 'N/A')
 
@@ -1269,8 +1267,7 @@ def save_system_info(parent_dialog, server_manager):
                 })
 
             progress_dialog.setValue(90)
-            progress_dialog.setLabelText("Excel 파일 생성 중...")
-            # Excel 파일 생성 및 저장 로직
+            progress_dialog.setLabelText("BIOS 설정 정보 수집 중...")
             bios_data = []
             
             for section_name, section_data in get_all_system_settings(parent_dialog, server_manager).items():
@@ -1295,10 +1292,10 @@ def save_system_info(parent_dialog, server_manager):
                                 'value': setting_info
                             })
             
-            firmware_data = server_manager.fetch_firmware_inventory()
+            firmware_components = server_manager.fetch_firmware_components()
             firmware_rows = []
             
-            if firmware_data:
+            if firmware_components:
                 # 기본 정보 가져오기
                 basic_info = server_manager.fetch_basic_info()
                 model_name = basic_info['system'].get('Model', 'N/A')
@@ -1339,24 +1336,22 @@ def save_system_info(parent_dialog, server_manager):
                 }
 
                 # 펌웨어 데이터를 그룹별로 분류
-                for member in firmware_data.get('Members', []):
-                    if member_uri := member.get('@odata.id'):
-                        component_id = member_uri.split('/')[-1]
-                        component_info = server_manager.fetch_firmware_component(component_id)
-                        
-                        # Installed 버전과 Previous 버전 구분
-                        version_type = 'installed' if component_id.startswith('Installed-') else 'previous'
-                        
-                        if 'BIOS' in component_id:
-                            firmware_groups['BIOS'][version_type] = component_info
-                        elif 'iDRAC' in component_id:
-                            firmware_groups['iDRAC'][version_type] = component_info
-                        elif 'PERC' in component_info.get('Name', ''):
-                            firmware_groups['RAID'][version_type] = component_info
-                        elif 'FC.' in component_id or 'QLogic' in component_info.get('Name', ''):
-                            firmware_groups['HBA'].append(component_info)
-                        elif 'NIC' in component_id:
-                            firmware_groups['NIC'].append(component_info)
+                for component_info in firmware_components:
+                    component_id = component_info.get('Id', '')
+                    
+                    # Installed 버전과 Previous 버전 구분
+                    version_type = 'installed' if component_id.startswith('Installed-') else 'previous'
+                    
+                    if 'BIOS' in component_id:
+                        firmware_groups['BIOS'][version_type] = component_info
+                    elif 'iDRAC' in component_id:
+                        firmware_groups['iDRAC'][version_type] = component_info
+                    elif 'PERC' in component_info.get('Name', ''):
+                        firmware_groups['RAID'][version_type] = component_info
+                    elif 'FC.' in component_id or 'QLogic' in component_info.get('Name', ''):
+                        firmware_groups['HBA'].append(component_info)
+                    elif 'NIC' in component_id:
+                        firmware_groups['NIC'].append(component_info)
 
                 # BIOS, iDRAC, RAID 정보 추가 (installed 버전 우선)
                 for category, versions in [('BIOS 펌웨어', firmware_groups['BIOS']), 
@@ -1446,186 +1441,45 @@ def save_system_info(parent_dialog, server_manager):
                             '현재 버전': info['version'],
                             '업데이트 날짜': format_firmware_date(info['date'])
                         })
+
+            # 시트별 행 구성 (수집한 데이터는 작고 이미 메모리에 있으므로 열 너비를 미리 계산)
+            status_rows = [(row['구성 요소'], row['Dell Attribute name'], row['value']) for row in status_data]
+            bios_rows = [(row['Settings'], row['Dell Attribute name'], row['value']) for row in bios_data]
+            firmware_table = [
+                (row['카테고리'], row['장치명'], row['현재 버전'], row['업데이트 날짜']) for row in firmware_rows
+            ]
+            status_headers = ['구성 요소', 'Dell Attribute name', 'value']
+            bios_headers = ['Settings', 'Dell Attribute name', 'value']
             
-                # 데이터프레임 생성 및 엑셀 파일 저장
-                df = pd.DataFrame(firmware_rows)
-                with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
-                    # 상태 정보 시트 작성
-                    df_status = pd.DataFrame(status_data)
-                    df_status.to_excel(writer, sheet_name='상태 정보', index=False)
-                    
-                    # 상태 정보 시트 스타일 적용
-                    status_worksheet = writer.sheets['상태 정보']
-                    
-                    # 상태 정보 헤더 스타일 적용
-                    header_font = Font(bold=True)
-                    for cell in status_worksheet[1]:
-                        cell.font = header_font
-                        cell.border = Border(
-                            left=Side(style='thin'),
-                            right=Side(style='thin'),
-                            top=Side(style='thin'),
-                            bottom=Side(style='thin')
-                        )
-                    
-                    # 상태 정보 내용 스타일 적용
-                    for row in status_worksheet.iter_rows(min_row=2):
-                        # CPU 카테고리 및 하위 항목 구분을 위한 스타일
-                        if row[0].value and not row[1].value and not row[2].value:
-                            row[0].font = header_font
-                            row[0].fill = PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
-                        
-                        # 모든 셀에 테두리 적용
-                        for cell in row:
-                            cell.border = Border(
-                                left=Side(style='thin'),
-                                right=Side(style='thin'),
-                                top=Side(style='thin'),
-                                bottom=Side(style='thin')
-                            )
-                    
-                    # 열 너비 자동 조정
-                    for column in status_worksheet.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = max_length + 2
-                        if any(ord(c) > 127 for c in str(column[0].value)):
-                            adjusted_width = adjusted_width * 1.5
-                        status_worksheet.column_dimensions[column_letter].width = adjusted_width
-
-                    # BIOS 정보 시트 작성
-                    df_bios = pd.DataFrame(bios_data)
-                    df_bios.to_excel(writer, sheet_name='BIOS 정보', index=False)
-                    
-                    # BIOS 정보 시트 스타일 적용
-                    bios_worksheet = writer.sheets['BIOS 정보']
-                    
-                    # BIOS 정보 헤더 굵게 설정
-                    header_font = Font(bold=True)
-                    for cell in bios_worksheet[1]:  # 첫 번째 행의 모든 셀
-                        cell.font = header_font
-                    
-                    # Settings, Dell Attribute name, value가 비어있는 셀 굵게 설정
-                    for row in bios_worksheet.iter_rows(min_row=2):
-                        if not row[1].value or not row[2].value:
-                            row[0].font = header_font
-                    
-                    # BIOS 정보 시트 열 너비 조정
-                    for column in bios_worksheet.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = max_length + 2
-                        if any(ord(c) > 127 for c in str(column[0].value)):
-                            adjusted_width = adjusted_width * 1.5
-                        bios_worksheet.column_dimensions[column_letter].width = adjusted_width
-                    
-                    # BIOS 정보 시트 테두리 적용
-                    for row in bios_worksheet.iter_rows(min_row=1, max_row=bios_worksheet.max_row):
-                        for cell in row:
-                            cell.border = Border(
-                                left=Side(style='thin'),
-                                right=Side(style='thin'),
-                                top=Side(style='thin'),
-                                bottom=Side(style='thin')
-                            )
-                    
-                    # 펌웨어 정보 시트 작성
-                    df = pd.DataFrame(firmware_rows)
-                    df.to_excel(writer, sheet_name='펌웨어 정보', index=False)
-                    
-                    # 펌웨어 정보 시트 가져오기
-                    worksheet = writer.sheets['펌웨어 정보']
-                    
-                    # 펌웨어 정보 헤더 굵게 설정 (카테고리, 장치명, 현재 버전, 업데이트 날짜)
-                    header_row = 2  # 두 번째 행이 실제 헤더
-                    for cell in worksheet[header_row]:
-                        cell.font = Font(bold=True)
-                    
-                    # 첫 번째 행 (모델명과 서비스태그)만 A1, B1에 배치
-                    worksheet['A1'] = model_name
-                    worksheet['B1'] = service_tag
-                    worksheet['C1'] = ''
-                    worksheet['D1'] = ''
-                    
-                    # 나머지 데이터는 두 번째 행부터 시작
-                    for idx, row in enumerate(df.iloc[1:].itertuples(), start=2):
-                        for col, value in enumerate(row[1:], start=1):
-                            worksheet.cell(row=idx, column=col, value=value)
-                    
-                    # NIC 카테고리 병합
-                    nic_start = None
-                    for idx, row in enumerate(worksheet.iter_rows(min_row=3), start=3):
-                        if row[0].value == 'NIC':
-                            nic_start = idx
-                            break
-                    
-                    if nic_start:
-                        worksheet.merge_cells(f'A{nic_start}:A{worksheet.max_row}')
-                    
-                    # 펌웨어 정보 시트 스타일 적용
-                    for row in worksheet.iter_rows():
-                        for cell in row:
-                            cell.alignment = Alignment(horizontal='center', vertical='center')
-                    
-                    # 펌웨어 정보 시트 열 너비 조정
-                    for column in worksheet.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = max_length + 2
-                        if any(ord(c) > 127 for c in str(column[0].value)):
-                            adjusted_width = adjusted_width * 1.5
-                        worksheet.column_dimensions[column_letter].width = adjusted_width
-                    
-                    # 펌웨어 정보 시트 테두리 적용
-                    for row in worksheet.iter_rows(min_row=1, max_row=worksheet.max_row):
-                        for cell in row:
-                            cell.border = Border(
-                                left=Side(style='thin'),
-                                right=Side(style='thin'),
-                                top=Side(style='thin'),
-                                bottom=Side(style='thin')
-                            )
-                    
-                    # 헤더 행 스타일 적용
-                    for cell in worksheet[1]:
-                        cell.font = Font(bold=True)
-                        cell.fill = PatternFill(start_color='F0F0F0', end_color='F0F0F0', fill_type='solid')
-                    
-                    # 섹션 헤더 스타일 적용 (카테고리만 굵게)
-                    for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                        if row[0].value and not row[1].value:  # 카테고리 값이 있고 장치명이 비어있는 경우
-                            for cell in row:
-                                cell.font = Font(bold=True)
-                                cell.fill = PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
+            sheets = [
+                ExportSheet(
+                    '상태 정보', status_headers, status_rows,
+                    total=len(status_rows),
+                    column_widths=estimate_column_widths(status_headers, status_rows),
+                    is_section=lambda row: row[0] and not row[1] and not row[2],
+                    bordered=True
+                ),
+                ExportSheet(
+                    'BIOS 정보', bios_headers, bios_rows,
+                    total=len(bios_rows),
+                    column_widths=estimate_column_widths(bios_headers, bios_rows),
+                    is_section=lambda row: not row[1] or not row[2],
+                    bordered=True
+                ),
+                # 첫 행은 모델명/서비스태그, 두 번째 행이 실제 헤더
+                ExportSheet(
+                    '펌웨어 정보', [], firmware_table,
+                    total=len(firmware_table),
+                    column_widths=estimate_column_widths([], firmware_table),
+                    is_section=lambda row: row[0] and (not row[1] or row[0] in ('카테고리', model_name)),
+                    bordered=True,
+                    centered=True
+                ),
+            ]
             
+            # 파일 기록은 작업자 스레드에서 행 단위로 스트리밍 (완료 알림도 작업자가 표시)
             progress_dialog.setValue(100)
-            progress_dialog.setLabelText("저장 완료")
-
-            success_dialog = ErrorDialog(
-                "저장 완료",
-                "엑셀 파일이 저장되었습니다.",
-                f"파일 위치: {os.path.abspath(file_name)}",
-                parent_dialog
-            )
-            success_dialog.exec()
+            start_export(parent_dialog, file_name, sheets, "시스템 정보 저장")
     except Exception as e:
         logger.error(f"시스템 설정 정보 저장 실패: {str(e)}")
         error_dialog = ErrorDialog(
@@ -0,0 +1,86 @@
+import threading
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+class JobWatcher(QObject):
+    """서버별 작업 큐 감시기 (JobTracker 폴링을 백그라운드 스레드에서 실행)
+
+    작업 관리/펌웨어 대기열 화면들이 같은 서버의 인스턴스를 공유하므로 화면을
+    여러 개 열어도 폴링은 하나만 돌고, 변경이 있을 때만 jobs_changed가 발생합니다.
+    폴링 간격은 추적기가 권장하는 값(진행 중인 작업의 백오프 간격)을 따릅니다.
+    """
+
+    jobs_changed = pyqtSignal(dict)  # {'added': [...], 'updated': [...], 'removed': [작업 ID...]}
+    refresh_failed = pyqtSignal(str)
+    _polled = pyqtSignal()
+
+    _instances = {}
+
+    @classmethod
+    def for_server(cls, server_manager):
+        key = server_manager.endpoints.base_url
+        watcher = cls._instances.get(key)
+        if watcher is None:
+            watcher = cls(server_manager)
+            cls._instances[key] = watcher
+        else:
+            # 인증 정보가 바뀌었을 수 있으므로 최신 관리자 객체 사용
+            watcher.tracker.server_manager = server_manager
+        return watcher
+
+    def __init__(self, server_manager):
+        super().__init__()
+        self.tracker = server_manager.job_tracker
+        self._subscribers = 0
+        self._polling = False
+        self._force = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.refresh)
+        self._polled.connect(self._schedule_next)
+
+    def jobs(self):
+        return self.tracker.jobs()
+
+    def acquire(self):
+        """화면이 열릴 때 호출 (첫 구독자가 폴링 시작)"""
+        self._subscribers += 1
+        if self._subscribers == 1:
+            self.refresh()
+
+    def release(self):
+        """화면이 닫힐 때 호출 (마지막 구독자가 폴링 중지)"""
+        self._subscribers = max(0, self._subscribers - 1)
+        if self._subscribers == 0:
+            self.timer.stop()
+
+    def refresh(self, force=False):
+        """즉시 한 번 확인 (이전 확인이 끝나지 않았으면 건너뜀)"""
+        self._force = self._force or force
+        if self._polling:
+            return
+        self._polling = True
+        self.timer.stop()
+        threading.Thread(target=self._poll, name='JobWatcher', daemon=True).start()
+
+    def _poll(self):
+        force, self._force = self._force, False
+        try:
+            changes = self.tracker.refresh(force=force)
+            if any(changes.values()):
+                self.jobs_changed.emit(changes)
+        except Exception as e:
+            logger.error(f"작업 큐 확인 실패: {str(e)}")
+            self.refresh_failed.emit(str(e))
+        finally:
+            self._polling = False
+            # 다음 예약은 GUI 스레드의 타이머에서
+            self._polled.emit()
+
+    def _schedule_next(self):
+        if self._subscribers > 0:
+            self.timer.start(int(self.tracker.suggested_interval() * 1000))
@@ -0,0 +1,159 @@
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtWidgets import QStyledItemDelegate
+
+from config.system.log_index import parse_log_line
+
+# 레벨별 표시 색상
+LOG_LEVEL_COLORS = {
+    'CRITICAL': QColor('red'),
+    'ERROR': QColor('red'),
+    'WARNING': QColor('orange'),
+    'INFO': QColor('green'),
+    'DEBUG': QColor('blue'),
+}
+
+# 모델 사용자 정의 역할
+LOG_TEXT_ROLE = Qt.ItemDataRole.UserRole + 1  # 레코드 전체 텍스트
+LOG_LEVEL_ROLE = Qt.ItemDataRole.UserRole + 2
+LOG_SERVER_ROLE = Qt.ItemDataRole.UserRole + 3
+
+class LogListModel(QAbstractListModel):
+    """로그 레코드 목록 모델
+
+    레코드마다 레벨/서버/검색용 소문자 텍스트를 추가 시점에 한 번만 계산하고,
+    새 로그는 행 단위로 추가/삭제 알림만 보내므로 전체 재구성이 없습니다.
+    """
+
+    def __init__(self, max_entries=100000, parent=None):
+        super().__init__(parent)
+        self.max_entries = max_entries
+        # (전체 텍스트, 표시 텍스트, 레벨, 서버, 소문자 텍스트)
+        self._entries = []
+
+    @staticmethod
+    def _make_entry(text):
+        text = text.rstrip('\n')
+        lines = text.split('\n')
+        display = lines[0] if len(lines) == 1 else f"{lines[0]}  (+{len(lines) - 1}줄)"
+        parsed = parse_log_line(lines[0])
+        level = parsed['level'] if parsed else ''
+        server = parsed['server'].strip() if parsed else ''
+        return (text, display, level, server, text.lower())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._entries):
+            return None
+        text, display, level, server, _ = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display
+        if role in (LOG_TEXT_ROLE, Qt.ItemDataRole.ToolTipRole):
+            return text
+        if role == LOG_LEVEL_ROLE:
+            return level
+        if role == LOG_SERVER_ROLE:
+            return server
+        return None
+
+    def entry_fields(self, row):
+        """프록시 필터용 (레벨, 서버, 소문자 텍스트)"""
+        _, _, level, server, lowered = self._entries[row]
+        return level, server, lowered
+
+    def entry_text(self, row):
+        return self._entries[row][0]
+
+    def set_entries(self, entries):
+        """전체 레코드 교체 (파일 변경/필터 대상 변경 시에만 사용)"""
+        self.beginResetModel()
+        self._entries = [self._make_entry(entry) for entry in entries[-self.max_entries:]]
+        self.endResetModel()
+
+    def append_entries(self, entries):
+        """새 레코드를 뒤에 추가하고 최대 개수를 넘는 오래된 레코드는 앞에서 제거"""
+        if not entries:
+            return
+        new_entries = [self._make_entry(entry) for entry in entries[-self.max_entries:]]
+
+        overflow = len(self._entries) + len(new_entries) - self.max_entries
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self._entries[:overflow]
+            self.endRemoveRows()
+
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_entries) - 1)
+        self._entries.extend(new_entries)
+        self.endInsertRows()
+
+    def prepend_entries(self, entries):
+        """이전 레코드를 앞에 추가하고 최대 개수를 넘는 최신 레코드는 뒤에서 제거"""
+        if not entries:
+            return
+        new_entries = [self._make_entry(entry) for entry in entries[-self.max_entries:]]
+
+        overflow = len(self._entries) + len(new_entries) - self.max_entries
+        if overflow > 0:
+            start = len(self._entries) - overflow
+            self.beginRemoveRows(QModelIndex(), start, len(self._entries) - 1)
+            del self._entries[start:]
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, len(new_entries) - 1)
+        self._entries[0:0] = new_entries
+        self.endInsertRows()
+
+class LogFilterProxyModel(QSortFilterProxyModel):
+    """레벨/서버/검색어 조건으로 로그 행을 거르는 프록시 모델
+
+    조건이 바뀔 때만 전체를 다시 거르고, 새로 추가된 행은 Qt가 추가된 행만 검사합니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._level = None
+        self._server = None
+        self._search = ''
+        self.setDynamicSortFilter(True)
+
+    def set_filters(self, level=None, server=None, search=''):
+        search = (search or '').strip().lower()
+        if (level, server, search) == (self._level, self._server, self._search):
+            return
+        self._level = level
+        self._server = server
+        self._search = search
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._level is None and self._server is None and not self._search:
+            return True
+        level, server, lowered = self.sourceModel().entry_fields(source_row)
+        if self._level is not None and level != self._level:
+            return False
+        if self._server is not None and server != self._server:
+            return False
+        if self._search and self._search not in lowered:
+            return False
+        return True
+
+    def visible_entries(self):
+        """현재 필터를 통과한 레코드 전체 텍스트 목록"""
+        source = self.sourceModel()
+        return [
+            source.entry_text(self.mapToSource(self.index(row, 0)).row())
+            for row in range(self.rowCount())
+        ]
+
+class LogLevelDelegate(QStyledItemDelegate):
+    """로그 레벨에 따라 글자색을 지정하는 델리게이트"""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        color = LOG_LEVEL_COLORS.get(index.data(LOG_LEVEL_ROLE))
+        if color is not None:
+            option.palette.setColor(QPalette.ColorRole.Text, color)
+            option.palette.setColor(QPalette.ColorRole.HighlightedText, color)
@@ -1,39 +1,58 @@
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import Counter
 import re
-import html
 from pathlib import Path
 import sys
 
-import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side
-
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from utils.system_utils import get_system_matplotlib_font
 
 # 시스템 한글 폰트 설정
 get_system_matplotlib_font()
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
 
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, 
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListView, 
                              QPushButton, QFileDialog, QLabel, QComboBox, 
                              QLineEdit, QCheckBox, QTabWidget, QWidget, 
                              QApplication, QScrollArea, QGroupBox, QGridLayout)
-from PyQt6.QtGui import QTextCursor
 from PyQt6.QtCore import Qt, QTimer
 
 from config.system.app_config import ResourceManager
 from config.system.log_config import setup_logging
-from utils.system_utils import get_system_monospace_font, get_system_matplotlib_font
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from ui.components.log_list_model import LogFilterProxyModel, LogLevelDelegate, LogListModel
+from config.system.log_index import (INDEX_SUFFIX, LOG_LEVELS, SERVER_TABLE_SUFFIX, LogIndex,
+                                     format_log_entry, parse_log_line)
+from utils.log_reader import LogTailReader
+from utils.export_utils import EXPORT_FORMATS, ExportSheet, ensure_export_extension
+from utils.log_search import log_search_index
+from utils.log_statistics import LogStatistics, build_timeline, hourly_level_counts
+from utils.system_utils import get_system_monospace_font
+from ui.components.charts import HorizontalBarChart, StackedBarChart
+from ui.components.export_worker import start_export
+from ui.components.popups.error_dialog import ErrorDialog
 
 logger = setup_logging()
 
+MAX_DISPLAY_ENTRIES = 1000  # 화면에 표시할 최대 로그 수
+LOG_PAGE_SIZE = 1000  # 이전 로그 한 페이지 크기
+MAX_LOADED_ENTRIES = 100000  # 메모리에 유지할 최대 로그 수 (이전 페이지 포함)
+MAX_INDEX_RESULTS = 10000  # 인덱스 조회 시 불러올 최대 레코드 수
+# 로그 레벨 차트 색상
+LOG_LEVEL_CHART_COLORS = {
+    'DEBUG': '#36A2EB',     # 밝은 파란색
+    'INFO': '#4BC0C0',      # 청록색
+    'WARNING': '#FFCE56',   # 노란색
+    'ERROR': '#FF6384',     # 밝은 빨간색
+    'CRITICAL': '#FF0000'   # 진한 빨간색
+}
+# 전체 파일 검색 기간
+SEARCH_PERIODS = {
+    "전체 기간": None,
+    "최근 1시간": timedelta(hours=1),
+    "최근 24시간": timedelta(days=1),
+    "최근 7일": timedelta(days=7),
+    "최근 30일": timedelta(days=30),
+}
+
 class LogViewerDialog(QDialog):
     def __init__(self, parent=None):
         # 모덜리스 다이얼로그로 설정
@@ -81,15 +100,31 @@ class LogViewerDialog(QDialog):
         filter_layout.addWidget(QLabel("검색:"))
         filter_layout.addWidget(self.search_input)
         
+        # 전체 로그 파일 검색 (회전/압축 파일 포함)
+        self.search_all_check = QCheckBox("전체 파일 검색")
+        self.search_all_check.stateChanged.connect(self.filter_logs)
+        filter_layout.addWidget(self.search_all_check)
+        
+        self.search_period_combo = QComboBox()
+        self.search_period_combo.addItems(list(SEARCH_PERIODS.keys()))
+        self.search_period_combo.currentTextChanged.connect(self.filter_logs)
+        filter_layout.addWidget(self.search_period_combo)
+        
         # 실시간 업데이트 체크박스
         self.auto_update_check = QCheckBox("실시간 업데이트")
         filter_layout.addWidget(self.auto_update_check)
 
-        # 로그 텍스트 에디터
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setFont(get_system_monospace_font())
-        log_viewer_layout.addWidget(self.log_text)
+        # 로그 목록 뷰 (모델/프록시/델리게이트)
+        self.log_model = LogListModel(MAX_LOADED_ENTRIES, self)
+        self.log_proxy = LogFilterProxyModel(self)
+        self.log_proxy.setSourceModel(self.log_model)
+        self.log_view = QListView()
+        self.log_view.setModel(self.log_proxy)
+        self.log_view.setItemDelegate(LogLevelDelegate(self.log_view))
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
+        self.log_view.setFont(get_system_monospace_font())
+        log_viewer_layout.addWidget(self.log_view)
 
         # 로그 파일 선택 레이아웃
         log_file_layout = QHBoxLayout()
@@ -114,6 +149,12 @@ class LogViewerDialog(QDialog):
         find_log_btn.clicked.connect(self.open_log_file)
         button_layout.addWidget(find_log_btn)
 
+        # 이전 로그 더 보기 버튼
+        self.load_older_btn = QPushButton("이전 로그 더 보기")
+        self.load_older_btn.clicked.connect(self.load_older_logs)
+        self.load_older_btn.setEnabled(False)
+        button_layout.addWidget(self.load_older_btn)
+
         # 클립보드 복사 버튼
         copy_btn = QPushButton("로그 복사")
         copy_btn.clicked.connect(self.copy_logs_to_clipboard)
@@ -152,7 +193,11 @@ class LogViewerDialog(QDialog):
         # 초기화
         self.current_log_file = None
         self.all_log_entries = []
-        self.last_log_file_position = 0  # 마지막으로 읽은 로그 파일 위치
+        self.log_index = None  # 현재 로그 파일의 사이드카 인덱스
+        self.log_stats = None  # 현재 로그 파일의 누적 통계 (인덱스 기반)
+        self.log_reader = None  # 현재 로그 파일의 역방향 리더
+        self.viewing_tail = True  # 최신 로그 구간을 보고 있는지 여부
+        self._model_source_key = None  # 모델에 적재된 레코드의 (레벨, 서버) 조회 조건
         self.populate_log_files()
         
         # 실시간 업데이트 체크박스 연결
@@ -199,8 +244,12 @@ class LogViewerDialog(QDialog):
         self.log_stats_label = QLabel("로그 통계")
         log_stats_layout.addWidget(self.log_stats_label)
         
-        # 로그 레벨 차트 레이아웃
+        # 로그 레벨 차트 레이아웃 (차트 캔버스는 한 번만 만들고 값만 갱신)
         self.log_level_chart_layout = QVBoxLayout()
+        self.log_level_chart = HorizontalBarChart('로그 레벨 분포', '비율 (%)')
+        self.log_level_chart.show_message('로그 없음')
+        self.log_level_chart_layout.addWidget(self.log_level_chart)
+        self.timeline_chart_canvas = None  # 시간대별 차트 (필요할 때 생성)
         log_stats_layout.addLayout(self.log_level_chart_layout)
         
         # 메인 레이아웃에 추가
@@ -228,6 +277,7 @@ class LogViewerDialog(QDialog):
                 log_files = [
                     f for f in os.listdir(log_dir) 
                     if (f.startswith('app.log') or f.startswith('20')) 
+                    and not f.endswith((INDEX_SUFFIX, SERVER_TABLE_SUFFIX))
                     and os.path.isfile(os.path.join(log_dir, f))
                 ]
             
@@ -294,12 +344,21 @@ class LogViewerDialog(QDialog):
             self.current_log_file = log_file_path
             self.log_file_path_label.setText(f"현재 로그 파일: {log_file_path}")
             
-            # 로그 파일 읽기
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                log_entries = f.readlines()
+            # 로그 파일 끝부분만 읽기 (회전된 이전 파일까지 하나의 스트림으로 취급)
+            self.log_reader = LogTailReader(log_file_path)
+            log_entries = [self._to_display_line(entry) for entry in self.log_reader.tail(MAX_DISPLAY_ENTRIES)]
+            self.viewing_tail = True
+            self.load_older_btn.setEnabled(self.log_reader.has_more())
             
-            # 로그 엔트리 제한 (최대 1000개)
-            log_entries = log_entries[-1000:]
+            # 사이드카 인덱스 로드 (없으면 한 번 스캔해 생성)
+            try:
+                self.log_index = LogIndex.open(log_file_path)
+                self.log_stats = LogStatistics(log_file_path)
+                self.log_stats.refresh()
+            except Exception as e:
+                logger.warning(f"로그 인덱스 로드 실패: {e}")
+                self.log_index = None
+                self.log_stats = None
             
             # 로그 텍스트 채우기
             self.all_log_entries = log_entries
@@ -307,7 +366,8 @@ class LogViewerDialog(QDialog):
             # 서버 필터 업데이트
             self.update_server_filter(log_entries)
             
-            # 로그 필터링 및 표시
+            # 로그 필터링 및 표시 (새 파일이므로 모델 다시 적재)
+            self._reset_log_model()
             self.filter_logs()
             
             # 로그 통계 업데이트
@@ -315,73 +375,84 @@ class LogViewerDialog(QDialog):
             
         except Exception as e:
             logger.error(f"로그 파일 로드 중 오류: {e}")
-            self.log_text.setPlainText(f"로그 파일 로드 실패: {e}")
+            self.all_log_entries = [f"로그 파일 로드 실패: {e}"]
+            self._model_source_key = (None, None)
+            self.log_model.set_entries(self.all_log_entries)
+
+    @staticmethod
+    def _to_display_line(log_entry):
+        """JSON 형식 로그는 기존 텍스트 형식으로 변환해 표시"""
+        if log_entry.startswith('{'):
+            entry = parse_log_line(log_entry)
+            if entry is not None:
+                return format_log_entry(entry) + '\n'
+        return log_entry
+
+    def _get_servers(self, log_entries):
+        """서버 목록 (인덱스가 있으면 인덱스의 서버 테이블 사용)"""
+        if self.log_index is not None:
+            return set(self.log_index.get_servers())
+        servers = set()
+        for log_entry in log_entries:
+            entry = parse_log_line(log_entry)
+            if entry is not None:
+                servers.add(entry['server'].strip())
+        return servers
+
+    def load_older_logs(self):
+        """이전 로그 한 페이지를 더 읽어 앞쪽에 추가"""
+        try:
+            if self.log_reader is None or not self.log_reader.has_more():
+                return
+            
+            older_entries = [self._to_display_line(entry) for entry in self.log_reader.read_previous(LOG_PAGE_SIZE)]
+            self.all_log_entries = older_entries + self.all_log_entries
+            
+            # 메모리 사용량 제한: 가장 최근 로그부터 잘라냄
+            if len(self.all_log_entries) > MAX_LOADED_ENTRIES:
+                self.all_log_entries = self.all_log_entries[:MAX_LOADED_ENTRIES]
+                self.viewing_tail = False
+            
+            # 꼬리 버퍼를 표시 중이면 모델 앞쪽에만 행 추가
+            if self._model_source_key == (None, None):
+                self.log_model.prepend_entries(older_entries)
+            
+            self.load_older_btn.setEnabled(self.log_reader.has_more())
+            
+            # 새로 읽은 구간이 보이도록 맨 위로 스크롤
+            self.log_view.scrollToTop()
+        except Exception as e:
+            logger.error(f"이전 로그 로드 중 오류: {e}")
 
     def update_server_filter(self, log_entries):
         """서버 필터 업데이트"""
         try:
-            # 기존 서버 필터 초기화
+            # 기존 서버 필터 초기화 (필터 재적용은 한 번만)
+            current_server = self.server_filter_combo.currentText()
+            self.server_filter_combo.blockSignals(True)
             self.server_filter_combo.clear()
             self.server_filter_combo.addItem("모든 서버")
             
             # 서버 목록 추출
-            servers = set()
-            for log_entry in log_entries:
-                try:
-                    server_parts = log_entry.split('[서버: ')
-                    if len(server_parts) > 1:
-                        server_name = server_parts[1].split(']')[0].strip()
-                        servers.add(server_name)
-                except Exception:
-                    pass
+            servers = self._get_servers(log_entries)
             
             # 서버 목록 추가
             for server in sorted(servers):
                 if server and server != 'SYSTEM':
                     self.server_filter_combo.addItem(server)
             
+            index = self.server_filter_combo.findText(current_server)
+            if index > -1:
+                self.server_filter_combo.setCurrentIndex(index)
+            self.server_filter_combo.blockSignals(False)
+            
         except Exception as e:
+            self.server_filter_combo.blockSignals(False)
             logger.error(f"서버 필터 업데이트 중 오류: {e}")
 
-    def populate_log_text(self, log_entries):
-        """로그 텍스트 채우기"""
-        try:
-            # 기존 텍스트 지우기
-            self.log_text.clear()
-            
-            # HTML 형식으로 로그 항목 추가 (가독성 개선)
-            html_log_entries = []
-            for log_entry in log_entries:
-                # 로그 레벨에 따른 색상 지정
-                if 'ERROR' in log_entry:
-                    color = 'red'
-                elif 'WARNING' in log_entry:
-                    color = 'orange'
-                elif 'INFO' in log_entry:
-                    color = 'green'
-                elif 'DEBUG' in log_entry:
-                    color = 'blue'
-                else:
-                    color = 'black'
-                
-                # HTML 형식으로 로그 항목 포맷팅
-                html_entry = f'<font color="{color}">{html.escape(log_entry)}</font>'
-                html_log_entries.append(html_entry)
-            
-            # HTML 형식으로 전체 로그 텍스트 설정
-            full_html_log = '<br>'.join(html_log_entries)
-            self.log_text.setHtml(full_html_log)
-            
-            # 커서를 맨 끝으로 이동
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.log_text.setTextCursor(cursor)
-            
-            # 스크롤을 맨 하단으로 이동
-            scrollbar = self.log_text.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
-        except Exception as e:
-            logger.error(f"로그 텍스트 채우기 중 오류: {e}")
+    def _is_scrolled_to_bottom(self):
+        scrollbar = self.log_view.verticalScrollBar()
+        return scrollbar.value() >= scrollbar.maximum()
 
     def toggle_auto_update(self, state):
         """실시간 업데이트 토글"""
@@ -409,37 +480,66 @@ class LogViewerDialog(QDialog):
             self.auto_update_check.setChecked(False)
             self.update_timer.stop()
 
-    def filter_logs(self, server_filter=None, level_filter=None):
-        """로그 필터링"""
+    def filter_logs(self, *args):
+        """로그 필터링
+
+        레벨/서버 조건이 바뀌면 사이드카 인덱스에서 해당 레코드만 읽어 모델에 적재하고,
+        실제 행 필터링(레벨/서버/검색어)은 프록시 모델에서 처리합니다.
+        """
         try:
-            # 필터링된 로그 저장할 리스트
-            filtered_logs = []
-            
-            # 필터링 조건에 맞는 로그 선택
-            for log_entry in self.all_log_entries:
-                # 서버 필터 적용
-                if server_filter and server_filter.lower() not in log_entry.lower():
-                    continue
-                
-                # 로그 레벨 필터 적용
-                if level_filter and level_filter.lower() not in log_entry.lower():
-                    continue
-                
-                filtered_logs.append(log_entry)
+            level_filter = self.log_level_combo.currentText()
+            server_filter = self.server_filter_combo.currentText()
+            level = None if level_filter in ("", "모든 로그") else level_filter
+            server = None if server_filter in ("", "모든 서버") else server_filter
+            
+            # 전체 파일 검색: 검색 인덱스 결과를 그대로 표시
+            if self.search_all_check.isChecked():
+                self.search_logs_all_files(level, server)
+                return
+            
+            # 인덱스 사용 여부에 따라 모델에 적재할 레코드 결정
+            source_key = (level, server) if self.log_index is not None else (None, None)
+            if source_key != self._model_source_key:
+                self._model_source_key = source_key
+                if source_key != (None, None):
+                    indices = self.log_index.query(level=level, server=server)[-MAX_INDEX_RESULTS:]
+                    self.log_model.set_entries(self.log_index.read_entries(indices))
+                else:
+                    self.log_model.set_entries(self.all_log_entries)
+                self.log_view.scrollToBottom()
             
-            # 필터링된 로그 표시
-            self.populate_log_text(filtered_logs)
+            self.log_proxy.set_filters(level, server, self.search_input.text())
         
         except Exception as e:
             logger.error(f"로그 필터링 중 오류: {e}")
             # 오류 발생 시 모든 로그 다시 표시
-            self.populate_log_text(self.all_log_entries)
+            self._model_source_key = (None, None)
+            self.log_model.set_entries(self.all_log_entries)
+            self.log_proxy.set_filters()
+
+    def search_logs_all_files(self, level=None, server=None):
+        """로그 디렉토리 전체 검색 인덱스 조회 결과 표시"""
+        log_search_index.start()
+        period = SEARCH_PERIODS.get(self.search_period_combo.currentText())
+        start = datetime.now() - period if period else None
+        results = log_search_index.search(
+            text=self.search_input.text(), level=level, server=server,
+            start=start, limit=MAX_INDEX_RESULTS
+        )
+        self._model_source_key = 'search'
+        self.log_model.set_entries([result['line'] for result in reversed(results)])
+        self.log_proxy.set_filters()
+        self.log_view.scrollToBottom()
+
+    def _reset_log_model(self):
+        """로그 파일 변경 시 모델을 다시 적재하도록 표시"""
+        self._model_source_key = None
 
     def copy_logs_to_clipboard(self):
         """로그를 클립보드에 복사"""
         try:
             clipboard = QApplication.clipboard()
-            clipboard.setText(self.log_text.toPlainText())
+            clipboard.setText(''.join(entry + '\n' for entry in self.log_proxy.visible_entries()))
             logger.info("로그가 클립보드에 복사되었습니다.")
             
             # 성공 다이얼로그
@@ -457,158 +557,84 @@ class LogViewerDialog(QDialog):
             )
             error_dialog.exec()
 
+    @staticmethod
+    def _iter_export_rows(log_entries):
+        """내보내기용 (타임스탬프, 레벨, 메시지) 행 생성 (작업자 스레드에서 순회)"""
+        for log_entry in log_entries:
+            log_entry = log_entry.strip()
+            if not log_entry:
+                continue
+            
+            # 로그 형식 파싱
+            first_line, _, rest = log_entry.partition('\n')
+            parsed = parse_log_line(first_line)
+            if parsed is not None:
+                message = parsed['message']
+                if rest:
+                    message += '\n' + rest
+                yield (parsed['ts'], parsed['level'], message)
+            else:
+                # 형식에 맞지 않는 경우 전체 로그 항목을 메시지로 처리
+                yield ("", "", log_entry)
+
     def export_logs_to_xlsx(self):
-        """로그를 Excel 파일로 내보내기"""
+        """로그를 Excel/CSV/Parquet 파일로 내보내기 (백그라운드 스트리밍 기록)"""
         log_dir = str(ResourceManager.get_log_dir())
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self, 
             "로그 파일 저장", 
             log_dir, 
-            "Excel 파일 (*.xlsx)"
+            EXPORT_FORMATS
         )
         
         if file_path:
-            try:
-                # 새 워크북 생성
-                wb = openpyxl.Workbook()
-                ws = wb.active
-                ws.title = "로그"
-                
-                # 헤더 설정
-                headers = ["타임스탬프", "로그 레벨", "메시지"]
-                ws.append(headers)
-                
-                # 헤더 스타일
-                header_font = Font(bold=True)
-                header_border = Border(
-                    left=Side(style='thin'), 
-                    right=Side(style='thin'), 
-                    top=Side(style='thin'), 
-                    bottom=Side(style='thin')
-                )
-                
-                for cell in ws[1]:
-                    cell.font = header_font
-                    cell.border = header_border
-                    cell.alignment = Alignment(horizontal='center')
-                
-                # 로그 데이터 추가
-                for log_entry in self.log_text.toPlainText().split('\n'):
-                    log_entry = log_entry.strip()
-                    if not log_entry:
-                        continue
-                    
-                    # 로그 형식 파싱
-                    parts = log_entry.split(' - ', 4)
-                    if len(parts) == 5:
-                        timestamp, pid, module, level, message = parts
-                        ws.append([timestamp, level, message])
-                    else:
-                        # 형식에 맞지 않는 경우 전체 로그 항목을 메시지로 처리
-                        ws.append(["", "", log_entry])
-                
-                # 열 너비 자동 조정
-                for col in ws.columns:
-                    max_length = 0
-                    column = col[0].column_letter
-                    for cell in col:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(cell.value)
-                        except:
-                            pass
-                    adjusted_width = (max_length + 2)
-                    ws.column_dimensions[column].width = adjusted_width
-                
-                # 파일 저장
-                wb.save(file_path)
-                
-                logger.info(f"로그가 {file_path}에 저장되었습니다.")
-                
-                # 성공 다이얼로그
-                success_dialog = ErrorDialog(
-                    "Excel 내보내기 성공", 
-                    f"로그가 {file_path}에 성공적으로 저장되었습니다."
-                )
-                success_dialog.exec()
-            except Exception as e:
-                logger.error(f"Excel 내보내기 중 오류: {e}")
-                error_dialog = ErrorDialog(
-                    "Excel 내보내기 오류", 
-                    "로그를 Excel 파일로 내보내는 중 오류가 발생했습니다.", 
-                    str(e)
-                )
-                error_dialog.exec()
-
-    def analyze_log_statistics(self, log_entries):
-        """로그 통계 분석"""
-        # 한글 폰트 설정
-        get_system_matplotlib_font()
-        
-        # 로그 레벨별 통계
-        log_level_counts = {}
-        total_logs = len(log_entries)
-        
-        # 로그 레벨 카운트
-        for entry in log_entries:
-            try:
-                # 로그 레벨 추출 (로그 형식: 2025-01-07 23:43:47 - [87281] - dell_idrac_monitor - INFO - [서버: SYSTEM] - 빠른 연결 서버 설정: web1)
-                log_level_parts = entry.split(' - ')
-                
-                if len(log_level_parts) >= 4:
-                    log_level = log_level_parts[3].strip()
-                    log_level_counts[log_level] = log_level_counts.get(log_level, 0) + 1
-            except Exception as e:
-                print(f"로그 레벨 추출 중 오류: {e}")
-        
-        # 기존 레이아웃 초기화
-        for i in reversed(range(self.log_level_chart_layout.count())): 
-            self.log_level_chart_layout.itemAt(i).widget().setParent(None)
+            file_path = ensure_export_extension(file_path, selected_filter)
+            # 현재 필터를 통과한 레코드 목록만 스냅샷으로 넘기고 파싱/기록은 작업자에서 수행
+            log_entries = self.log_proxy.visible_entries()
+            sheet = ExportSheet(
+                "로그",
+                ["타임스탬프", "로그 레벨", "메시지"],
+                self._iter_export_rows(log_entries),
+                total=len(log_entries),
+                column_widths=[21, 11, 120]
+            )
+            self._export_worker = start_export(self, file_path, [sheet], "로그 내보내기")
+
+    def _get_level_counts(self, server=None, level=None, log_entries=None):
+        """레벨별 로그 수 (누적 집계가 있으면 사용, 없으면 로드된 로그를 한 번에 집계)"""
+        if self.log_stats is not None and log_entries is None:
+            return self.log_stats.level_counts(server=server, level=level)
+        hourly = self._hourly_counts_from_entries(log_entries or self.all_log_entries, server=server)
+        per_level = hourly.sum(axis=0)
+        return {
+            name: int(per_level[code]) if level in (None, name) else 0
+            for code, name in enumerate(LOG_LEVELS)
+        }
 
-        # 새 수평 막대 그래프 생성
-        plt.close('all')  # 기존 플롯 닫기
-        
-        # 데이터 개수에 따라 동적으로 그래프 높이 조정
-        graph_height = max(3, min(len(log_level_counts) * 0.5, 6))
-        if len(log_level_counts) <= 2:
-            graph_height = 2.5  # 로그 개수가 적을 때 더 작은 높이
-        
-        fig, ax = plt.subplots(figsize=(8, graph_height))
-        
-        # 데이터 준비
-        levels = list(log_level_counts.keys())
-        counts = list(log_level_counts.values())
-        percentages = [(count / total_logs * 100) for count in counts]
-        
-        # 색상 매핑
-        color_map = {
-            'DEBUG': '#36A2EB',     # 밝은 파란색
-            'INFO': '#4BC0C0',      # 청록색
-            'WARNING': '#FFCE56',   # 노란색
-            'ERROR': '#FF6384',     # 밝은 빨간색
-            'CRITICAL': '#FF0000'   # 진한 빨간색
+    @staticmethod
+    def _hourly_counts_from_entries(log_entries, server=None):
+        """로드된 로그 항목을 한 번 파싱해 시간대 × 레벨 집계 행렬 생성"""
+        timestamps, levels = [], []
+        for log_entry in log_entries:
+            parsed = parse_log_line(log_entry)
+            if parsed is None or (server and parsed['server'].strip() != server):
+                continue
+            timestamps.append(parsed['ts'])
+            levels.append(parsed['level'])
+        return hourly_level_counts(timestamps, levels)
+
+    def analyze_log_statistics(self, log_entries=None):
+        """로그 통계 분석"""
+        # 로그 레벨별 통계 (누적 집계 사용, 0건인 레벨은 제외)
+        log_level_counts = {
+            level: count for level, count in self._get_level_counts(log_entries=log_entries).items() if count
         }
-        colors = [color_map.get(level, '#000000') for level in levels]
-        
-        # 수평 막대 그래프 생성
-        bars = ax.barh(levels, percentages, color=colors, height=0.5)  # 막대 높이 더 작게
-        
-        # 각 막대에 로그 개수 표시
-        for bar, count in zip(bars, counts):
-            width = bar.get_width()
-            ax.text(width, bar.get_y() + bar.get_height()/2, 
-                    f'{count}', 
-                    va='center', fontsize=8)
-        
-        plt.title('로그 레벨 분포', fontsize=10)
-        plt.xlabel('비율 (%)', fontsize=9)
-        plt.xticks(fontsize=8)
-        plt.yticks(fontsize=8)
-        plt.tight_layout()
+        total_logs = sum(log_level_counts.values())
+        if total_logs == 0:
+            return
         
-        # Qt 캔버스에 추가
-        canvas = FigureCanvas(fig)
-        self.log_level_chart_layout.addWidget(canvas)
+        # 기존 차트의 막대만 갱신
+        self.create_log_level_chart(log_level_counts)
         
         # 통계 라벨 업데이트
         self.total_logs_label.setText(f"전체 로그: {total_logs}")
@@ -617,67 +643,28 @@ class LogViewerDialog(QDialog):
         self.error_logs_label.setText(f"ERROR 로그: {log_level_counts.get('ERROR', 0)}")
         self.debug_logs_label.setText(f"DEBUG 로그: {log_level_counts.get('DEBUG', 0)}")
 
-    def analyze_timeline_statistics(self, log_entries):
+    def analyze_timeline_statistics(self, log_entries=None):
         """시간대별 로그 통계 분석"""
         try:
-            # 한글 폰트 설정
-            get_system_matplotlib_font()
-            
-            # 로그 항목 파싱
-            parsed_logs = []
-            for log_entry in log_entries:
-                try:
-                    # 로그 항목에서 타임스탬프 추출
-                    timestamp = log_entry.split(' - ')[0].strip()
-                    log_time = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                    
-                    # 로그 레벨 추출
-                    log_level_parts = log_entry.split(' - ')
-                    if len(log_level_parts) >= 4:
-                        log_level = log_level_parts[3].strip()
-                    
-                    # 로그 메시지 추출
-                    message = ' - '.join(log_level_parts[4:])
-                    
-                    parsed_logs.append({
-                        'timestamp': timestamp,
-                        'level': log_level,
-                        'message': message
-                    })
-                except Exception:
-                    pass
-            
-            # 시간대별 통계 계산
-            timeline_stats = self.calculate_timeline_stats(parsed_logs)
-            
-            # 그래프 그리기 (matplotlib)
-            plt.clf()  # 이전 그래프 초기화
-            fig, ax = plt.subplots(figsize=(10, 5))
+            # 시간대별 통계 계산 (누적 집계가 있으면 로그 본문을 다시 파싱하지 않음)
+            if self.log_stats is not None and log_entries is None:
+                timeline_stats = self.log_stats.timeline()
+            else:
+                hourly = self._hourly_counts_from_entries(log_entries or self.all_log_entries)
+                timeline_stats = build_timeline(hourly)
             
-            # 시간대별 로그 레벨 분포
+            # 시간대별 로그 레벨 분포 (차트는 처음 한 번만 만들고 이후 값만 갱신)
             levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
             colors = ['blue', 'green', 'orange', 'red']
-            
-            bottom = [0] * len(timeline_stats)
-            for level, color in zip(levels, colors):
-                counts = [stats.get(level, 0) for stats in timeline_stats]
-                ax.bar(range(len(timeline_stats)), counts, bottom=bottom, label=level, color=color, alpha=0.7)
-                bottom = [b + c for b, c in zip(bottom, counts)]
-            
-            ax.set_title('시간대별 로그 레벨 분포')
-            ax.set_xlabel('시간대')
-            ax.set_ylabel('로그 수')
-            ax.set_xticks(range(len(timeline_stats)))
-            ax.set_xticklabels([stat['hour'] for stat in timeline_stats], rotation=45)
-            ax.legend()
-            
-            # 기존 위젯 제거
-            for i in reversed(range(self.timeline_chart.layout().count())): 
-                self.timeline_chart.layout().itemAt(i).widget().setParent(None)
-            
-            # 새 캔버스 추가
-            canvas = FigureCanvas(fig)
-            self.timeline_chart.layout().addWidget(canvas)
+            if self.timeline_chart_canvas is None:
+                self.timeline_chart_canvas = StackedBarChart('시간대별 로그 레벨 분포', '시간대', '로그 수')
+                self.log_level_chart_layout.addWidget(self.timeline_chart_canvas)
+            
+            self.timeline_chart_canvas.update_series(
+                [stat['hour'] for stat in timeline_stats],
+                {level: [stats.get(level, 0) for stats in timeline_stats] for level in levels},
+                colors
+            )
             
         except Exception as e:
             logger.error(f"시간대별 로그 통계 분석 중 오류: {e}")
@@ -704,15 +691,7 @@ class LogViewerDialog(QDialog):
             level_filter = self.analysis_level_filter.currentText()
 
             # 서버 목록 추출 및 콤보박스 채우기
-            server_list = set()
-            for log_entry in self.all_log_entries:
-                try:
-                    server_name_parts = log_entry.split('[서버: ')
-                    if len(server_name_parts) > 1:
-                        server_name = server_name_parts[1].split(']')[0].strip()
-                        server_list.add(server_name)
-                except Exception:
-                    pass
+            server_list = self._get_servers(self.all_log_entries)
             
             # 서버 필터 콤보박스 업데이트
             current_server = self.analysis_server_filter.currentText()
@@ -726,51 +705,11 @@ class LogViewerDialog(QDialog):
             if index > -1:
                 self.analysis_server_filter.setCurrentIndex(index)
 
-            # 필터링된 로그 선택
-            filtered_logs = []
-            log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-            
-            for log_entry in self.all_log_entries:  # 전체 로그 사용
-                # 서버 필터링
-                try:
-                    server_name_parts = log_entry.split('[서버: ')
-                    server_name = 'SYSTEM'  # 기본값
-                    if len(server_name_parts) > 1:
-                        server_name = server_name_parts[1].split(']')[0].strip()
-                    
-                    if server_filter != "모든 서버" and server_name != server_filter:
-                        continue
-                    
-                    # 로그 레벨 필터링 (더 안전한 방식)
-                    log_level_match = None
-                    for level in log_levels:
-                        if f" - {level} - " in log_entry:
-                            log_level_match = level
-                            break
-                    
-                    # 로그 레벨 필터링 적용
-                    if level_filter != "모든 로그" and log_level_match != level_filter:
-                        continue
-                    
-                    filtered_logs.append(log_entry)
-                except Exception as e:
-                    logger.error(f"로그 필터링 중 오류: {e}")
-
-            # 로그 레벨별 카운트
-            log_level_counts = {
-                'DEBUG': 0,
-                'INFO': 0,
-                'WARNING': 0,
-                'ERROR': 0,
-                'CRITICAL': 0
-            }
-
-            # 로그 레벨 카운트
-            for entry in filtered_logs:
-                for level in log_level_counts.keys():
-                    if f" - {level} - " in entry:
-                        log_level_counts[level] += 1
-                        break
+            server = None if server_filter == "모든 서버" else server_filter
+            level = None if level_filter == "모든 로그" else level_filter
+
+            # 로그 레벨별 카운트 (누적 집계에서 조회, 로그 본문을 다시 파싱하지 않음)
+            log_level_counts = self._get_level_counts(server=server, level=level)
 
             # 로그 통계 텍스트 업데이트
             stats_text = "로그 통계:\n"
@@ -779,12 +718,7 @@ class LogViewerDialog(QDialog):
             # 로그가 없을 경우 처리
             if total_logs == 0:
                 self.log_stats_label.setText("로그 없음")
-                # 기존 차트 제거
-                for i in reversed(range(self.log_level_chart_layout.count())): 
-                    widget = self.log_level_chart_layout.itemAt(i).widget()
-                    if widget:
-                        widget.setParent(None)
-                        widget.deleteLater()
+                self.log_level_chart.show_message('로그 없음')
                 return
 
             for level, count in log_level_counts.items():
@@ -806,91 +740,25 @@ class LogViewerDialog(QDialog):
                 delattr(self, '_updating_log_stats')
 
     def create_log_level_chart(self, log_level_counts):
-        # 기존 레이아웃의 모든 위젯 제거
-        for i in reversed(range(self.log_level_chart_layout.count())): 
-            widget = self.log_level_chart_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-                widget.deleteLater()
-
-        # 데이터 개수에 따라 동적으로 그래프 높이 조정
-        graph_height = max(3, min(len(log_level_counts) * 0.5, 6))
-        if len(log_level_counts) <= 2:
-            graph_height = 2.5  # 로그 개수가 적을 때 더 작은 높이
-
-        plt.close('all')  # 기존 플롯 닫기
-        
-        # 데이터 준비
+        """로그 레벨 분포 차트 갱신 (기존 Figure/캔버스 재사용)"""
         levels = list(log_level_counts.keys())
         counts = list(log_level_counts.values())
-        percentages = [(count / sum(log_level_counts.values()) * 100) for count in counts]
-        
-        # 색상 매핑
-        color_map = {
-            'DEBUG': '#36A2EB',     # 밝은 파란색
-            'INFO': '#4BC0C0',      # 청록색
-            'WARNING': '#FFCE56',   # 노란색
-            'ERROR': '#FF6384',     # 밝은 빨간색
-            'CRITICAL': '#FF0000'   # 진한 빨간색
-        }
-        colors = [color_map.get(level, '#000000') for level in levels]
+        total = sum(counts) or 1
+        percentages = [(count / total * 100) for count in counts]
+        colors = [LOG_LEVEL_CHART_COLORS.get(level, '#000000') for level in levels]
         
-        # 수평 막대 그래프 생성
-        fig, ax = plt.subplots(figsize=(8, graph_height))
-        bars = ax.barh(levels, percentages, color=colors, height=0.5)  # 막대 높이 더 작게
-        
-        # 각 막대에 로그 개수 표시
-        for bar, count in zip(bars, counts):
-            width = bar.get_width()
-            ax.text(width, bar.get_y() + bar.get_height()/2, 
-                    f'{count}', 
-                    va='center', fontsize=8)
-        
-        plt.title('로그 레벨 분포', fontsize=10)
-        plt.xlabel('비율 (%)', fontsize=9)
-        plt.xticks(fontsize=8)
-        plt.yticks(fontsize=8)
-        plt.tight_layout()
-        
-        # Qt 캔버스에 추가
-        canvas = FigureCanvas(fig)
-        self.log_level_chart_layout.addWidget(canvas)
+        # 각 막대 끝에는 로그 개수 표시
+        self.log_level_chart.update_bars(levels, percentages, colors, annotations=[f'{count}' for count in counts])
 
     def calculate_timeline_stats(self, log_entries):
-        """로그의 시간대별 통계 계산"""
-        # 시간대별 통계를 저장할 딕셔너리 리스트
-        timeline_stats = []
-        
-        # 24시간을 2시간 단위로 분할
-        for hour in range(0, 24, 2):
-            # 각 시간대의 통계 초기화
-            hour_stats = {
-                'hour': f'{hour:02d}:00-{hour+2:02d}:00',
-                'DEBUG': 0,
-                'INFO': 0,
-                'WARNING': 0,
-                'ERROR': 0
-            }
-            
-            # 해당 시간대의 로그 필터링
-            for log in log_entries:
-                try:
-                    # 로그 항목에서 타임스탬프 추출
-                    timestamp = log.get('timestamp', '')
-                    log_time = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                    
-                    # 로그 시간이 현재 시간대에 속하는지 확인
-                    if hour <= log_time.hour < hour + 2:
-                        # 로그 레벨 카운트
-                        log_level = log.get('level', '')
-                        if log_level in hour_stats:
-                            hour_stats[log_level] += 1
-                except Exception as e:
-                    logger.warning(f"시간대 통계 계산 중 오류: {e}")
-            
-            timeline_stats.append(hour_stats)
-        
-        return timeline_stats
+        """로그의 시간대별 통계 계산 (2시간 단위)
+
+        log_entries는 'timestamp'/'level' 키를 가진 딕셔너리 목록이며,
+        시간과 레벨은 배열로 모아 한 번에 디코딩합니다.
+        """
+        timestamps = [log.get('timestamp', '') for log in log_entries]
+        levels = [log.get('level', '') for log in log_entries]
+        return build_timeline(hourly_level_counts(timestamps, levels))
 
     def periodic_log_update(self):
         """주기적인 로그 업데이트"""
@@ -903,55 +771,38 @@ class LogViewerDialog(QDialog):
             if not self.auto_update_check.isChecked():
                 return
 
-            # 로그 파일 다시 로드
-            with open(self.current_log_file, 'r', encoding='utf-8') as f:
-                # 마지막으로 읽은 위치부터 새로운 로그 읽기
-                f.seek(self.last_log_file_position)
-                new_log_entries = f.readlines()
-                
-                # 마지막 읽은 위치 업데이트
-                self.last_log_file_position = f.tell()
+            # 마지막으로 읽은 위치 이후 추가된 로그만 읽기 (회전 시 처음부터)
+            if self.log_reader is None or not self.viewing_tail:
+                return
+            new_log_entries = self.log_reader.read_new(MAX_DISPLAY_ENTRIES)
             
             # 새로운 로그 항목이 있는 경우에만 처리
             if new_log_entries:
-                # 기존 로그 항목에 새 로그 추가 (최대 1000개로 제한)
-                self.all_log_entries.extend(new_log_entries)
-                if len(self.all_log_entries) > 1000:
-                    self.all_log_entries = self.all_log_entries[-1000:]
-                
-                # 현재 필터 상태 유지하며 로그 업데이트 (최적화된 필터링)
-                current_server_filter = self.server_filter_combo.currentText()
-                current_level_filter = self.log_level_combo.currentText()
-                
-                # 필터링된 로그 다시 표시 (최적화)
-                filtered_logs = []
-                for log_entry in self.all_log_entries:
-                    # 서버 필터
-                    if current_server_filter != "모든 서버":
-                        server_parts = log_entry.split('[서버: ')
-                        if len(server_parts) > 1:
-                            server_name = server_parts[1].split(']')[0].strip()
-                            if server_name != current_server_filter:
-                                continue
-                    
-                    # 로그 레벨 필터
-                    if current_level_filter != "모든 로그":
-                        log_level_parts = log_entry.split(' - ')
-                        if len(log_level_parts) >= 3:
-                            log_level = log_level_parts[2].strip()
-                            if log_level != current_level_filter:
-                                continue
-                    
-                    filtered_logs.append(log_entry)
+                # 기존 로그 항목에 새 로그 추가 (최대 개수 제한)
+                new_entries = [self._to_display_line(entry) for entry in new_log_entries]
+                self.all_log_entries.extend(new_entries)
+                if len(self.all_log_entries) > MAX_LOADED_ENTRIES:
+                    self.all_log_entries = self.all_log_entries[-MAX_LOADED_ENTRIES:]
                 
-                # 최근 1000개 로그만 표시
-                filtered_logs = filtered_logs[-1000:]
+                # 핸들러가 사이드카 인덱스에 추가한 레코드만 반영
+                try:
+                    if self.log_index is None or not self.log_index.refresh():
+                        self.log_index = LogIndex.open(self.current_log_file)
+                    if self.log_stats is not None:
+                        self.log_stats.refresh()
+                except Exception:
+                    self.log_index = None
+                    self.log_stats = None
                 
-                # 로그 텍스트 업데이트 (최적화)
-                self.populate_log_text(filtered_logs)
+                # 새 행만 모델에 추가 (필터는 프록시가 추가된 행에만 적용)
+                if self._model_source_key != 'search':
+                    follow = self._is_scrolled_to_bottom()
+                    self.log_model.append_entries(new_entries)
+                    if follow:
+                        self.log_view.scrollToBottom()
                 
-                # 로그 통계 업데이트 (최적화)
-                self.update_log_stats(filtered_logs)
+                # 로그 통계 업데이트
+                self.update_log_stats()
         
         except Exception as e:
             logger.error(f"주기적 로그 업데이트 중 오류: {e}")
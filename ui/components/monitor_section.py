@@ -1,29 +1,34 @@
-import base64
 import os
 import time
 from pathlib import Path
 import requests
-import openpyxl
-from openpyxl.styles import Font
 from collections import Counter
 from datetime import datetime
 import matplotlib
 matplotlib.use('qtagg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from utils.system_utils import get_system_matplotlib_font
 
+from config.system.app_config import ResourceManager
 from config.system.log_config import setup_logging
 from managers.dell_server_manager import DellServerManager
+from managers.nic_attributes import port_functions
 from PyQt6.QtCore import Qt, QTimer, QSettings
-from PyQt6.QtGui import QColor, QIcon, QImage, QPixmap
+from PyQt6.QtGui import QColor, QIcon
 from PyQt6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDialog, QDialogButtonBox, 
                              QFileDialog, QGroupBox, QHBoxLayout, QLabel, QLineEdit, 
                              QMainWindow, QMenu, QMessageBox, QPushButton, QProgressBar, 
-                             QProgressDialog, QSpinBox, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QTabWidget, QFileDialog, QWidget, QScrollArea, QTableWidget, QTableWidgetItem)
+                             QProgressDialog, QSpinBox, QTreeView, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QTabWidget, QFileDialog, QWidget, QScrollArea, QTableWidget, QTableWidgetItem)
 from typing import Optional, cast
+from ui.components.charts import HorizontalBarChart
+from ui.components.event_log_model import (EventLogFilterProxyModel, EventLogModel,
+                                            create_search_debouncer)
+from ui.components.export_worker import start_export
+from ui.components.firmware_upload_worker import start_firmware_upload
+from ui.components.job_watcher import JobWatcher
 from ui.components.popups.error_dialog import ErrorDialog
+from ui.components.rebuild_watcher import RebuildWatcher, format_eta
 from utils.utils import convert_capacity
+from utils.export_utils import EXPORT_FORMATS, ExportSheet, ensure_export_extension
+from utils.firmware_cache import TERMINAL_JOB_STATES, is_firmware_job
 from utils.cafe24 import cafe24_manager
 
 logger = setup_logging()
@@ -39,8 +44,10 @@ def create_section(title, items, parent=None):
         # 모니터링 섹션
         "시스템 상태": "📊",
         "펌웨어 정보": "📦",
+        "펌웨어 비교": "🧾",
         # 관리 섹션
         "BIOS 설정": "🔧",
+        "BIOS 프로파일": "🧩",
         "SSH 연결": "🔌",
         # 로그 섹션
         "LC LOG": "📜",
@@ -61,9 +68,15 @@ def create_section(title, items, parent=None):
         # 펌웨어 정보 버튼 클릭 이벤트 처리
         elif item == "펌웨어 정보":
             btn.clicked.connect(lambda checked=False, p=parent: show_firmware_info(p))
+        # 펌웨어 비교 버튼 클릭 이벤트 처리
+        elif item == "펌웨어 비교":
+            btn.clicked.connect(lambda checked=False, p=parent: show_firmware_compliance(p))
         # BIOS 설정 버튼 클릭 이벤트 처리
         elif item == "BIOS 설정":
             btn.clicked.connect(lambda checked=False, p=parent: show_system_info(p))
+        # BIOS 프로파일 버튼 클릭 이벤트 처리
+        elif item == "BIOS 프로파일":
+            btn.clicked.connect(lambda checked=False, p=parent: show_bios_profile(p))
         # 작업 관리 버튼 클릭 이벤트 처리
         elif item == "작업 관리":
             btn.clicked.connect(lambda checked=False, p=parent: show_task_manager(p))
@@ -93,8 +106,8 @@ def create_monitor_section(parent=None):
     monitor_layout.setSpacing(5)
     
     sections = {
-        "📊 모니터링": ["시스템 상태", "펌웨어 정보"],
-        "⚙️ 관리": ["BIOS 설정", "작업 관리", "SSH 연결"],
+        "📊 모니터링": ["시스템 상태", "펌웨어 정보", "펌웨어 비교"],
+        "⚙️ 관리": ["BIOS 설정", "BIOS 프로파일", "작업 관리", "SSH 연결"],
         "📋 로그": ["LC LOG", "TSR LOG"]
     }
     
@@ -701,9 +714,7 @@ def show_all_status(parent):
     rebuild_status_group.setLayout(rebuild_status_layout)
     layout.addWidget(rebuild_status_group)
 
-    def check_disk_status(drive):
-        status = drive.get('Oem', {}).get('Dell', {}).get('DellPhysicalDisk', {}).get('RaidStatus', 'N/A')
-        
+    def check_disk_status(status):
         status_colors = {
             'Online': QColor('green'),
             'Rebuilding': QColor('orange'),
@@ -712,94 +723,113 @@ def show_all_status(parent):
             'Offline': QColor('gray')
         }
         
-        return (status, status_colors.get(status))
+        return status_colors.get(status)
+
+    # 리빌딩 중인 드라이브 ID -> (트리 항목, 진행률 바)
+    rebuild_items = {}
+    rebuild_watcher = None  # 데이터 로드 후 생성 (로드 전/실패 시 토글은 무시)
+
+    def create_rebuild_progress_bar(progress):
+        progress_bar = QProgressBar()
+        progress_bar.setValue(progress)
+        progress_bar.setStyleSheet("""
+            QProgressBar {
+                border: 2px solid grey;
+                text-align: center;
+            }
+            QProgressBar::chunk {
+                background-color: #FFA500;
+            }
+        """)
+        return progress_bar
 
-    def update_rebuild_status():
+    def build_rebuild_status_tree():
+        """탐색 결과로 볼륨/드라이브 트리를 한 번 구성 (이후에는 진행률만 갱신)"""
         rebuild_status_tree.clear()
-        storage_info = server_manager.fetch_storage_info()
-        rebuilding_exists = False
+        rebuild_items.clear()
+        drives = rebuild_watcher.snapshot()
         
-        for controller in storage_info.get('Controllers', []):
-            volumes = controller.get('Volumes', [])
-            drives = controller.get('Drives', [])
+        for volume in rebuild_watcher.volumes.values():
+            capacity = volume['capacity'] / (1024**4)
             
-            for volume in volumes:
-                volume_name = volume.get('Name', '')
-                raid_type = volume.get('RAIDType', '')
-                capacity = volume.get('CapacityBytes', 0) / (1024**4)
-                
-                volume_drive_ids = [link.get('@odata.id', '').split('/')[-1] 
-                                for link in volume.get('Links', {}).get('Drives', [])]
-                
-                volume_item = QTreeWidgetItem(rebuild_status_tree)
-                volume_item.setText(0, f"볼륨: {volume_name}")
-                volume_item.setText(1, f"RAID {raid_type}")
-                volume_item.setText(2, f"{capacity:.1f} TiB")
-                volume_item.setBackground(0, QColor('#E6E6FA'))  # 연한 녹색 배경
-                
-                # 리빌딩 디스크 존재 여부 확인을 위한 플래그
-                has_rebuilding_disk = False
-                
-                for drive in drives:
-                    if drive.get('Id', '') in volume_drive_ids:
-                        disk_id = drive.get('Id', '').split(':')[0]
-                        
-                        drive_item = QTreeWidgetItem(volume_item)
-                        drive_item.setText(0, disk_id)
-                        
-                        status, color = check_disk_status(drive)
-                        
-                        if drive.get('Operations'):
-                            for operation in drive.get('Operations', []):
-                                if operation.get('OperationName') == "Rebuilding":
-                                    rebuilding_exists = True
-                                    has_rebuilding_disk = True  # 리빌딩 중인 디스크 발견
-                                    progress = operation.get('PercentageComplete', 0)
-                                    
-                                    progress_bar = QProgressBar()
-                                    progress_bar.setValue(progress)
-                                    progress_bar.setStyleSheet("""
-                                        QProgressBar {
-                                            border: 2px solid grey;
-                                            text-align: center;
-                                        }
-                                        QProgressBar::chunk {
-                                            background-color: #FFA500;
-                                        }
-                                    """)
-                                    rebuild_status_tree.setItemWidget(drive_item, 1, progress_bar)
-                                    
-                                    if progress > 0:
-                                        remaining_minutes = int((100 - progress) * 2)
-                                        drive_item.setText(2, f"{remaining_minutes}분")
-                        else:
-                            status_label = QLabel(status)
-                            if color:
-                                status_label.setStyleSheet(f"color: {color.name()}")
-                            rebuild_status_tree.setItemWidget(drive_item, 1, status_label)
-                            drive_item.setText(2, "-")
+            volume_item = QTreeWidgetItem(rebuild_status_tree)
+            volume_item.setText(0, f"볼륨: {volume['name']}")
+            volume_item.setText(1, f"RAID {volume['raid_type']}")
+            volume_item.setText(2, f"{capacity:.1f} TiB")
+            volume_item.setBackground(0, QColor('#E6E6FA'))  # 연한 녹색 배경
+            
+            # 리빌딩 디스크 존재 여부 확인을 위한 플래그
+            has_rebuilding_disk = False
+            
+            for drive_id in volume['drive_ids']:
+                drive = drives.get(drive_id)
+                if drive is None:
+                    continue
+                drive_item = QTreeWidgetItem(volume_item)
+                drive_item.setText(0, drive_id.split(':')[0])
                 
-                # 볼륨의 펼침 상태 설정
-                if has_rebuilding_disk:
-                    rebuild_status_tree.expandItem(volume_item)  # 리빌딩 중인 디스크가 있는 볼륨은 펼치기
+                if drive['rebuilding']:
+                    has_rebuilding_disk = True  # 리빌딩 중인 디스크 발견
+                    progress_bar = create_rebuild_progress_bar(drive['percent'] or 0)
+                    rebuild_status_tree.setItemWidget(drive_item, 1, progress_bar)
+                    drive_item.setText(2, format_eta(drive['eta']))
+                    rebuild_items[drive_id] = (drive_item, progress_bar)
                 else:
-                    rebuild_status_tree.collapseItem(volume_item)  # 리빌딩 중인 디스크가 없는 볼륨은 접기
+                    status_label = QLabel(drive['status'])
+                    color = check_disk_status(drive['status'])
+                    if color:
+                        status_label.setStyleSheet(f"color: {color.name()}")
+                    rebuild_status_tree.setItemWidget(drive_item, 1, status_label)
+                    drive_item.setText(2, "-")
+            
+            # 볼륨의 펼침 상태 설정
+            if has_rebuilding_disk:
+                rebuild_status_tree.expandItem(volume_item)  # 리빌딩 중인 디스크가 있는 볼륨은 펼치기
+            else:
+                rebuild_status_tree.collapseItem(volume_item)  # 리빌딩 중인 디스크가 없는 볼륨은 접기
+
+    def update_rebuild_status(drives):
+        """공유 감시기의 폴링 결과로 진행률/예상 시간만 갱신"""
+        if not rebuild_status_group.isVisible():
+            return
+        rebuilding_exists = False
+        for drive_id, (drive_item, progress_bar) in rebuild_items.items():
+            drive = drives.get(drive_id)
+            if drive is None:
+                continue
+            progress_bar.setValue(drive['percent'] or 0)
+            if drive['rebuilding']:
+                rebuilding_exists = True
+                drive_item.setText(2, format_eta(drive['eta']))
+            else:
+                drive_item.setText(2, "완료")
         
         if not rebuilding_exists:
             rebuild_monitor_toggle.setChecked(False)
             rebuild_status_group.setVisible(False)
     
     def toggle_rebuild_monitor(checked):
+        if rebuild_watcher is None:
+            if checked:
+                rebuild_monitor_toggle.setChecked(False)
+            return
         rebuild_status_group.setVisible(checked)
         if checked:
-            update_rebuild_status()
-            timer.start(10000)  # 10초마다 갱신
+            build_rebuild_status_tree()
+            if not rebuild_items:
+                rebuild_monitor_toggle.setChecked(False)
+                return
+            rebuild_watcher.progress_updated.connect(update_rebuild_status)
+            rebuild_watcher.acquire()
         else:
-            timer.stop()
+            try:
+                rebuild_watcher.progress_updated.disconnect(update_rebuild_status)
+                rebuild_watcher.release()
+            except TypeError:
+                pass  # 연결되지 않은 상태
     
-    timer = QTimer()
-    timer.timeout.connect(update_rebuild_status)
     rebuild_monitor_toggle.toggled.connect(toggle_rebuild_monitor)
+    status_dialog.finished.connect(lambda _: rebuild_monitor_toggle.setChecked(False))
     
     try:
         def toggle_all_sections():
@@ -834,6 +864,9 @@ def show_all_status(parent):
                     'idrac': server_manager.fetch_detailed_info(server_manager.endpoints.idrac_mac_address),
                     'license': server_manager.check_idrac_license()
                 }
+                
+                # 리빌딩 감시기는 방금 조회한 스토리지 정보를 탐색 결과로 사용 (전체 재조회 없음)
+                rebuild_watcher = RebuildWatcher.for_server(server_manager, storage_info=data['storage'])
 
                 # 섹션별 설정 딕셔너리 정의
                 processor_settings = {
@@ -1073,12 +1106,9 @@ def show_all_status(parent):
                                                 else:
                                                     item.setText(2, str(volume.get(value, 'N/A')))
 
-                                            # 드라이브 정보 표시
-                                            drives = controller.get('Drives', [])
-                                            volume_drive_ids = [link.get('@odata.id', '').split('/')[-1]
-                                                                for link in volume.get('Links', {}).get('Drives', [])]
-                                            volume_drives = [d for d in drives if d.get('Id', '') in volume_drive_ids]
-                                            sorted_drives = sort_drives(volume_drives)
+                                            # 드라이브 정보 표시 (스토리지 구성 캐시의 볼륨별 색인, Bay 순)
+                                            sorted_drives = server_manager.storage_topology.drives_in_volume(
+                                                volume.get('@odata.id', ''))
 
                                             for drive in sorted_drives:
                                                 simplified_id = drive.get('Id', 'N/A').split(':')[0]  # drive 변수가 정의된 후에 사용
@@ -1170,51 +1200,39 @@ def show_all_status(parent):
                                                                     main_layout.addLayout(progress_layout)
                                                                     monitor_dialog.setLayout(main_layout)
                                                                     
-                                                                    # 타이머 설정
-                                                                    start_time = time.time()
-                                                                    last_progress = progress
-                                                                    timer = QTimer(parent)
-                                                                    
-                                                                    def update_progress():
-                                                                        try:
-                                                                            drive_info = server_manager.fetch_drive_rebuild_status(current_drive)
-                                                                            if drive_info and 'Operations' in drive_info:
-                                                                                for op in drive_info['Operations']:
-                                                                                    if op.get('OperationName') == "Rebuilding":
-                                                                                        current_progress = op.get('PercentageComplete', 0)
-                                                                                        
-                                                                                        # 예상 시간 계산
-                                                                                        elapsed_time = time.time() - start_time
-                                                                                        if current_progress > 0:
-                                                                                            total_time = (elapsed_time * 100) / current_progress
-                                                                                            remaining_time = total_time - elapsed_time
-                                                                                            remaining_minutes = int(remaining_time // 60)
-                                                                                            remaining_seconds = int(remaining_time % 60)
-                                                                                            
-                                                                                            status_label.setText(
-                                                                                                f"리빌딩 진행률: {current_progress}%\n"
-                                                                                                f"예상 남은 시간: {remaining_minutes}분 {remaining_seconds}초"
-                                                                                            )
-                                                                                        
-                                                                                        progress_bar.setValue(current_progress)
-                                                                                        last_progress = current_progress
-                                                                                        
-                                                                        except Exception as e:
-                                                                            logger.error(f"리빌딩 상태 업데이트 실패: {str(e)}")
-                                                                        
-                                                                        if last_progress == 100:
-                                                                            timer.stop()
+                                                                    # 공유 리빌딩 감시기 구독 (드라이브별 개별 타이머 없음)
+                                                                    drive_id = current_drive.get('Id', '')
+                                                                    status_label.setText(f"리빌딩 진행률: {progress}%\n예상 남은 시간: {format_eta(None)}")
+
+                                                                    def update_progress(drives):
+                                                                        drive_state = drives.get(drive_id)
+                                                                        if drive_state is None:
+                                                                            return
+                                                                        current_progress = drive_state['percent'] or 0
+                                                                        progress_bar.setValue(current_progress)
+                                                                        status_label.setText(
+                                                                            f"리빌딩 진행률: {current_progress}%\n"
+                                                                            f"예상 남은 시간: {format_eta(drive_state['eta'])}"
+                                                                        )
+
+                                                                    def on_finished(finished_drive_id):
+                                                                        if finished_drive_id == drive_id:
+                                                                            progress_bar.setValue(100)
                                                                             monitor_dialog.close()
-                                                                    
-                                                                    def on_canceled():
-                                                                        timer.stop()
-                                                                        monitor_dialog.close()
-                                                                    
-                                                                    timer.timeout.connect(update_progress)
-                                                                    cancel_button.clicked.connect(on_canceled)
-                                                                    refresh_spin.valueChanged.connect(lambda: timer.setInterval(refresh_spin.value() * 1000))
-                                                                    
-                                                                    timer.start(refresh_spin.value() * 1000)
+
+                                                                    def on_closed(_):
+                                                                        rebuild_watcher.progress_updated.disconnect(update_progress)
+                                                                        rebuild_watcher.rebuild_finished.disconnect(on_finished)
+                                                                        rebuild_watcher.release()
+
+                                                                    rebuild_watcher.progress_updated.connect(update_progress)
+                                                                    rebuild_watcher.rebuild_finished.connect(on_finished)
+                                                                    cancel_button.clicked.connect(monitor_dialog.close)
+                                                                    monitor_dialog.finished.connect(on_closed)
+                                                                    refresh_spin.valueChanged.connect(rebuild_watcher.set_interval)
+
+                                                                    rebuild_watcher.set_interval(refresh_spin.value())
+                                                                    rebuild_watcher.acquire()
                                                                     monitor_dialog.exec()
                                                                 
                                                                 return show_rebuild_monitor
@@ -1225,6 +1243,9 @@ def show_all_status(parent):
 
                         elif section_name == "NIC 정보":
                             if 'NetworkAdapters' in info_source:
+                                # 가상화 지원 카드의 포트별 속성을 한 번에 동시 조회 (캐시 우선)
+                                port_attributes = server_manager.fetch_nic_attributes(
+                                    functions=port_functions(info_source, virtualization_only=True))
                                 sorted_adapters = sorted(info_source['NetworkAdapters'], key=lambda x: get_nic_order(x.get('Id', '')))
                                 for adapter in sorted_adapters:
                                     adapter_item = QTreeWidgetItem(section_item, [f"NIC 어댑터: {adapter.get('Id', 'N/A')}"])
@@ -1267,15 +1288,8 @@ def show_all_status(parent):
                                         # 가상화 모드 정보
                                         virtualization_mode = 'N/A'
                                         if is_virtualization_supported:
-                                            try:
-                                                device_function_info = requests.get(
-                                                    f"{server_manager.endpoints.base_url}/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/{adapter.get('Id')}/NetworkDeviceFunctions/{device_function_id}/Oem/Dell/DellNetworkAttributes/{device_function_id}",
-                                                    auth=server_manager.auth,
-                                                    verify=False
-                                                ).json()
-                                                virtualization_mode = device_function_info.get('Attributes', {}).get('VirtualizationMode', 'N/A')
-                                            except:
-                                                pass
+                                            device_function_info = port_attributes.get((adapter.get('Id'), device_function_id)) or {}
+                                            virtualization_mode = device_function_info.get('Attributes', {}).get('VirtualizationMode', 'N/A')
 
                                         # 포트 설정 표시
                                         for key, value in port_settings.items():
@@ -1474,6 +1488,8 @@ def show_system_info(parent):
                 idrac_info = server_manager.fetch_idrac_info()
                 idrac_pwr_info = server_manager.fetch_idrac_pwr_info()
                 nic_data = server_manager.fetch_network_adapters_info()
+                # 툴팁용 BIOS 속성 레지스트리 (같은 BIOS 버전이면 디스크 캐시 사용)
+                bios_registry = server_manager.bios_registry(bios_info)
 
                 # 섹션별 설정 딕셔너리 정의
                 system_info_settings = {
@@ -1576,19 +1592,20 @@ def show_system_info(parent):
                 ]
 
                 for section_name, info_source, settings_dict in sections:
-                    icon_base64 = get_icon_base64(section_name)
                     section_item = QTreeWidgetItem(tree_widget)
                     section_item.setText(0, section_name)
-                    section_item.setIcon(0, QIcon(QPixmap.fromImage(QImage.fromData(base64.b64decode(icon_base64)))))
+                    section_item.setIcon(0, get_section_icon(section_name))
                     
                     if section_name == "NIC Configuration" and info_source and 'NetworkAdapters' in info_source:
+                        # 모든 NIC 기능 속성을 한 번에 동시 조회 (캐시 우선)
+                        nic_attributes = server_manager.fetch_nic_attributes(info_source)
                         for adapter in info_source['NetworkAdapters']:
                             for func in adapter.get('NetworkDeviceFunctions', []):
                                 if func_id := func.get('Id'):
-                                    virt_info = server_manager.fetch_network_virtualization_info(
-                                        adapter.get('Id'), func_id)
+                                    virt_info = nic_attributes.get((adapter.get('Id'), func_id))
                                     if virt_info and 'Attributes' in virt_info:
                                         attrs = virt_info['Attributes']
+                                        nic_registry = server_manager.nic_registry(adapter, func_id)
                                         
                                         # NIC 포트 아이템 생성
                                         port_item = QTreeWidgetItem(section_item)
@@ -1598,19 +1615,19 @@ def show_system_info(parent):
                                         virt_mode_item = QTreeWidgetItem(port_item)
                                         virt_mode_item.setText(1, "VirtualizationMode")
                                         virt_mode_item.setText(2, attrs.get('VirtualizationMode', 'N/A'))
-                                        virt_mode_item.setToolTip(1, get_tooltip('VirtualizationMode'))
+                                        virt_mode_item.setToolTip(1, get_tooltip('VirtualizationMode', nic_registry))
                                         
                                         # 링크 속도
                                         speed_item = QTreeWidgetItem(port_item)
                                         speed_item.setText(1, "LnkSpeed")
                                         speed_item.setText(2, attrs.get('LnkSpeed', 'N/A'))
-                                        speed_item.setToolTip(1, get_tooltip('LnkSpeed'))
+                                        speed_item.setToolTip(1, get_tooltip('LnkSpeed', nic_registry))
                                         
                                         # 부팅 프로토콜
                                         boot_item = QTreeWidgetItem(port_item)
                                         boot_item.setText(1, "LegacyBootProto")
                                         boot_item.setText(2, attrs.get('LegacyBootProto', 'N/A'))
-                                        boot_item.setToolTip(1, get_tooltip('LegacyBootProto'))
+                                        boot_item.setToolTip(1, get_tooltip('LegacyBootProto', nic_registry))
                     
                     elif info_source and 'Attributes' in info_source:
                         # CPU 종류 확인
@@ -1630,7 +1647,7 @@ def show_system_info(parent):
                             child_item.setText(2, str(value))
                             
                             # 툴팁 추가
-                            tooltip_text = get_tooltip(attr_name)
+                            tooltip_text = get_tooltip(attr_name, bios_registry if info_source is bios_info else None)
                             child_item.setToolTip(0, tooltip_text)
                             child_item.setToolTip(1, tooltip_text)
                             child_item.setToolTip(2, tooltip_text)
@@ -1693,8 +1710,8 @@ def get_nic_order(component_id):
         
     return (order, primary, secondary, tertiary)
 
-def get_icon_base64(section_name):
-    """섹션 이름에 따라 적절한 아이콘의 Base64 인코딩 문자열 반환"""
+def get_section_icon(section_name):
+    """섹션 이름에 따라 적절한 아이콘 반환 (ResourceManager 공유 캐시 사용)"""
     icon_map = {
         "System Information": "system_icon.png",
         "Processor Settings": "cpu_icon.png",
@@ -1707,18 +1724,7 @@ def get_icon_base64(section_name):
         "Power Configuration": "power_icon.png",
         "NIC Configuration": "nic_icon.png"
     }
-    
-    # 현재 스크립트의 디렉토리를 기준으로 상대 경로 설정
-    current_dir = Path(os.path.dirname(os.path.abspath(__file__)))
-    icon_dir = current_dir.parent.parent / "icon"
-    icon_path = icon_dir / icon_map.get(section_name, "default_icon.png")
-    
-    try:
-        with open(icon_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
-    except FileNotFoundError:
-        print(f"아이콘 파일을 찾을 수 없습니다: {icon_path}")
-        return ""  # 아이콘을 찾지 못한 경우 빈 문자열 반환
+    return ResourceManager.get_icon(icon_map.get(section_name, "default_icon.png"))
 
 def get_section_settings(section_name, info_source):
     """섹션 이름에 따라 해당 섹션의 설정 딕셔너리 반환"""
@@ -1739,8 +1745,11 @@ def get_value_style(value):
         return "color: red;"
     return ""
 
-def get_tooltip(attr_name):
-    """속성 이름에 따른 툴팁 텍스트 반환"""
+def get_tooltip(attr_name, registry=None):
+    """속성 이름에 따른 툴팁 텍스트 반환
+
+    registry(속성 레지스트리 조회기)가 있으면 iDRAC의 표시 이름/도움말/허용 값을 덧붙입니다.
+    """
     tooltips = {
         # System Information
         "SystemModelName": "서버 모델 이름",
@@ -1802,7 +1811,27 @@ def get_tooltip(attr_name):
         "LnkSpeed": "NIC 링크 속도",
         "LegacyBootProto": "NIC 부팅 프로토콜"
     }
-    return tooltips.get(attr_name, "설정에 대한 추가 정보")
+    tooltip = tooltips.get(attr_name)
+    detail = registry.describe(attr_name) if registry is not None else ''
+    if tooltip and detail:
+        return f"{tooltip}\n\n{detail}"
+    return tooltip or detail or "설정에 대한 추가 정보"
+
+def show_firmware_compliance(parent):
+    """로컬 Dell 카탈로그 기준 전체 서버 펌웨어 비교 보고서 표시"""
+    from ui.components.popups.firmware_compliance_dialog import FirmwareComplianceDialog
+    dialog = FirmwareComplianceDialog(parent)
+    dialog.exec()
+
+def show_bios_profile(parent):
+    """BIOS 프로파일을 여러 서버와 비교/적용하는 창 표시 (현재 서버가 선택된 상태로 시작)"""
+    from ui.components.popups.bios_profile_dialog import BiosProfileDialog
+    main_window = parent.window()
+    server_section = getattr(main_window, 'server_section', None)
+    server_info = getattr(server_section, 'current_server_info', None) or {}
+    selected = [server_info['NAME']] if server_info.get('NAME') else []
+    dialog = BiosProfileDialog(parent, selected_servers=selected)
+    dialog.exec()
 
 def show_firmware_info(parent):
     """펌웨어 정보 조회"""
@@ -1852,9 +1881,12 @@ def show_firmware_info(parent):
                 progress_dialog.show()
                 progress_dialog.setValue(30)
                 
-                firmware_data = server_manager.fetch_firmware_inventory()
+                # 펌웨어 컴포넌트 조회 (서비스 태그별 캐시가 없으면 동시 조회)
+                components = server_manager.fetch_firmware_components(
+                    progress_callback=lambda done, total: progress_dialog.setValue(50 + (40 * done // total))
+                )
                 
-                if firmware_data:
+                if components:
                     status_dialog = QDialog(parent)
                     status_dialog.setWindowTitle("펌웨어 정보")
                     status_dialog.resize(1000, 600)
@@ -1870,25 +1902,18 @@ def show_firmware_info(parent):
                     }
 
                     # 펌웨어 데이터를 그룹별로 분류
-                    total_components = len(firmware_data.get('Members', []))
-                    for idx, member in enumerate(firmware_data.get('Members', [])):
-                        member_uri = member.get('@odata.id')
-                        if member_uri:
-                            component_id = member_uri.split('/')[-1]
-                            component_info = server_manager.fetch_firmware_component(component_id)
-                            
-                            if 'BIOS' in component_id:
-                                firmware_groups['BIOS'].append(component_info)
-                            elif 'iDRAC' in component_id:
-                                firmware_groups['iDRAC'].append(component_info)
-                            elif 'PERC' in component_info.get('Name', ''):
-                                firmware_groups['RAID'].append(component_info)
-                            elif 'NIC' in component_id:
-                                firmware_groups['NIC'].append(component_info)
-                            else:
-                                firmware_groups['Others'].append(component_info)
-                            
-                            progress_dialog.setValue(50 + (40 * idx // total_components))
+                    for component_info in components:
+                        component_id = component_info.get('Id', '')
+                        if 'BIOS' in component_id:
+                            firmware_groups['BIOS'].append(component_info)
+                        elif 'iDRAC' in component_id:
+                            firmware_groups['iDRAC'].append(component_info)
+                        elif 'PERC' in component_info.get('Name', ''):
+                            firmware_groups['RAID'].append(component_info)
+                        elif 'NIC' in component_id:
+                            firmware_groups['NIC'].append(component_info)
+                        else:
+                            firmware_groups['Others'].append(component_info)
 
                     # 테이블 위젯 생성
                     table_widget = QTableWidget()
@@ -2051,26 +2076,8 @@ def show_firmware_info(parent):
                                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
                             )
                             if confirm == QMessageBox.StandardButton.Yes:
-                                try:
-                                    if len(file_paths) == 1:
-                                        # 단일 파일 업데이트
-                                        result = server_manager.update_firmware(file_paths[0])
-                                    else:
-                                        # 멀티파트 업데이트
-                                        result = server_manager.multipart_firmware_update(file_paths)
-                                    
-                                    if result:
-                                        QMessageBox.information(
-                                            parent,
-                                            "업데이트 시작",
-                                            "펌웨어 업데이트가 시작되었습니다. 작업 큐에서 진행 상황을 확인하세요."
-                                        )
-                                except Exception as e:
-                                    QMessageBox.critical(
-                                        parent,
-                                        "업데이트 오류",
-                                        f"펌웨어 업데이트 중 오류가 발생했습니다: {str(e)}"
-                                    )
+                                # 파일을 청크 단위로 스트리밍 업로드 (진행률 표시, 취소 가능)
+                                start_firmware_upload(parent, server_manager, file_paths)
 
                     def show_rollback_dialog():
                         # 선택된 행 가져오기
@@ -2162,74 +2169,67 @@ def show_firmware_info(parent):
                         table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
                         table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
 
-                        # 실제 작업 데이터 가져오기
-                        try:
-                            server_manager = DellServerManager(
-                                ip=server_info['IP'],
-                                port=server_info['PORT'],
-                                auth=(server_info['USERNAME'], server_info['PASSWORD'])
-                            )
-                            queue_data = server_manager.get_firmware_queue()
-                            
-                            if queue_data and 'Members' in queue_data:
-                                jobs = queue_data['Members']
-                                table.setRowCount(len(jobs))
-                                for row, job in enumerate(jobs):
-                                    # 작업 ID
-                                    table.setItem(row, 0, QTableWidgetItem(job.get('Id', '')))
-                                    
-                                    # 작업 종류
-                                    job_type = ''
-                                    job_name = job.get('Name', '').lower()
-                                    if 'update' in job_name:
-                                        job_type = '펌웨어 업데이트'
-                                    elif 'rollback' in job_name:
-                                        job_type = '펌웨어 롤백'
-                                    elif 'restart' in job_name:
-                                        job_type = '재시작'
-                                    table.setItem(row, 1, QTableWidgetItem(job_type))
-                                    
-                                    # 구성 요소
-                                    table.setItem(row, 2, QTableWidgetItem(job.get('Component', '')))
-                                    
-                                    # 상태
-                                    status = job.get('JobState', '')
-                                    status_item = QTableWidgetItem(status)
-                                    if status == '완료':
-                                        status_item.setForeground(QColor("#2E7D32"))
-                                    elif status == '진행 중':
-                                        status_item.setForeground(QColor("#1976D2"))
-                                    elif status == '실패':
-                                        status_item.setForeground(QColor("#B71C1C"))
-                                    table.setItem(row, 3, status_item)
-                                    
-                                    # 진행률
-                                    progress = job.get('PercentComplete', '0')
-                                    table.setItem(row, 4, QTableWidgetItem(f"{progress}%"))
-                                    
-                                    # 시작 시각
-                                    start_time = job.get('StartTime', '')
-                                    table.setItem(row, 5, QTableWidgetItem(start_time))
-                                    
-                                    # 예정된 재시작
-                                    reboot_time = job.get('RebootTime', '')
-                                    table.setItem(row, 6, QTableWidgetItem(reboot_time))
-                            else:
-                                QMessageBox.information(
-                                    dialog,
-                                    "알림",
-                                    "현재 진행 중인 작업이 없습니다."
-                                )
-                                
-                        except Exception as e:
-                            logger.error(f"작업 목록 조회 실패: {str(e)}")
+                        layout.addWidget(table)
+
+                        server_manager = DellServerManager(
+                            ip=server_info['IP'],
+                            port=server_info['PORT'],
+                            auth=(server_info['USERNAME'], server_info['PASSWORD'])
+                        )
+                        # 작업 관리 화면과 같은 작업 큐 감시기 공유
+                        watcher = JobWatcher.for_server(server_manager)
+
+                        def job_type_of(job):
+                            job_name = job.get('Name', '').lower()
+                            if 'rollback' in job_name:
+                                return '펌웨어 롤백'
+                            if 'update' in job_name or job.get('JobType') == 'FirmwareUpdate':
+                                return '펌웨어 업데이트'
+                            if 'restart' in job_name or 'reboot' in job_name:
+                                return '재시작'
+                            return ''
+
+                        def fill_job_table():
+                            """추적 중인 펌웨어/재시작 작업을 필터에 맞춰 표시"""
+                            jobs = []
+                            for job in watcher.jobs():
+                                job_type = job_type_of(job)
+                                if not job_type and not is_firmware_job(job):
+                                    continue
+                                status = JOB_STATE_LABELS.get(job.get('JobState'), job.get('JobState', ''))
+                                if status_combo.currentText() != "전체" and status != status_combo.currentText():
+                                    continue
+                                if type_combo.currentText() != "전체" and job_type != type_combo.currentText():
+                                    continue
+                                jobs.append((job, job_type, status))
+
+                            table.setRowCount(len(jobs))
+                            for row, (job, job_type, status) in enumerate(jobs):
+                                table.setItem(row, 0, QTableWidgetItem(job.get('Id', '')))
+                                table.setItem(row, 1, QTableWidgetItem(job_type))
+                                table.setItem(row, 2, QTableWidgetItem(job.get('Component', '') or job.get('Name', '')))
+
+                                status_item = QTableWidgetItem(status)
+                                if status == '완료':
+                                    status_item.setForeground(QColor("#2E7D32"))
+                                elif status == '진행 중':
+                                    status_item.setForeground(QColor("#1976D2"))
+                                elif status == '실패':
+                                    status_item.setForeground(QColor("#B71C1C"))
+                                table.setItem(row, 3, status_item)
+
+                                table.setItem(row, 4, QTableWidgetItem(f"{job.get('PercentComplete', 0)}%"))
+                                table.setItem(row, 5, QTableWidgetItem(format_time(job.get('StartTime', ''))))
+                                table.setItem(row, 6, QTableWidgetItem(job.get('RebootTime', '')))
+
+                        def on_refresh_failed(message):
                             ErrorDialog(
                                 "작업 목록 조회 실패",
                                 "작업 목록을 가져오는데 실패했습니다.",
-                                str(e),
-                                parent
+                                message,
+                                dialog
                             ).exec()
-                        
+
                         # 하단 버튼
                         button_layout = QHBoxLayout()
                         refresh_btn = QPushButton("새로고침")
@@ -2241,31 +2241,6 @@ def show_firmware_info(parent):
                         button_layout.addWidget(cancel_job_btn)
                         layout.addLayout(button_layout)
 
-                        def refresh_job_list():
-                            """작업 목록을 새로고침합니다."""
-                            try:
-                                queue_data = server_manager.get_firmware_queue()
-                                table.clearContents()
-                                if queue_data and 'Members' in queue_data:
-                                    jobs = queue_data['Members']
-                                    table.setRowCount(len(jobs))
-                                    # ... (위의 작업 목록 표시 코드와 동일)
-                                else:
-                                    table.setRowCount(0)
-                                    QMessageBox.information(
-                                        dialog,
-                                        "알림",
-                                        "현재 진행 중인 작업이 없습니다."
-                                    )
-                            except Exception as e:
-                                logger.error(f"작업 목록 새로고침 실패: {str(e)}")
-                                ErrorDialog(
-                                    "새로고침 실패",
-                                    "작업 목록을 새로고침하는데 실패했습니다.",
-                                    str(e),
-                                    parent
-                                ).exec()
-
                         def cancel_selected_job():
                             """선택된 작업을 취소합니다."""
                             selected_rows = table.selectedItems()
@@ -2298,13 +2273,13 @@ def show_firmware_info(parent):
 
                             if reply == QMessageBox.StandardButton.Yes:
                                 try:
-                                    server_manager.cancel_firmware_job(job_id)
+                                    server_manager.cancel_firmware_update(job_id)
                                     QMessageBox.information(
                                         dialog,
                                         "작업 취소 완료",
                                         "작업이 취소되었습니다."
                                     )
-                                    refresh_job_list()
+                                    watcher.refresh(force=True)
                                 except Exception as e:
                                     logger.error(f"작업 취소 실패: {str(e)}")
                                     ErrorDialog(
@@ -2314,10 +2289,23 @@ def show_firmware_info(parent):
                                         parent
                                     ).exec()
 
+                        def on_queue_dialog_finished():
+                            watcher.jobs_changed.disconnect(fill_job_table)
+                            watcher.refresh_failed.disconnect(on_refresh_failed)
+                            watcher.release()
+
                         # 버튼 연결
-                        refresh_btn.clicked.connect(lambda _: refresh_job_list())
+                        refresh_btn.clicked.connect(lambda _: watcher.refresh(force=True))
                         cancel_job_btn.clicked.connect(lambda _: cancel_selected_job())
-                        
+                        status_combo.currentTextChanged.connect(fill_job_table)
+                        type_combo.currentTextChanged.connect(fill_job_table)
+                        watcher.jobs_changed.connect(fill_job_table)
+                        watcher.refresh_failed.connect(on_refresh_failed)
+                        dialog.finished.connect(on_queue_dialog_finished)
+
+                        fill_job_table()
+                        watcher.acquire()
+
                         dialog.setLayout(layout)
                         dialog.exec()
 
@@ -2382,17 +2370,6 @@ def show_firmware_info(parent):
             error_dialog.exec()
             logger.error(f"펌웨어 정보 조회 중 오류 발생: {str(e)}")
 
-def sort_drives(drive_info):
-    import re  # 명시적 import 추가
-    def sort_key(drive):
-        # Disk.Bay.숫자:Enclosure... 형식에서 숫자만 추출하여 정렬
-        match = re.search(r"Disk\.Bay\.(\d+)", drive.get('Id', ''))
-        if match:
-            return int(match.group(1))
-        return float('inf')
-
-    return sorted(drive_info, key=sort_key)
-
 def show_restart_scheduler(parent):
     """재시작 일정 예약 다이얼로그를 표시합니다."""
     dialog = QDialog(parent)
@@ -2558,16 +2535,27 @@ def show_log_popup(parent, log_type):
         filter_layout.addWidget(search_input)
         log_viewer_layout.addLayout(filter_layout)
 
-        # 로그 목록 트리 위젯
-        tree_widget = QTreeWidget(dialog)
-        tree_widget.setHeaderLabels(["ID", "심각도", "생성 시간", "메시지"])
+        # 로그 목록 (모델/뷰: 표시 값과 검색 키는 적재 시 한 번만 계산, 필터는 프록시에서 처리)
+        log_model = EventLogModel([
+            ("ID", lambda entry: entry.get('Id', 'N/A')),
+            ("심각도", lambda entry: entry.get('Severity', 'N/A')),
+            ("생성 시간", lambda entry: format_time(entry.get('Created', 'N/A'))),
+            ("메시지", lambda entry: entry.get('Message', 'N/A')),
+        ], severity_column=1, parent=dialog)
+        log_proxy = EventLogFilterProxyModel(dialog)
+        log_proxy.setSourceModel(log_model)
+        
+        log_table = QTreeView(dialog)
+        log_table.setRootIsDecorated(False)
+        log_table.setUniformRowHeights(True)
+        log_table.setModel(log_proxy)
         
         # 컬럼 너비 최적화
-        tree_widget.setColumnWidth(0, 100)   # ID
-        tree_widget.setColumnWidth(1, 100)   # 심각도
-        tree_widget.setColumnWidth(2, 150)   # 생성 시간
-        tree_widget.setColumnWidth(3, 600)   # 메시지
-        log_viewer_layout.addWidget(tree_widget)
+        log_table.setColumnWidth(0, 100)   # ID
+        log_table.setColumnWidth(1, 100)   # 심각도
+        log_table.setColumnWidth(2, 150)   # 생성 시간
+        log_table.setColumnWidth(3, 600)   # 메시지
+        log_viewer_layout.addWidget(log_table)
 
         # 버튼 레이아웃
         button_layout = QHBoxLayout()
@@ -2602,6 +2590,8 @@ def show_log_popup(parent, log_type):
         log_level_scroll_area.setWidgetResizable(True)
         log_level_chart_widget = QWidget()
         log_level_chart_layout = QVBoxLayout(log_level_chart_widget)
+        log_level_chart = HorizontalBarChart('로그 레벨 분포', '비율 (%)')
+        log_level_chart_layout.addWidget(log_level_chart)
         log_level_scroll_area.setWidget(log_level_chart_widget)
         log_analysis_layout.addWidget(log_level_scroll_area)
         
@@ -2615,74 +2605,22 @@ def show_log_popup(parent, log_type):
         timeline_scroll_area.setWidgetResizable(True)
         timeline_chart_widget = QWidget()
         timeline_chart_layout = QVBoxLayout(timeline_chart_widget)
+        timeline_chart = HorizontalBarChart('시간대별 로그 분포', '로그 수')
+        timeline_chart_layout.addWidget(timeline_chart)
         timeline_scroll_area.setWidget(timeline_chart_widget)
         log_analysis_layout.addWidget(timeline_scroll_area)
 
-        # 로그 엔트리 저장 리스트
+        # 현재 필터를 통과한 로그 엔트리 (복사/내보내기/통계 대상)
         log_entries = []
 
-        def add_log_to_tree(log_entry):
-            nonlocal log_entries
-            item = QTreeWidgetItem(tree_widget)
-            
-            # ID 설정
-            item.setText(0, log_entry.get('Id', 'N/A'))
-            
-            # 심각도 설정 및 색상 적용
-            severity = log_entry.get('Severity', 'N/A')
-            item.setText(1, severity)
-            if severity == 'Critical':
-                item.setForeground(1, QColor('red'))
-            elif severity == 'Warning':
-                item.setForeground(1, QColor('orange'))
-            elif severity == 'OK':
-                item.setForeground(1, QColor('green'))
-            
-            # 시간 형식 변환
-            created_time = log_entry.get('Created', 'N/A')
-            item.setText(2, format_time(created_time))
-            
-            # 메시지
-            item.setText(3, log_entry.get('Message', 'N/A'))
-            
-            log_entries.append(log_entry)
-
         def calculate_log_statistics(entries):
-            # 로그 엔트리가 없으면 빈 그래프 생성
+            # 차트 캔버스는 다이얼로그 생성 시 한 번만 만들고 여기서는 값만 갱신
             if not entries:
-                # 로그 레벨 통계 그래프
-                plt.close('all')
-                fig, ax = plt.subplots(figsize=(8, 3))
-                ax.text(0.5, 0.5, '로그 데이터 없음', 
-                        horizontalalignment='center', 
-                        verticalalignment='center')
-                plt.title('로그 레벨 분포', fontsize=10)
-                canvas = FigureCanvas(fig)
-                
-                # 기존 위젯 제거 및 새 캔버스 추가
-                for i in reversed(range(log_level_chart_layout.count())): 
-                    log_level_chart_layout.itemAt(i).widget().setParent(None)
-                log_level_chart_layout.addWidget(canvas)
-                
-                # 타임라인 통계 그래프
-                plt.close('all')
-                fig, ax = plt.subplots(figsize=(8, 3))
-                ax.text(0.5, 0.5, '로그 데이터 없음', 
-                        horizontalalignment='center', 
-                        verticalalignment='center')
-                plt.title('시간대별 로그 분포', fontsize=10)
-                canvas = FigureCanvas(fig)
-                
-                # 기존 위젯 제거 및 새 캔버스 추가
-                for i in reversed(range(timeline_chart_layout.count())): 
-                    timeline_chart_layout.itemAt(i).widget().setParent(None)
-                timeline_chart_layout.addWidget(canvas)
+                log_level_chart.show_message('로그 데이터 없음')
+                timeline_chart.show_message('로그 데이터 없음')
                 return
             
-            # matplotlib 한글 폰트 설정
-            get_system_matplotlib_font()
-            
-            # 로그 레벨 통계
+            # 로그 레벨 통계 (심각도 순서를 고정해 막대 구성이 유지되도록 함)
             severity_counts = Counter(entry.get('Severity', 'N/A') for entry in entries)
             total_entries = len(entries)
             
@@ -2692,101 +2630,46 @@ def show_log_popup(parent, log_type):
                 'Warning': '#FFCE56',    # 노란색
                 'OK': '#4BC0C0'          # 청록색
             }
-            
-            # 새 수평 막대 그래프 생성
-            plt.close('all')  # 기존 플롯 닫기
-            
-            # 데이터 개수에 따라 동적으로 그래프 높이 조정
-            graph_height = max(3, min(len(severity_counts) * 0.5, 6))
-            if len(severity_counts) <= 2:
-                graph_height = 2.5  # 로그 개수가 적을 때 더 작은 높이
-            fig, ax = plt.subplots(figsize=(8, graph_height))
-            
-            # 데이터 준비
-            levels = list(severity_counts.keys())
-            counts = list(severity_counts.values())
+            levels = [level for level in color_map if level in severity_counts]
+            levels += sorted(level for level in severity_counts if level not in color_map)
+            counts = [severity_counts[level] for level in levels]
             percentages = [(count / total_entries * 100) for count in counts]
-            
             colors = [color_map.get(level, '#000000') for level in levels]
             
-            # 수평 막대 그래프 생성
-            bars = ax.barh(levels, percentages, color=colors, height=0.5)  # 막대 높이 더 작게
-            
-            # 각 막대에 로그 개수 표시
-            for bar, count in zip(bars, counts):
-                width = bar.get_width()
-                ax.text(width, bar.get_y() + bar.get_height()/2, 
-                        f'{count}', 
-                        va='center', fontsize=8)
-            
-            plt.title('로그 레벨 분포', fontsize=10)
-            plt.xlabel('비율 (%)', fontsize=9)
-            plt.xticks(fontsize=8)
-            plt.yticks(fontsize=8)
-            plt.tight_layout()
-            
-            # 기존 위젯 제거 및 새 캔버스 추가
-            for i in reversed(range(log_level_chart_layout.count())): 
-                log_level_chart_layout.itemAt(i).widget().setParent(None)
-            canvas = FigureCanvas(fig)
-            log_level_chart_layout.addWidget(canvas)
+            log_level_chart.update_bars(levels, percentages, colors, annotations=[f'{count}' for count in counts])
 
             # 타임라인 통계
             # 시간대별 로그 분포
-            timeline_counts = {}
+            timeline_counts = Counter()
             for entry in entries:
                 try:
                     entry_time = datetime.fromisoformat(entry.get('Created', '').replace('Z', '+00:00'))
-                    hour_key = entry_time.strftime("%Y/%m/%d %H시")
-                    timeline_counts[hour_key] = timeline_counts.get(hour_key, 0) + 1
-                except:
+                    timeline_counts[entry_time.strftime("%Y/%m/%d %H시")] += 1
+                except ValueError:
                     pass
             
             # 시간대 순서대로 정렬
-            sorted_timeline = dict(sorted(timeline_counts.items(), key=lambda x: x[0]))
-            
-            # 새 막대 그래프 생성
-            plt.close('all')  # 기존 플롯 닫기
-            
-            # 데이터 개수에 따라 동적으로 그래프 높이 조정
-            graph_height = max(3, min(len(sorted_timeline) * 0.5, 6))
-            if len(sorted_timeline) <= 2:
-                graph_height = 2.5  # 로그 개수가 적을 때 더 작은 높이
-            fig, ax = plt.subplots(figsize=(8, graph_height))
-            
-            # 데이터 준비
-            time_periods = list(sorted_timeline.keys())
-            counts = list(sorted_timeline.values())
-            percentages = [(count / total_entries * 100) for count in counts]
-            
-            # 막대 그래프 생성
-            bars = ax.barh(time_periods, counts, color='#4BC0C0', height=0.5)  # 막대 높이 더 작게
-            
-            # 각 막대에 로그 개수 표시
-            for bar, count in zip(bars, counts):
-                width = bar.get_width()
-                ax.text(width, bar.get_y() + bar.get_height()/2, 
-                        f'{count}', 
-                        va='center', fontsize=8)
-            
-            plt.title('시간대별 로그 분포', fontsize=10)
-            plt.xlabel('로그 수', fontsize=9)
-            plt.xticks(fontsize=8)
-            plt.yticks(fontsize=8)
-            plt.tight_layout()
-            
-            # 기존 위젯 제거 및 새 캔버스 추가
-            for i in reversed(range(timeline_chart_layout.count())): 
-                timeline_chart_layout.itemAt(i).widget().setParent(None)
-            canvas = FigureCanvas(fig)
-            timeline_chart_layout.addWidget(canvas)
+            time_periods = sorted(timeline_counts)
+            timeline_chart.update_bars(
+                time_periods,
+                [timeline_counts[period] for period in time_periods],
+                ['#4BC0C0'] * len(time_periods)
+            )
 
-        def refresh_logs():
-            # log_entries 초기화
+        def apply_filters():
+            # 서버에 다시 요청하지 않고 프록시 필터만 갱신
             nonlocal log_entries
-            log_entries = []
+            severity_filter = severity_combo.currentText()
+            log_proxy.set_filters(
+                severity=None if severity_filter == '전체' else severity_filter,
+                search=search_input.text()
+            )
+            log_entries = log_proxy.visible_events()
             
-            tree_widget.clear()
+            # 로그 통계 계산 및 표시
+            calculate_log_statistics(log_entries)
+
+        def refresh_logs():
             try:
                 # 로그 타입에 따라 적절한 메서드 호출
                 if log_type == 'sel':
@@ -2795,32 +2678,13 @@ def show_log_popup(parent, log_type):
                     log_data = server_manager.fetch_lc_entries()
                 
                 # log_data가 None이면 빈 리스트로 처리
-                entries = log_data.get('Members', []) if log_data else []
-                
-                # 필터링 적용
-                filtered_entries = []
-                severity_filter = severity_combo.currentText()
-                search_text = search_input.text().lower()
-                
-                for entry in entries:
-                    # 심각도 필터 적용
-                    if severity_filter != '전체' and entry.get('Severity') != severity_filter:
-                        continue
-                    
-                    # 검색어 필터 적용
-                    if search_text and search_text not in entry.get('Message', '').lower():
-                        continue
-                    
-                    filtered_entries.append(entry)
-                    add_log_to_tree(entry)
-                
-                # 로그 통계 계산 및 표시
-                calculate_log_statistics(filtered_entries)
+                log_model.set_events(log_data.get('Members', []) if log_data else [])
                 
             except Exception as e:
                 QMessageBox.critical(dialog, "오류", f"로그 조회 실패: {str(e)}")
-                # 빈 리스트로 통계 그래프 생성
-                calculate_log_statistics([])
+                log_model.set_events([])
+            
+            apply_filters()
         
         def copy_logs_to_clipboard():
             if not log_entries:
@@ -2844,36 +2708,30 @@ def show_log_popup(parent, log_type):
                 QMessageBox.warning(dialog, "경고", "내보낼 로그가 없습니다.")
                 return
             
-            file_path, _ = QFileDialog.getSaveFileName(
+            file_path, selected_filter = QFileDialog.getSaveFileName(
                 dialog, 
-                "Excel 파일로 저장", 
+                "로그 파일로 저장", 
                 f"{log_type}_logs.xlsx", 
-                "Excel 파일 (*.xlsx)"
+                EXPORT_FORMATS
             )
             
             if file_path:
-                try:
-                    wb = openpyxl.Workbook()
-                    ws = wb.active
-                    ws.title = f"{log_type.upper()} 로그"
-                    
-                    # 헤더
-                    headers = ["ID", "심각도", "생성 시간", "메시지"]
-                    for col, header in enumerate(headers, 1):
-                        ws.cell(row=1, column=col, value=header)
-                        ws.cell(row=1, column=col).font = Font(bold=True)
-                    
-                    # 로그 데이터
-                    for row, entry in enumerate(log_entries, 2):
-                        ws.cell(row=row, column=1, value=entry.get('Id', 'N/A'))
-                        ws.cell(row=row, column=2, value=entry.get('Severity', 'N/A'))
-                        ws.cell(row=row, column=3, value=format_time(entry.get('Created', 'N/A')))
-                        ws.cell(row=row, column=4, value=entry.get('Message', 'N/A'))
-                    
-                    wb.save(file_path)
-                    QMessageBox.information(dialog, "완료", f"로그가 {file_path}에 저장되었습니다.")
-                except Exception as e:
-                    QMessageBox.critical(dialog, "오류", f"Excel 저장 실패: {str(e)}")
+                file_path = ensure_export_extension(file_path, selected_filter)
+                # 현재 목록을 스냅샷으로 넘기고 행 변환/기록은 작업자 스레드에서 수행
+                entries = list(log_entries)
+                rows = (
+                    (entry.get('Id', 'N/A'), entry.get('Severity', 'N/A'),
+                     format_time(entry.get('Created', 'N/A')), entry.get('Message', 'N/A'))
+                    for entry in entries
+                )
+                sheet = ExportSheet(
+                    f"{log_type.upper()} 로그",
+                    ["ID", "심각도", "생성 시간", "메시지"],
+                    rows,
+                    total=len(entries),
+                    column_widths=[12, 10, 20, 120]
+                )
+                dialog._export_worker = start_export(dialog, file_path, [sheet], "로그 내보내기")
 
         def clear_logs():
             confirm = QMessageBox.question(
@@ -2899,8 +2757,10 @@ def show_log_popup(parent, log_type):
         if log_type == 'sel':
             clear_button.clicked.connect(clear_logs)
         
-        severity_combo.currentTextChanged.connect(refresh_logs)
-        search_input.textChanged.connect(refresh_logs)
+        # 검색어는 입력이 멈춘 뒤에 한 번만 적용
+        search_debouncer = create_search_debouncer(dialog, apply_filters)
+        severity_combo.currentTextChanged.connect(apply_filters)
+        search_input.textChanged.connect(search_debouncer.start)
         
         # 초기 로그 목록 로드
         refresh_logs()
@@ -2951,47 +2811,10 @@ def show_tsr_log_popup(parent):
         error_dialog.exec()
         return
 
-    progress_dialog = QProgressDialog("TSR 로그 수집 중...", "취소", 0, 100, parent)
-    progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-    progress_dialog.setWindowTitle("TSR 로그 수집")
-    progress_dialog.setAutoClose(True)
-    progress_dialog.setMinimumDuration(0)
-    progress_dialog.show()
-
-    try:
-        server_manager = DellServerManager(
-            ip=server_info['IP'],
-            port=server_info['PORT'],
-            auth=(server_info['USERNAME'], server_info['PASSWORD'])
-        )
-
-        def update_progress(progress):
-            progress_dialog.setValue(int(progress))
-
-        tsr_file = server_manager.collect_tsr_log(progress_callback=update_progress)
-        
-        if tsr_file:
-            QMessageBox.information(parent, "완료", f"TSR 로그가 성공적으로 수집되었습니다.\n저장 위치: {tsr_file}")
-        else:
-            error_dialog = ErrorDialog(
-                "TSR 로그 수집 오류",
-                "TSR 로그 수집에 실패했습니다.",
-                "서버 연결 상태를 확인하고 다시 시도해주세요.",
-                parent
-            )
-            error_dialog.exec()
-
-    except Exception as e:
-        logger.error(f"TSR 로그 수집 중 오류 발생: {str(e)}")
-        error_dialog = ErrorDialog(
-            "TSR 로그 수집 오류",
-            "TSR 로그 수집에 실패했습니다.",
-            str(e),
-            parent
-        )
-        error_dialog.exec()
-    finally:
-        progress_dialog.close()
+    # 여러 서버를 동시에 수집할 수 있는 창 (현재 서버가 선택된 상태로 시작)
+    from ui.components.popups.tsr_collection_dialog import TsrCollectionDialog
+    dialog = TsrCollectionDialog(parent, selected_servers=[server_info.get('NAME')])
+    dialog.exec()
 
 def update_all_status():
     """모든 시스템 상태 정보 업데이트"""
@@ -3110,9 +2933,12 @@ def show_task_manager(parent):
         delete_button = QPushButton("선택 작업 삭제")
         delete_button.setIcon(QIcon("delete_icon.png"))
         
+        status_label = QLabel("")
+
         button_layout.addWidget(refresh_button)
         button_layout.addWidget(delete_button)
         button_layout.addStretch()
+        button_layout.addWidget(status_label)
         layout.addLayout(button_layout)
 
         def add_job_to_tree(job_details):
@@ -3153,46 +2979,26 @@ def show_task_manager(parent):
             item.setText(4, format_time(start_time) if start_time != 'N/A' else 'N/A')
             item.setText(5, format_time(end_time) if end_time != 'N/A' else 'N/A')
 
-        def refresh_jobs():
+        def render_jobs():
+            """추적기에 보관된 작업을 필터에 맞춰 표시 (네트워크 요청 없음)"""
             tree_widget.clear()
-            try:
-                jobs = server_manager.fetch_job_queue()
-                job_items = []
-                has_running_jobs = False
-                
-                for job in jobs.get('Members', []):
-                    job_id = job['@odata.id'].split('/')[-1]
-                    job_details = server_manager.fetch_job_details(job_id)
-                    
-                    # 진행 중인 작업 확인
-                    if job_details.get('JobState') == 'Running':
-                        has_running_jobs = True
-                    
-                    # 필터링 적용
-                    if status_combo.currentText() != '전체' and job_details.get('JobState') != status_combo.currentText():
-                        continue
-                    
-                    search_text = search_input.text().lower()
-                    if search_text and search_text not in job_details.get('Id', '').lower() and \
-                       search_text not in job_details.get('Name', '').lower():
-                        continue
-                    
-                    job_items.append((job_details.get('StartTime', ''), job_details))
-                
-                # 진행 중인 작업이 있으면 갱신 주기 변경
-                if has_running_jobs:
-                    timer.setInterval(5000)  # 5초마다 갱신
-                else:
-                    timer.setInterval(30000)  # 30초마다 갱신
-                
-                # 시작 시간 기준 내림차순 정렬
-                job_items.sort(key=lambda x: x[0], reverse=True)
-                
-                for _, job_details in job_items:
-                    add_job_to_tree(job_details)
-                    
-            except Exception as e:
-                QMessageBox.critical(dialog, "오류", f"작업 목록 조회 실패: {str(e)}")
+            search_text = search_input.text().lower()
+            for job_details in watcher.jobs():
+                # 필터링 적용
+                if status_combo.currentText() != '전체' and job_details.get('JobState') != status_combo.currentText():
+                    continue
+                if search_text and search_text not in job_details.get('Id', '').lower() and \
+                   search_text not in job_details.get('Name', '').lower():
+                    continue
+                add_job_to_tree(job_details)
+            active = len([job for job in watcher.jobs() if job.get('JobState') not in TERMINAL_JOB_STATES])
+            status_label.setText(f"진행 중 {active}개" if active else "")
+
+        def refresh_jobs():
+            watcher.refresh(force=True)
+
+        def on_refresh_failed(message):
+            status_label.setText(f"작업 목록 조회 실패: {message}")
 
         def delete_selected_job():
             selected_items = tree_widget.selectedItems()
@@ -3218,25 +3024,27 @@ def show_task_manager(parent):
                 except Exception as e:
                     QMessageBox.critical(dialog, "오류", f"작업 삭제 실패: {str(e)}")
 
-        # 다이얼로그가 닫힐 때 타이머 정지를 위한 이벤트 처리
+        # 같은 서버의 작업 큐 감시기 공유 (진행 중인 작업이 있을 때만 짧은 간격으로 확인)
+        watcher = JobWatcher.for_server(server_manager)
+
         def on_dialog_finished():
-            timer.stop()
-            logger.debug("작업 관리자 다이얼로그 종료: 타이머 정지")
-            
+            watcher.jobs_changed.disconnect(render_jobs)
+            watcher.refresh_failed.disconnect(on_refresh_failed)
+            watcher.release()
+            logger.debug("작업 관리자 다이얼로그 종료: 작업 감시 해제")
+
         # 이벤트 연결
         refresh_button.clicked.connect(refresh_jobs)
         delete_button.clicked.connect(delete_selected_job)
-        status_combo.currentTextChanged.connect(refresh_jobs)
-        search_input.textChanged.connect(refresh_jobs)
-
-        # 타이머 설정 및 시작
-        timer = QTimer(dialog)
-        timer.timeout.connect(refresh_jobs)
+        status_combo.currentTextChanged.connect(render_jobs)
+        search_input.textChanged.connect(render_jobs)
+        watcher.jobs_changed.connect(render_jobs)
+        watcher.refresh_failed.connect(on_refresh_failed)
         dialog.finished.connect(on_dialog_finished)
-        
-        # 초기 작업 목록 로드 및 타이머 시작
-        refresh_jobs()  # 다이얼로그가 열릴 때 첫 조회
-        timer.start(30000)  # 30초 주기로 시작
+
+        # 이미 추적 중인 작업을 먼저 표시하고 감시 시작
+        render_jobs()
+        watcher.acquire()
         
         dialog.exec()
 
@@ -3250,6 +3058,24 @@ def show_task_manager(parent):
         )
         error_dialog.exec()
 
+# 작업 상태 표시 이름 (펌웨어 대기열 필터와 같은 값)
+JOB_STATE_LABELS = {
+    'Completed': '완료',
+    'CompletedWithErrors': '실패',
+    'Failed': '실패',
+    'Killed': '실패',
+    'Cancelled': '실패',
+    'Running': '진행 중',
+    'Downloading': '진행 중',
+    'Downloaded': '대기 중',
+    'New': '대기 중',
+    'Scheduled': '대기 중',
+    'Scheduling': '대기 중',
+    'Waiting': '대기 중',
+    'ReadyForExecution': '대기 중',
+    'PendingActivation': '대기 중',
+}
+
 def format_time(time_str):
     """시간 형식을 보기 좋게 변환"""
     if time_str and time_str != 'N/A':
@@ -0,0 +1,390 @@
+import os
+
+from PyQt6.QtCore import QSettings, Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import (QCheckBox, QComboBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel,
+                             QMessageBox, QPushButton, QSplitter, QTableWidget, QTableWidgetItem, QVBoxLayout,
+                             QWidget)
+
+from config.server.server_config import server_config
+from config.system.log_config import setup_logging
+from managers.bios_profile import (BUILTIN_PROFILES, CELL_CHANGE, CELL_PENDING, CELL_UNSUPPORTED,
+                                   STATUS_APPLIED, STATUS_CONFLICT, STATUS_DRIFT, STATUS_FAILED, STATUS_PENDING,
+                                   BiosProfileEngine, build_matrix, format_cell, load_profile, save_profile)
+from managers.dell_server_manager import DellServerManager
+from ui.components.export_worker import start_export
+from ui.components.popups.error_dialog import ErrorDialog
+from ui.components.worker_utils import stop_worker
+from utils.export_utils import EXPORT_FORMATS, ExportSheet, ensure_export_extension
+
+logger = setup_logging()
+
+PROFILE_SETTING_KEY = 'bios/profile_path'
+ALL_SERVERS = '전체'
+CUSTOM_PROFILE = '사용자 정의'
+COLUMN_NAME, COLUMN_HOST, COLUMN_STATUS, COLUMN_JOB = range(4)
+FIXED_COLUMNS = 4
+
+CELL_COLORS = {
+    CELL_CHANGE: QColor('orange'),
+    CELL_PENDING: QColor('#ADD8E6'),
+    CELL_UNSUPPORTED: QColor('lightgray'),
+}
+STATUS_COLORS = {
+    STATUS_DRIFT: QColor('orange'),
+    STATUS_PENDING: QColor('#ADD8E6'),
+    STATUS_APPLIED: QColor('lightgreen'),
+    STATUS_CONFLICT: QColor('yellow'),
+    STATUS_FAILED: QColor('red'),
+}
+
+class BiosProfileWorker(QThread):
+    """선택한 서버들에 대해 BIOS 프로파일 비교(및 적용)를 실행하는 작업자"""
+
+    progress = pyqtSignal(str, str)  # 서버 이름, 단계
+    completed = pyqtSignal(object)  # {서버 이름: BiosServerPlan}
+    failed = pyqtSignal(str)
+
+    def __init__(self, servers, attributes, apply=False, reboot=False, parent=None):
+        super().__init__(parent)
+        self.servers = servers
+        self.attributes = attributes
+        self.apply = apply
+        self.reboot = reboot
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            server_managers = {
+                name: DellServerManager(ip=server.IP, port=server.PORT, auth=(server.USERNAME, server.PASSWORD))
+                for name, server in self.servers.items()
+            }
+            engine = BiosProfileEngine(server_managers, self.attributes, self.progress.emit,
+                                       lambda: self._cancel_requested)
+            # 적용할 때도 최신 상태로 다시 비교한 뒤 차이만 적용
+            engine.plan()
+            plans = engine.apply(self.reboot) if self.apply else engine.plans
+            self.completed.emit(plans)
+        except Exception as e:
+            logger.error(f"BIOS 프로파일 처리 실패: {str(e)}")
+            self.failed.emit(str(e))
+
+class BiosProfileDialog(QDialog):
+    """BIOS 프로파일(목표 속성 값)을 여러 서버와 비교하고 다른 값만 적용하는 창
+
+    결과는 서버(행) x 속성(열) 표로 보여주며, 일치하는 서버에는 아무 요청도 보내지 않습니다.
+    """
+
+    def __init__(self, parent=None, selected_servers=None):
+        super().__init__(parent)
+        self.setWindowTitle("BIOS 프로파일 적용")
+        self.resize(1200, 700)
+        self.settings = QSettings('Dell', 'iDRAC Monitor')
+        self.worker = None
+        self.plans = {}
+        self.rows = {}
+        self.setup_ui()
+        self.load_servers(selected_servers or [])
+        self.select_profile()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        option_layout = QHBoxLayout()
+        self.profile_combo = QComboBox()
+        self.profile_combo.addItems(list(BUILTIN_PROFILES) + [CUSTOM_PROFILE])
+        self.profile_combo.activated.connect(self.select_profile)
+        load_btn = QPushButton("불러오기")
+        save_btn = QPushButton("저장")
+        load_btn.clicked.connect(self.load_profile_file)
+        save_btn.clicked.connect(self.save_profile_file)
+        self.group_combo = QComboBox()
+        self.group_combo.addItem(ALL_SERVERS)
+        self.group_combo.addItems(server_config.get_groups())
+        self.group_combo.activated.connect(self.select_group)
+        option_layout.addWidget(QLabel("프로파일:"))
+        option_layout.addWidget(self.profile_combo, 1)
+        option_layout.addWidget(load_btn)
+        option_layout.addWidget(save_btn)
+        option_layout.addWidget(QLabel("그룹 선택:"))
+        option_layout.addWidget(self.group_combo)
+        layout.addLayout(option_layout)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        profile_widget = QWidget()
+        profile_layout = QVBoxLayout(profile_widget)
+        profile_layout.setContentsMargins(0, 0, 0, 0)
+        self.attribute_table = QTableWidget(0, 2)
+        self.attribute_table.setHorizontalHeaderLabels(["속성", "목표 값"])
+        self.attribute_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.attribute_table.itemChanged.connect(self._on_attribute_edited)
+        attribute_buttons = QHBoxLayout()
+        add_btn = QPushButton("속성 추가")
+        remove_btn = QPushButton("속성 삭제")
+        add_btn.clicked.connect(self.add_attribute)
+        remove_btn.clicked.connect(self.remove_attribute)
+        attribute_buttons.addWidget(add_btn)
+        attribute_buttons.addWidget(remove_btn)
+        profile_layout.addWidget(self.attribute_table)
+        profile_layout.addLayout(attribute_buttons)
+        splitter.addWidget(profile_widget)
+
+        self.matrix = QTableWidget(0, FIXED_COLUMNS)
+        self.matrix.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.matrix.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.matrix.setAlternatingRowColors(True)
+        splitter.addWidget(self.matrix)
+        splitter.setSizes([300, 900])
+        layout.addWidget(splitter, 1)
+
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        self.reboot_check = QCheckBox("적용 후 재시작")
+        self.plan_btn = QPushButton("비교")
+        self.apply_btn = QPushButton("적용")
+        self.apply_btn.setEnabled(False)
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.setEnabled(False)
+        export_btn = QPushButton("내보내기")
+        close_btn = QPushButton("닫기")
+        self.plan_btn.clicked.connect(self.run_plan)
+        self.apply_btn.clicked.connect(self.run_apply)
+        self.cancel_btn.clicked.connect(self.cancel_run)
+        export_btn.clicked.connect(self.export_matrix)
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(self.status_label, 1)
+        button_layout.addWidget(self.reboot_check)
+        button_layout.addWidget(self.plan_btn)
+        button_layout.addWidget(self.apply_btn)
+        button_layout.addWidget(self.cancel_btn)
+        button_layout.addWidget(export_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+    # 프로파일 편집
+    def select_profile(self):
+        name = self.profile_combo.currentText()
+        if name in BUILTIN_PROFILES:
+            self.set_attributes(BUILTIN_PROFILES[name])
+
+    def set_attributes(self, attributes):
+        self.attribute_table.blockSignals(True)
+        self.attribute_table.setRowCount(0)
+        for name, value in attributes.items():
+            row = self.attribute_table.rowCount()
+            self.attribute_table.insertRow(row)
+            self.attribute_table.setItem(row, 0, QTableWidgetItem(name))
+            value_item = QTableWidgetItem(str(value))
+            # 파일에서 읽은 정수 값은 형식을 유지
+            value_item.setData(Qt.ItemDataRole.UserRole, value)
+            self.attribute_table.setItem(row, 1, value_item)
+        self.attribute_table.blockSignals(False)
+        self._reset_results()
+
+    def attributes(self):
+        attributes = {}
+        for row in range(self.attribute_table.rowCount()):
+            name_item = self.attribute_table.item(row, 0)
+            value_item = self.attribute_table.item(row, 1)
+            name = name_item.text().strip() if name_item else ''
+            if not name or value_item is None:
+                continue
+            original = value_item.data(Qt.ItemDataRole.UserRole)
+            text = value_item.text().strip()
+            attributes[name] = original if original is not None and str(original) == text else text
+        return attributes
+
+    def add_attribute(self):
+        row = self.attribute_table.rowCount()
+        self.attribute_table.blockSignals(True)
+        self.attribute_table.insertRow(row)
+        self.attribute_table.setItem(row, 0, QTableWidgetItem(""))
+        self.attribute_table.setItem(row, 1, QTableWidgetItem(""))
+        self.attribute_table.blockSignals(False)
+        self.attribute_table.editItem(self.attribute_table.item(row, 0))
+
+    def remove_attribute(self):
+        for row in sorted({index.row() for index in self.attribute_table.selectedIndexes()}, reverse=True):
+            self.attribute_table.removeRow(row)
+        self._on_attribute_edited()
+
+    def _on_attribute_edited(self, *_):
+        if self.profile_combo.currentText() != CUSTOM_PROFILE:
+            self.profile_combo.setCurrentText(CUSTOM_PROFILE)
+        self._reset_results()
+
+    def load_profile_file(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "BIOS 프로파일 선택", self.settings.value(PROFILE_SETTING_KEY, ''), "BIOS 프로파일 (*.json)")
+        if not file_path:
+            return
+        try:
+            name, attributes = load_profile(file_path)
+        except Exception as e:
+            ErrorDialog("BIOS 프로파일", "프로파일 파일을 읽을 수 없습니다.", str(e), self).exec()
+            return
+        self.settings.setValue(PROFILE_SETTING_KEY, file_path)
+        self.set_attributes(attributes)
+        self.profile_combo.setCurrentText(CUSTOM_PROFILE)
+        self.status_label.setText(f"프로파일 불러옴: {name or os.path.basename(file_path)}")
+
+    def save_profile_file(self):
+        attributes = self.attributes()
+        if not attributes:
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "BIOS 프로파일 저장", self.settings.value(PROFILE_SETTING_KEY, 'bios_profile.json'),
+            "BIOS 프로파일 (*.json)")
+        if not file_path:
+            return
+        try:
+            save_profile(file_path, os.path.splitext(os.path.basename(file_path))[0], attributes)
+            self.settings.setValue(PROFILE_SETTING_KEY, file_path)
+        except Exception as e:
+            logger.error(f"BIOS 프로파일 저장 실패: {str(e)}")
+            ErrorDialog("BIOS 프로파일", "프로파일을 저장할 수 없습니다.", str(e), self).exec()
+
+    # 서버 선택
+    def load_servers(self, selected_servers):
+        self.matrix.setRowCount(0)
+        for name, server in server_config.servers.items():
+            row = self.matrix.rowCount()
+            self.matrix.insertRow(row)
+            item = QTableWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if name in selected_servers else Qt.CheckState.Unchecked)
+            self.matrix.setItem(row, COLUMN_NAME, item)
+            self.matrix.setItem(row, COLUMN_HOST, QTableWidgetItem(f"{server.IP}:{server.PORT}"))
+            self.rows[name] = row
+        self._reset_results()
+
+    def select_group(self):
+        group = self.group_combo.currentText()
+        names = (set(server_config.servers) if group == ALL_SERVERS
+                 else {server.NAME for server in server_config.get_servers_in_group(group)})
+        for name, row in self.rows.items():
+            self.matrix.item(row, COLUMN_NAME).setCheckState(
+                Qt.CheckState.Checked if name in names else Qt.CheckState.Unchecked)
+
+    def checked_servers(self):
+        return {name: server_config.servers[name] for name, row in self.rows.items()
+                if self.matrix.item(row, COLUMN_NAME).checkState() == Qt.CheckState.Checked
+                and name in server_config.servers}
+
+    # 비교/적용
+    def _reset_results(self):
+        """프로파일이 바뀌면 이전 결과 열을 지우고 속성 열을 다시 구성"""
+        self.plans = {}
+        self.apply_btn.setEnabled(False)
+        attributes = list(self.attributes())
+        self.matrix.setColumnCount(FIXED_COLUMNS + len(attributes) + 1)
+        self.matrix.setHorizontalHeaderLabels(["서버", "호스트", "상태", "작업 ID"] + attributes + ["메시지"])
+        for row in range(self.matrix.rowCount()):
+            for column in range(COLUMN_STATUS, self.matrix.columnCount()):
+                self.matrix.setItem(row, column, QTableWidgetItem(""))
+
+    def _start(self, apply):
+        servers = self.checked_servers()
+        attributes = self.attributes()
+        if not servers or not attributes or (self.worker is not None and self.worker.isRunning()):
+            return
+        for name in servers:
+            self.matrix.item(self.rows[name], COLUMN_STATUS).setText("대기")
+        self.plan_btn.setEnabled(False)
+        self.apply_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.status_label.setText(f"서버 {len(servers)}대 {'적용' if apply else '비교'} 중...")
+
+        self.worker = BiosProfileWorker(servers, attributes, apply, self.reboot_check.isChecked(), self)
+        self.worker.progress.connect(self._on_progress)
+        self.worker.completed.connect(self._on_completed)
+        self.worker.failed.connect(self._on_failed)
+        self.worker.finished.connect(self._on_worker_finished)
+        self.worker.start()
+
+    def run_plan(self):
+        self._start(apply=False)
+
+    def run_apply(self):
+        targets = [plan for plan in self.plans.values() if plan.status in (STATUS_DRIFT, STATUS_PENDING)]
+        if not targets:
+            return
+        changes = sum(len(plan.changes) for plan in targets)
+        reboot = "\n적용 후 대상 서버를 재시작합니다." if self.reboot_check.isChecked() else "\n변경은 다음 재부팅 때 반영됩니다."
+        reply = QMessageBox.question(
+            self,
+            "BIOS 프로파일 적용",
+            f"서버 {len(targets)}대에 다른 속성 {changes}개만 적용합니다.{reboot}\n\n계속하시겠습니까?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self._start(apply=True)
+
+    def cancel_run(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("취소 중...")
+
+    def _on_progress(self, name, stage):
+        row = self.rows.get(name)
+        if row is not None:
+            self.matrix.item(row, COLUMN_STATUS).setText(stage)
+
+    def _on_failed(self, message):
+        self.status_label.setText("")
+        ErrorDialog("BIOS 프로파일", "BIOS 프로파일을 처리하는 중 오류가 발생했습니다.", message, self).exec()
+
+    def _on_completed(self, plans):
+        self.plans = plans
+        attributes = list(self.attributes())
+        for name, plan in plans.items():
+            row = self.rows.get(name)
+            if row is None:
+                continue
+            status_item = QTableWidgetItem(plan.status)
+            if plan.status in STATUS_COLORS:
+                status_item.setBackground(STATUS_COLORS[plan.status])
+            self.matrix.setItem(row, COLUMN_STATUS, status_item)
+            self.matrix.setItem(row, COLUMN_JOB, QTableWidgetItem(plan.job_id or ''))
+            for index, attribute in enumerate(attributes):
+                cell = plan.cells.get(attribute)
+                item = QTableWidgetItem(format_cell(cell))
+                if cell is not None and cell['state'] in CELL_COLORS:
+                    item.setBackground(CELL_COLORS[cell['state']])
+                self.matrix.setItem(row, FIXED_COLUMNS + index, item)
+            message_item = QTableWidgetItem(plan.message)
+            message_item.setToolTip(plan.message)
+            self.matrix.setItem(row, FIXED_COLUMNS + len(attributes), message_item)
+
+        counts = {}
+        for plan in plans.values():
+            counts[plan.status] = counts.get(plan.status, 0) + 1
+        self.status_label.setText(" | ".join(f"{status} {count}대" for status, count in counts.items()))
+        self.apply_btn.setEnabled(any(plan.status in (STATUS_DRIFT, STATUS_PENDING) for plan in plans.values()))
+
+    def _on_worker_finished(self):
+        self.worker = None
+        self.plan_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+
+    def export_matrix(self):
+        if not self.plans:
+            return
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "BIOS 프로파일 결과 저장", "bios_profile.xlsx", EXPORT_FORMATS)
+        if not file_path:
+            return
+        headers, rows = build_matrix(self.attributes(), self.plans)
+        sheet = ExportSheet("BIOS 프로파일", headers, rows, total=len(rows))
+        start_export(self, ensure_export_extension(file_path, selected_filter), [sheet], "결과 내보내기")
+
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            stop_worker(self.worker)
+            self.worker = None
+        super().closeEvent(event)
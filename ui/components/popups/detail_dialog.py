@@ -6,8 +6,9 @@ from config.system.log_config import setup_logging
 logger = setup_logging()
 
 class DetailDialog(QDialog):
-    def __init__(self, title, component_info, parent=None):
+    def __init__(self, title, component_info, parent=None, history_callback=None):
         super().__init__(parent)
+        self.history_callback = history_callback
         self.setWindowTitle(f"{title} 상세 정보")
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
@@ -83,6 +84,10 @@ class DetailDialog(QDialog):
         close_btn.clicked.connect(self.close)
         
         button_layout.addWidget(expand_btn)
+        if self.history_callback:
+            history_btn = QPushButton("상태 이력")
+            history_btn.clicked.connect(self.history_callback)
+            button_layout.addWidget(history_btn)
         button_layout.addWidget(close_btn)
         layout.addLayout(button_layout)
 
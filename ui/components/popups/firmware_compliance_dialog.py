@@ -0,0 +1,232 @@
+import os
+
+from PyQt6.QtCore import QSettings, QThread, pyqtSignal
+from PyQt6.QtWidgets import (QCheckBox, QComboBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel,
+                             QLineEdit, QProgressBar, QPushButton, QTableView, QTreeWidget, QTreeWidgetItem,
+                             QVBoxLayout)
+
+from config.server.server_config import server_config
+from config.system.log_config import setup_logging
+from ui.components.event_log_model import (EventLogFilterProxyModel, EventLogModel,
+                                           create_search_debouncer)
+from ui.components.export_worker import start_export
+from ui.components.popups.error_dialog import ErrorDialog
+from utils.export_utils import EXPORT_FORMATS, ExportSheet, ensure_export_extension
+from utils.firmware_cache import firmware_inventory_cache
+from utils.firmware_compliance import CatalogIndex, build_compliance_report
+
+logger = setup_logging()
+
+CATALOG_SETTING_KEY = 'firmware/catalog_path'
+CATEGORIES = ['전체', 'BIOS', 'iDRAC', 'RAID', 'NIC', '기타']
+
+# (헤더, 결과 행 키)
+REPORT_COLUMNS = [
+    ("서버", 'Server'),
+    ("서비스태그", 'ServiceTag'),
+    ("모델", 'Model'),
+    ("분류", 'Category'),
+    ("구성 요소", 'Component'),
+    ("설치 버전", 'Installed'),
+    ("카탈로그 버전", 'Latest'),
+    ("상태", 'Status'),
+    ("배포일", 'ReleaseDate'),
+]
+
+def _server_names():
+    """호스트(IP:포트) -> 등록된 서버 이름"""
+    names = {}
+    for name, server in server_config.servers.items():
+        names[f"{server.IP}:{server.PORT}"] = name
+    return names
+
+class ComplianceWorker(QThread):
+    """카탈로그 색인(필요 시 파싱)과 전체 서버 비교를 백그라운드에서 실행"""
+
+    progress = pyqtSignal(int, int)
+    succeeded = pyqtSignal(list, list, str)  # 결과 행, 서버별 요약, 카탈로그 버전
+    failed = pyqtSignal(str)
+
+    def __init__(self, catalog_path, parent=None):
+        super().__init__(parent)
+        self.catalog_path = catalog_path
+
+    def run(self):
+        try:
+            catalog = CatalogIndex().load_or_build(self.catalog_path, self.progress.emit)
+            rows, summary = build_compliance_report(catalog, firmware_inventory_cache.iter_entries(), _server_names())
+            self.succeeded.emit(rows, summary, catalog.catalog_version or '')
+        except Exception as e:
+            logger.error(f"펌웨어 규정 준수 비교 실패: {str(e)}")
+            self.failed.emit(str(e))
+
+class FirmwareComplianceDialog(QDialog):
+    """로컬 Dell 카탈로그 기준 서버별 펌웨어 업데이트 필요 항목 보고서
+
+    비교 대상은 각 서버의 펌웨어 정보를 조회할 때 캐시된 인벤토리입니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("펌웨어 규정 준수")
+        self.resize(1100, 700)
+        self.settings = QSettings('Dell', 'iDRAC Monitor')
+        self.rows = []
+        self.worker = None
+        self.setup_ui()
+
+        catalog_path = self.settings.value(CATALOG_SETTING_KEY, '')
+        if catalog_path and os.path.exists(catalog_path):
+            self.catalog_label.setText(catalog_path)
+            self.run_compare()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        catalog_layout = QHBoxLayout()
+        self.catalog_label = QLabel("카탈로그를 선택하세요 (Catalog.xml / Catalog.xml.gz)")
+        select_btn = QPushButton("카탈로그 선택")
+        self.compare_btn = QPushButton("다시 비교")
+        select_btn.clicked.connect(self.select_catalog)
+        self.compare_btn.clicked.connect(self.run_compare)
+        catalog_layout.addWidget(self.catalog_label, 1)
+        catalog_layout.addWidget(select_btn)
+        catalog_layout.addWidget(self.compare_btn)
+        layout.addLayout(catalog_layout)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+
+        self.summary_tree = QTreeWidget()
+        self.summary_tree.setHeaderLabels(["서버", "서비스태그", "모델", "업데이트 필요", "최신", "카탈로그 없음"])
+        self.summary_tree.setColumnWidth(0, 200)
+        self.summary_tree.setMaximumHeight(200)
+        self.summary_tree.itemSelectionChanged.connect(self._on_summary_selected)
+        layout.addWidget(self.summary_tree)
+
+        filter_layout = QHBoxLayout()
+        self.category_combo = QComboBox()
+        self.category_combo.addItems(CATEGORIES)
+        self.outdated_only = QCheckBox("업데이트 필요 항목만")
+        self.outdated_only.setChecked(True)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("서버/구성 요소 검색...")
+        filter_layout.addWidget(QLabel("분류:"))
+        filter_layout.addWidget(self.category_combo)
+        filter_layout.addWidget(self.outdated_only)
+        filter_layout.addWidget(self.search_input, 1)
+        layout.addLayout(filter_layout)
+
+        self.model = EventLogModel(
+            [(header, lambda row, key=key: row.get(key, '')) for header, key in REPORT_COLUMNS],
+            severity_column=7,
+            search_key=lambda row: f"{row['Server']} {row['ServiceTag']} {row['Component']}",
+            parent=self
+        )
+        self.proxy = EventLogFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setAlternatingRowColors(True)
+        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        export_btn = QPushButton("내보내기")
+        close_btn = QPushButton("닫기")
+        export_btn.clicked.connect(self.export_report)
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(self.status_label, 1)
+        button_layout.addWidget(export_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self.search_timer = create_search_debouncer(self, self.apply_filters)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.category_combo.currentIndexChanged.connect(self._load_rows)
+        self.outdated_only.toggled.connect(self.apply_filters)
+
+    def select_catalog(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Dell 카탈로그 선택", "", "Dell 카탈로그 (*.xml *.xml.gz *.gz);;모든 파일 (*.*)")
+        if file_path:
+            self.settings.setValue(CATALOG_SETTING_KEY, file_path)
+            self.catalog_label.setText(file_path)
+            self.run_compare()
+
+    def run_compare(self):
+        catalog_path = self.settings.value(CATALOG_SETTING_KEY, '')
+        if not catalog_path or not os.path.exists(catalog_path):
+            return
+        if self.worker is not None and self.worker.isRunning():
+            return
+        self.compare_btn.setEnabled(False)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.status_label.setText("카탈로그 색인 확인 및 비교 중...")
+
+        self.worker = ComplianceWorker(catalog_path, self)
+        self.worker.progress.connect(self._on_progress)
+        self.worker.succeeded.connect(self._on_compared)
+        self.worker.failed.connect(self._on_failed)
+        self.worker.finished.connect(lambda: self.compare_btn.setEnabled(True))
+        self.worker.start()
+
+    def _on_progress(self, done, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
+    def _on_failed(self, message):
+        self.progress_bar.hide()
+        self.status_label.setText("")
+        ErrorDialog("펌웨어 규정 준수", "카탈로그와 비교하는 중 오류가 발생했습니다.", message, self).exec()
+
+    def _on_compared(self, rows, summary, catalog_version):
+        self.progress_bar.hide()
+        self.rows = rows
+        self.summary_tree.clear()
+        for item in summary:
+            QTreeWidgetItem(self.summary_tree, [
+                item['Server'], item['ServiceTag'], item['Model'],
+                str(item['Outdated']), str(item['Current']), str(item['Unknown'])
+            ])
+        outdated_servers = sum(1 for item in summary if item['Outdated'])
+        self.status_label.setText(
+            f"카탈로그 {catalog_version} | 서버 {len(summary)}대 중 {outdated_servers}대 업데이트 필요"
+            " (펌웨어 정보를 조회한 서버만 비교)")
+        self._load_rows()
+
+    def _load_rows(self):
+        category = self.category_combo.currentText()
+        rows = self.rows if category == '전체' else [row for row in self.rows if row['Category'] == category]
+        self.model.set_events(rows)
+        self.apply_filters()
+
+    def apply_filters(self):
+        self.proxy.set_filters('Warning' if self.outdated_only.isChecked() else None, self.search_input.text())
+
+    def _on_summary_selected(self):
+        items = self.summary_tree.selectedItems()
+        if items:
+            self.search_input.setText(items[0].text(1))
+
+    def export_report(self):
+        rows = self.proxy.visible_events()
+        if not rows:
+            return
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "펌웨어 규정 준수 보고서 저장", "firmware_compliance.xlsx", EXPORT_FORMATS)
+        if not file_path:
+            return
+        sheet = ExportSheet(
+            "펌웨어 규정 준수",
+            [header for header, _ in REPORT_COLUMNS] + ["경로"],
+            ([row.get(key, '') for _, key in REPORT_COLUMNS] + [row.get('Path', '')] for row in rows),
+            total=len(rows),
+            column_widths=[18, 12, 16, 8, 40, 16, 16, 16, 14, 40]
+        )
+        start_export(self, ensure_export_extension(file_path, selected_filter), [sheet], "보고서 내보내기")
@@ -0,0 +1,151 @@
+import time
+from datetime import datetime
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import (QComboBox, QDialog, QHBoxLayout, QLabel, QPushButton, QTreeWidget,
+                             QTreeWidgetItem, QVBoxLayout)
+
+from config.system.log_config import setup_logging
+from ui.components.charts import StepSeriesChart
+from utils.health_history import HEALTH_LEVELS, METRIC_LABELS, health_history
+
+logger = setup_logging()
+
+# 조회 기간 (표시 이름, 일 수)
+HISTORY_PERIODS = [("7일", 7), ("30일", 30), ("90일", 90), ("1년", 365)]
+
+SEVERITY_COLORS = {
+    'Critical': QColor('red'),
+    'Warning': QColor('orange'),
+}
+
+def _format_ts(ts):
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')
+
+class HealthHistoryDialog(QDialog):
+    """드라이브/DIMM 상태 이력 및 악화 추세 표시 다이얼로그"""
+
+    def __init__(self, server, kind, title, parent=None):
+        super().__init__(parent)
+        self.server = server
+        self.kind = kind
+        self.setWindowTitle(f"{title} 상태 이력")
+        self.setMinimumWidth(800)
+        self.setMinimumHeight(650)
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        filter_layout = QHBoxLayout()
+        self.component_combo = QComboBox()
+        self.metric_combo = QComboBox()
+        self.period_combo = QComboBox()
+        for label, days in HISTORY_PERIODS:
+            self.period_combo.addItem(label, days)
+        self.period_combo.setCurrentIndex(1)
+        filter_layout.addWidget(QLabel("부품:"))
+        filter_layout.addWidget(self.component_combo, 1)
+        filter_layout.addWidget(QLabel("지표:"))
+        filter_layout.addWidget(self.metric_combo, 1)
+        filter_layout.addWidget(QLabel("기간:"))
+        filter_layout.addWidget(self.period_combo)
+        layout.addLayout(filter_layout)
+
+        self.chart = StepSeriesChart("상태 이력")
+        self.chart.setMinimumHeight(250)
+        layout.addWidget(self.chart)
+
+        layout.addWidget(QLabel("악화 추세"))
+        self.trend_tree = QTreeWidget()
+        self.trend_tree.setHeaderLabels(["부품", "지표", "내용"])
+        self.trend_tree.setColumnWidth(0, 200)
+        self.trend_tree.setColumnWidth(1, 150)
+        self.trend_tree.setMaximumHeight(120)
+        layout.addWidget(self.trend_tree)
+
+        layout.addWidget(QLabel("상태 변경 내역"))
+        self.transition_tree = QTreeWidget()
+        self.transition_tree.setHeaderLabels(["시각", "부품", "지표", "변경 전", "변경 후"])
+        self.transition_tree.setColumnWidth(0, 130)
+        self.transition_tree.setColumnWidth(1, 200)
+        self.transition_tree.setColumnWidth(2, 150)
+        layout.addWidget(self.transition_tree)
+
+        button_layout = QHBoxLayout()
+        refresh_btn = QPushButton("새로고침")
+        close_btn = QPushButton("닫기")
+        refresh_btn.clicked.connect(self.refresh)
+        close_btn.clicked.connect(self.close)
+        button_layout.addStretch()
+        button_layout.addWidget(refresh_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self.component_combo.currentIndexChanged.connect(self._load_metrics)
+        self.metric_combo.currentIndexChanged.connect(self.update_chart)
+        self.period_combo.currentIndexChanged.connect(self.refresh)
+
+    def _since(self):
+        return time.time() - self.period_combo.currentData() * 86400
+
+    def refresh(self):
+        """부품 목록, 추세, 변경 내역 다시 조회"""
+        try:
+            current = self.component_combo.currentText()
+            self.component_combo.blockSignals(True)
+            self.component_combo.clear()
+            self.component_combo.addItems(health_history.get_components(self.server, self.kind))
+            index = self.component_combo.findText(current)
+            self.component_combo.setCurrentIndex(max(index, 0))
+            self.component_combo.blockSignals(False)
+            self._load_metrics()
+
+            since = self._since()
+            self.trend_tree.clear()
+            for finding in health_history.detect_trends(self.server, since=since, kind=self.kind):
+                item = QTreeWidgetItem(self.trend_tree, [
+                    finding['component'],
+                    METRIC_LABELS.get(finding['metric'], finding['metric']),
+                    finding['message']
+                ])
+                item.setForeground(2, SEVERITY_COLORS.get(finding['severity'], QColor('orange')))
+
+            self.transition_tree.clear()
+            for change in health_history.get_transitions(self.server, since=since, kind=self.kind):
+                QTreeWidgetItem(self.transition_tree, [
+                    _format_ts(change['ts']),
+                    change['component'],
+                    METRIC_LABELS.get(change['metric'], change['metric']),
+                    change['before'],
+                    change['after']
+                ])
+        except Exception as e:
+            logger.error(f"상태 이력 조회 실패: {str(e)}")
+
+    def _load_metrics(self):
+        current = self.metric_combo.currentData()
+        self.metric_combo.blockSignals(True)
+        self.metric_combo.clear()
+        component = self.component_combo.currentText()
+        if component:
+            for metric in health_history.get_metrics(self.server, component):
+                self.metric_combo.addItem(METRIC_LABELS.get(metric, metric), metric)
+        index = self.metric_combo.findData(current if current else 'health')
+        self.metric_combo.setCurrentIndex(max(index, 0))
+        self.metric_combo.blockSignals(False)
+        self.update_chart()
+
+    def update_chart(self):
+        component = self.component_combo.currentText()
+        metric = self.metric_combo.currentData()
+        if not component or not metric:
+            self.chart.show_message('이력 데이터 없음')
+            return
+        points = [(datetime.fromtimestamp(ts), value)
+                  for ts, value in health_history.get_series(self.server, component, metric, since=self._since())]
+        numeric = all(isinstance(value, float) for _, value in points)
+        categories = None if numeric else (HEALTH_LEVELS if metric == 'health' else [])
+        self.chart.update_series({component: points}, categories=categories,
+                                 ylabel=METRIC_LABELS.get(metric, metric))
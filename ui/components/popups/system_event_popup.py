@@ -1,7 +1,7 @@
 from config.system.log_config import setup_logging
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QPushButton, QHBoxLayout, QLabel
-from PyQt6.QtGui import QColor
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTableView, QHeaderView, QPushButton, QHBoxLayout, QLabel, QLineEdit
+from ui.components.event_log_model import (EventLogFilterProxyModel, EventLogModel, PageProxyModel,
+                                            create_search_debouncer)
 
 logger = setup_logging()
 
@@ -13,17 +13,41 @@ class SystemEventPopup(QDialog):
         self.total_events = []  # 전체 이벤트 저장
         self.page_size = 50  # 페이지당 표시할 항목 수
         self.current_page = 0  # 현재 페이지
+        
+        # 이벤트 모델 -> 검색 필터 프록시 -> 페이지 프록시 순으로 연결
+        self.event_model = EventLogModel([
+            ("발생 시간", lambda event: event.get('Created', '')),
+            ("심각도", lambda event: event.get('Severity', '')),
+            ("구성요소", lambda event: event.get('Oem', {}).get('Dell', {}).get('Category', '')),
+            ("메시지", lambda event: event.get('Message', '')),
+        ], severity_column=1, search_key=self._search_key, parent=self)
+        self.filter_proxy = EventLogFilterProxyModel(self)
+        self.filter_proxy.setSourceModel(self.event_model)
+        self.page_proxy = PageProxyModel(self.page_size, self)
+        self.page_proxy.setSourceModel(self.filter_proxy)
         self.setup_ui()
         
+    @staticmethod
+    def _search_key(event):
+        """검색 대상 텍스트 (구성요소 + 메시지)"""
+        category = event.get('Oem', {}).get('Dell', {}).get('Category', '')
+        return f"{category} {event.get('Message', '')}"
+        
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
-        # 테이블 위젯 설정
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels([
-            "발생 시간", "심각도", "구성요소", "메시지"
-        ])
+        # 검색 입력 (입력이 멈춘 뒤 필터 적용)
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("구성요소 또는 메시지로 검색")
+        self.search_debouncer = create_search_debouncer(self, self.apply_search)
+        self.search_input.textChanged.connect(self.search_debouncer.start)
+        search_layout.addWidget(QLabel("검색:"))
+        search_layout.addWidget(self.search_input)
+        
+        # 테이블 뷰 설정 (현재 페이지 행만 프록시를 통해 표시)
+        self.table = QTableView()
+        self.table.setModel(self.page_proxy)
 
         # 헤더 설정 (타입 체크 추가)
         header = self.table.horizontalHeader()
@@ -55,6 +79,7 @@ class SystemEventPopup(QDialog):
         pagination_layout.addWidget(self.next_button)
         pagination_layout.addStretch()
         
+        layout.addLayout(search_layout)
         layout.addWidget(self.table)
         layout.addLayout(pagination_layout)
     
@@ -72,38 +97,30 @@ class SystemEventPopup(QDialog):
             
             # 데이터 정렬 (최신 순)
             self.total_events.sort(key=lambda x: x.get('Created', ''), reverse=True)
+            self.event_model.set_events(self.total_events)
             
             self.update_page()
         except Exception as e:
             logger.error(f"이벤트 데이터 업데이트 실패: {str(e)}")
             logger.exception(e)
     
+    def apply_search(self):
+        """검색어 필터 적용 후 첫 페이지로 이동"""
+        self.filter_proxy.set_filters(search=self.search_input.text())
+        self.current_page = 0
+        self.update_page()
+
     def update_page(self):
         try:
-            # 현재 페이지 데이터 계산
-            start_idx = self.current_page * self.page_size
-            end_idx = min(start_idx + self.page_size, len(self.total_events))
-            current_data = self.total_events[start_idx:end_idx]
+            # 페이지 프록시의 표시 구간만 변경 (셀 아이템을 다시 만들지 않음)
+            self.page_proxy.set_page(self.current_page)
+            self.current_page = self.page_proxy.page
+            total_pages = self.page_proxy.page_count()
             
-            logger.debug(f"페이지 업데이트 - 시작: {start_idx}, 끝: {end_idx}, 전체: {len(self.total_events)}")
-            
-            # 테이블 초기화
-            self.table.clearContents()
-            self.table.setRowCount(len(current_data))
-            
-            # 데이터 채우기
-            for row, event in enumerate(current_data):
-                for col, value in enumerate([
-                    event.get('Created', ''),
-                    event.get('Severity', ''),
-                    event.get('Oem', {}).get('Dell', {}).get('Category', ''),
-                    event.get('Message', '')
-                ]):
-                    item = QTableWidgetItem(str(value))
-                    self.table.setItem(row, col, item)
+            logger.debug(f"페이지 업데이트 - 페이지: {self.current_page + 1}/{total_pages}, "
+                         f"필터 결과: {self.filter_proxy.rowCount()}, 전체: {len(self.total_events)}")
             
             # 페이지 버튼 상태 업데이트
-            total_pages = (len(self.total_events) - 1) // self.page_size + 1
             self.prev_button.setEnabled(self.current_page > 0)
             self.next_button.setEnabled(self.current_page < total_pages - 1)
             self.page_label.setText(f"{self.current_page + 1} / {total_pages}")
@@ -112,7 +129,6 @@ class SystemEventPopup(QDialog):
             logger.error(f"페이지 업데이트 실패: {str(e)}")
             logger.exception(e)
 
-
     def prev_page(self):
         """이전 페이지로 이동"""
         if self.current_page > 0:
@@ -121,7 +137,6 @@ class SystemEventPopup(QDialog):
     
     def next_page(self):
         """다음 페이지로 이동"""
-        total_pages = (len(self.total_events) - 1) // self.page_size + 1
-        if self.current_page < total_pages - 1:
+        if self.current_page < self.page_proxy.page_count() - 1:
             self.current_page += 1
-            self.update_page()
\ No newline at end of file
+            self.update_page()
@@ -0,0 +1,210 @@
+import os
+
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtWidgets import (QComboBox, QDialog, QFileDialog, QHBoxLayout, QLabel, QPushButton, QTreeWidget,
+                             QTreeWidgetItem, QVBoxLayout)
+
+from config.server.server_config import server_config
+from config.system.log_config import setup_logging
+from managers.dell_server_manager import DellServerManager
+from managers.tsr_collector import collect_tsr_logs, default_download_dir
+from ui.components.popups.tsr_summary_dialog import TsrSummaryDialog
+from ui.components.worker_utils import stop_worker
+
+logger = setup_logging()
+
+ALL_SERVERS = '전체'
+COLUMN_NAME, COLUMN_IP, COLUMN_STAGE, COLUMN_PROGRESS, COLUMN_RESULT = range(5)
+
+class TsrCollectionWorker(QThread):
+    """선택한 서버들의 TSR을 동시에 수집하는 작업자"""
+
+    progress = pyqtSignal(str, str, float)  # 서버 이름, 단계, 퍼센트
+    server_finished = pyqtSignal(str, object, object)  # 서버 이름, 저장 경로, 오류 메시지
+    all_finished = pyqtSignal()
+
+    def __init__(self, servers, download_dir, parent=None):
+        super().__init__(parent)
+        self.servers = servers
+        self.download_dir = download_dir
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            server_managers = {
+                name: DellServerManager(ip=server.IP, port=server.PORT, auth=(server.USERNAME, server.PASSWORD))
+                for name, server in self.servers.items()
+            }
+            results = collect_tsr_logs(
+                server_managers,
+                self.download_dir,
+                progress_callback=self.progress.emit,
+                is_cancelled=lambda: self._cancel_requested
+            )
+            for name, (path, error) in results.items():
+                self.server_finished.emit(name, path, error)
+        except Exception as e:
+            logger.error(f"TSR 일괄 수집 중 오류 발생: {str(e)}")
+            for name in self.servers:
+                self.server_finished.emit(name, None, str(e))
+        finally:
+            self.all_finished.emit()
+
+class TsrCollectionDialog(QDialog):
+    """여러 서버의 TSR 로그를 동시에 수집하는 창 (서버별 진행 상황 표시)"""
+
+    def __init__(self, parent=None, selected_servers=None):
+        super().__init__(parent)
+        self.setWindowTitle("TSR 로그 수집")
+        self.resize(800, 450)
+        self.download_dir = default_download_dir()
+        self.worker = None
+        self.items = {}
+        self.setup_ui()
+        self.load_servers(selected_servers or [])
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        option_layout = QHBoxLayout()
+        self.group_combo = QComboBox()
+        self.group_combo.addItem(ALL_SERVERS)
+        self.group_combo.addItems(server_config.get_groups())
+        self.group_combo.activated.connect(self.select_group)
+        self.dir_label = QLabel(self.download_dir)
+        dir_btn = QPushButton("저장 위치")
+        dir_btn.clicked.connect(self.select_download_dir)
+        option_layout.addWidget(QLabel("그룹 선택:"))
+        option_layout.addWidget(self.group_combo)
+        option_layout.addWidget(self.dir_label, 1)
+        option_layout.addWidget(dir_btn)
+        layout.addLayout(option_layout)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["서버", "IP", "단계", "진행률", "결과"])
+        self.tree.setColumnWidth(COLUMN_NAME, 160)
+        self.tree.setColumnWidth(COLUMN_IP, 130)
+        self.tree.setColumnWidth(COLUMN_STAGE, 100)
+        self.tree.setColumnWidth(COLUMN_PROGRESS, 70)
+        self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        layout.addWidget(self.tree)
+
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        self.start_btn = QPushButton("수집 시작")
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.setEnabled(False)
+        open_btn = QPushButton("TSR 열기")
+        close_btn = QPushButton("닫기")
+        open_btn.clicked.connect(self.open_archive)
+        self.start_btn.clicked.connect(self.start_collection)
+        self.cancel_btn.clicked.connect(self.cancel_collection)
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(self.status_label, 1)
+        button_layout.addWidget(self.start_btn)
+        button_layout.addWidget(self.cancel_btn)
+        button_layout.addWidget(open_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+    def load_servers(self, selected_servers):
+        for name, server in server_config.servers.items():
+            item = QTreeWidgetItem(self.tree, [name, f"{server.IP}:{server.PORT}", "", "", ""])
+            item.setCheckState(COLUMN_NAME, Qt.CheckState.Checked if name in selected_servers else Qt.CheckState.Unchecked)
+            self.items[name] = item
+
+    def select_group(self):
+        group = self.group_combo.currentText()
+        names = (set(server_config.servers) if group == ALL_SERVERS
+                 else {server.NAME for server in server_config.get_servers_in_group(group)})
+        for name, item in self.items.items():
+            item.setCheckState(COLUMN_NAME, Qt.CheckState.Checked if name in names else Qt.CheckState.Unchecked)
+
+    def select_download_dir(self):
+        directory = QFileDialog.getExistingDirectory(self, "TSR 저장 위치 선택", self.download_dir)
+        if directory:
+            self.download_dir = directory
+            self.dir_label.setText(directory)
+
+    def checked_servers(self):
+        return {name: server_config.servers[name] for name, item in self.items.items()
+                if item.checkState(COLUMN_NAME) == Qt.CheckState.Checked and name in server_config.servers}
+
+    def start_collection(self):
+        servers = self.checked_servers()
+        if not servers or (self.worker is not None and self.worker.isRunning()):
+            return
+        for name, item in self.items.items():
+            for column in (COLUMN_STAGE, COLUMN_PROGRESS, COLUMN_RESULT):
+                item.setText(column, "")
+            item.setData(COLUMN_RESULT, Qt.ItemDataRole.UserRole, None)
+            if name in servers:
+                item.setText(COLUMN_STAGE, "대기")
+        self.start_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.status_label.setText(f"서버 {len(servers)}대 TSR 수집 중...")
+
+        self.worker = TsrCollectionWorker(servers, self.download_dir, self)
+        self.worker.progress.connect(self._on_progress)
+        self.worker.server_finished.connect(self._on_server_finished)
+        self.worker.all_finished.connect(self._on_all_finished)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker.start()
+
+    def cancel_collection(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("취소 중...")
+
+    def _on_progress(self, name, stage, percent):
+        item = self.items.get(name)
+        if item:
+            item.setText(COLUMN_STAGE, stage)
+            item.setText(COLUMN_PROGRESS, f"{percent:.0f}%")
+
+    def _on_server_finished(self, name, path, error):
+        item = self.items.get(name)
+        if not item:
+            return
+        if path:
+            item.setText(COLUMN_STAGE, "완료")
+            item.setText(COLUMN_PROGRESS, "100%")
+            item.setText(COLUMN_RESULT, os.path.basename(path))
+            item.setToolTip(COLUMN_RESULT, f"{path}\n두 번 클릭하면 요약을 엽니다.")
+            item.setData(COLUMN_RESULT, Qt.ItemDataRole.UserRole, path)
+        else:
+            item.setText(COLUMN_STAGE, "실패")
+            item.setText(COLUMN_RESULT, error or "")
+            item.setToolTip(COLUMN_RESULT, error or "")
+
+    def _on_all_finished(self):
+        self.worker = None
+        self.start_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        done = sum(1 for item in self.items.values() if item.text(COLUMN_STAGE) == "완료")
+        failed = sum(1 for item in self.items.values() if item.text(COLUMN_STAGE) == "실패")
+        self.status_label.setText(f"완료 {done}대, 실패 {failed}대 | 저장 위치: {self.download_dir}")
+
+    def _on_item_double_clicked(self, item, column):
+        path = item.data(COLUMN_RESULT, Qt.ItemDataRole.UserRole)
+        if path and os.path.exists(path):
+            self.show_summary(path)
+
+    def open_archive(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "TSR 파일 선택", self.download_dir, "TSR 로그 (*.zip)")
+        if file_path:
+            self.show_summary(file_path)
+
+    def show_summary(self, archive_path):
+        dialog = TsrSummaryDialog(archive_path, self)
+        dialog.show()
+
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            stop_worker(self.worker)
+            self.worker = None
+        super().closeEvent(event)
@@ -0,0 +1,176 @@
+import os
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtWidgets import (QComboBox, QDialog, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QProgressBar,
+                             QPushButton, QTableView, QTabWidget, QVBoxLayout)
+
+from config.system.log_config import setup_logging
+from ui.components.event_log_model import (EventLogFilterProxyModel, EventLogModel,
+                                           create_search_debouncer)
+from ui.components.popups.error_dialog import ErrorDialog
+from utils.tsr_index import index_tsr
+
+logger = setup_logging()
+
+SEVERITY_FILTERS = [("전체", None), ("Critical", 'Critical'), ("Warning", 'Warning'), ("OK", 'OK')]
+
+# (헤더, 구성 요소 키)
+COMPONENT_COLUMNS = [
+    ("분류", 'Class'),
+    ("FQDD", 'FQDD'),
+    ("이름", 'Name'),
+    ("모델", 'Model'),
+    ("시리얼", 'SerialNumber'),
+    ("펌웨어", 'FirmwareVersion'),
+    ("상태", 'Severity'),
+]
+
+# (헤더, 로그 줄 키)
+LOG_COLUMNS = [
+    ("출처", 'Source'),
+    ("심각도", 'Severity'),
+    ("시각", 'Created'),
+    ("메시지 ID", 'MessageId'),
+    ("메시지", 'Message'),
+]
+
+class TsrIndexWorker(QThread):
+    """TSR 아카이브 분석(캐시된 요약이 있으면 재사용)을 백그라운드에서 실행"""
+
+    progress = pyqtSignal(int, int)
+    succeeded = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, archive_path, parent=None):
+        super().__init__(parent)
+        self.archive_path = archive_path
+
+    def run(self):
+        try:
+            self.succeeded.emit(index_tsr(self.archive_path, self.progress.emit))
+        except Exception as e:
+            logger.error(f"TSR 분석 실패: {str(e)}")
+            self.failed.emit(str(e))
+
+def _table(model, stretch_column):
+    proxy = EventLogFilterProxyModel(model.parent())
+    proxy.setSourceModel(model)
+    table = QTableView()
+    table.setModel(proxy)
+    table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+    table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+    table.setAlternatingRowColors(True)
+    table.horizontalHeader().setSectionResizeMode(stretch_column, QHeaderView.ResizeMode.Stretch)
+    return table, proxy
+
+class TsrSummaryDialog(QDialog):
+    """TSR 요약 (구성 요소 상태, 경고/오류 로그) 검색 창"""
+
+    def __init__(self, archive_path, parent=None):
+        super().__init__(parent)
+        self.archive_path = archive_path
+        self.setWindowTitle(f"TSR 요약 - {os.path.basename(archive_path)}")
+        self.resize(1100, 700)
+        self.setup_ui()
+
+        self.worker = TsrIndexWorker(archive_path, self)
+        self.worker.progress.connect(self._on_progress)
+        self.worker.succeeded.connect(self._on_indexed)
+        self.worker.failed.connect(self._on_failed)
+        self.worker.start()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.info_label = QLabel("TSR 분석 중...")
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        layout.addWidget(self.progress_bar)
+
+        filter_layout = QHBoxLayout()
+        self.severity_combo = QComboBox()
+        for label, _ in SEVERITY_FILTERS:
+            self.severity_combo.addItem(label)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("FQDD/메시지 검색...")
+        filter_layout.addWidget(QLabel("심각도:"))
+        filter_layout.addWidget(self.severity_combo)
+        filter_layout.addWidget(self.search_input, 1)
+        layout.addLayout(filter_layout)
+
+        self.component_model = EventLogModel(
+            [(header, lambda row, key=key: row.get(key, '')) for header, key in COMPONENT_COLUMNS],
+            severity_column=6,
+            search_key=lambda row: ' '.join(str(value) for value in row.values()),
+            parent=self
+        )
+        self.log_model = EventLogModel(
+            [(header, lambda row, key=key: row.get(key, '')) for header, key in LOG_COLUMNS],
+            severity_column=1,
+            search_key=lambda row: f"{row.get('MessageId', '')} {row.get('Message', '')}",
+            parent=self
+        )
+        component_table, self.component_proxy = _table(self.component_model, 2)
+        log_table, self.log_proxy = _table(self.log_model, 4)
+
+        self.tabs = QTabWidget()
+        self.tabs.addTab(component_table, "구성 요소")
+        self.tabs.addTab(log_table, "경고/오류 로그")
+        layout.addWidget(self.tabs)
+
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(self.status_label, 1)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self.search_timer = create_search_debouncer(self, self.apply_filters)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.severity_combo.currentIndexChanged.connect(self.apply_filters)
+
+    def _on_progress(self, done, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
+    def _on_failed(self, message):
+        self.progress_bar.hide()
+        self.info_label.setText("TSR 분석 실패")
+        ErrorDialog("TSR 요약", "TSR 파일을 분석하는 중 오류가 발생했습니다.", message, self).exec()
+
+    def _on_indexed(self, summary):
+        self.progress_bar.hide()
+        metadata = summary.get('metadata', {})
+        details = [f"{key}: {value}" for key, value in metadata.items()][:8]
+        self.info_label.setText(" | ".join(details) if details else os.path.basename(self.archive_path))
+
+        counts = summary.get('log_counts', {})
+        status = (f"구성 요소 {len(summary.get('components', []))}개 (이상 {len(summary.get('faults', []))}개) | "
+                  f"로그 Critical {counts.get('Critical', 0)}, Warning {counts.get('Warning', 0)}, "
+                  f"OK {counts.get('OK', 0)}")
+        if summary.get('truncated'):
+            status += f" | 경고/오류 로그는 처음 {len(summary.get('log_lines', []))}줄만 표시"
+        self.status_label.setText(status)
+
+        self.component_model.set_events(summary.get('components', []))
+        self.log_model.set_events(summary.get('log_lines', []))
+        if summary.get('faults') or not summary.get('log_lines'):
+            self.tabs.setCurrentIndex(0)
+        else:
+            self.tabs.setCurrentIndex(1)
+        self.apply_filters()
+
+    def apply_filters(self):
+        severity = SEVERITY_FILTERS[self.severity_combo.currentIndex()][1]
+        search = self.search_input.text()
+        self.component_proxy.set_filters(severity, search)
+        self.log_proxy.set_filters(severity, search)
+
+    def closeEvent(self, event):
+        if self.worker.isRunning():
+            self.worker.wait()
+        super().closeEvent(event)
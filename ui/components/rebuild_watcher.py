@@ -0,0 +1,211 @@
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+def _find_rebuild_operation(resource):
+    """Operations 목록에서 리빌딩 작업 항목 반환"""
+    for operation in resource.get('Operations', []) or []:
+        if operation.get('OperationName') == "Rebuilding":
+            return operation
+    return None
+
+def format_eta(seconds):
+    """남은 시간(초)을 표시용 문자열로 변환"""
+    if seconds is None:
+        return "계산 중"
+    seconds = int(max(seconds, 0))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    return f"{minutes}분 {seconds}초"
+
+class RebuildWatcher(QObject):
+    """서버별 리빌딩 진행 상태 감시기
+
+    스토리지 전체(컨트롤러/볼륨/드라이브)는 처음 한 번만 조회하고, 이후에는
+    리빌딩 중인 드라이브와 그 드라이브가 속한 볼륨만 다시 조회합니다. 같은 서버의
+    리빌딩 화면들은 하나의 인스턴스와 폴링 루프를 공유하며, 남은 시간은 실제
+    진행 속도(진행률 변화량 / 경과 시간)로 추정합니다.
+    """
+
+    progress_updated = pyqtSignal(dict)  # {드라이브 ID: 상태 딕셔너리}
+    rebuild_finished = pyqtSignal(str)  # 리빌딩이 끝난 드라이브 ID
+
+    DEFAULT_INTERVAL = 10  # 폴링 주기(초)
+    REDISCOVER_INTERVAL = 600  # 새 리빌딩 드라이브 확인을 위한 재탐색 주기(초)
+    RATE_WINDOW = 1800  # 진행 속도 계산에 사용할 최근 구간(초)
+
+    _instances = {}
+
+    @classmethod
+    def for_server(cls, server_manager, storage_info=None):
+        """서버별 공유 인스턴스 반환 (storage_info가 있으면 조회 없이 탐색 결과로 사용)"""
+        key = server_manager.endpoints.base_url
+        watcher = cls._instances.get(key)
+        if watcher is None:
+            watcher = cls(server_manager)
+            cls._instances[key] = watcher
+        else:
+            watcher.server_manager = server_manager
+        if storage_info is not None:
+            watcher.discover(storage_info)
+        return watcher
+
+    def __init__(self, server_manager):
+        super().__init__()
+        self.server_manager = server_manager
+        self.volumes = {}  # 볼륨 URI -> 볼륨 정보
+        self.drives = {}  # 드라이브 ID -> 드라이브 상태
+        self.interval = self.DEFAULT_INTERVAL
+        self._discovered_at = 0
+        self._subscribers = 0
+        self._lock = threading.Lock()
+        self._polling = False
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._schedule_poll)
+
+    def _drive_state(self, drive, volume_uri, previous=None):
+        operation = _find_rebuild_operation(drive)
+        status = drive.get('Oem', {}).get('Dell', {}).get('DellPhysicalDisk', {}).get('RaidStatus', 'N/A')
+        state = previous or {'samples': [], 'eta': None}
+        state.update({
+            'id': drive.get('Id', ''),
+            'uri': drive.get('@odata.id', state.get('uri')),
+            'volume_uri': volume_uri,
+            'status': status,
+            'rebuilding': operation is not None or status == 'Rebuilding',
+            'percent': operation.get('PercentageComplete', 0) if operation else state.get('percent'),
+        })
+        return state
+
+    def discover(self, storage_info=None):
+        """스토리지 전체를 한 번 조회해 볼륨-드라이브 구성과 리빌딩 드라이브 파악"""
+        if storage_info is None:
+            storage_info = self.server_manager.fetch_storage_info()
+        if not storage_info:
+            return
+
+        volumes = {}
+        drives = {}
+        with self._lock:
+            for controller in storage_info.get('Controllers', []):
+                drives_by_id = {drive.get('Id', ''): drive for drive in controller.get('Drives', [])}
+                for volume in controller.get('Volumes', []):
+                    volume_uri = volume.get('@odata.id', volume.get('Name', ''))
+                    drive_ids = [link.get('@odata.id', '').split('/')[-1]
+                                 for link in volume.get('Links', {}).get('Drives', [])]
+                    operation = _find_rebuild_operation(volume)
+                    volumes[volume_uri] = {
+                        'uri': volume_uri,
+                        'name': volume.get('Name', ''),
+                        'raid_type': volume.get('RAIDType', ''),
+                        'capacity': volume.get('CapacityBytes', 0) or 0,
+                        'drive_ids': drive_ids,
+                        'percent': operation.get('PercentageComplete') if operation else None,
+                    }
+                    for drive_id in drive_ids:
+                        drive = drives_by_id.get(drive_id)
+                        if drive is not None:
+                            drives[drive_id] = self._drive_state(drive, volume_uri, self.drives.get(drive_id))
+            self.volumes = volumes
+            self.drives = drives
+            self._discovered_at = time.time()
+
+    def rebuilding_drives(self):
+        with self._lock:
+            return [drive_id for drive_id, state in self.drives.items() if state['rebuilding']]
+
+    def snapshot(self):
+        """현재 드라이브 상태 사본 (GUI 스레드 전달용)"""
+        with self._lock:
+            return {drive_id: {k: v for k, v in state.items() if k != 'samples'}
+                    for drive_id, state in self.drives.items()}
+
+    def acquire(self):
+        """리빌딩 화면이 열릴 때 호출 (첫 구독자가 폴링 루프 시작)"""
+        self._subscribers += 1
+        if not self.timer.isActive():
+            self.timer.start(self.interval * 1000)
+        self._schedule_poll()
+
+    def release(self):
+        """리빌딩 화면이 닫힐 때 호출 (마지막 구독자가 폴링 루프 중지)"""
+        self._subscribers = max(0, self._subscribers - 1)
+        if self._subscribers == 0:
+            self.timer.stop()
+
+    def set_interval(self, seconds):
+        self.interval = seconds
+        if self.timer.isActive():
+            self.timer.setInterval(seconds * 1000)
+
+    def _schedule_poll(self):
+        # 이전 폴링이 끝나지 않았으면 건너뜀 (응답이 느린 경우 요청 누적 방지)
+        if self._polling:
+            return
+        self._polling = True
+        threading.Thread(target=self._poll, name='RebuildWatcher', daemon=True).start()
+
+    def _fetch(self, uri):
+        return self.server_manager.fetch_detailed_info(f"{self.server_manager.endpoints.base_url}{uri}")
+
+    def _update_rate(self, state, now):
+        """최근 진행률 표본으로 진행 속도를 구해 남은 시간 추정"""
+        samples = state['samples']
+        percent = state.get('percent')
+        if percent is None:
+            return
+        if not samples or samples[-1][1] != percent:
+            samples.append((now, percent))
+        while len(samples) > 2 and now - samples[0][0] > self.RATE_WINDOW:
+            samples.pop(0)
+        if len(samples) >= 2 and samples[-1][0] > samples[0][0]:
+            rate = (samples[-1][1] - samples[0][1]) / (samples[-1][0] - samples[0][0])
+            # 마지막 진행 이후 경과 시간만큼 차감
+            state['eta'] = (100 - percent) / rate - (now - samples[-1][0]) if rate > 0 else None
+
+    def _poll(self):
+        finished = []
+        try:
+            if not self.drives or time.time() - self._discovered_at > self.REDISCOVER_INTERVAL:
+                self.discover()
+
+            targets = self.rebuilding_drives()
+            volume_uris = set()
+            for drive_id in targets:
+                state = self.drives[drive_id]
+                drive = self._fetch(state['uri'])
+                now = time.time()
+                with self._lock:
+                    self._drive_state(drive, state['volume_uri'], state)
+                    if state['rebuilding']:
+                        self._update_rate(state, now)
+                        volume_uris.add(state['volume_uri'])
+                    else:
+                        state['percent'] = 100
+                        state['eta'] = 0
+                        state['samples'] = []
+                        finished.append(drive_id)
+
+            # 리빌딩 드라이브가 속한 볼륨의 작업 진행률만 조회
+            for volume_uri in volume_uris:
+                volume = self._fetch(volume_uri)
+                operation = _find_rebuild_operation(volume) or next(iter(volume.get('Operations', []) or []), None)
+                with self._lock:
+                    if volume_uri in self.volumes:
+                        self.volumes[volume_uri]['percent'] = operation.get('PercentageComplete') if operation else None
+        except Exception as e:
+            logger.error(f"리빌딩 상태 조회 실패: {str(e)}")
+        finally:
+            self._polling = False
+
+        for drive_id in finished:
+            logger.info(f"드라이브 리빌딩 완료: {drive_id}")
+            self.rebuild_finished.emit(drive_id)
+        self.progress_updated.emit(self.snapshot())
@@ -0,0 +1,32 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from managers.task_monitor import task_monitor
+
+class TaskNotifier(QObject):
+    """작업 모니터 알림을 GUI 스레드 시그널로 전달
+
+    작업 모니터는 자체 스레드에서 알림을 보내므로, 화면은 이 객체의 시그널에
+    연결해 큐 연결로 안전하게 받습니다. 애플리케이션 전체에서 하나만 사용합니다.
+    """
+
+    task_progress = pyqtSignal(dict)
+    task_finished = pyqtSignal(dict)
+
+    def __init__(self):
+        super().__init__()
+        task_monitor.add_listener(self._on_event)
+
+    def _on_event(self, event, task):
+        if event == 'finished':
+            self.task_finished.emit(task)
+        else:
+            self.task_progress.emit(task)
+
+_notifier = None
+
+def task_notifier():
+    """공유 TaskNotifier (GUI 스레드에서 처음 호출할 때 생성)"""
+    global _notifier
+    if _notifier is None:
+        _notifier = TaskNotifier()
+    return _notifier
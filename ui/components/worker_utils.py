@@ -0,0 +1,29 @@
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+WORKER_STOP_TIMEOUT_MS = 3000  # 창을 닫을 때 작업자 종료를 기다리는 최대 시간
+
+# 창을 닫은 뒤에도 정리 중인 작업자 (끝날 때까지 참조 유지)
+_detached_workers = set()
+
+def _release_worker(worker):
+    worker.wait()  # finished 직후 스레드가 완전히 끝날 때까지 (바로 반환)
+    _detached_workers.discard(worker)
+    worker.deleteLater()
+
+def stop_worker(worker, timeout_ms=WORKER_STOP_TIMEOUT_MS):
+    """창을 닫을 때 작업자 취소 후 제한 시간만 대기 (종료되면 True)
+
+    진행 중인 요청이 끝나야 취소가 반영되므로, 제한 시간 안에 끝나지 않으면
+    창과의 시그널 연결을 끊고 부모에서 분리해 작업자가 끝난 뒤 스스로 정리되게 합니다.
+    """
+    worker.cancel()
+    if worker.wait(timeout_ms):
+        return True
+    worker.disconnect()
+    worker.setParent(None)
+    _detached_workers.add(worker)
+    worker.finished.connect(lambda: _release_worker(worker))
+    logger.info(f"작업 취소 대기 중 창을 닫음 ({type(worker).__name__}, 종료 후 정리)")
+    return False
@@ -8,9 +8,9 @@ from typing import Optional
 from ui.components.hardware_section import create_hardware_section
 from ui.components.monitor_section import create_monitor_section
 from ui.components.server_section import create_server_section
+from ui.components.task_notifier import task_notifier
 from version import __version__
 from config.server.server_config import server_config
-from utils.server_utils import convert_to_idrac_config
 import json
 
 logger = setup_logging()
@@ -209,8 +209,10 @@ class ServerSettingsDialog(QDialog):
                 'PASSWORD': original_server.PASSWORD
             }
             
-            server_config.servers[new_name] = convert_to_idrac_config(server_info)
-            server_config.save_servers()
+            server_config.add_server(
+                new_name, server_info['IP'], server_info['USERNAME'], server_info['PASSWORD'],
+                server_info['PORT'], group=original_server.GROUP, tags=original_server.TAGS
+            )
             self.load_servers()
             
             QMessageBox.information(
@@ -297,15 +299,7 @@ class ServerSettingsDialog(QDialog):
             QMessageBox.warning(self, "경고", "모든 필드를 입력해주세요.")
             return
             
-        server_info = {
-            'NAME': name,
-            'IP': ip,
-            'PORT': port,
-            'USERNAME': username,
-            'PASSWORD': password
-        }
-        server_config.servers[name] = convert_to_idrac_config(server_info)
-        server_config.save_servers()
+        server_config.add_server(name, ip, username, password, port)
         self.load_servers()
         
         # 입력 필드 초기화
@@ -326,8 +320,7 @@ class ServerSettingsDialog(QDialog):
                                     QMessageBox.StandardButton.No)
             
             if reply == QMessageBox.StandardButton.Yes:
-                del server_config.servers[name]
-                server_config.save_servers()
+                server_config.remove_server(name)
                 self.load_servers()
 
                 self.name_edit.clear()
@@ -514,17 +507,13 @@ class ServerSettingsDialog(QDialog):
                 'IP': new_ip,
                 'PORT': new_port,
                 'USERNAME': new_username,
-                'PASSWORD': new_password
+                'PASSWORD': new_password,
+                'GROUP': server_info.GROUP,
+                'TAGS': server_info.TAGS
             }
             
-            # 기존 서버 삭제 후 새로운 정보로 저장
-            del server_config.servers[self.original_server_name]
-            server_config.servers[new_server_name] = convert_to_idrac_config(new_server_info)
-            server_config.save_servers()
-            
-            # 빠른 연결 서버였다면 새 이름으로 업데이트
-            if server_config.quick_connect_server == self.original_server_name:
-                server_config.save_quick_connect_server(new_server_name)
+            # 기존 서버 레코드를 새로운 정보로 교체 (빠른 연결 서버 이름도 함께 갱신)
+            server_config.rename_server(self.original_server_name, new_server_info)
             
             # 서버 목록 새로고침
             self.load_servers()
@@ -544,16 +533,7 @@ class ServerSettingsDialog(QDialog):
                 return  # 사용자가 취소한 경우
             
             # 서버 설정을 딕셔너리로 변환
-            export_data = {
-                name: {
-                    'IP': server.IP,
-                    'PORT': getattr(server, 'PORT', '443'),
-                    'USERNAME': server.USERNAME,
-                    'PASSWORD': server.PASSWORD,
-                    'CONNECTED': server.CONNECTED,
-                    'LAST_CONNECTED': str(server.LAST_CONNECTED) if server.LAST_CONNECTED else None
-                } for name, server in server_config.servers.items()
-            }
+            export_data = server_config.export_servers()
             
             # JSON 파일로 저장
             with open(file_path, 'w', encoding='utf-8') as f:
@@ -591,23 +571,9 @@ class ServerSettingsDialog(QDialog):
             with open(file_path, 'r', encoding='utf-8') as f:
                 import_data = json.load(f)
             
-            # 기존 서버 설정 백업
-            backup_servers = server_config.servers.copy()
-            
             try:
-                # 새로운 서버 설정 적용
-                server_config.servers.clear()
-                for name, server_info in import_data.items():
-                    server_config.servers[name] = convert_to_idrac_config({
-                        'NAME': name,
-                        'IP': server_info['IP'],
-                        'PORT': server_info.get('PORT', '443'),
-                        'USERNAME': server_info['USERNAME'],
-                        'PASSWORD': server_info['PASSWORD']
-                    })
-                
-                # 설정 저장
-                server_config.save_servers()
+                # 새로운 서버 설정 적용 (단일 트랜잭션, 실패 시 기존 설정 유지)
+                server_config.import_servers(import_data)
                 
                 # 서버 목록 새로고침
                 if hasattr(self, 'settings_dialog'):
@@ -624,9 +590,8 @@ class ServerSettingsDialog(QDialog):
                 )
                 
             except Exception as import_error:
-                # 가져오기 실패 시 백업된 설정 복원
-                server_config.servers = backup_servers
-                server_config.save_servers()
+                # 레지스트리는 트랜잭션 롤백으로 기존 설정이 유지되므로 메모리만 다시 동기화
+                server_config.load_servers()
                 raise import_error
             
         except Exception as e:
@@ -799,6 +764,23 @@ class DellIDRACMonitor(QMainWindow):
         main_layout.addLayout(left_layout, 1)  # 1은 stretch factor
         main_layout.addLayout(right_layout, 3)  # 3은 stretch factor (오른쪽이 더 넓게)        
 
+        # 장시간 작업(펌웨어 업데이트, BIOS 작업, 재시작 예약 등) 진행/완료 알림
+        notifier = task_notifier()
+        notifier.task_progress.connect(self.on_task_progress)
+        notifier.task_finished.connect(self.on_task_finished)
+
+    def on_task_progress(self, task):
+        self.statusBar().showMessage(f"[{task['host']}] {task['label']}: {task['state']} {task['percent']}%")
+
+    def on_task_finished(self, task):
+        result = "완료" if task['succeeded'] else f"실패 ({task['state']})"
+        message = f"[{task['host']}] {task['label']} {result}"
+        if task['message']:
+            message += f" - {task['message']}"
+        self.statusBar().showMessage(message, 30000)
+        if not task['succeeded']:
+            logger.warning(f"작업 실패: {message}")
+
     def refresh_server_list(self):
         """서버 목록을 새로고침"""
         try:
@@ -0,0 +1,219 @@
+import json
+import mmap
+import os
+import re
+import threading
+
+from config.system.app_config import ResourceManager
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+REGISTRY_FORMAT_VERSION = 1
+BIOS_REGISTRY_ID = 'BiosAttributeRegistry'
+NIC_REGISTRY_ID = 'NetworkAttributesRegistry'
+MAX_TOOLTIP_VALUES = 12  # 툴팁에 표시할 허용 값 개수
+
+def _safe_name(text):
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', str(text)).strip('_') or 'unknown'
+
+def registry_attributes(registry):
+    """Redfish AttributeRegistry 문서의 속성 목록"""
+    return (registry.get('RegistryEntries') or {}).get('Attributes') or []
+
+def nic_registry_version(adapter):
+    """NIC 레지스트리 캐시 버전 (어댑터 모델 + 펌웨어 버전, 알 수 없으면 None)"""
+    controllers = adapter.get('Controllers') or [{}]
+    firmware = controllers[0].get('FirmwarePackageVersion')
+    if not firmware:
+        return None
+    return f"{adapter.get('Model') or adapter.get('Manufacturer') or adapter.get('Id', '')}_{firmware}"
+
+class _StoredRegistry:
+    """디스크에 저장된 레지스트리 하나 (속성별 오프셋 색인 + mmap 본문)"""
+
+    def __init__(self, data_path, offsets):
+        self.data_path = data_path
+        self.offsets = offsets  # 속성 이름 -> [오프셋, 길이]
+        self._map = None
+        self._file = None
+        self._attributes = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        if name in self._attributes:
+            return self._attributes[name]
+        position = self.offsets.get(name)
+        if position is None:
+            return None
+        offset, length = position
+        with self._lock:
+            if self._map is None:
+                self._file = open(self.data_path, 'rb')
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            data = self._map[offset:offset + length]
+        attribute = json.loads(data.decode('utf-8'))
+        self._attributes[name] = attribute
+        return attribute
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+class AttributeRegistryCache:
+    """BIOS/NIC 속성 레지스트리 디스크 캐시 (레지스트리 ID + 펌웨어 버전별)
+
+    레지스트리는 수백 KB 크기지만 같은 펌웨어 버전이면 내용이 같으므로, 한 번
+    받은 문서를 모든 서버가 함께 씁니다. 저장할 때 속성 하나를 한 줄(JSON)로
+    쓰고 이름별 [오프셋, 길이] 색인을 따로 두어, 조회 시에는 색인만 읽고 필요한
+    속성만 mmap에서 꺼냅니다. 저장된 파일은 바뀌지 않으므로 무효화가 필요 없고,
+    같은 키를 여러 스레드가 동시에 요청해도 네트워크 조회는 한 번만 합니다.
+    """
+
+    DIR_NAME = 'attribute_registries'
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir
+        self._registries = {}  # 키 -> _StoredRegistry
+        self._unavailable = set()  # 이번 실행에서 조회에 실패한 키
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is None:
+            self._cache_dir = str(ResourceManager.get_cache_dir() / self.DIR_NAME)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        return self._cache_dir
+
+    @staticmethod
+    def key(registry_id, version):
+        return f"{_safe_name(registry_id)}__{_safe_name(version)}"
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.jsonl", f"{base}.idx.json"
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def view(self, registry_id, version, fetch_func=None):
+        """레지스트리 조회기 (없으면 fetch_func()로 받아 저장, 받을 수 없으면 None)"""
+        if not version:
+            return None
+        key = self.key(registry_id, version)
+        registry = self._registries.get(key)
+        if registry is None:
+            with self._key_lock(key):
+                registry = self._registries.get(key) or self._load(key)
+                if registry is None and fetch_func is not None and key not in self._unavailable:
+                    registry = self._fetch_and_store(key, fetch_func)
+        return RegistryView(registry) if registry is not None else None
+
+    def _load(self, key):
+        data_path, index_path = self._paths(key)
+        if not (os.path.exists(data_path) and os.path.exists(index_path)):
+            return None
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('format') != REGISTRY_FORMAT_VERSION:
+                return None
+            registry = _StoredRegistry(data_path, index.get('offsets', {}))
+            self._registries[key] = registry
+            return registry
+        except Exception as e:
+            logger.error(f"속성 레지스트리 색인 읽기 실패 ({key}): {str(e)}")
+            return None
+
+    def _fetch_and_store(self, key, fetch_func):
+        try:
+            document = fetch_func()
+            if not document or not registry_attributes(document):
+                raise ValueError("레지스트리에 속성 정보가 없습니다.")
+            self.store(key, document)
+            logger.info(f"속성 레지스트리 캐시 저장: {key} (속성 {len(registry_attributes(document))}개)")
+            return self._load(key)
+        except Exception as e:
+            self._unavailable.add(key)
+            logger.warning(f"속성 레지스트리 조회 실패 ({key}): {str(e)}")
+            return None
+
+    def store(self, key, document):
+        """레지스트리 문서를 속성별 한 줄 JSON과 오프셋 색인으로 저장"""
+        data_path, index_path = self._paths(key)
+        offsets = {}
+        temp_data = f"{data_path}.tmp"
+        with open(temp_data, 'wb') as f:
+            for attribute in registry_attributes(document):
+                name = attribute.get('AttributeName')
+                if not name:
+                    continue
+                line = json.dumps(attribute, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                offsets[name] = [f.tell(), len(line)]
+                f.write(line + b'\n')
+        index = {
+            'format': REGISTRY_FORMAT_VERSION,
+            'registry_id': document.get('Id', ''),
+            'registry_version': document.get('RegistryVersion', ''),
+            'offsets': offsets,
+        }
+        temp_index = f"{index_path}.tmp"
+        with open(temp_index, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+        # 색인이 마지막에 생기므로 중간에 중단돼도 불완전한 캐시를 읽지 않음
+        os.replace(temp_data, data_path)
+        os.replace(temp_index, index_path)
+
+    def clear(self):
+        """메모리에 열어 둔 레지스트리 해제 (디스크 캐시는 유지)"""
+        with self._lock:
+            for registry in self._registries.values():
+                registry.close()
+            self._registries.clear()
+            self._unavailable.clear()
+
+class RegistryView:
+    """레지스트리 하나의 속성 메타데이터 조회"""
+
+    def __init__(self, registry):
+        self._registry = registry
+
+    def get(self, name):
+        """속성 정의 (AttributeName, DisplayName, HelpText, Type, Value 등) 또는 None"""
+        return self._registry.get(name)
+
+    def __contains__(self, name):
+        return name in self._registry.offsets
+
+    def allowed_values(self, name):
+        attribute = self.get(name) or {}
+        return [value.get('ValueDisplayName') or value.get('ValueName', '') for value in attribute.get('Value') or []]
+
+    def describe(self, name):
+        """툴팁용 설명 (표시 이름, 도움말, 허용 값/범위, 읽기 전용 여부)"""
+        attribute = self.get(name)
+        if not attribute:
+            return ''
+        lines = []
+        if attribute.get('DisplayName'):
+            lines.append(attribute['DisplayName'])
+        if attribute.get('HelpText'):
+            lines.append(attribute['HelpText'])
+        values = self.allowed_values(name)
+        if values:
+            shown = ', '.join(values[:MAX_TOOLTIP_VALUES])
+            more = f" 외 {len(values) - MAX_TOOLTIP_VALUES}개" if len(values) > MAX_TOOLTIP_VALUES else ''
+            lines.append(f"허용 값: {shown}{more}")
+        elif attribute.get('LowerBound') is not None or attribute.get('UpperBound') is not None:
+            lines.append(f"범위: {attribute.get('LowerBound', '')} ~ {attribute.get('UpperBound', '')}")
+        if attribute.get('ReadOnly'):
+            lines.append("읽기 전용")
+        return '\n'.join(lines)
+
+# 전역 인스턴스
+attribute_registry_cache = AttributeRegistryCache()
@@ -3,6 +3,13 @@ from config.system.log_config import setup_logging
 
 logger = setup_logging()
 
+# set_all 명령과 같은 목표 BIOS 값 (Redfish 속성 이름 기준, BIOS 프로파일 적용에 사용)
+BIOS_PROFILE = {
+    "LogicalProc": "Disabled",
+    "BootMode": "Bios",
+    "SysProfile": "PerfOptimized",
+}
+
 class Cafe24Manager:
     def __init__(self):
         self.commands = {
@@ -0,0 +1,204 @@
+import csv
+import importlib.util
+import os
+from itertools import chain, islice
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+EXPORT_BATCH_SIZE = 1000  # 한 번에 기록/진행률 보고할 행 수
+# Parquet은 pyarrow가 설치된 경우에만 저장 대화상자에 표시 (배포 패키지에는 포함하지 않음)
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+EXPORT_FORMATS = "Excel 파일 (*.xlsx);;CSV 파일 (*.csv)" + (";;Parquet 파일 (*.parquet)" if PARQUET_AVAILABLE else "")
+
+class ExportCancelled(Exception):
+    """사용자가 내보내기를 취소한 경우"""
+
+class ExportSheet:
+    """내보낼 시트 하나의 정의
+
+    rows는 행(리스트/튜플)을 생성하는 이터러블이며 한 번만 순회합니다.
+    write-only 모드에서는 시트를 다 쓴 뒤 열 너비를 계산할 수 없으므로
+    column_widths를 미리 지정합니다.
+    """
+
+    def __init__(self, title, headers, rows, total=None, column_widths=None,
+                 is_section=None, bordered=False, centered=False):
+        self.title = title
+        self.headers = list(headers) if headers else []
+        self.rows = rows
+        self.total = total  # 진행률 계산용 전체 행 수 (모르면 None)
+        self.column_widths = column_widths
+        self.is_section = is_section  # 섹션 제목 행 판별 함수 (굵게 + 배경색)
+        self.bordered = bordered
+        self.centered = centered
+
+def estimate_column_widths(headers, rows, min_width=8, max_width=80):
+    """이미 메모리에 있는 작은 데이터의 열 너비 계산 (한글은 1.5배 폭)"""
+    widths = [len(str(header)) for header in headers]
+    for row in rows:
+        for index, value in enumerate(row):
+            text = '' if value is None else str(value)
+            length = sum(2 if ord(c) > 127 else 1 for c in text)
+            if index >= len(widths):
+                widths.append(length)
+            elif length > widths[index]:
+                widths[index] = length
+    return [min(max(width + 2, min_width), max_width) for width in widths]
+
+def _iter_batches(rows):
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, EXPORT_BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+def _sheet_path(file_path, index, sheet):
+    """CSV/Parquet은 시트마다 별도 파일 (첫 시트는 지정한 파일명 그대로)"""
+    if index == 0:
+        return file_path
+    stem, ext = os.path.splitext(file_path)
+    return f"{stem}_{sheet.title}{ext}"
+
+class _Progress:
+    def __init__(self, sheets, progress_callback, is_cancelled):
+        self.total = sum(sheet.total or 0 for sheet in sheets)
+        self.done = 0
+        self.progress_callback = progress_callback
+        self.is_cancelled = is_cancelled
+
+    def advance(self, count):
+        self.done += count
+        if self.is_cancelled and self.is_cancelled():
+            raise ExportCancelled("내보내기가 취소되었습니다.")
+        if self.progress_callback:
+            self.progress_callback(self.done, max(self.total, self.done))
+
+def _export_xlsx(file_path, sheets, progress):
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+
+    bold = Font(bold=True)
+    border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                    top=Side(style='thin'), bottom=Side(style='thin'))
+    section_fill = PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
+    center = Alignment(horizontal='center', vertical='center')
+
+    # write-only 워크북은 행을 바로 임시 파일로 내보내므로 메모리 사용량이 행 수와 무관
+    wb = openpyxl.Workbook(write_only=True)
+    for sheet in sheets:
+        ws = wb.create_sheet(title=sheet.title[:31])
+        for index, width in enumerate(sheet.column_widths or [], 1):
+            ws.column_dimensions[get_column_letter(index)].width = width
+
+        def make_cell(value, font=None, fill=None):
+            cell = WriteOnlyCell(ws, value=value)
+            if font is not None:
+                cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            if sheet.bordered:
+                cell.border = border
+            if sheet.centered:
+                cell.alignment = center
+            return cell
+
+        if sheet.headers:
+            header_row = []
+            for header in sheet.headers:
+                cell = make_cell(header, bold)
+                cell.border = border
+                if not sheet.centered:
+                    cell.alignment = Alignment(horizontal='center')
+                header_row.append(cell)
+            ws.append(header_row)
+
+        for batch in _iter_batches(sheet.rows):
+            for row in batch:
+                if sheet.is_section and sheet.is_section(row):
+                    ws.append([make_cell(value, bold, section_fill) for value in row])
+                elif sheet.bordered or sheet.centered:
+                    ws.append([make_cell(value) for value in row])
+                else:
+                    ws.append(list(row))
+            progress.advance(len(batch))
+
+    wb.save(file_path)
+    return [file_path]
+
+def _export_csv(file_path, sheets, progress):
+    written = []
+    for index, sheet in enumerate(sheets):
+        path = _sheet_path(file_path, index, sheet)
+        # Excel에서 한글이 깨지지 않도록 BOM 포함
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            if sheet.headers:
+                writer.writerow(sheet.headers)
+            for batch in _iter_batches(sheet.rows):
+                writer.writerows(batch)
+                progress.advance(len(batch))
+        written.append(path)
+    return written
+
+def _export_parquet(file_path, sheets, progress):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow 패키지가 필요합니다.")
+
+    written = []
+    for index, sheet in enumerate(sheets):
+        path = _sheet_path(file_path, index, sheet)
+        batches = _iter_batches(sheet.rows)
+        first_batch = next(batches, [])
+        headers = sheet.headers
+        if not headers:
+            # 헤더 없는 시트(제목 행이 데이터에 포함된 경우)는 첫 배치의 행 너비로 열 구성
+            width = max((len(row) for row in first_batch), default=0)
+            headers = [f"열{number}" for number in range(1, width + 1)]
+        schema = pa.schema([(str(header), pa.string()) for header in headers])
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch in chain([first_batch] if first_batch else [], batches):
+                columns = [[] for _ in headers]
+                for row in batch:
+                    # 짧은 행은 빈 값으로 채워 열 길이를 맞춤
+                    for column, value in zip(columns, list(row) + [None] * len(headers)):
+                        column.append(None if value is None else str(value))
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+                progress.advance(len(batch))
+        written.append(path)
+    return written
+
+def export_sheets(file_path, sheets, progress_callback=None, is_cancelled=None):
+    """시트 목록을 파일 확장자에 맞는 형식(.xlsx/.csv/.parquet)으로 스트리밍 기록
+
+    각 시트의 행은 EXPORT_BATCH_SIZE 단위로 기록하며, 배치마다
+    progress_callback(완료 행 수, 전체 행 수)를 호출하고 is_cancelled()가
+    True이면 ExportCancelled를 발생시킵니다. 기록한 파일 경로 목록을 반환합니다.
+    """
+    progress = _Progress(sheets, progress_callback, is_cancelled)
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == '.csv':
+        written = _export_csv(file_path, sheets, progress)
+    elif ext == '.parquet':
+        written = _export_parquet(file_path, sheets, progress)
+    else:
+        written = _export_xlsx(file_path, sheets, progress)
+    logger.info(f"내보내기 완료: {', '.join(written)} ({progress.done}행)")
+    return written
+
+def ensure_export_extension(file_path, selected_filter=''):
+    """확장자가 없으면 선택한 파일 형식에 맞는 확장자 추가"""
+    if os.path.splitext(file_path)[1].lower() in ('.xlsx', '.csv', '.parquet'):
+        return file_path
+    if 'csv' in selected_filter.lower():
+        return file_path + '.csv'
+    if 'parquet' in selected_filter.lower():
+        return file_path + '.parquet'
+    return file_path + '.xlsx'
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from config.system.app_config import ResourceManager
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+FIRMWARE_JOB_TYPES = ('FirmwareUpdate', 'FirmwareRollback', 'RepositoryUpdate')
+TERMINAL_JOB_STATES = ('Completed', 'CompletedWithErrors', 'Failed', 'Failure', 'Killed', 'Cancelled',
+                       'RebootCompleted', 'RebootFailed')
+
+def is_firmware_job(job):
+    """펌웨어 업데이트/롤백 작업 여부"""
+    if job.get('JobType') in FIRMWARE_JOB_TYPES:
+        return True
+    name = job.get('Name', '').lower()
+    return 'firmware' in name or 'update' in name or 'rollback' in name
+
+class FirmwareInventoryCache:
+    """서비스 태그별 펌웨어 인벤토리 캐시
+
+    항목마다 조회 당시의 iDRAC/BIOS 펌웨어 버전(signature)을 함께 저장하고,
+    버전이 달라졌거나 해당 서버의 펌웨어 작업이 완료되면 무효화합니다.
+    메모리와 캐시 디렉토리(JSON)에 함께 보관하므로 프로그램을 다시 시작해도
+    재사용되며, 여러 서버의 인벤토리를 비교하는 기능에서도 사용합니다.
+    """
+
+    DIR_NAME = 'firmware_inventory'
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._running_jobs = set()  # (호스트, 작업 ID) - 진행 중으로 확인된 펌웨어 작업
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is None:
+            self._cache_dir = str(ResourceManager.get_cache_dir() / self.DIR_NAME)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        return self._cache_dir
+
+    def _path(self, service_tag):
+        return os.path.join(self.cache_dir, f"{service_tag}.json")
+
+    def _load(self, service_tag):
+        entry = self._entries.get(service_tag)
+        if entry is None:
+            path = self._path(service_tag)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        entry = json.load(f)
+                    self._entries[service_tag] = entry
+                except Exception as e:
+                    logger.error(f"펌웨어 인벤토리 캐시 읽기 실패 ({service_tag}): {str(e)}")
+        return entry
+
+    def get(self, service_tag, signature=None):
+        """캐시된 컴포넌트 목록 반환 (signature가 다르면 무효화 후 None)"""
+        if not service_tag or service_tag == 'None':
+            return None
+        with self._lock:
+            entry = self._load(service_tag)
+            if entry is None:
+                return None
+            if signature is not None and entry.get('signature') != signature:
+                logger.info(f"펌웨어 버전 변경으로 인벤토리 캐시 무효화: {service_tag}")
+                self._remove(service_tag)
+                return None
+            return entry['components']
+
+    def store(self, service_tag, components, signature=None, host=None, model=None):
+        # 서비스 태그를 읽지 못한 서버('None')는 다른 서버와 섞이지 않도록 저장하지 않음
+        if not service_tag or service_tag == 'None':
+            return
+        entry = {
+            'service_tag': service_tag,
+            'host': host,
+            'model': model,
+            'signature': signature,
+            'fetched_at': time.time(),
+            'components': components,
+        }
+        with self._lock:
+            self._entries[service_tag] = entry
+            try:
+                path = self._path(service_tag)
+                with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(f"{path}.tmp", path)
+            except Exception as e:
+                logger.error(f"펌웨어 인벤토리 캐시 저장 실패 ({service_tag}): {str(e)}")
+
+    def _remove(self, service_tag):
+        self._entries.pop(service_tag, None)
+        try:
+            os.remove(self._path(service_tag))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"펌웨어 인벤토리 캐시 삭제 실패 ({service_tag}): {str(e)}")
+
+    def invalidate(self, service_tag=None, host=None):
+        """서비스 태그 또는 호스트(IP)의 캐시 삭제 (둘 다 없으면 전체)"""
+        with self._lock:
+            if service_tag:
+                self._remove(service_tag)
+                return
+            for entry in self.iter_entries(locked=True):
+                if host is None or entry.get('host') == host:
+                    self._remove(entry['service_tag'])
+
+    def note_job(self, host, job):
+        """작업 상태 관찰 - 진행 중으로 본 펌웨어 작업이 끝나면 해당 서버 캐시 무효화 (무효화했으면 True)"""
+        if not job or not is_firmware_job(job):
+            return False
+        key = (host, job.get('Id'))
+        if job.get('JobState') in TERMINAL_JOB_STATES:
+            if key in self._running_jobs:
+                self._running_jobs.discard(key)
+                logger.info(f"펌웨어 작업 완료로 인벤토리 캐시 무효화: {host} {job.get('Id')}")
+                self.invalidate(host=host)
+                return True
+        else:
+            self._running_jobs.add(key)
+        return False
+
+    def iter_entries(self, locked=False):
+        """저장된 모든 서버의 캐시 항목"""
+        entries = []
+        for name in sorted(os.listdir(self.cache_dir)):
+            if not name.endswith('.json'):
+                continue
+            service_tag = name[:-5]
+            if locked:
+                entry = self._load(service_tag)
+            else:
+                with self._lock:
+                    entry = self._load(service_tag)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+class FirmwarePackageCache:
+    """펌웨어 패키지(DUP) 해시와 서버별 스테이징 기록
+
+    패키지 SHA-256은 경로/크기/수정 시각이 같으면 다시 계산하지 않고, 업로드 후
+    iDRAC에 'Available-' 항목으로 남은 패키지는 호스트별로 해시와 연결해 둡니다.
+    같은 패키지를 다시 보낼 때 이 기록으로 재업로드 없이 설치할 수 있습니다.
+    """
+
+    FILE_NAME = 'firmware_packages.json'
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path=None):
+        self._path = path
+        self._data = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        if self._path is None:
+            self._path = str(ResourceManager.get_cache_dir() / self.FILE_NAME)
+        return self._path
+
+    def _load(self):
+        if self._data is None:
+            self._data = {'digests': {}, 'staged': {}}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._data.update(json.load(f))
+                except Exception as e:
+                    logger.error(f"펌웨어 패키지 캐시 읽기 실패: {str(e)}")
+        return self._data
+
+    def _save(self):
+        try:
+            with open(f"{self.path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(f"{self.path}.tmp", self.path)
+        except Exception as e:
+            logger.error(f"펌웨어 패키지 캐시 저장 실패: {str(e)}")
+
+    def digest(self, file_path):
+        """패키지 SHA-256 (파일을 청크 단위로 읽으며, 경로+크기+수정 시각으로 캐시)"""
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        with self._lock:
+            cached = self._load()['digests'].get(file_path)
+            if cached and cached.get('stamp') == stamp:
+                return cached['sha256']
+
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                sha256.update(chunk)
+        value = sha256.hexdigest()
+
+        with self._lock:
+            self._load()['digests'][file_path] = {'stamp': stamp, 'sha256': value}
+            self._save()
+        return value
+
+    def staged(self, host, sha256):
+        """호스트에 스테이징된 것으로 기록된 패키지 정보 (없으면 None)"""
+        with self._lock:
+            return self._load()['staged'].get(host, {}).get(sha256)
+
+    def remember_staged(self, host, sha256, uri, file_name=None):
+        with self._lock:
+            self._load()['staged'].setdefault(host, {})[sha256] = {
+                'uri': uri,
+                'file_name': file_name,
+                'staged_at': time.time(),
+            }
+            self._save()
+
+    def forget_staged(self, host, sha256):
+        with self._lock:
+            if self._load()['staged'].get(host, {}).pop(sha256, None) is not None:
+                self._save()
+
+# 전역 인스턴스
+firmware_inventory_cache = FirmwareInventoryCache()
+firmware_package_cache = FirmwarePackageCache()
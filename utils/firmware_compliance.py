@@ -0,0 +1,314 @@
+import gzip
+import json
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+
+from config.system.app_config import ResourceManager
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+INDEX_FORMAT_VERSION = 1
+_VERSION_PART = re.compile(r'\d+|[A-Za-z]+')
+
+# 비교 결과 상태
+STATUS_OUTDATED = '업데이트 필요'
+STATUS_CURRENT = '최신'
+STATUS_NEWER = '카탈로그보다 최신'
+STATUS_UNKNOWN = '카탈로그 없음'
+
+# 보고서 필터/표시용 심각도 (EventLogModel 색상 규칙과 동일)
+STATUS_SEVERITY = {
+    STATUS_OUTDATED: 'Warning',
+    STATUS_CURRENT: 'OK',
+    STATUS_NEWER: 'OK',
+    STATUS_UNKNOWN: 'N/A',
+}
+
+def version_key(version):
+    """Dell 버전 문자열 비교 키 ('2.19.1', '6.10.30.20', 'A07' 등)
+
+    숫자 부분은 숫자로, 문자 부분은 문자열로 비교합니다.
+    """
+    return tuple((0, int(part), '') if part.isdigit() else (1, 0, part.upper())
+                 for part in _VERSION_PART.findall(version or ''))
+
+def normalize_model(model):
+    """'PowerEdge R740' / 'R740' -> 'R740'"""
+    model = (model or '').upper().replace('POWEREDGE', '')
+    return re.sub(r'\s+', '', model)
+
+def _pci_key(vendor_id, device_id, sub_vendor_id, sub_device_id):
+    return 'pci:' + ':'.join((value or '').lower().lstrip('0') or '0'
+                             for value in (vendor_id, device_id, sub_vendor_id, sub_device_id))
+
+def inventory_component_keys(component):
+    """FirmwareInventory 항목의 카탈로그 조회 키 (컴포넌트 ID 우선, PCI ID 보조)"""
+    dell = component.get('Oem', {}).get('Dell', {}).get('DellSoftwareInventory', {}) or {}
+    keys = []
+    component_id = dell.get('ComponentID') or component.get('SoftwareId')
+    if component_id and str(component_id) != '0':
+        keys.append(f"id:{component_id}")
+    if dell.get('DeviceID'):
+        keys.append(_pci_key(dell.get('VendorID'), dell.get('DeviceID'),
+                             dell.get('SubVendorID'), dell.get('SubDeviceID')))
+    return keys
+
+def component_category(component):
+    """BIOS / iDRAC / RAID / NIC / 기타 분류 (펌웨어 정보 화면과 같은 기준)"""
+    component_id = component.get('Id', '')
+    name = component.get('Name', '')
+    if 'BIOS' in component_id:
+        return 'BIOS'
+    if 'iDRAC' in component_id:
+        return 'iDRAC'
+    if 'PERC' in name or 'RAID' in component_id:
+        return 'RAID'
+    if 'NIC' in component_id:
+        return 'NIC'
+    return '기타'
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def _open_catalog(path):
+    return gzip.open(path, 'rb') if path.lower().endswith('.gz') else open(path, 'rb')
+
+class CatalogIndex:
+    """Dell Catalog.xml에서 추출한 모델별/컴포넌트별 최신 버전 색인
+
+    카탈로그는 iterparse로 SoftwareComponent 단위로 읽고 바로 해제하므로
+    수백 MB 파일도 메모리에 전부 올리지 않습니다. 색인은 캐시 디렉토리에
+    JSON으로 저장하고, 카탈로그 파일의 크기/수정 시각이 같으면 다시 파싱하지
+    않습니다.
+
+    index: {정규화 모델명: {조회 키: [버전, 이름, 컴포넌트 종류, 배포일, 경로, 중요도]}}
+    """
+
+    INDEX_NAME = 'firmware_catalog_index.json'
+
+    def __init__(self, index_path=None):
+        self._index_path = index_path
+        self.catalog_path = None
+        self.catalog_stat = None
+        self.catalog_version = None
+        self.index = {}
+
+    @property
+    def index_path(self):
+        if self._index_path is None:
+            self._index_path = str(ResourceManager.get_cache_dir() / self.INDEX_NAME)
+        return self._index_path
+
+    @staticmethod
+    def _stat(path):
+        stat = os.stat(path)
+        return [stat.st_size, int(stat.st_mtime)]
+
+    def load(self):
+        """저장된 색인 읽기 (없으면 False)"""
+        if not os.path.exists(self.index_path):
+            return False
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != INDEX_FORMAT_VERSION:
+                return False
+            self.catalog_path = data.get('catalog_path')
+            self.catalog_stat = data.get('catalog_stat')
+            self.catalog_version = data.get('catalog_version')
+            self.index = data.get('index', {})
+            return True
+        except Exception as e:
+            logger.error(f"카탈로그 색인 읽기 실패: {str(e)}")
+            return False
+
+    def save(self):
+        data = {
+            'format': INDEX_FORMAT_VERSION,
+            'catalog_path': self.catalog_path,
+            'catalog_stat': self.catalog_stat,
+            'catalog_version': self.catalog_version,
+            'index': self.index,
+        }
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.index_path)
+
+    def is_current(self, catalog_path):
+        """색인이 해당 카탈로그 파일로 만든 최신 상태인지"""
+        try:
+            return (self.index and self.catalog_path == os.path.abspath(catalog_path)
+                    and self.catalog_stat == self._stat(catalog_path))
+        except OSError:
+            return False
+
+    def load_or_build(self, catalog_path, progress_callback=None):
+        """저장된 색인이 같은 카탈로그로 만든 것이면 재사용, 아니면 새로 파싱"""
+        if (self.index or self.load()) and self.is_current(catalog_path):
+            return self
+        self.build(catalog_path, progress_callback)
+        return self
+
+    def build(self, catalog_path, progress_callback=None):
+        """카탈로그 스트리밍 파싱 (progress_callback(읽은 바이트, 전체 바이트))"""
+        started = time.time()
+        total_size = os.path.getsize(catalog_path)
+        index = {}
+        count = 0
+        catalog_version = None
+
+        with _open_catalog(catalog_path) as raw:
+            context = ET.iterparse(raw, events=('start', 'end'))
+            root = None
+            for event, elem in context:
+                if root is None:
+                    root = elem
+                    catalog_version = elem.get('version')
+                    continue
+                if event != 'end' or _local_name(elem.tag) != 'SoftwareComponent':
+                    continue
+
+                self._index_component(index, elem)
+                count += 1
+                # 처리한 컴포넌트는 바로 해제해 메모리 사용량 유지
+                elem.clear()
+                root.clear()
+                if progress_callback and count % 500 == 0:
+                    position = raw.fileobj.tell() if hasattr(raw, 'fileobj') else raw.tell()
+                    progress_callback(min(position, total_size), total_size)
+
+        self.catalog_path = os.path.abspath(catalog_path)
+        self.catalog_stat = self._stat(catalog_path)
+        self.catalog_version = catalog_version
+        self.index = index
+        self.save()
+        if progress_callback:
+            progress_callback(total_size, total_size)
+        logger.info(f"카탈로그 색인 생성 완료: 컴포넌트 {count}개, 모델 {len(index)}개 ({time.time() - started:.1f}초)")
+        return self
+
+    @staticmethod
+    def _index_component(index, elem):
+        version = elem.get('vendorVersion') or elem.get('dellVersion')
+        if not version:
+            return
+
+        name = ''
+        component_type = ''
+        keys = []
+        models = []
+        for child in elem:
+            tag = _local_name(child.tag)
+            if tag == 'Name':
+                display = child.find('.//{*}Display')
+                name = (display.text or '').strip() if display is not None else ''
+            elif tag == 'ComponentType':
+                component_type = child.get('value', '')
+            elif tag == 'SupportedDevices':
+                for device in child.iter():
+                    if _local_name(device.tag) == 'Device' and device.get('componentID'):
+                        keys.append(f"id:{device.get('componentID')}")
+                    elif _local_name(device.tag) == 'PCIInfo':
+                        keys.append(_pci_key(device.get('vendorID'), device.get('deviceID'),
+                                             device.get('subVendorID'), device.get('subDeviceID')))
+            elif tag == 'SupportedSystems':
+                for model in child.iter():
+                    if _local_name(model.tag) == 'Model':
+                        display = model.find('{*}Display')
+                        if display is not None and display.text:
+                            models.append(normalize_model(display.text))
+
+        if not keys or not models:
+            return
+        criticality = elem.find('{*}Criticality')
+        record = [version, name, component_type, elem.get('releaseDate', ''), elem.get('path', ''),
+                  criticality.get('value', '') if criticality is not None else '']
+        new_key = version_key(version)
+        for model in models:
+            model_index = index.setdefault(model, {})
+            for key in keys:
+                current = model_index.get(key)
+                if current is None or version_key(current[0]) < new_key:
+                    model_index[key] = record
+
+    def lookup(self, model, component):
+        """인벤토리 항목에 해당하는 카탈로그 최신 항목 (없으면 None)"""
+        model_index = self.index.get(normalize_model(model))
+        if not model_index:
+            return None
+        for key in inventory_component_keys(component):
+            record = model_index.get(key)
+            if record is not None:
+                return record
+        return None
+
+def compare_inventory(catalog, entry, server_name=None, categories=None):
+    """서버 한 대의 캐시된 인벤토리와 카탈로그 비교 결과 행 목록"""
+    rows = []
+    for component in entry.get('components', []):
+        # 설치된 버전만 비교 (Previous-는 롤백용 이전 버전)
+        if not component.get('Id', '').startswith('Installed-'):
+            continue
+        category = component_category(component)
+        if categories and category not in categories:
+            continue
+        installed = component.get('Version', '')
+        record = catalog.lookup(entry.get('model'), component)
+        if record is None:
+            status = STATUS_UNKNOWN
+            latest = ''
+        else:
+            latest = record[0]
+            installed_key, latest_key = version_key(installed), version_key(latest)
+            if installed_key < latest_key:
+                status = STATUS_OUTDATED
+            elif installed_key > latest_key:
+                status = STATUS_NEWER
+            else:
+                status = STATUS_CURRENT
+        rows.append({
+            'Server': server_name or entry.get('service_tag', ''),
+            'ServiceTag': entry.get('service_tag', ''),
+            'Model': entry.get('model', ''),
+            'Category': category,
+            'Component': component.get('Name', ''),
+            'Installed': installed,
+            'Latest': latest,
+            'Status': status,
+            'Severity': STATUS_SEVERITY[status],
+            'Criticality': record[5] if record else '',
+            'ReleaseDate': record[3] if record else '',
+            'Path': record[4] if record else '',
+            'InventoryAge': entry.get('fetched_at'),
+        })
+    return rows
+
+def build_compliance_report(catalog, entries, server_names=None, categories=None):
+    """여러 서버의 비교 결과 (행 목록, 서버별 요약)
+
+    server_names: {호스트(IP:포트) 또는 서비스 태그: 표시 이름}
+    """
+    server_names = server_names or {}
+    rows = []
+    summary = []
+    for entry in entries:
+        name = server_names.get(entry.get('host')) or server_names.get(entry.get('service_tag'))
+        server_rows = compare_inventory(catalog, entry, name, categories)
+        rows.extend(server_rows)
+        counts = {status: 0 for status in STATUS_SEVERITY}
+        for row in server_rows:
+            counts[row['Status']] += 1
+        summary.append({
+            'Server': name or entry.get('service_tag', ''),
+            'ServiceTag': entry.get('service_tag', ''),
+            'Model': entry.get('model', ''),
+            'Outdated': counts[STATUS_OUTDATED],
+            'Current': counts[STATUS_CURRENT] + counts[STATUS_NEWER],
+            'Unknown': counts[STATUS_UNKNOWN],
+        })
+    summary.sort(key=lambda item: (-item['Outdated'], item['Server']))
+    return rows, summary
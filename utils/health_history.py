@@ -0,0 +1,309 @@
+import sqlite3
+import threading
+import time
+
+from config.system.app_config import ResourceManager
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+RETENTION_DAYS = 365  # 이력 보관 기간
+MAX_GAP_SECONDS = 6 * 3600  # 이 시간 이상 관측이 없으면 같은 값이라도 새 구간으로 기록
+LIFE_LEFT_WARNING = 10  # 예상 수명 잔여율 경고 기준(%)
+LIFE_DROP_WARNING = 5  # 조회 기간 내 수명 잔여율 감소 경고 기준(%p)
+
+HEALTH_LEVELS = ['OK', 'Warning', 'Critical']
+
+# 지표 이름 -> 표시 이름
+METRIC_LABELS = {
+    'health': '상태',
+    'state': '동작 상태',
+    'raid_status': 'RAID 상태',
+    'predicted_life_left': '예상 수명 잔여율(%)',
+    'failure_predicted': '장애 예측',
+    'predictive_failure': '예측 장애 상태',
+    'rebuilding': '리빌딩',
+}
+
+def _dell_oem(resource, name):
+    return resource.get('Oem', {}).get('Dell', {}).get(name, {}) or {}
+
+def _error_counters(oem):
+    """Dell OEM 항목 중 오류 카운터(이름에 Error가 포함된 숫자 값)만 추출"""
+    return {
+        key: value for key, value in oem.items()
+        if 'Error' in key and isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+
+def drive_metrics(drive):
+    """드라이브 리소스에서 기록할 지표 추출 (값이 없는 항목은 제외)"""
+    dell_disk = _dell_oem(drive, 'DellPhysicalDisk')
+    rebuilding = any(op.get('OperationName') == 'Rebuilding' for op in drive.get('Operations', []) or [])
+    metrics = {
+        'health': drive.get('Status', {}).get('Health'),
+        'state': drive.get('Status', {}).get('State'),
+        'raid_status': dell_disk.get('RaidStatus'),
+        'predicted_life_left': drive.get('PredictedMediaLifeLeftPercent'),
+        'failure_predicted': drive.get('FailurePredicted'),
+        'predictive_failure': dell_disk.get('PredictiveFailureState'),
+        'rebuilding': rebuilding or dell_disk.get('RaidStatus') == 'Rebuilding',
+    }
+    metrics.update(_error_counters(dell_disk))
+    return {key: value for key, value in metrics.items() if value is not None}
+
+def memory_metrics(memory):
+    """DIMM 리소스에서 기록할 지표 추출 (값이 없는 항목은 제외)"""
+    status = memory.get('Status', {})
+    metrics = {
+        'health': status.get('Health'),
+        'state': status.get('State'),
+    }
+    metrics.update(_error_counters(_dell_oem(memory, 'DellMemory')))
+    return {key: value for key, value in metrics.items() if value is not None}
+
+def _encode(value):
+    """(저장 문자열, 숫자 값) 변환 - 숫자 지표는 추세 계산을 위해 숫자로도 저장"""
+    if isinstance(value, bool):
+        return ('Yes' if value else 'No'), None
+    if isinstance(value, (int, float)):
+        return str(value), float(value)
+    return str(value), None
+
+class HealthHistoryStore:
+    """서버별 드라이브/DIMM 상태 이력 저장소
+
+    같은 값이 이어지는 동안은 한 행(구간)의 종료 시각과 표본 수만 갱신하는
+    런 렝스 방식으로 저장하므로, 상태가 바뀌지 않으면 주기적으로 조회해도
+    저장 크기가 늘지 않습니다. 각 구간은 (서버, 부품, 지표)별로 관리합니다.
+    """
+
+    DB_NAME = 'health_history.db'
+
+    def __init__(self, db_path=None):
+        self._db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._schema_ready = False
+        self._purged = False
+
+    @property
+    def db_path(self):
+        if self._db_path is None:
+            self._db_path = str(ResourceManager.get_cache_dir() / self.DB_NAME)
+        return self._db_path
+
+    def _connection(self):
+        """스레드별 SQLite 연결"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._schema_ready:
+            self._init_schema(conn)
+        return conn
+
+    def _init_schema(self, conn):
+        with conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY,
+                    server TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    component TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    number REAL,
+                    start_ts INTEGER NOT NULL,
+                    end_ts INTEGER NOT NULL,
+                    samples INTEGER NOT NULL DEFAULT 1
+                );
+                CREATE INDEX IF NOT EXISTS idx_runs_key ON runs(server, component, metric, start_ts);
+                CREATE INDEX IF NOT EXISTS idx_runs_server_ts ON runs(server, start_ts);
+
+                CREATE TABLE IF NOT EXISTS latest (
+                    server TEXT NOT NULL,
+                    component TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    run_id INTEGER NOT NULL,
+                    PRIMARY KEY (server, component, metric)
+                );
+            """)
+        self._schema_ready = True
+
+    # --- 기록 ---
+
+    def record(self, server, kind, samples, ts=None):
+        """관측값 기록
+
+        samples: {부품 ID: {지표: 값}}, kind: 'drive' / 'memory' 등 부품 종류.
+        값이 직전 구간과 같으면 구간을 연장하고, 다르면 새 구간을 시작합니다.
+        """
+        if not server or not samples:
+            return
+        ts = int(ts if ts is not None else time.time())
+        try:
+            with self._write_lock:
+                conn = self._connection()
+                with conn:
+                    for component, metrics in samples.items():
+                        for metric, value in metrics.items():
+                            self._append(conn, server, kind, component, metric, value, ts)
+            if not self._purged:
+                self._purged = True
+                self.purge()
+        except Exception as e:
+            logger.error(f"상태 이력 기록 실패: {str(e)}")
+
+    def _append(self, conn, server, kind, component, metric, value, ts):
+        text, number = _encode(value)
+        row = conn.execute("""
+            SELECT r.id, r.value, r.end_ts FROM latest l JOIN runs r ON r.id = l.run_id
+            WHERE l.server = ? AND l.component = ? AND l.metric = ?
+        """, (server, component, metric)).fetchone()
+
+        if row is not None and row['value'] == text and ts - row['end_ts'] <= MAX_GAP_SECONDS:
+            conn.execute("UPDATE runs SET end_ts = ?, samples = samples + 1 WHERE id = ?",
+                         (max(ts, row['end_ts']), row['id']))
+            return
+
+        if row is not None and row['value'] != text:
+            logger.info(f"상태 변경 감지: {server} {component} {metric} {row['value']} -> {text}")
+        cursor = conn.execute("""
+            INSERT INTO runs (server, kind, component, metric, value, number, start_ts, end_ts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (server, kind, component, metric, text, number, ts, ts))
+        conn.execute("""
+            INSERT OR REPLACE INTO latest (server, component, metric, run_id) VALUES (?, ?, ?, ?)
+        """, (server, component, metric, cursor.lastrowid))
+
+    def purge(self, retention_days=RETENTION_DAYS):
+        """보관 기간이 지난 구간 삭제 (각 지표의 최신 구간은 유지)"""
+        cutoff = int(time.time()) - retention_days * 86400
+        try:
+            with self._write_lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute("""
+                        DELETE FROM runs WHERE end_ts < ? AND id NOT IN (SELECT run_id FROM latest)
+                    """, (cutoff,))
+        except Exception as e:
+            logger.error(f"상태 이력 정리 실패: {str(e)}")
+
+    # --- 조회 ---
+
+    def get_components(self, server, kind=None):
+        """이력이 있는 부품 ID 목록"""
+        query = "SELECT DISTINCT component FROM runs WHERE server = ?"
+        params = [server]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        return [row['component'] for row in self._connection().execute(query + " ORDER BY component", params)]
+
+    def get_metrics(self, server, component):
+        """부품에 기록된 지표 목록"""
+        rows = self._connection().execute(
+            "SELECT DISTINCT metric FROM runs WHERE server = ? AND component = ? ORDER BY metric",
+            (server, component))
+        return [row['metric'] for row in rows]
+
+    def get_runs(self, server, component=None, metric=None, since=None, until=None, kind=None):
+        """조건에 맞는 구간 목록 (시작 시각 순)"""
+        query = "SELECT * FROM runs WHERE server = ?"
+        params = [server]
+        for column, value in (('component', component), ('metric', metric), ('kind', kind)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+        if since is not None:
+            query += " AND end_ts >= ?"
+            params.append(int(since))
+        if until is not None:
+            query += " AND start_ts <= ?"
+            params.append(int(until))
+        query += " ORDER BY component, metric, start_ts"
+        return [dict(row) for row in self._connection().execute(query, params)]
+
+    def get_series(self, server, component, metric, since=None):
+        """차트용 계단형 시계열 [(시각, 값), ...] - 구간마다 시작/종료 두 점"""
+        points = []
+        for run in self.get_runs(server, component, metric, since=since):
+            value = run['number'] if run['number'] is not None else run['value']
+            points.append((run['start_ts'], value))
+            if run['end_ts'] > run['start_ts']:
+                points.append((run['end_ts'], value))
+        return points
+
+    def get_transitions(self, server, since=None, kind=None, metric=None):
+        """값이 바뀐 시점 목록 (최근 순)"""
+        transitions = []
+        previous = {}
+        for run in self.get_runs(server, metric=metric, kind=kind):
+            key = (run['component'], run['metric'])
+            before = previous.get(key)
+            previous[key] = run
+            if before is None or before['value'] == run['value']:
+                continue
+            if since is not None and run['start_ts'] < since:
+                continue
+            transitions.append({
+                'ts': run['start_ts'],
+                'component': run['component'],
+                'kind': run['kind'],
+                'metric': run['metric'],
+                'before': before['value'],
+                'after': run['value'],
+            })
+        transitions.sort(key=lambda item: item['ts'], reverse=True)
+        return transitions
+
+    def detect_trends(self, server, since=None, kind=None):
+        """악화 추세 탐지
+
+        - 상태가 OK에서 Warning/Critical로 바뀐 부품
+        - 예상 수명 잔여율이 기준 이하이거나 기간 내 기준 이상 감소한 드라이브
+          (감소 속도로 소진 예상 일수 추정)
+        - 기간 내 증가한 오류 카운터
+        """
+        findings = []
+        first = {}
+        last = {}
+        for run in self.get_runs(server, since=since, kind=kind):
+            key = (run['component'], run['metric'])
+            first.setdefault(key, run)
+            last[key] = run
+
+        for (component, metric), latest in last.items():
+            earliest = first[(component, metric)]
+            if metric == 'health':
+                if latest['value'] in HEALTH_LEVELS[1:]:
+                    findings.append({
+                        'component': component, 'metric': metric, 'severity': latest['value'],
+                        'message': f"상태 {earliest['value']} -> {latest['value']}",
+                    })
+            elif metric == 'predicted_life_left' and latest['number'] is not None:
+                drop = (earliest['number'] or 0) - latest['number']
+                elapsed = latest['end_ts'] - earliest['start_ts']
+                if latest['number'] <= LIFE_LEFT_WARNING or drop >= LIFE_DROP_WARNING:
+                    message = f"수명 잔여율 {earliest['number']:.0f}% -> {latest['number']:.0f}%"
+                    if drop > 0 and elapsed > 0:
+                        days_left = latest['number'] / (drop / elapsed) / 86400
+                        message += f" (약 {days_left:.0f}일 후 소진 예상)"
+                    severity = 'Critical' if latest['number'] <= LIFE_LEFT_WARNING else 'Warning'
+                    findings.append({'component': component, 'metric': metric,
+                                     'severity': severity, 'message': message})
+            elif 'Error' in metric and latest['number'] is not None:
+                increase = latest['number'] - (earliest['number'] or 0)
+                if increase > 0:
+                    findings.append({
+                        'component': component, 'metric': metric, 'severity': 'Warning',
+                        'message': f"{metric} {increase:.0f} 증가 (현재 {latest['number']:.0f})",
+                    })
+        findings.sort(key=lambda item: (item['severity'] != 'Critical', item['component']))
+        return findings
+
+# 전역 인스턴스
+health_history = HealthHistoryStore()
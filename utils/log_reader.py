@@ -0,0 +1,161 @@
+import os
+import re
+
+from config.system.log_index import INDEX_SUFFIX, SERVER_TABLE_SUFFIX
+
+# 레코드 시작 줄 판별 (텍스트 형식 타임스탬프 또는 JSON 객체)
+_RECORD_START_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - |\{)')
+# 회전 파일 이름에서 기본 로그 이름 추출 (예: 20250107-app.log.1.1 -> app.log)
+_ROTATED_NAME_PATTERN = re.compile(r'^(?:\d{8}-)?(?P<base>.+?\.log)(?:\.\d+)*$')
+
+def get_rotation_family(log_path):
+    """로그 파일과 같은 계열의 회전 파일 목록을 오래된 순으로 반환 (지정한 파일이 마지막)"""
+    log_path = os.path.abspath(log_path)
+    log_dir = os.path.dirname(log_path)
+    match = _ROTATED_NAME_PATTERN.match(os.path.basename(log_path))
+    if not match:
+        return [log_path]
+
+    base_name = match.group('base')
+    selected_mtime = os.path.getmtime(log_path)
+    family = []
+    for name in os.listdir(log_dir):
+        if name.endswith((INDEX_SUFFIX, SERVER_TABLE_SUFFIX)):
+            continue
+        name_match = _ROTATED_NAME_PATTERN.match(name)
+        path = os.path.join(log_dir, name)
+        if not name_match or name_match.group('base') != base_name or path == log_path:
+            continue
+        if os.path.isfile(path) and os.path.getmtime(path) <= selected_mtime:
+            family.append(path)
+
+    family.sort(key=os.path.getmtime)
+    family.append(log_path)
+    return family
+
+class LogTailReader:
+    """로그 파일을 끝에서부터 청크 단위로 역방향으로 읽는 리더
+
+    파일 전체를 읽지 않고 마지막 N개 레코드만 읽으며, 이전 페이지로 계속
+    거슬러 올라갈 수 있습니다. 회전된 파일(app.log.1 등)은 하나의 연속된
+    스트림으로 이어서 읽고, 여러 줄 레코드(트레이스백)는 한 항목으로 묶습니다.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    MAX_FOLLOW_BYTES = 4 * 1024 * 1024  # 실시간 갱신 시 한 번에 읽을 최대 크기
+
+    def __init__(self, log_path, include_rotated=True, chunk_size=None):
+        self.log_path = os.path.abspath(log_path)
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.files = get_rotation_family(self.log_path) if include_rotated else [self.log_path]
+        self._file_index = len(self.files) - 1
+        self._cursor = os.path.getsize(self.log_path)  # 역방향 읽기 위치
+        self._follow_offset = self._cursor  # 순방향(신규 로그) 읽기 위치
+
+    def _iter_lines_reversed(self, path, end):
+        """파일의 end 위치부터 역방향으로 (시작 오프셋, 줄 바이트) 생성"""
+        with open(path, 'rb') as f:
+            pos = end
+            remainder = b''
+            while pos > 0:
+                read_size = min(self.chunk_size, pos)
+                pos -= read_size
+                f.seek(pos)
+                buf = f.read(read_size) + remainder
+                lines = buf.split(b'\n')
+                remainder = lines[0]
+                line_end = pos + len(buf)
+                for line in reversed(lines[1:]):
+                    start = line_end - len(line)
+                    yield start, line
+                    line_end = start - 1
+            if remainder:
+                yield 0, remainder
+
+    @staticmethod
+    def _join_record(lines):
+        return '\n'.join(reversed(lines)) + '\n'
+
+    def has_more(self):
+        """더 거슬러 올라갈 이전 레코드가 있는지 여부"""
+        return self._file_index > 0 or self._cursor > 0
+
+    def tail(self, count):
+        """마지막 count개 레코드를 시간 순으로 반환"""
+        self._file_index = len(self.files) - 1
+        self._cursor = os.path.getsize(self.files[self._file_index])
+        self._follow_offset = self._cursor
+        return self.read_previous(count)
+
+    def read_previous(self, count):
+        """현재 위치 이전의 레코드를 최대 count개 시간 순으로 반환"""
+        records = []
+        pending = []  # 레코드 시작 줄을 만나기 전까지의 연속 줄 (역순)
+
+        while len(records) < count and self._file_index >= 0:
+            path = self.files[self._file_index]
+            exhausted = True
+            try:
+                for start, raw_line in self._iter_lines_reversed(path, self._cursor):
+                    line = raw_line.decode('utf-8', errors='replace').rstrip('\r')
+                    if not line and not pending:
+                        continue
+                    pending.append(line)
+                    if _RECORD_START_PATTERN.match(line):
+                        records.append(self._join_record(pending))
+                        pending = []
+                        self._cursor = start
+                        if len(records) >= count:
+                            exhausted = False
+                            break
+            except OSError:
+                pass  # 회전 중 사라진 파일은 건너뜀
+
+            if exhausted:
+                if pending:
+                    records.append(self._join_record(pending))
+                    pending = []
+                self._file_index -= 1
+                self._cursor = os.path.getsize(self.files[self._file_index]) if self._file_index >= 0 else 0
+
+        records.reverse()
+        return records
+
+    def read_new(self, max_records=None):
+        """마지막으로 읽은 위치 이후 새로 추가된 레코드를 시간 순으로 반환
+
+        파일이 회전되어 크기가 줄어든 경우 처음부터 다시 읽고, 한 번에
+        MAX_FOLLOW_BYTES 이상 늘어난 경우에는 끝부분만 읽습니다.
+        """
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            return []
+        if size < self._follow_offset:
+            self._follow_offset = 0
+        if size == self._follow_offset:
+            return []
+
+        start = max(self._follow_offset, size - self.MAX_FOLLOW_BYTES)
+        with open(self.log_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(size - start)
+
+        # 아직 기록 중인 마지막 줄은 다음 호출에서 읽음
+        last_newline = data.rfind(b'\n')
+        if last_newline < 0:
+            return []
+        data = data[:last_newline + 1]
+        self._follow_offset = start + len(data)
+
+        records = []
+        for line in data.decode('utf-8', errors='replace').split('\n')[:-1]:
+            line = line.rstrip('\r')
+            if records and not _RECORD_START_PATTERN.match(line):
+                records[-1] += line + '\n'
+            elif line:
+                records.append(line + '\n')
+
+        if max_records is not None:
+            records = records[-max_records:]
+        return records
@@ -0,0 +1,334 @@
+import gzip
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+from config.system.app_config import ResourceManager
+from config.system.log_config import TimestampRotatingFileHandler, setup_logging
+from config.system.log_index import (INDEX_SUFFIX, SERVER_TABLE_SUFFIX, TIMESTAMP_FORMAT,
+                                     format_log_entry, parse_log_line)
+
+logger = setup_logging()
+
+BUCKET_SECONDS = 3600  # 역색인 시간 버킷 크기 (1시간)
+MAX_TOKENS_PER_RECORD = 64
+_TOKEN_PATTERN = re.compile(r'[\w.:/-]{2,}')
+_RECORD_START_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - |\{)')
+
+def tokenize(text):
+    """검색용 토큰 추출 (소문자, 중복 제거)"""
+    tokens = []
+    seen = set()
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        token = token.strip('.:/-')
+        if len(token) >= 2 and token not in seen:
+            seen.add(token)
+            tokens.append(token)
+            if len(tokens) >= MAX_TOKENS_PER_RECORD:
+                break
+    return tokens
+
+def _to_epoch(ts):
+    try:
+        return int(datetime.strptime(ts[:19], TIMESTAMP_FORMAT).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+class LogSearchIndex:
+    """로그 디렉토리 전체(회전/압축 파일 포함)에 대한 검색 인덱스
+
+    레코드는 서버/레벨/시간 복합 인덱스로, 메시지 토큰은 (토큰, 시간 버킷)
+    역색인으로 저장합니다. 파일별로 색인한 위치를 기억해 핸들러가 새로 기록한
+    부분만 추가로 색인하며, 회전으로 이름이 바뀐 파일은 inode로 추적합니다.
+    """
+
+    DB_NAME = 'log_search.db'
+    DEBOUNCE_SECONDS = 1.0
+    POLL_SECONDS = 30.0
+
+    def __init__(self, log_dir=None, db_path=None):
+        self._log_dir = log_dir
+        self._db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._schema_ready = False
+
+    @property
+    def log_dir(self):
+        if self._log_dir is None:
+            self._log_dir = str(ResourceManager.get_log_dir())
+        return self._log_dir
+
+    @property
+    def db_path(self):
+        if self._db_path is None:
+            self._db_path = str(ResourceManager.get_cache_dir() / self.DB_NAME)
+        return self._db_path
+
+    def _connection(self):
+        """스레드별 SQLite 연결"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._schema_ready:
+            self._init_schema(conn)
+        return conn
+
+    def _init_schema(self, conn):
+        with conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE,
+                    inode INTEGER,
+                    size INTEGER NOT NULL DEFAULT 0,
+                    mtime REAL NOT NULL DEFAULT 0,
+                    indexed_offset INTEGER NOT NULL DEFAULT 0,
+                    compressed INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_files_inode ON files(inode);
+
+                CREATE TABLE IF NOT EXISTS records (
+                    id INTEGER PRIMARY KEY,
+                    file_id INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    ts INTEGER NOT NULL,
+                    level TEXT NOT NULL,
+                    server TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    line TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_records_server_level_ts ON records(server, level, ts);
+                CREATE INDEX IF NOT EXISTS idx_records_level_ts ON records(level, ts);
+                CREATE INDEX IF NOT EXISTS idx_records_ts ON records(ts);
+                CREATE INDEX IF NOT EXISTS idx_records_file ON records(file_id);
+
+                CREATE TABLE IF NOT EXISTS postings (
+                    token TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    record_id INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_postings_token_bucket ON postings(token, bucket);
+            """)
+        self._schema_ready = True
+
+    # --- 백그라운드 색인 ---
+
+    def start(self):
+        """백그라운드 색인 스레드 시작 (로그 핸들러 기록 시 깨어남)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        TimestampRotatingFileHandler.add_write_listener(self._wake.set)
+        self._thread = threading.Thread(target=self._run, name='LogSearchIndexer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        TimestampRotatingFileHandler.remove_write_listener(self._wake.set)
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.update()
+            except Exception as e:
+                logger.error(f"로그 검색 인덱스 갱신 실패: {str(e)}")
+            self._wake.wait(self.POLL_SECONDS)
+            # 연속 기록은 한 번에 모아서 색인
+            if self._wake.is_set() and not self._stop.is_set():
+                self._stop.wait(self.DEBOUNCE_SECONDS)
+            self._wake.clear()
+
+    def _list_log_files(self):
+        files = []
+        if not os.path.isdir(self.log_dir):
+            return files
+        for name in os.listdir(self.log_dir):
+            if name.endswith((INDEX_SUFFIX, SERVER_TABLE_SUFFIX)):
+                continue
+            if '.log' not in name:
+                continue
+            path = os.path.join(self.log_dir, name)
+            if os.path.isfile(path):
+                files.append(path)
+        return files
+
+    def update(self):
+        """로그 디렉토리의 새 파일/추가된 부분만 색인"""
+        with self._write_lock:
+            conn = self._connection()
+            current = {}
+            for path in self._list_log_files():
+                try:
+                    current[path] = os.stat(path)
+                except OSError:
+                    pass
+            self._sync_paths(conn, current)
+
+            for path, stat in current.items():
+                try:
+                    self._update_file(conn, path, stat)
+                except Exception as e:
+                    logger.error(f"로그 파일 색인 실패 ({os.path.basename(path)}): {str(e)}")
+
+    def _sync_paths(self, conn, current):
+        """회전으로 이름이 바뀐 파일은 inode로 찾아 경로만 갱신하고, 사라진 파일은 정리"""
+        by_inode = {stat.st_ino: path for path, stat in current.items()}
+        rows = conn.execute("SELECT id, path, inode FROM files").fetchall()
+        with conn:
+            moved = []
+            for row in rows:
+                new_path = by_inode.get(row['inode'])
+                if new_path is None:
+                    self._drop_file(conn, row['id'])
+                elif new_path != row['path']:
+                    # 경로 충돌을 피하기 위해 임시 경로를 거쳐 이동
+                    conn.execute("UPDATE files SET path = ? WHERE id = ?", (f"#{row['id']}", row['id']))
+                    moved.append((new_path, row['id']))
+            for new_path, file_id in moved:
+                conn.execute("UPDATE files SET path = ? WHERE id = ?", (new_path, file_id))
+
+    def _drop_file(self, conn, file_id):
+        self._clear_records(conn, file_id)
+        conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def _clear_records(self, conn, file_id):
+        conn.execute("DELETE FROM postings WHERE record_id IN (SELECT id FROM records WHERE file_id = ?)", (file_id,))
+        conn.execute("DELETE FROM records WHERE file_id = ?", (file_id,))
+
+    def _update_file(self, conn, path, stat):
+        compressed = path.endswith('.gz')
+        row = conn.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            with conn:
+                conn.execute(
+                    "INSERT INTO files (path, inode, compressed) VALUES (?, ?, ?)",
+                    (path, stat.st_ino, int(compressed)))
+            row = conn.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone()
+
+        file_id = row['id']
+        if stat.st_size == row['size'] and stat.st_mtime == row['mtime']:
+            return
+
+        offset = row['indexed_offset']
+        if compressed or stat.st_size < offset:
+            # 압축 파일이 바뀌었거나 파일이 잘린 경우 처음부터 다시 색인
+            with conn:
+                self._clear_records(conn, file_id)
+            offset = 0
+
+        if compressed:
+            with gzip.open(path, 'rb') as f:
+                data = f.read()
+        else:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read(stat.st_size - offset)
+            # 아직 기록 중인 마지막 줄은 다음 갱신에서 색인
+            last_newline = data.rfind(b'\n')
+            data = data[:last_newline + 1] if last_newline >= 0 else b''
+
+        new_offset = self._index_chunk(conn, file_id, offset, data)
+        with conn:
+            conn.execute(
+                "UPDATE files SET size = ?, mtime = ?, indexed_offset = ? WHERE id = ?",
+                (stat.st_size, stat.st_mtime, new_offset, file_id))
+
+    def _index_chunk(self, conn, file_id, base_offset, data):
+        """바이트 청크 안의 레코드를 색인하고 색인이 끝난 위치 반환"""
+        offset = base_offset
+        with conn:
+            for raw_line in data.splitlines(keepends=True):
+                line_offset = offset
+                offset += len(raw_line)
+                line = raw_line.decode('utf-8', errors='replace').rstrip('\r\n')
+                if not _RECORD_START_PATTERN.match(line):
+                    continue
+                entry = parse_log_line(line)
+                if entry is None:
+                    continue
+                ts = _to_epoch(entry.get('ts', ''))
+                cursor = conn.execute(
+                    "INSERT INTO records (file_id, offset, ts, level, server, message, line) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (file_id, line_offset, ts, entry.get('level', ''),
+                     (entry.get('server') or 'SYSTEM').strip(), entry.get('message', ''),
+                     format_log_entry(entry) if line.startswith('{') else line))
+                bucket = ts // BUCKET_SECONDS
+                conn.executemany(
+                    "INSERT INTO postings (token, bucket, record_id) VALUES (?, ?, ?)",
+                    [(token, bucket, cursor.lastrowid) for token in tokenize(entry.get('message', ''))])
+        return offset
+
+    # --- 조회 ---
+
+    def search(self, text=None, level=None, server=None, start=None, end=None, limit=1000):
+        """조건에 맞는 로그 레코드를 최신 순으로 반환
+
+        text는 공백으로 구분된 토큰을 모두 포함하는 레코드를 찾고,
+        start/end(datetime)는 시간 버킷 범위로 역색인 조회 범위를 좁힙니다.
+        """
+        conn = self._connection()
+        where = []
+        params = []
+        start_ts = int(start.timestamp()) if start else None
+        end_ts = int(end.timestamp()) if end else None
+
+        for token in tokenize(text or ''):
+            clause = "r.id IN (SELECT record_id FROM postings WHERE token = ?"
+            params.append(token)
+            if start_ts is not None:
+                clause += " AND bucket >= ?"
+                params.append(start_ts // BUCKET_SECONDS)
+            if end_ts is not None:
+                clause += " AND bucket <= ?"
+                params.append(end_ts // BUCKET_SECONDS)
+            where.append(clause + ")")
+        if level:
+            where.append("r.level = ?")
+            params.append(level)
+        if server:
+            where.append("r.server = ?")
+            params.append(server)
+        if start_ts is not None:
+            where.append("r.ts >= ?")
+            params.append(start_ts)
+        if end_ts is not None:
+            where.append("r.ts <= ?")
+            params.append(end_ts)
+
+        query = "SELECT r.ts, r.level, r.server, r.message, r.line, f.path FROM records r JOIN files f ON r.file_id = f.id"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY r.ts DESC, r.id DESC LIMIT ?"
+        params.append(limit)
+
+        return [
+            {
+                'ts': datetime.fromtimestamp(row['ts']).strftime(TIMESTAMP_FORMAT),
+                'level': row['level'],
+                'server': row['server'],
+                'message': row['message'],
+                'line': row['line'],
+                'file': os.path.basename(row['path'])
+            }
+            for row in conn.execute(query, params)
+        ]
+
+    def get_servers(self):
+        conn = self._connection()
+        return [row['server'] for row in conn.execute("SELECT DISTINCT server FROM records ORDER BY server")]
+
+log_search_index = LogSearchIndex()
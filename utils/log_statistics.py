@@ -0,0 +1,145 @@
+import os
+import time
+
+import numpy as np
+
+from config.system.log_index import INDEX_RECORD, INDEX_SUFFIX, LOG_LEVELS, SERVER_TABLE_SUFFIX
+
+# 사이드카 인덱스 레코드와 동일한 구조의 numpy 타입 (오프셋, epoch 초, 레벨 코드, 서버 ID)
+INDEX_DTYPE = np.dtype([('offset', '<u8'), ('ts', '<u4'), ('level', 'u1'), ('server', '<u2')])
+assert INDEX_DTYPE.itemsize == INDEX_RECORD.size
+
+_OTHER_LEVEL = len(LOG_LEVELS)  # 알 수 없는 레벨 열
+_TIMESTAMP_WIDTH = 19  # 'YYYY-MM-DD HH:MM:SS'
+
+def decode_hours(timestamps):
+    """타임스탬프 문자열 배열에서 시(hour)를 벡터 연산으로 추출 (형식이 다르면 -1)"""
+    if not len(timestamps):
+        return np.zeros(0, dtype=np.int64)
+    chars = np.array(timestamps, dtype=f'U{_TIMESTAMP_WIDTH}').view(np.uint32)
+    chars = chars.reshape(-1, _TIMESTAMP_WIDTH).astype(np.int64)
+    tens, ones = chars[:, 11] - ord('0'), chars[:, 12] - ord('0')
+    valid = (tens >= 0) & (tens <= 2) & (ones >= 0) & (ones <= 9) & (chars[:, 13] == ord(':'))
+    return np.where(valid, tens * 10 + ones, -1)
+
+def decode_levels(levels):
+    """레벨 이름 배열을 레벨 코드 배열로 변환 (알 수 없는 레벨은 len(LOG_LEVELS))"""
+    if not len(levels):
+        return np.zeros(0, dtype=np.int64)
+    names, inverse = np.unique(np.asarray(levels, dtype=str), return_inverse=True)
+    codes = np.array([LOG_LEVELS.index(name) if name in LOG_LEVELS else _OTHER_LEVEL for name in names])
+    return codes[inverse.reshape(-1)]
+
+def hourly_level_counts(timestamps, levels):
+    """파싱된 로그의 시간대(24) × 레벨 집계 행렬"""
+    counts = np.zeros((24, len(LOG_LEVELS) + 1), dtype=np.int64)
+    hours = decode_hours(timestamps)
+    codes = decode_levels(levels)
+    valid = hours >= 0
+    np.add.at(counts, (hours[valid], codes[valid]), 1)
+    return counts
+
+def build_timeline(hourly, bucket_hours=2, levels=('DEBUG', 'INFO', 'WARNING', 'ERROR')):
+    """시간대 × 레벨 집계 행렬을 bucket_hours 단위 시간대별 통계 목록으로 변환"""
+    buckets = hourly.reshape(24 // bucket_hours, bucket_hours, -1).sum(axis=1)
+    timeline_stats = []
+    for bucket_index, counts in enumerate(buckets):
+        hour = bucket_index * bucket_hours
+        stats = {'hour': f'{hour:02d}:00-{hour + bucket_hours:02d}:00'}
+        for level in levels:
+            stats[level] = int(counts[LOG_LEVELS.index(level)])
+        timeline_stats.append(stats)
+    return timeline_stats
+
+class LogStatistics:
+    """로그 통계 엔진
+
+    로그 본문을 다시 파싱하지 않고 사이드카 인덱스(고정 길이 레코드)를 numpy 배열로
+    직접 읽어 서버 × 시간대(0~23시) × 레벨 누적 집계를 유지합니다. refresh()는
+    마지막으로 읽은 이후 추가된 인덱스 레코드만 읽으므로 갱신 비용은 새 로그 수에 비례합니다.
+    """
+
+    def __init__(self, log_path):
+        self.log_path = str(log_path)
+        self.index_path = self.log_path + INDEX_SUFFIX
+        self.server_table_path = self.log_path + SERVER_TABLE_SUFFIX
+        self.reset()
+
+    def reset(self):
+        self._position = 0  # 인덱스 파일에서 읽은 바이트 수
+        self.servers = []
+        self.counts = np.zeros((0, 24, len(LOG_LEVELS) + 1), dtype=np.int64)
+        self.total = 0
+
+    def _load_servers(self):
+        try:
+            with open(self.server_table_path, 'r', encoding='utf-8') as f:
+                self.servers = f.read().split('\n')[:-1]
+        except OSError:
+            self.servers = []
+
+    def refresh(self):
+        """새로 추가된 인덱스 레코드만 읽어 집계에 반영하고 추가된 레코드 수 반환"""
+        try:
+            size = os.path.getsize(self.index_path)
+        except OSError:
+            return 0
+
+        # 로그 회전 등으로 인덱스가 새로 시작된 경우 처음부터 다시 집계
+        if size < self._position:
+            self.reset()
+
+        readable = (size - self._position) // INDEX_DTYPE.itemsize * INDEX_DTYPE.itemsize
+        if readable <= 0:
+            return 0
+
+        with open(self.index_path, 'rb') as f:
+            f.seek(self._position)
+            records = np.frombuffer(f.read(readable), dtype=INDEX_DTYPE)
+        self._position += readable
+
+        if not len(records):
+            return 0
+
+        # 서버 테이블은 새 서버 ID가 나타난 경우에만 다시 읽음
+        max_server = int(records['server'].max())
+        if max_server >= len(self.servers):
+            self._load_servers()
+        if max_server >= self.counts.shape[0]:
+            grown = np.zeros((max_server + 1,) + self.counts.shape[1:], dtype=np.int64)
+            grown[:self.counts.shape[0]] = self.counts
+            self.counts = grown
+
+        # 벡터화된 시간대/레벨 디코딩
+        utc_offset = time.localtime().tm_gmtoff
+        hours = ((records['ts'].astype(np.int64) + utc_offset) // 3600) % 24
+        levels = np.minimum(records['level'], _OTHER_LEVEL)
+        np.add.at(self.counts, (records['server'].astype(np.intp), hours, levels), 1)
+
+        self.total += len(records)
+        return len(records)
+
+    def _select(self, server=None):
+        if server is None:
+            return self.counts.sum(axis=0)
+        if server not in self.servers:
+            return np.zeros(self.counts.shape[1:], dtype=np.int64)
+        server_id = self.servers.index(server)
+        if server_id >= self.counts.shape[0]:
+            return np.zeros(self.counts.shape[1:], dtype=np.int64)
+        return self.counts[server_id]
+
+    def level_counts(self, server=None, level=None):
+        """레벨별 로그 수"""
+        per_level = self._select(server).sum(axis=0)
+        return {
+            name: int(per_level[code]) if level in (None, name) else 0
+            for code, name in enumerate(LOG_LEVELS)
+        }
+
+    def timeline(self, server=None, bucket_hours=2, levels=('DEBUG', 'INFO', 'WARNING', 'ERROR')):
+        """시간대별 레벨 분포 (calculate_timeline_stats와 같은 형식)"""
+        return build_timeline(self._select(server), bucket_hours, levels)
+
+    def get_servers(self):
+        return list(self.servers)
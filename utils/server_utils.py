@@ -7,7 +7,9 @@ def convert_to_idrac_config(server_info: dict) -> IDRACConfig:
         IP=server_info.get('IP', ''),
         PORT=server_info.get('PORT', '443'),
         USERNAME=server_info.get('USERNAME', ''),
-        PASSWORD=server_info.get('PASSWORD', '')
+        PASSWORD=server_info.get('PASSWORD', ''),
+        GROUP=server_info.get('GROUP', ''),
+        TAGS=server_info.get('TAGS', [])
     )
 
 def convert_to_dict(idrac_config: IDRACConfig) -> dict:
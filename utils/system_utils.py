@@ -1,6 +1,6 @@
 import platform
 from PyQt6.QtGui import QFont
-import matplotlib.pyplot as plt
+import matplotlib
 
 def get_system_monospace_font(size=10):
     """
@@ -47,7 +47,7 @@ def get_system_matplotlib_font():
     font_name = hangul_font_map.get(os_name, 'sans-serif')
     
     # matplotlib 한글 폰트 설정
-    plt.rcParams['font.family'] = font_name
-    plt.rcParams['axes.unicode_minus'] = False
+    matplotlib.rcParams['font.family'] = font_name
+    matplotlib.rcParams['axes.unicode_minus'] = False
     
     return font_name
@@ -0,0 +1,285 @@
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+
+from config.system.log_config import setup_logging
+
+logger = setup_logging()
+
+INDEX_FORMAT_VERSION = 1
+INDEX_SUFFIX = '.index.json'
+MAX_LOG_LINES = 5000  # 요약에 남길 경고/오류 로그 줄 수 (심각도별 개수는 전부 집계)
+MAX_JSON_SIZE = 5 * 1024 * 1024  # 통째로 읽는 JSON 최대 크기
+TEXT_LOG_EXTENSIONS = ('.log', '.txt')
+
+# 파일 종류 (중앙 디렉토리의 경로/이름으로 판별)
+KIND_INVENTORY = 'inventory'
+KIND_LCLOG = 'lclog'
+KIND_SEL = 'sel'
+KIND_TTYLOG = 'ttylog'
+KIND_METADATA = 'metadata'
+KIND_ARCHIVE = 'archive'
+
+# CIM PrimaryStatus 값
+_PRIMARY_STATUS = {'0': 'N/A', '1': 'OK', '2': 'Warning', '3': 'Critical'}
+_EVENT_TAGS = ('Event', 'LogEntry', 'Record')
+_COMPONENT_FIELDS = ('FQDD', 'InstanceID', 'DeviceDescription', 'ProductName', 'Model', 'SerialNumber',
+                     'FirmwareVersion', 'PrimaryStatus')
+_TEXT_CRITICAL = re.compile(r'\b(fatal|critical|error|fail(ed|ure)?)\b', re.IGNORECASE)
+_TEXT_WARNING = re.compile(r'\b(warn(ing)?|degraded|predictive)\b', re.IGNORECASE)
+
+_SEVERITY_VALUES = {
+    'critical': 'Critical', 'error': 'Critical', 'fatal': 'Critical', 'major': 'Critical', '3': 'Critical', '4': 'Critical',
+    'warning': 'Warning', 'minor': 'Warning', 'degraded': 'Warning', '2': 'Warning',
+    'informational': 'OK', 'info': 'OK', 'ok': 'OK', 'normal': 'OK', '1': 'OK',
+}
+
+def normalize_severity(value):
+    """Critical / Warning / OK / N/A (이벤트 로그 화면과 같은 값)"""
+    return _SEVERITY_VALUES.get((value or '').strip().lower(), 'N/A')
+
+def classify_member(name):
+    """ZIP 항목 경로로 파일 종류 판별 (분석 대상이 아니면 None)"""
+    lower = name.lower()
+    base = os.path.basename(lower)
+    if lower.endswith('.zip'):
+        return KIND_ARCHIVE
+    if base == 'metadata.json':
+        return KIND_METADATA
+    if 'lclog' in base and lower.endswith('.xml'):
+        return KIND_LCLOG
+    if base.startswith('sel') and (lower.endswith('.xml') or lower.endswith(TEXT_LOG_EXTENSIONS)):
+        return KIND_SEL
+    if 'tty' in base and (lower.endswith(TEXT_LOG_EXTENSIONS + ('.xml',)) or '.' not in base):
+        return KIND_TTYLOG
+    if 'inventory' in lower and lower.endswith('.xml'):
+        return KIND_INVENTORY
+    return None
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def index_path_for(archive_path):
+    return archive_path + INDEX_SUFFIX
+
+class TsrIndexer:
+    """TSR ZIP을 풀지 않고 분석해 검색용 요약을 만드는 색인기
+
+    ZIP 중앙 디렉토리로 필요한 항목만 골라 스트림으로 열고, XML은 iterparse로
+    요소 단위 처리 후 바로 해제하며, 텍스트 로그는 줄 단위로 읽습니다. 로그 줄은
+    경고/오류만 MAX_LOG_LINES까지 남기므로 아카이브 크기와 관계없이 메모리 사용량이
+    일정합니다. 결과는 아카이브 옆 '<파일명>.index.json'에 저장되고, 아카이브
+    크기/수정 시각이 같으면 다시 분석하지 않습니다.
+    """
+
+    def __init__(self, progress_callback=None):
+        self.progress_callback = progress_callback  # (처리한 항목 수, 전체 항목 수)
+        self._reset()
+
+    def _reset(self):
+        self.components = []
+        self.faults = []
+        self.metadata = {}
+        self.log_counts = {}
+        self.log_lines = []
+        self.files = {}
+
+    @staticmethod
+    def _stat(path):
+        stat = os.stat(path)
+        return [stat.st_size, int(stat.st_mtime)]
+
+    def load_or_build(self, archive_path):
+        """저장된 요약이 같은 아카이브로 만든 것이면 재사용, 아니면 새로 분석"""
+        index_path = index_path_for(archive_path)
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    summary = json.load(f)
+                if summary.get('format') == INDEX_FORMAT_VERSION and summary.get('stat') == self._stat(archive_path):
+                    return summary
+            except Exception as e:
+                logger.error(f"TSR 요약 읽기 실패: {str(e)}")
+        return self.build(archive_path)
+
+    def build(self, archive_path):
+        started = time.time()
+        self._reset()
+        with zipfile.ZipFile(archive_path) as archive:
+            self._index_archive(archive, '')
+
+        summary = {
+            'format': INDEX_FORMAT_VERSION,
+            'archive': os.path.abspath(archive_path),
+            'stat': self._stat(archive_path),
+            'indexed_at': time.time(),
+            'metadata': self.metadata,
+            'files': self.files,
+            'components': self.components,
+            'faults': self.faults,
+            'log_counts': self.log_counts,
+            'log_lines': self.log_lines,
+            'truncated': sum(self.log_counts.get(severity, 0) for severity in ('Critical', 'Warning')) > len(self.log_lines),
+        }
+        index_path = index_path_for(archive_path)
+        try:
+            with open(f"{index_path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(f"{index_path}.tmp", index_path)
+        except Exception as e:
+            logger.error(f"TSR 요약 저장 실패: {str(e)}")
+        logger.info(f"TSR 분석 완료: 구성 요소 {len(self.components)}개, 오류 {len(self.faults)}개, "
+                    f"로그 {sum(self.log_counts.values())}줄 ({time.time() - started:.1f}초)")
+        return summary
+
+    def _index_archive(self, archive, prefix):
+        members = [(info, classify_member(info.filename)) for info in archive.infolist() if not info.is_dir()]
+        targets = [(info, kind) for info, kind in members if kind]
+        for done, (info, kind) in enumerate(targets, 1):
+            name = prefix + info.filename
+            self.files.setdefault(kind, []).append(name)
+            try:
+                if kind == KIND_ARCHIVE:
+                    self._index_nested(archive, info, name)
+                else:
+                    with archive.open(info) as stream:
+                        self._parse_member(kind, name, stream, info.file_size)
+            except Exception as e:
+                # 암호화되었거나 손상된 항목은 건너뛰고 나머지 분석
+                logger.warning(f"TSR 항목 분석 실패 ({name}): {str(e)}")
+            if self.progress_callback and not prefix:
+                self.progress_callback(done, len(targets))
+
+    def _index_nested(self, archive, info, name):
+        # 내부 ZIP은 임의 접근이 필요하므로 메모리 대신 임시 파일로 복사
+        with tempfile.TemporaryFile() as temp:
+            with archive.open(info) as stream:
+                shutil.copyfileobj(stream, temp, 1024 * 1024)
+            temp.seek(0)
+            with zipfile.ZipFile(temp) as nested:
+                self._index_archive(nested, name + '/')
+
+    def _parse_member(self, kind, name, stream, size):
+        if kind == KIND_METADATA:
+            if size <= MAX_JSON_SIZE:
+                data = json.load(io.TextIOWrapper(stream, encoding='utf-8', errors='replace'))
+                if isinstance(data, dict):
+                    self.metadata.update({key: value for key, value in data.items()
+                                          if isinstance(value, (str, int, float, bool))})
+        elif kind == KIND_INVENTORY:
+            self._parse_inventory(name, stream)
+        elif name.lower().endswith('.xml'):
+            self._parse_event_xml(kind, stream)
+        else:
+            self._parse_text_log(kind, stream)
+
+    def _add_log_line(self, source, severity, timestamp, message, message_id=''):
+        self.log_counts[severity] = self.log_counts.get(severity, 0) + 1
+        if severity in ('Critical', 'Warning') and len(self.log_lines) < MAX_LOG_LINES:
+            self.log_lines.append({
+                'Source': source,
+                'Severity': severity,
+                'Created': timestamp,
+                'MessageId': message_id,
+                'Message': message,
+            })
+
+    def _parse_inventory(self, name, stream):
+        """CIM 인벤토리 XML (INSTANCE/PROPERTY) -> 구성 요소 목록"""
+        context = ET.iterparse(stream, events=('start', 'end'))
+        root = None
+        for event, elem in context:
+            if root is None:
+                root = elem
+                continue
+            if event != 'end' or _local_name(elem.tag) != 'INSTANCE':
+                continue
+            properties = {}
+            for prop in elem.iter():
+                if _local_name(prop.tag).startswith('PROPERTY') and prop.get('NAME') in _COMPONENT_FIELDS:
+                    value = prop.find('{*}VALUE')
+                    if value is not None and value.text:
+                        properties[prop.get('NAME')] = value.text.strip()
+            class_name = elem.get('CLASSNAME', '')
+            elem.clear()
+            root.clear()
+            if not properties.get('FQDD') and not properties.get('InstanceID'):
+                continue
+            severity = _PRIMARY_STATUS.get(properties.get('PrimaryStatus', ''), 'N/A')
+            component = {
+                'Class': class_name,
+                'FQDD': properties.get('FQDD') or properties.get('InstanceID'),
+                'Name': properties.get('DeviceDescription') or properties.get('ProductName') or properties.get('Model', ''),
+                'Model': properties.get('Model', ''),
+                'SerialNumber': properties.get('SerialNumber', ''),
+                'FirmwareVersion': properties.get('FirmwareVersion', ''),
+                'Severity': severity,
+            }
+            self.components.append(component)
+            if severity in ('Critical', 'Warning'):
+                self.faults.append(component)
+
+    def _parse_event_xml(self, kind, stream):
+        """LC 로그/SEL XML의 Event 요소를 하나씩 처리"""
+        context = ET.iterparse(stream, events=('start', 'end'))
+        root = None
+        for event, elem in context:
+            if root is None:
+                root = elem
+                continue
+            if event != 'end' or _local_name(elem.tag) not in _EVENT_TAGS:
+                continue
+            raw_severity = elem.get('Severity') or elem.get('s')
+            if raw_severity is None:
+                child = elem.find('{*}Severity')
+                raw_severity = child.text if child is not None else None
+            severity = normalize_severity(raw_severity)
+            if severity in ('Critical', 'Warning') and len(self.log_lines) < MAX_LOG_LINES:
+                # 남길 줄만 필드를 모음 (대부분인 정보성 이벤트는 개수만 집계)
+                fields = dict(elem.attrib)
+                for child in elem:
+                    if child.text and child.text.strip():
+                        fields[_local_name(child.tag)] = child.text.strip()
+                timestamp = next((value for key, value in fields.items() if 'time' in key.lower()), '')
+                message = fields.get('Message') or fields.get('Description') or fields.get('Msg', '')
+                self._add_log_line(kind, severity, timestamp, message,
+                                   fields.get('MessageID') or fields.get('MessageId', ''))
+            else:
+                self.log_counts[severity] = self.log_counts.get(severity, 0) + 1
+            elem.clear()
+            root.clear()
+
+    def _parse_text_log(self, kind, stream):
+        """TTY 로그 등 텍스트 로그를 줄 단위로 분류"""
+        for line in io.TextIOWrapper(stream, encoding='utf-8', errors='replace'):
+            line = line.rstrip()
+            if not line:
+                continue
+            if _TEXT_CRITICAL.search(line):
+                severity = 'Critical'
+            elif _TEXT_WARNING.search(line):
+                severity = 'Warning'
+            else:
+                severity = 'OK'
+            self._add_log_line(kind, severity, '', line)
+
+def index_tsr(archive_path, progress_callback=None):
+    """TSR 요약 반환 (아카이브 옆에 캐시된 요약이 최신이면 재사용)"""
+    return TsrIndexer(progress_callback).load_or_build(archive_path)
+
+def search_summary(summary, text):
+    """요약에서 검색어가 들어간 구성 요소와 로그 줄 (대소문자 무시)"""
+    text = (text or '').strip().lower()
+    if not text:
+        return summary.get('components', []), summary.get('log_lines', [])
+    components = [component for component in summary.get('components', [])
+                  if text in ' '.join(str(value) for value in component.values()).lower()]
+    log_lines = [line for line in summary.get('log_lines', [])
+                 if text in f"{line.get('MessageId', '')} {line.get('Message', '')}".lower()]
+    return components, log_lines